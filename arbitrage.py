@@ -0,0 +1,247 @@
+# arbitrage.py
+
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from order_book import OrderBook, price_levels
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; it is only needed to build a scanner.
+    np = None
+
+# Opportunity kinds ranked by ArbitrageScanner.opportunities, and the profit column of each.
+KINDS = {
+    'shop_sell': 'shop_sell_profit',          # Buy at the market minimum, sell to the city shop
+    'market_value': 'market_value_discount',  # Buy at the market minimum, below the item's market value
+    'shop_buy': 'shop_buy_profit',            # Buy from the city shop, list under the market minimum
+    'cross_market': 'cross_market_profit',    # Buy in one market, list under the other's minimum
+}
+
+_CATALOGUE_FIELDS = ('buy_price', 'sell_price', 'market_value')
+
+
+def _field(item: Any, name: str):
+    if isinstance(item, dict):
+        return item.get(name)
+    return getattr(item, name, None)
+
+
+class ArbitrageScanner:
+    """
+    Compares the item catalogue with the latest market minimums for every item at once.
+
+    The catalogue (`torn/items` buy_price, sell_price and market_value) and the lowest bazaar
+    and item market prices are kept as NumPy arrays aligned by item ID. Market updates write
+    one element each, so they can be applied as every poll arrives (see `attach`), and `scan`
+    computes the spreads and margins of the whole catalogue in one vectorized pass.
+
+    Prices of 0 in the catalogue (items the city shops do not trade, or without a market
+    value) and markets with no listings are treated as missing, so they never rank. Each
+    market's minimum has its own update time, so an update of one market never makes the
+    other's price look fresh.
+
+    Args:
+        catalogue (optional): `ItemsData`, or a dict of item ID to Item objects or raw item dicts.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+
+    def __init__(self, catalogue: Any = None):
+        if np is None:
+            raise ImportError("NumPy is required for the arbitrage scanner. Install it with 'pip install numpy'.")
+        self.item_ids = np.empty(0, dtype=np.int64)
+        self.names = np.empty(0, dtype=object)
+        self.buy_price = np.empty(0)
+        self.sell_price = np.empty(0)
+        self.market_value = np.empty(0)
+        self.bazaar_min = np.empty(0)
+        self.itemmarket_min = np.empty(0)
+        self.bazaar_updated = np.empty(0)
+        self.itemmarket_updated = np.empty(0)
+        if catalogue is not None:
+            self.load_catalogue(catalogue)
+
+    def load_catalogue(self, catalogue: Any):
+        """
+        Load or replace the item catalogue.
+
+        Market prices already known for items still in the catalogue are kept.
+
+        Args:
+            catalogue: `ItemsData`, or a dict of item ID to Item objects or raw item dicts.
+        """
+        items = getattr(catalogue, 'items', catalogue)
+        if callable(items):
+            items = dict(items())
+        item_ids = np.array(sorted(int(item_id) for item_id in items), dtype=np.int64)
+        by_id = {int(item_id): item for item_id, item in items.items()}
+        ordered = [by_id[item_id] for item_id in item_ids.tolist()]
+
+        columns = {}
+        for name in _CATALOGUE_FIELDS:
+            values = np.array([_field(item, name) or 0 for item in ordered], dtype=np.float64)
+            values[values <= 0] = np.nan
+            columns[name] = values
+
+        bazaar_min = np.full(len(item_ids), np.nan)
+        itemmarket_min = np.full(len(item_ids), np.nan)
+        bazaar_updated = np.full(len(item_ids), np.nan)
+        itemmarket_updated = np.full(len(item_ids), np.nan)
+        if len(self.item_ids) and len(item_ids):
+            # Carry over market prices for items in both catalogues
+            positions = np.searchsorted(self.item_ids, item_ids).clip(max=len(self.item_ids) - 1)
+            kept = self.item_ids[positions] == item_ids
+            bazaar_min[kept] = self.bazaar_min[positions[kept]]
+            itemmarket_min[kept] = self.itemmarket_min[positions[kept]]
+            bazaar_updated[kept] = self.bazaar_updated[positions[kept]]
+            itemmarket_updated[kept] = self.itemmarket_updated[positions[kept]]
+
+        self.item_ids = item_ids
+        self.names = np.array([_field(item, 'name') or '' for item in ordered], dtype=object)
+        self.buy_price = columns['buy_price']
+        self.sell_price = columns['sell_price']
+        self.market_value = columns['market_value']
+        self.bazaar_min = bazaar_min
+        self.itemmarket_min = itemmarket_min
+        self.bazaar_updated = bazaar_updated
+        self.itemmarket_updated = itemmarket_updated
+
+    def _index(self, item_id) -> Optional[int]:
+        item_id = int(item_id)
+        index = int(np.searchsorted(self.item_ids, item_id))
+        if index < len(self.item_ids) and self.item_ids[index] == item_id:
+            return index
+        return None
+
+    def update_market(self, item_id, bazaar: Optional[Iterable[Any]] = None,
+                      itemmarket: Optional[Iterable[Any]] = None, timestamp: Optional[float] = None) -> bool:
+        """
+        Record the latest listings of one item.
+
+        Args:
+            item_id: The item.
+            bazaar (iterable, optional): The bazaar listings (dicts, MarketItem objects or an
+                OrderBook). None leaves the bazaar minimum unchanged; an empty list clears it.
+            itemmarket (iterable, optional): The item market listings, as for `bazaar`.
+            timestamp (float, optional): When the listings were fetched. Defaults to now. Only the
+                markets given are marked as updated.
+
+        Returns:
+            bool: False if the item is not in the catalogue.
+        """
+        index = self._index(item_id)
+        if index is None:
+            return False
+        timestamp = timestamp if timestamp is not None else time.time()
+        for listings, prices, updated in ((bazaar, self.bazaar_min, self.bazaar_updated),
+                                          (itemmarket, self.itemmarket_min, self.itemmarket_updated)):
+            if listings is None:
+                continue
+            if isinstance(listings, OrderBook):
+                best = listings.best
+            else:
+                levels = [cost for cost, quantity in price_levels(listings).items() if quantity > 0]
+                best = min(levels) if levels else None
+            prices[index] = best if best is not None else np.nan
+            updated[index] = timestamp
+        return True
+
+    def update_from_response(self, item_id, data: Dict[str, Any]) -> bool:
+        """Record the listings of a `market` response with the 'bazaar' and/or 'itemmarket' selections."""
+        data = data or {}
+        return self.update_market(item_id, data.get('bazaar'), data.get('itemmarket'))
+
+    def attach(self, watcher):
+        """Update the scanner from every successful poll of a `MarketWatcher`."""
+        watcher.subscribe_snapshots(self.update_from_response)
+
+    def scan(self, max_age: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Compute the spreads and margins of every item in one pass.
+
+        Args:
+            max_age (float, optional): Ignore market prices older than this many seconds.
+
+        Returns:
+            dict: Arrays aligned with `item_ids`:
+                - 'item_id', 'name'
+                - 'market_min': the lowest price in either market, NaN if none is known
+                - 'market_source': 'bazaar' or 'itemmarket', where market_min was found ('' if none)
+                - 'shop_sell_profit': sell_price - market_min
+                - 'market_value_discount': market_value - market_min
+                - 'market_value_margin': market_value_discount / market_value
+                - 'shop_buy_profit': market_min - buy_price
+                - 'cross_market_profit': the spread between the two markets' minimums
+        """
+        bazaar, itemmarket = self.bazaar_min, self.itemmarket_min
+        if max_age is not None:
+            oldest = time.time() - max_age
+            bazaar = np.where(self.bazaar_updated >= oldest, bazaar, np.nan)
+            itemmarket = np.where(self.itemmarket_updated >= oldest, itemmarket, np.nan)
+
+        market_min = np.fmin(bazaar, itemmarket)
+        source = np.where(np.isnan(market_min), '', np.where(bazaar == market_min, 'bazaar', 'itemmarket'))
+        discount = self.market_value - market_min
+        with np.errstate(invalid='ignore', divide='ignore'):
+            margin = discount / self.market_value
+        return {
+            'item_id': self.item_ids,
+            'name': self.names,
+            'market_min': market_min,
+            'market_source': source,
+            'shop_sell_profit': self.sell_price - market_min,
+            'market_value_discount': discount,
+            'market_value_margin': margin,
+            'shop_buy_profit': market_min - self.buy_price,
+            'cross_market_profit': np.abs(bazaar - itemmarket),
+        }
+
+    def opportunities(self, kind: str = 'market_value', top: int = 20, min_profit: float = 1,
+                      min_margin: Optional[float] = None, max_age: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Rank the items by the profit of one kind of opportunity.
+
+        Args:
+            kind (str): 'shop_sell', 'market_value', 'shop_buy' or 'cross_market'.
+            top (int): The most opportunities to return.
+            min_profit (float): The smallest profit per unit to include. Defaults to 1.
+            min_margin (float, optional): The smallest profit as a fraction of the market value.
+            max_age (float, optional): Ignore market prices older than this many seconds.
+
+        Returns:
+            list: Dicts with item_id, name, market_min, market_source, profit and
+                market_value_margin, highest profit first.
+
+        Raises:
+            ValueError: If the kind is unknown.
+        """
+        column = KINDS.get(kind)
+        if column is None:
+            raise ValueError(f"Unknown opportunity kind '{kind}'. Expected one of: {', '.join(KINDS)}.")
+        result = self.scan(max_age)
+        profit = result[column]
+        keep = profit >= min_profit
+        if min_margin is not None:
+            keep &= result['market_value_margin'] >= min_margin
+        candidates = np.flatnonzero(keep)
+        if top is not None and len(candidates) > top:
+            # Select the top candidates before sorting them, rather than sorting everything
+            candidates = candidates[np.argpartition(-profit[candidates], top - 1)[:top]]
+        candidates = candidates[np.argsort(-profit[candidates], kind='stable')]
+        return [{
+            'item_id': int(result['item_id'][i]),
+            'name': result['name'][i],
+            'market_min': float(result['market_min'][i]),
+            'market_source': str(result['market_source'][i]),
+            'profit': float(profit[i]),
+            'market_value_margin': float(result['market_value_margin'][i]),
+        } for i in candidates]
+
+    def __len__(self):
+        return len(self.item_ids)
+
+    def __repr__(self):
+        priced = int(np.count_nonzero(~np.isnan(np.fmin(self.bazaar_min, self.itemmarket_min))))
+        return f"ArbitrageScanner(items={len(self.item_ids)}, priced={priced})"
@@ -0,0 +1,232 @@
+# attack_store.py
+
+import json
+import sqlite3
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Optional
+
+from columns import ATTACK_COLUMNS
+
+_SQL_TYPES = {'i8': 'INTEGER', '?': 'INTEGER', 'f8': 'REAL', 'U': 'TEXT'}
+
+# Columns stored for every attack: the `user/attacks` fields plus the modifiers as JSON text.
+# `user/attacksfull` records have a subset of them; the rest are stored as NULL.
+COLUMNS = tuple(column.name for column in ATTACK_COLUMNS) + ('modifiers',)
+
+# Columns returned by queries unless the modifiers are asked for: decoding their JSON costs
+# more than the indexed lookup itself.
+QUERY_COLUMNS = COLUMNS[:-1]
+
+_BOOLEANS = ('stealthed', 'raid', 'ranked_war')
+
+# Each index leads with the filtered ID and ends with the start time, so "faction X in a
+# time range" is a single index range scan.
+INDEXES = {
+    'attacker_id': ('attacker_id', 'timestamp_started'),
+    'defender_id': ('defender_id', 'timestamp_started'),
+    'attacker_faction': ('attacker_faction', 'timestamp_started'),
+    'defender_faction': ('defender_faction', 'timestamp_started'),
+    'timestamp_started': ('timestamp_started',),
+}
+
+FILTERS = ('attacker_id', 'defender_id', 'attacker_faction', 'defender_faction', 'result')
+
+
+def _attack_dict(record: Any) -> Dict[str, Any]:
+    # Accepts raw records, (key, record) pairs from the stream methods, and Attack/AttackFull objects.
+    if isinstance(record, tuple):
+        record = record[1]
+    if isinstance(record, dict):
+        return record
+    return {name: getattr(record, name) for name in COLUMNS if hasattr(record, name)}
+
+
+class AttackStore:
+    """
+    A local SQLite store of attack records, keyed by attack code.
+
+    Attacks are only ever added: writing an attack again keeps the stored row and only
+    fills in fields it was missing (e.g. names, when an `attacksfull` record is followed by
+    the `attacks` record of the same attack). Lookups by attacker, defender, either faction
+    and start time are served from indexes, without any API request.
+
+    The store also has the sink interface (`write`, `flush`), so it can be passed to
+    `SyncManager.sync` or `sinks.write_records`.
+
+    Args:
+        path (str): The database file. Defaults to ':memory:'.
+        table (str): The table name. Defaults to 'attacks'.
+        batch_size (int): Attacks buffered by `write` before each insert. Defaults to 1000.
+    """
+
+    def __init__(self, path: str = ':memory:', table: str = 'attacks', batch_size: int = 1000):
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name '{table}'.")
+        self.path = path
+        self.table = table
+        self.batch_size = batch_size
+        self._rows = []
+        self._lock = Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        if path != ':memory:':
+            self.connection.execute('PRAGMA journal_mode=WAL')
+            self.connection.execute('PRAGMA synchronous=NORMAL')
+        self._create()
+        placeholders = ', '.join('?' * len(COLUMNS))
+        updates = ', '.join(f"{name} = COALESCE({name}, excluded.{name})" for name in COLUMNS[1:])
+        self._insert = (f"INSERT INTO {table} ({', '.join(COLUMNS)}) VALUES ({placeholders}) "
+                        f"ON CONFLICT(code) DO UPDATE SET {updates}")
+
+    def _create(self):
+        definitions = [f"{column.name} {_SQL_TYPES[column.dtype]}" for column in ATTACK_COLUMNS[1:]]
+        with self.connection:
+            self.connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} (code TEXT PRIMARY KEY, {', '.join(definitions)}, modifiers TEXT)"
+            )
+            for name, indexed in INDEXES.items():
+                self.connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS {self.table}_{name} ON {self.table} ({', '.join(indexed)})"
+                )
+
+    @staticmethod
+    def _row(attack: Dict[str, Any]):
+        row = [attack.get(name) for name in COLUMNS]
+        modifiers = attack.get('modifiers')
+        row[-1] = json.dumps(modifiers, separators=(',', ':')) if modifiers is not None else None
+        return row
+
+    def add(self, attacks: Iterable[Any]) -> int:
+        """
+        Store attacks in one transaction.
+
+        Args:
+            attacks (iterable): Raw attack dicts, (key, attack) pairs or Attack/AttackFull objects.
+
+        Returns:
+            int: The number of attacks that were not stored before.
+        """
+        rows = [self._row(_attack_dict(attack)) for attack in attacks]
+        rows = [row for row in rows if row[0]]  # An attack without a code cannot be keyed
+        with self._lock, self.connection:
+            before = self.connection.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+            self.connection.executemany(self._insert, rows)
+            return self.connection.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0] - before
+
+    def write(self, key: Any, attack: Any):
+        """Buffer one attack, storing the batch once it is full."""
+        self._rows.append(attack)
+        if len(self._rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Store the buffered attacks."""
+        rows, self._rows = self._rows, []
+        if rows:
+            self.add(rows)
+
+    def get(self, code: str) -> Optional[Dict[str, Any]]:
+        """Return the attack with the given code, including its modifiers, or None if it is not stored."""
+        with self._lock:
+            row = self.connection.execute(f"SELECT {', '.join(COLUMNS)} FROM {self.table} WHERE code = ?",
+                                          (code,)).fetchone()
+        return self._attacks(COLUMNS, [row])[0] if row else None
+
+    def find(self, start: Optional[int] = None, end: Optional[int] = None, limit: Optional[int] = None,
+             newest_first: bool = True, modifiers: bool = False, **filters) -> List[Dict[str, Any]]:
+        """
+        Return stored attacks matching all the given filters.
+
+        Args:
+            start (int, optional): The earliest `timestamp_started` to include.
+            end (int, optional): The latest `timestamp_started` to include.
+            limit (int, optional): The most attacks to return.
+            newest_first (bool): Order by start time, newest first (default) or oldest first.
+            modifiers (bool): Include the decoded `modifiers` of each attack. Defaults to False,
+                which makes large results several times faster to build.
+            **filters: Exact matches on attacker_id, defender_id, attacker_faction,
+                defender_faction or result.
+
+        Returns:
+            list: The attacks as dicts with the `user/attacks` fields.
+
+        Raises:
+            ValueError: If a filter is not one of the indexed fields.
+        """
+        clauses, values = self._where(start, end, filters)
+        names = COLUMNS if modifiers else QUERY_COLUMNS
+        sql = f"SELECT {', '.join(names)} FROM {self.table}{clauses} ORDER BY timestamp_started {'DESC' if newest_first else 'ASC'}"
+        if limit is not None:
+            sql += ' LIMIT ?'
+            values.append(limit)
+        with self._lock:
+            rows = self.connection.execute(sql, values).fetchall()
+        return self._attacks(names, rows)
+
+    def count(self, start: Optional[int] = None, end: Optional[int] = None, **filters) -> int:
+        """Return the number of stored attacks matching the filters (see `find`)."""
+        clauses, values = self._where(start, end, filters)
+        with self._lock:
+            return self.connection.execute(f"SELECT COUNT(*) FROM {self.table}{clauses}", values).fetchone()[0]
+
+    def hits_on_faction(self, faction_id: int, start: Optional[int] = None, end: Optional[int] = None,
+                        limit: Optional[int] = None, modifiers: bool = False) -> List[Dict[str, Any]]:
+        """Return the attacks on members of a faction, optionally within a time range."""
+        return self.find(start, end, limit, modifiers=modifiers, defender_faction=faction_id)
+
+    def hits_by_faction(self, faction_id: int, start: Optional[int] = None, end: Optional[int] = None,
+                        limit: Optional[int] = None, modifiers: bool = False) -> List[Dict[str, Any]]:
+        """Return the attacks made by members of a faction, optionally within a time range."""
+        return self.find(start, end, limit, modifiers=modifiers, attacker_faction=faction_id)
+
+    def latest_timestamp(self) -> Optional[int]:
+        """Return the newest stored `timestamp_started`, or None if the store is empty."""
+        with self._lock:
+            return self.connection.execute(f"SELECT MAX(timestamp_started) FROM {self.table}").fetchone()[0]
+
+    def _where(self, start: Optional[int], end: Optional[int], filters: Dict[str, Any]):
+        clauses, values = [], []
+        for name, value in filters.items():
+            if name not in FILTERS:
+                raise ValueError(f"Cannot filter attacks by '{name}'. Expected one of: {', '.join(FILTERS)}.")
+            clauses.append(f"{name} = ?")
+            values.append(value)
+        if start is not None:
+            clauses.append('timestamp_started >= ?')
+            values.append(start)
+        if end is not None:
+            clauses.append('timestamp_started <= ?')
+            values.append(end)
+        return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', values
+
+    @staticmethod
+    def _attacks(names, rows) -> List[Dict[str, Any]]:
+        decode = 'modifiers' in names
+        attacks = []
+        for row in rows:
+            attack = dict(zip(names, row))
+            for name in _BOOLEANS:
+                if attack[name] is not None:
+                    attack[name] = bool(attack[name])
+            if decode and attack['modifiers'] is not None:
+                attack['modifiers'] = json.loads(attack['modifiers'])
+            attacks.append(attack)
+        return attacks
+
+    def close(self):
+        if self.connection is not None:
+            self.flush()
+            self.connection.close()
+            self.connection = None
+
+    def __len__(self):
+        with self._lock:
+            return self.connection.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __repr__(self):
+        return f"AttackStore(path={self.path!r}, table={self.table!r})"
@@ -0,0 +1,210 @@
+# backfill.py
+
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from pagination import Cursor, PaginationError, fetch_page, paginate
+from sinks import write_records
+from sync import SELECTIONS
+
+DAY = 24 * 60 * 60
+
+
+def plan_shards(from_ts: int, to_ts: int, shard_seconds: int = DAY) -> List[Tuple[int, int]]:
+    """
+    Split [from_ts, to_ts] into consecutive, non-overlapping shards of `shard_seconds`.
+
+    Timestamps are whole seconds and both ends of a shard are inclusive, so no record
+    falls in two shards.
+
+    Returns:
+        list: (from_ts, to_ts) of each shard, oldest first.
+    """
+    if shard_seconds < 1:
+        raise ValueError("shard_seconds must be at least 1.")
+    shards = []
+    start = from_ts
+    while start <= to_ts:
+        end = min(start + shard_seconds - 1, to_ts)
+        shards.append((start, end))
+        start = end + 1
+    return shards
+
+
+class Backfill:
+    """
+    Fetches a long history of a timestamped selection in parallel time shards.
+
+    The range is split into shards which are fetched concurrently, each by the first free
+    worker. Every API instance (one per key) gets `workers_per_key` workers and keeps its own
+    rate limiter. Each finished shard is written, sorted, to its own file in the checkpoint
+    directory, and shards already there are not fetched again, so an interrupted backfill
+    resumes with the unfinished shards only. The output is merged from the shard files in
+    time order.
+
+    An open-ended backfill (`to_ts` None) is pinned to the end saved in the checkpoint
+    directory by the interrupted run, or to now for a new one, so a resumed run plans the
+    same shards. Once a run completes, the pin is removed, along with the file of a final
+    partial shard, and the next run extends the range to its own "now".
+
+    Args:
+        apis (TornAPI or list): The API instance(s) to spread the shards over, one per key.
+        section (str): The API section, e.g. 'user' or 'faction'.
+        id: The ID in the section, or None for the key owner.
+        selection (str): The selection, one of `sync.SELECTIONS` (e.g. 'attacks', 'revives', 'log').
+        from_ts (int): The oldest timestamp to fetch.
+        to_ts (int, optional): The newest timestamp to fetch. Defaults to now (pinned when resuming).
+        shard_seconds (int): The length of each shard. Defaults to one day.
+        workers_per_key (int): Concurrent shards per API instance. Defaults to 1.
+        checkpoint (str, optional): The directory finished shards are kept in. Without it,
+            shards are kept in a temporary directory for the duration of the run.
+        retries (int): How many times a shard is retried after a transient error. Defaults to 3.
+        retry_wait (float): Seconds to wait before the first retry, doubled for each one. Defaults to 5.
+    """
+
+    def __init__(self, apis, section: str, id, selection: str, from_ts: int, to_ts: Optional[int] = None,
+                 shard_seconds: int = DAY, workers_per_key: int = 1, checkpoint: Optional[str] = None,
+                 retries: int = 3, retry_wait: float = 5.0):
+        self.spec = SELECTIONS.get(selection)
+        if self.spec is None:
+            raise ValueError(f"Cannot backfill '{selection}'. Expected one of: {', '.join(SELECTIONS)}.")
+        self.apis = list(apis) if isinstance(apis, Sequence) else [apis]
+        if not self.apis:
+            raise ValueError("At least one API instance is required.")
+        self.section = section
+        self.id = id
+        self.selection = selection
+        self.checkpoint = checkpoint
+        self.open_ended = to_ts is None
+        self._cursor = Cursor(os.path.join(checkpoint, f"{self._prefix()}.run.json")) if checkpoint else None
+        if self._cursor is not None:
+            to_ts, _ = self._cursor.load(from_ts, to_ts)
+        self.from_ts = from_ts
+        self.to_ts = to_ts if to_ts is not None else int(time.time())
+        self.shard_seconds = shard_seconds
+        self.shards = plan_shards(from_ts, self.to_ts, shard_seconds)
+        self.workers_per_key = workers_per_key
+        self.retries = retries
+        self.retry_wait = retry_wait
+
+    def pending(self) -> List[Tuple[int, int]]:
+        """Return the shards that have not been checkpointed yet."""
+        if not self.checkpoint:
+            return list(self.shards)
+        return [shard for shard in self.shards if not os.path.exists(self._shard_path(self.checkpoint, shard))]
+
+    def iter_records(self) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+        """
+        Fetch the pending shards in parallel and yield every record, oldest first.
+
+        Records are yielded as soon as all earlier shards have finished, while later shards
+        are still being fetched.
+
+        Yields:
+            tuple: (key, record)
+
+        Raises:
+            PaginationError: If a shard fails with a non-transient error, or keeps failing
+                after all retries. Shards finished so far stay checkpointed.
+        """
+        if self.checkpoint:
+            os.makedirs(self.checkpoint, exist_ok=True)
+            self._cursor.save(self.from_ts, self.to_ts, {})
+            yield from self._run(self.checkpoint)
+            self._finish()
+        else:
+            with tempfile.TemporaryDirectory(prefix='backfill-') as directory:
+                yield from self._run(directory)
+
+    def run(self, sink) -> int:
+        """
+        Write every record to a sink, oldest first.
+
+        Args:
+            sink: A `sinks.NDJSONSink`, `sinks.SQLiteSink`, `attack_store.AttackStore` or any object
+                with write(key, record) and flush().
+
+        Returns:
+            int: The number of records written.
+        """
+        return write_records(self.iter_records(), sink, flush_every=1000)
+
+    def _run(self, directory: str) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+        workers = Queue()
+        for api in self.apis:
+            for _ in range(self.workers_per_key):
+                workers.put(api)
+
+        with ThreadPoolExecutor(max_workers=workers.qsize(), thread_name_prefix='backfill') as executor:
+            futures = [executor.submit(self._fetch_shard, workers, directory, shard) for shard in self.shards]
+            try:
+                for future in futures:
+                    yield from self._read_shard(future.result())
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def _fetch_shard(self, workers: Queue, directory: str, shard: Tuple[int, int]) -> str:
+        path = self._shard_path(directory, shard)
+        if os.path.exists(path):
+            return path
+        api = workers.get()
+        try:
+            records = self._fetch_with_retries(api, shard)
+        finally:
+            workers.put(api)
+
+        records.sort(key=lambda entry: self.spec.record_timestamp(entry[1]))
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            for key, record in records:
+                file.write(json.dumps([self.spec.record_key(key, record), record], separators=(',', ':')))
+                file.write('\n')
+        os.replace(temp_path, path)
+        return path
+
+    def _fetch_with_retries(self, api, shard: Tuple[int, int]) -> List[Tuple[Any, Dict[str, Any]]]:
+        def fetch(lower, upper):
+            parameters = {'from': lower, 'to': upper, 'limit': self.spec.page_size}
+            return fetch_page(api, self.section, self.id, self.selection, self.spec.key, parameters)
+
+        attempt = 0
+        while True:
+            try:
+                return list(paginate(fetch, shard[0], shard[1], self.spec.page_size,
+                                     self.spec.record_timestamp, self.spec.record_id))
+            except PaginationError as error:
+                if attempt >= self.retries or (error.result is not None and not error.result.retryable):
+                    raise
+                time.sleep(self.retry_wait * (2 ** attempt))
+                attempt += 1
+
+    def _finish(self):
+        # The final shard of an open-ended run ends at the pinned "now"; the next run plans a
+        # longer one, so its file would never be read again.
+        last = self.shards[-1] if self.shards else None
+        if self.open_ended and last is not None and last[1] - last[0] + 1 < self.shard_seconds:
+            os.remove(self._shard_path(self.checkpoint, last))
+        self._cursor.clear()
+
+    @staticmethod
+    def _read_shard(path: str) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+        with open(path, encoding='utf-8') as file:
+            for line in file:
+                key, record = json.loads(line)
+                yield key, record
+
+    def _prefix(self) -> str:
+        return f"{self.section}-{self.id or 'self'}-{self.selection}"
+
+    def _shard_path(self, directory: str, shard: Tuple[int, int]) -> str:
+        return os.path.join(directory, f"{self._prefix()}-{shard[0]}-{shard[1]}.ndjson")
+
+    def __repr__(self):
+        return (f"Backfill(section={self.section!r}, id={self.id!r}, selection={self.selection!r}, "
+                f"shards={len(self.shards)}, keys={len(self.apis)})")
@@ -0,0 +1,60 @@
+"""Arbitrage scan benchmark: Python loop over ItemsData against ArbitrageScanner.
+
+Builds the catalogue from the synthetic `torn/items` payload and gives every item a
+bazaar and item market minimum. Times ranking the top 20 market-value discounts with a
+loop over the Item objects (what callers did before), with ArbitrageScanner.opportunities,
+and the cost of applying one market update to the scanner.
+
+Run from the repository root:
+    python benchmarks/bench_arbitrage.py
+"""
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import payloads
+from arbitrage import ArbitrageScanner
+from section_torn import Torn
+
+
+def loop_scan(items, minimums, top=20):
+    found = []
+    for item_id, item in items.items():
+        bazaar, itemmarket = minimums[item_id]
+        prices = [price for price in (bazaar, itemmarket) if price]
+        if not prices or not item.market_value:
+            continue
+        profit = item.market_value - min(prices)
+        if profit >= 1:
+            found.append((profit, item_id))
+    found.sort(reverse=True)
+    return found[:top]
+
+
+def main(number=50):
+    rng = random.Random(4)
+    items = Torn.Items.ItemsData(payloads.items()['items']).items
+    minimums = {item_id: (rng.randint(1, 10_000_000), rng.randint(1, 10_000_000)) for item_id in items}
+
+    scanner = ArbitrageScanner(items)
+    for item_id, (bazaar, itemmarket) in minimums.items():
+        scanner.update_market(item_id, [{'cost': bazaar, 'quantity': 1}], [{'cost': itemmarket, 'quantity': 1}])
+
+    update = [{'cost': 5_000, 'quantity': 2}]
+    timings = {
+        'Python loop': lambda: loop_scan(items, minimums),
+        'ArbitrageScanner.opportunities': lambda: scanner.opportunities('market_value', top=20),
+        'ArbitrageScanner.update_market': lambda: scanner.update_market(7, update, update),
+    }
+    print(f"{len(items)} items")
+    for name, run in timings.items():
+        seconds = min(timeit.repeat(run, number=number, repeat=3)) / number
+        print(f"  {name:>31}: {seconds * 1000:7.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
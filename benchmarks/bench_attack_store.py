@@ -0,0 +1,56 @@
+"""Attack store benchmark: bulk insert and indexed lookups.
+
+Stores a synthetic attack history in a temporary SQLite file with AttackStore, then
+times "all hits on faction X in a time range" and per-attacker lookups. Filtering the
+same records in a Python list is shown for reference; it needs the whole history in
+memory, which the store does not. Selective queries are dominated by the index lookup,
+broad ones by building the result dicts; decoding the modifiers JSON of every row
+(modifiers=True) roughly doubles their cost, so it is only done when asked for.
+
+Run from the repository root:
+    python benchmarks/bench_attack_store.py [count]
+"""
+import os
+import sys
+import tempfile
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import payloads
+from attack_store import AttackStore
+
+
+def main(count=200_000, number=50):
+    records = list(payloads.attacks(count)['attacks'].values())
+    faction = records[0]['defender_faction']
+    start = records[count // 4]['timestamp_started']
+    end = records[count // 2]['timestamp_started']
+    attacker = records[count // 3]['attacker_id']
+
+    with tempfile.TemporaryDirectory() as directory, AttackStore(os.path.join(directory, 'attacks.db')) as store:
+        began = time.perf_counter()
+        store.add(records)
+        print(f"insert {count} attacks: {time.perf_counter() - began:.2f} s")
+
+        queries = {
+            'hits_on_faction(range)': (lambda: store.hits_on_faction(faction, start, end),
+                                       lambda: [r for r in records if r['defender_faction'] == faction
+                                                and start <= r['timestamp_started'] <= end]),
+            'hits_on_faction(modifiers)': (lambda: store.hits_on_faction(faction, start, end, modifiers=True),
+                                           lambda: [r for r in records if r['defender_faction'] == faction
+                                                    and start <= r['timestamp_started'] <= end]),
+            'find(attacker_id)': (lambda: store.find(attacker_id=attacker),
+                                  lambda: [r for r in records if r['attacker_id'] == attacker]),
+        }
+        for label, (indexed, scan) in queries.items():
+            stored = min(timeit.repeat(indexed, number=number, repeat=3)) / number
+            scanned = min(timeit.repeat(scan, number=number, repeat=3)) / number
+            print(f"  {label:>26}: {stored * 1000:7.2f} ms indexed, {scanned * 1000:7.2f} ms list scan "
+                  f"({len(indexed())} rows)")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
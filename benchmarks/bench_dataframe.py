@@ -0,0 +1,47 @@
+"""DataFrame construction benchmark for User.Attacks.
+
+Compares building a frame row by row from parsed ``Attack`` objects with the
+column-wise ``columns.to_dataframe`` adapter used by ``User.Attacks.to_dataframe()``.
+
+Run from the repository root:
+    python benchmarks/bench_dataframe.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+
+import columns
+import payloads
+from logger import set_record_logging
+from section_user import User
+
+NAMES = [column.name for column in columns.ATTACK_COLUMNS]
+
+
+def row_by_row(raw):
+    attacks = [User.Attacks.Attack(item) for item in raw.values()]
+    return pd.DataFrame([{name: getattr(attack, name) for name in NAMES} for attack in attacks], index=list(raw))
+
+
+def column_wise(raw):
+    ids, rows = columns.keyed_records(raw)
+    return columns.to_dataframe(rows, columns.ATTACK_COLUMNS, index=ids, index_name='attack_id')
+
+
+def main(count=50_000, repeat=3):
+    set_record_logging(False)
+    raw = payloads.attacks(count)['attacks']
+    rows = min(timeit.repeat(lambda: row_by_row(raw), number=1, repeat=repeat))
+    cols = min(timeit.repeat(lambda: column_wise(raw), number=1, repeat=repeat))
+    print(f"row-by-row: {rows * 1000:.1f} ms   column-wise: {cols * 1000:.1f} ms   ({rows / cols:.2f}x) for {count} attacks")
+    print(f"memory: {row_by_row(raw).memory_usage(deep=True).sum() / 1e6:.1f} MB -> "
+          f"{column_wise(raw).memory_usage(deep=True).sum() / 1e6:.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
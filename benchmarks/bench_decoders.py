@@ -0,0 +1,43 @@
+"""JSON decode benchmark for the available decoder backends.
+
+Decodes the raw bytes of the fixture payloads (items, attacksfull, rankedwarreport)
+with every installed backend in decoders.BACKENDS. ``response.json()`` is included
+for reference: it decodes the bytes to text and then parses it with the stdlib.
+
+Run from the repository root:
+    python benchmarks/bench_decoders.py
+"""
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import payloads
+from decoders import available_decoders, get_decoder
+
+PAYLOADS = {
+    'torn/items': payloads.items(),
+    'user/attacksfull': payloads.attacks(1000),
+    'torn/rankedwarreport': payloads.rankedwarreport(),
+}
+
+
+def main(number=20, repeat=5):
+    decoders = [get_decoder(name) for name in available_decoders()]
+    for label, payload in PAYLOADS.items():
+        body = json.dumps(payload).encode()
+        timings = {'response.json()': lambda: json.loads(body.decode('utf-8'))}
+        for decoder in decoders:
+            timings[decoder.name] = lambda loads=decoder.loads: loads(body)
+        results = {name: min(timeit.repeat(run, number=number, repeat=repeat)) / number for name, run in timings.items()}
+        baseline = results['response.json()']
+        print(f"{label} ({len(body) / 1024:.0f} KB)")
+        for name, seconds in results.items():
+            print(f"  {name:>16}: {seconds * 1000:7.2f} ms  ({baseline / seconds:.2f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+"""Import-time benchmark for the `sections` entry point.
+
+Each measurement runs in a fresh interpreter, so nothing is cached between runs:
+  * sections        - ``import sections`` (section modules are loaded on first use)
+  * sections + user - ``import sections`` and create one ``User`` section
+  * all sections    - importing every section module up front, as ``sections`` used to
+
+Run from the repository root:
+    python benchmarks/bench_import.py
+"""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASES = {
+    'sections': "import sections",
+    'sections + user': "import sections; from unittest.mock import MagicMock; sections.Sections(MagicMock()).user(1)",
+    'all sections': "import sections, section_user, section_property, section_market, section_torn",
+}
+
+
+def measure(code, repeat):
+    timer = f"import time; start = time.perf_counter(); {code}; print(time.perf_counter() - start)"
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', timer], cwd=ROOT, capture_output=True, text=True, check=True)
+        runs.append(float(output.stdout.strip().splitlines()[-1]))
+    return min(runs)
+
+
+def main(repeat=5):
+    for name, code in CASES.items():
+        print(f"{name:>16}: {measure(code, repeat) * 1000:7.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
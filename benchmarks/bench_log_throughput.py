@@ -0,0 +1,83 @@
+"""Log throughput for a burst of parses on the shared 'Sections' logger.
+
+Parses attacks with per-record DEBUG logging on and compares:
+  * duplicated - the handlers the five section modules used to attach, one file and
+                 one console handler per setup_logger('Sections') call
+  * shared     - the current idempotent setup_logger: one file handler and the
+                 process-wide console handler, however many modules set it up
+
+Run from the repository root:
+    python benchmarks/bench_log_throughput.py
+"""
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import payloads
+from logger import close_logger, setup_logger
+from section_user import User
+
+MODULES = 5  # sections.py plus the four section modules
+LOG_FILE = os.path.join('logs', 'bench_throughput.log')
+
+
+def parse(records):
+    start = time.perf_counter()
+    for record in records:
+        User.Attacks.Attack(record)
+    return time.perf_counter() - start
+
+
+def duplicated(logger, records):
+    # The shared handlers plus the pairs the other four setup_logger('Sections') calls used to add
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    extra = []
+    for _ in range(MODULES - 1):
+        file_handler = logging.FileHandler(LOG_FILE)
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(logging.WARNING)
+        for handler in (file_handler, console_handler):
+            handler.setFormatter(formatter)
+            logger.addHandler(handler)
+            extra.append(handler)
+    elapsed = parse(records)
+    for handler in extra:
+        logger.removeHandler(handler)
+        handler.close()
+    return elapsed
+
+
+def shared(logger, records):
+    return parse(records)
+
+
+def lines_written():
+    with open(LOG_FILE) as f:
+        count = sum(1 for _ in f)
+    os.remove(LOG_FILE)
+    return count
+
+
+def main(count=5_000):
+    records = list(payloads.attacks(count)['attacks'].values())
+    # Every section module calls setup_logger('Sections'); these calls return the same handler
+    setups = [setup_logger('Sections', logging.DEBUG) for _ in range(MODULES)]
+    logger, file_handler = setups[0]
+    # Write to the benchmark file instead of logs/Sections.log
+    file_handler.close()
+    file_handler.baseFilename = os.path.abspath(LOG_FILE)
+    for name, run in (('duplicated', duplicated), ('shared', shared)):
+        elapsed = run(logger, records)
+        file_handler.close()
+        print(f"{name:>10}: {elapsed * 1000:8.1f} ms, {count / elapsed:9.0f} records/s, "
+              f"{lines_written()} lines written for {count} records")
+    for log, handler in setups:
+        close_logger(log, handler)
+
+
+if __name__ == '__main__':
+    main()
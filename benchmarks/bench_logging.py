@@ -0,0 +1,45 @@
+"""Hot-path cost of logging full responses, synchronous vs queued.
+
+Logs "Response data: %s" for a large attacks payload at INFO, the way
+``TornAPI.make_request`` does, and reports the time spent on the calling thread:
+  * sync   - setup_logger(..., queued=False): formatting and file writes inline
+  * queued - setup_logger(..., queued=True): records handed to the listener thread
+
+Run from the repository root:
+    python benchmarks/bench_logging.py
+"""
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import payloads
+from logger import setup_logger, close_logger
+
+
+def run(queued, response, calls):
+    name = f"bench_logging_{'queued' if queued else 'sync'}"
+    log, handler = setup_logger(name, logging.INFO, queued=queued)
+    start = time.perf_counter()
+    for _ in range(calls):
+        log.info("Response data: %s", response)
+    caller = time.perf_counter() - start
+    close_logger(log, handler)
+    total = time.perf_counter() - start
+    os.remove(os.path.join('logs', f'{name}.log'))
+    return caller, total, getattr(handler, 'dropped', 0)
+
+
+def main(calls=50, attacks=1_000):
+    response = payloads.attacks(attacks)
+    for queued in (False, True):
+        caller, total, dropped = run(queued, response, calls)
+        print(f"{'queued' if queued else 'sync':>6}: {caller * 1000:8.1f} ms on the caller, "
+              f"{total * 1000:8.1f} ms until flushed, {dropped} dropped ({calls} responses of {attacks} attacks)")
+
+
+if __name__ == '__main__':
+    main()
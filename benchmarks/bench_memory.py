@@ -0,0 +1,67 @@
+"""Memory benchmark for the slotted record classes.
+
+Builds the same records with the slotted section classes and with an equivalent
+``__dict__``-based copy of each class, and reports the traced allocation size.
+
+Run from the repository root:
+    python benchmarks/bench_memory.py [attack_count]
+"""
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import payloads
+from section_user import User
+from section_torn import Torn
+from section_market import Market
+
+
+def unslotted(cls):
+    """Return a copy of `cls` without ``__slots__`` so instances carry a ``__dict__``."""
+    namespace = {key: value for key, value in vars(cls).items()
+                 if key not in ('__slots__', '__dict__', '__weakref__') and key not in cls.__slots__}
+    return type(cls.__name__, (), namespace)
+
+
+def measure(build):
+    """Return the bytes still allocated after calling `build` (result kept alive)."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def main(attack_count=100_000):
+    attacks = list(payloads.attacks(attack_count)['attacks'].values())
+    items = list(payloads.items()['items'].values())
+    listings = payloads.bazaar(1000)['bazaar']
+    members = [member for faction in payloads.rankedwarreport(500)['rankedwarreport']['factions'].values()
+               for member in faction['members'].values()]
+
+    cases = [
+        ('User.Attacks.Attack', User.Attacks.Attack, attacks),
+        ('User.AttacksFull.AttackFull', User.AttacksFull.AttackFull, attacks),
+        ('Torn.Items.ItemsData.Item', Torn.Items.ItemsData.Item, items),
+        ('Market.Bazaar.BazaarData.BazaarItem', Market.Bazaar.BazaarData.BazaarItem, listings),
+        ('RankedWarReport Faction.User', Torn.RankedWarReport.RankedWarReportData.Faction.User, members),
+    ]
+
+    print(f"{'record class':<40}{'records':>10}{'dict (KiB)':>14}{'slots (KiB)':>14}{'saved':>8}")
+    for name, cls, records in cases:
+        plain = unslotted(cls)
+        # Nested records (e.g. Item.Coverage) stay slotted in both runs; only the outer class differs.
+        before = measure(lambda: [plain(record) for record in records])
+        after = measure(lambda: [cls(record) for record in records])
+        print(f"{name:<40}{len(records):>10}{before / 1024:>14.1f}{after / 1024:>14.1f}"
+              f"{(1 - after / before) * 100:>7.1f}%")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,55 @@
+"""Order book benchmark: fill-cost queries against sorting and scanning the listings.
+
+Builds an OrderBook from a synthetic item market snapshot and times "cost to buy N units"
+for many N, compared with sorting the MarketItem list and scanning it for every query (what
+callers of CombinedMarketData did before). Also times applying a new snapshot in which a
+few levels changed.
+
+Run from the repository root:
+    python benchmarks/bench_order_book.py [listings]
+"""
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from order_book import OrderBook
+
+
+def sort_and_scan(listings, units):
+    cost = 0
+    for listing in sorted(listings, key=lambda listing: listing['cost']):
+        take = min(units, listing['quantity'])
+        cost += take * listing['cost']
+        units -= take
+        if not units:
+            return cost
+    return None
+
+
+def main(count=5000, queries=200, number=5):
+    rng = random.Random(1)
+    listings = [{'cost': rng.randint(1_000, 100_000), 'quantity': rng.randint(1, 20)} for _ in range(count)]
+    sizes = [rng.randint(1, count * 5) for _ in range(queries)]
+    book = OrderBook(listings)
+
+    updated = [dict(listing) for listing in listings]
+    for listing in rng.sample(updated, 10):
+        listing['quantity'] = rng.randint(0, 20)
+
+    timings = {
+        'sort and scan': lambda: [sort_and_scan(listings, n) for n in sizes],
+        'OrderBook.fill_cost': lambda: [book.fill_cost(n) for n in sizes],
+        'OrderBook(listings)': lambda: OrderBook(listings),
+        'OrderBook.update': lambda: (book.update(updated), book.update(listings), book.fill_cost(1)),
+    }
+    print(f"{count} listings, {queries} queries")
+    for name, run in timings.items():
+        seconds = min(timeit.repeat(run, number=number, repeat=3)) / number
+        print(f"  {name:>20}: {seconds * 1000:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
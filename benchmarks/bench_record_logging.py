@@ -0,0 +1,76 @@
+"""Parse-time benchmark for per-record debug logging at WARNING level.
+
+Compares, per payload:
+  * eager    - parsing plus the f-string repr formatting every record used to pay
+               (``logger.debug(f"Processed X: {self}")`` builds the string even when DEBUG is off)
+  * deferred - parsing with ``record_logger.debug("Processed X: %s", self)`` (current code)
+  * disabled - parsing with per-record logging turned off via ``set_record_logging(False)``
+
+Run from the repository root:
+    python benchmarks/bench_record_logging.py
+"""
+import logging
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import payloads
+from logger import set_record_logging
+from section_user import User
+from section_torn import Torn
+
+
+def eager_repr_cost(objects):
+    """Format every record the way the old f-string log calls did."""
+    for obj in objects:
+        f"Processed record: {obj}"
+
+
+def main(repeat=5):
+    logging.getLogger('Sections').setLevel(logging.WARNING)
+
+    attacks = payloads.attacks(1000)['attacks']
+    report = payloads.rankedwarreport(500)['rankedwarreport']
+    items = payloads.items()['items']
+
+    def parse_attacks():
+        return [User.Attacks.Attack(record) for record in attacks.values()]
+
+    def parse_report():
+        return Torn.RankedWarReport.RankedWarReportData(report)
+
+    def parse_items():
+        return Torn.Items.ItemsData(items)
+
+    def report_objects(data):
+        # The old code formatted the report, every faction, member, reward and item.
+        objects = [data, data.war]
+        for faction in data.factions.values():
+            objects += [faction, faction.rewards, *faction.members.values(), *faction.rewards.items.values()]
+        return objects
+
+    cases = [
+        ('attacks (1000)', parse_attacks, lambda result: result),
+        ('rankedwarreport (2x500)', parse_report, report_objects),
+        ('items (1200)', parse_items, lambda result: [result]),
+    ]
+
+    print(f"{'payload':<26}{'eager ms':>10}{'deferred ms':>13}{'disabled ms':>13}{'speedup':>9}")
+    for name, parse, formatted in cases:
+        objects = formatted(parse())
+        set_record_logging(True)
+        deferred = min(timeit.repeat(parse, number=10, repeat=repeat)) / 10
+        formatting = min(timeit.repeat(lambda: eager_repr_cost(objects), number=10, repeat=repeat)) / 10
+        set_record_logging(False)
+        disabled = min(timeit.repeat(parse, number=10, repeat=repeat)) / 10
+        set_record_logging(True)
+        eager = deferred + formatting
+        print(f"{name:<26}{eager * 1000:>10.2f}{deferred * 1000:>13.2f}{disabled * 1000:>13.2f}"
+              f"{eager / disabled:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""Constructor benchmark for the schema-generated data models.
+
+Compares the generated ``User.Attacks.Attack.__init__`` with the hand-written
+constructor it replaced, on the same slotted class layout.
+
+Run from the repository root:
+    python benchmarks/bench_schema.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import payloads
+from logger import set_record_logging
+from section_user import User, record_logger
+
+
+class HandWrittenAttack:
+    __slots__ = User.Attacks.Attack.__slots__
+
+    def __init__(self, data):
+        self.attacker_faction = data.get('attacker_faction', 0)
+        self.attacker_factionname = data.get('attacker_factionname', '')
+        self.attacker_id = data.get('attacker_id', 0)
+        self.attacker_name = data.get('attacker_name', '')
+        self.chain = data.get('chain', 0)
+        self.code = data.get('code', '')
+        self.defender_faction = data.get('defender_faction', 0)
+        self.defender_factionname = data.get('defender_factionname', '')
+        self.defender_id = data.get('defender_id', 0)
+        self.defender_name = data.get('defender_name', '')
+        self.modifiers = data.get('modifiers', {})
+        self.raid = bool(data.get('raid', 0))
+        self.ranked_war = bool(data.get('ranked_war', 0))
+        self.respect = data.get('respect', 0.0)
+        self.respect_gain = data.get('respect_gain', 0.0)
+        self.respect_loss = data.get('respect_loss', 0.0)
+        self.result = data.get('result', '')
+        self.stealthed = bool(data.get('stealthed', 0))
+        self.timestamp_ended = data.get('timestamp_ended', 0)
+        self.timestamp_started = data.get('timestamp_started', 0)
+        record_logger.debug("Processed Attack: %s", self)
+
+
+def main(count=10_000, repeat=5):
+    set_record_logging(False)
+    records = list(payloads.attacks(count)['attacks'].values())
+    hand = min(timeit.repeat(lambda: [HandWrittenAttack(r) for r in records], number=5, repeat=repeat)) / 5
+    generated = min(timeit.repeat(lambda: [User.Attacks.Attack(r) for r in records], number=5, repeat=repeat)) / 5
+    print(f"hand-written: {hand * 1000:.2f} ms   generated: {generated * 1000:.2f} ms   "
+          f"({hand / generated:.2f}x) for {count} attacks")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,30 @@
+"""Construction benchmark for the User and Torn sections.
+
+Measures building one section per faction member and fetching a single selection
+(``user.profile``), which now only constructs the selection object that is used.
+
+Run from the repository root:
+    python benchmarks/bench_sections.py
+"""
+import logging
+import os
+import sys
+import timeit
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from section_user import User
+from section_torn import Torn
+
+
+def main(members=2_000, repeat=5):
+    logging.getLogger('Sections').setLevel(logging.INFO)
+    api = MagicMock()
+    user = min(timeit.repeat(lambda: [User(api, member).profile for member in range(members)], number=1, repeat=repeat))
+    torn = min(timeit.repeat(lambda: [Torn(api, member).stats for member in range(members)], number=1, repeat=repeat))
+    print(f"User(...).profile: {user * 1000:.1f} ms   Torn(...).stats: {torn * 1000:.1f} ms   for {members} sections")
+
+
+if __name__ == '__main__':
+    main()
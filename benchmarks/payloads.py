@@ -0,0 +1,99 @@
+"""Synthetic Torn API payloads shaped like real responses, used by the benchmarks."""
+import random
+
+RESULTS = ['Attacked', 'Mugged', 'Hospitalized', 'Lost', 'Stalemate', 'Escape', 'Assist']
+FACTIONS = [(1000 + i, f"Faction {i}") for i in range(40)]
+ITEM_TYPES = ['Melee', 'Primary', 'Secondary', 'Defensive', 'Medical', 'Drug', 'Candy', 'Booster']
+
+
+def attacks(count=1000, seed=1, start=1_700_000_000):
+    """Return an `attacks`/`attacksfull` payload with `count` records keyed by attack ID."""
+    rng = random.Random(seed)
+    records = {}
+    for i in range(count):
+        attacker_faction, attacker_factionname = rng.choice(FACTIONS)
+        defender_faction, defender_factionname = rng.choice(FACTIONS)
+        started = start + i * 60
+        records[str(10_000_000 + i)] = {
+            'code': f"{i:032x}",
+            'timestamp_started': started,
+            'timestamp_ended': started + rng.randint(5, 300),
+            'attacker_id': rng.randint(1, 3_000_000),
+            'attacker_name': f"attacker{i}",
+            'attacker_faction': attacker_faction,
+            'attacker_factionname': attacker_factionname,
+            'defender_id': rng.randint(1, 3_000_000),
+            'defender_name': f"defender{i}",
+            'defender_faction': defender_faction,
+            'defender_factionname': defender_factionname,
+            'result': rng.choice(RESULTS),
+            'stealthed': rng.randint(0, 1),
+            'respect': round(rng.uniform(0, 10), 2),
+            'chain': rng.randint(0, 1000),
+            'raid': 0,
+            'ranked_war': rng.randint(0, 1),
+            'respect_gain': round(rng.uniform(0, 10), 2),
+            'respect_loss': 0,
+            'modifiers': {'fair_fight': 3, 'war': 1, 'retaliation': 1, 'group_attack': 1,
+                          'overseas': 1, 'chain_bonus': 1},
+        }
+    return {'attacks': records}
+
+
+def items(count=1200, seed=2):
+    """Return a `torn/items` payload with `count` catalogue entries."""
+    rng = random.Random(seed)
+    records = {}
+    for i in range(1, count + 1):
+        records[str(i)] = {
+            'name': f"Item {i}",
+            'description': f"Description of item {i}. " * 4,
+            'effect': '',
+            'requirement': '',
+            'image': f"https://www.torn.com/images/items/{i}/large.png",
+            'type': rng.choice(ITEM_TYPES),
+            'weapon_type': None,
+            'buy_price': rng.randint(0, 100_000),
+            'sell_price': rng.randint(0, 50_000),
+            'market_value': rng.randint(0, 10_000_000),
+            'circulation': rng.randint(0, 5_000_000),
+            'coverage': {'Full Body Coverage': 0, 'Head Coverage': 0},
+        }
+    return {'items': records}
+
+
+def bazaar(count=100, seed=3):
+    """Return a `market/bazaar` payload with `count` listings."""
+    rng = random.Random(seed)
+    return {'bazaar': [{'ID': i, 'cost': rng.randint(100, 10_000), 'quantity': rng.randint(1, 50)}
+                       for i in range(count)]}
+
+
+def rankedwarreport(members_per_faction=100, seed=4):
+    """Return a `torn/rankedwarreport` payload for two factions."""
+    rng = random.Random(seed)
+    factions = {}
+    for faction_id, name in FACTIONS[:2]:
+        factions[str(faction_id)] = {
+            'name': name,
+            'score': rng.randint(0, 10_000),
+            'attacks': rng.randint(0, 5_000),
+            'rank_before': 'Gold II',
+            'rank_after': 'Gold III',
+            'rewards': {'respect': 1000, 'points': 100,
+                        'items': {'370': {'name': 'Armor Cache', 'quantity': 2}}},
+            'members': {str(faction_id * 1000 + m): {'name': f"member{m}", 'level': rng.randint(1, 100),
+                                                     'attacks': rng.randint(0, 200),
+                                                     'score': round(rng.uniform(0, 500), 2),
+                                                     'faction_id': faction_id}
+                        for m in range(members_per_faction)},
+        }
+    return {'rankedwarreport': {'factions': factions,
+                                'war': {'start': 1_700_000_000, 'end': 1_700_100_000,
+                                        'winner': FACTIONS[0][0], 'forfeit': 0}}}
+
+
+def personalstats(seed=5):
+    """Return a `user/personalstats` payload with a few hundred numeric stats."""
+    rng = random.Random(seed)
+    return {'personalstats': {f"stat{i}": rng.randint(0, 1_000_000) for i in range(300)}}
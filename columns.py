@@ -0,0 +1,267 @@
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+# NumPy and pandas are optional and slow to import, so they are only loaded by the first
+# columnar export or DataFrame adapter that needs them.
+np = None
+pd = None
+
+
+class Column:
+    """Describes one typed column of a columnar export.
+
+    Args:
+        name (str): The column name in the output.
+        dtype (str): The NumPy dtype, e.g. 'i8', 'f8', '?', 'U' for strings or 'O' for nested values.
+        default (Any): The value used when the key is missing or null, or (for numeric and
+            boolean columns) an empty string, which the API sends for e.g. stealthed attackers.
+        key (str, optional): The response key, when it differs from `name`.
+        categorical (bool): Encode as a pandas categorical (for repeated strings like faction names).
+        timestamp (bool): Epoch seconds, converted to UTC datetimes in DataFrames.
+    """
+    __slots__ = ('name', 'dtype', 'default', 'key', 'categorical', 'timestamp')
+
+    def __init__(self, name: str, dtype: str, default: Any = 0, key: str = None,
+                 categorical: bool = False, timestamp: bool = False):
+        self.name = name
+        self.dtype = dtype
+        self.default = default
+        self.key = name if key is None else key
+        self.categorical = categorical
+        self.timestamp = timestamp
+
+    def __repr__(self):
+        return f"Column(name={self.name!r}, dtype={self.dtype!r})"
+
+
+ATTACK_COLUMNS = (
+    Column('code', 'U', ''),
+    Column('timestamp_started', 'i8', timestamp=True),
+    Column('timestamp_ended', 'i8', timestamp=True),
+    Column('attacker_id', 'i8'),
+    Column('attacker_name', 'U', ''),
+    Column('attacker_faction', 'i8'),
+    Column('attacker_factionname', 'U', '', categorical=True),
+    Column('defender_id', 'i8'),
+    Column('defender_name', 'U', ''),
+    Column('defender_faction', 'i8'),
+    Column('defender_factionname', 'U', '', categorical=True),
+    Column('result', 'U', '', categorical=True),
+    Column('stealthed', '?', False),
+    Column('raid', '?', False),
+    Column('ranked_war', '?', False),
+    Column('chain', 'i8'),
+    Column('respect', 'f8', 0.0),
+    Column('respect_gain', 'f8', 0.0),
+    Column('respect_loss', 'f8', 0.0),
+)
+
+ATTACK_FULL_COLUMNS = (
+    Column('code', 'U', ''),
+    Column('timestamp_started', 'i8', timestamp=True),
+    Column('timestamp_ended', 'i8', timestamp=True),
+    Column('attacker_id', 'i8'),
+    Column('attacker_faction', 'i8'),
+    Column('defender_id', 'i8'),
+    Column('defender_faction', 'i8'),
+    Column('result', 'U', '', categorical=True),
+    Column('stealthed', '?', False),
+    Column('respect', 'f8', 0.0),
+)
+
+REVIVE_COLUMNS = (
+    Column('timestamp', 'i8', timestamp=True),
+    Column('reviver_id', 'i8'),
+    Column('reviver_name', 'U', ''),
+    Column('reviver_faction', 'i8'),
+    Column('reviver_factionname', 'U', '', categorical=True),
+    Column('target_id', 'i8'),
+    Column('target_name', 'U', ''),
+    Column('target_faction', 'i8'),
+    Column('target_factionname', 'U', '', categorical=True),
+    Column('target_hospital_reason', 'U', '', categorical=True),
+    Column('chance', 'f8', 0.0),
+    Column('result', 'U', '', categorical=True),
+)
+
+REVIVE_FULL_COLUMNS = (
+    Column('timestamp', 'i8', timestamp=True),
+    Column('reviver_id', 'i8'),
+    Column('reviver_faction', 'i8'),
+    Column('target_id', 'i8'),
+    Column('target_faction', 'i8'),
+    Column('target_hospital_reason', 'U', '', categorical=True),
+    Column('chance', 'f8', 0.0),
+    Column('result', 'U', '', categorical=True),
+)
+
+EVENT_COLUMNS = (
+    Column('timestamp', 'i8', timestamp=True),
+    Column('event', 'U', ''),
+)
+
+MESSAGE_COLUMNS = (
+    Column('timestamp', 'i8', timestamp=True),
+    Column('name', 'U', '', categorical=True),
+    Column('type', 'U', '', categorical=True),
+    Column('title', 'U', ''),
+    Column('seen', '?', False),
+    Column('read', '?', False),
+)
+
+LOG_COLUMNS = (
+    Column('timestamp', 'i8', timestamp=True),
+    Column('log', 'i8'),
+    Column('title', 'U', '', categorical=True),
+    Column('category', 'U', '', categorical=True),
+    Column('data', 'O', None),
+    Column('params', 'O', None),
+)
+
+LISTING_COLUMNS = (
+    Column('cost', 'i8'),
+    Column('quantity', 'i8'),
+)
+
+STOCK_COLUMNS = (
+    Column('name', 'U', ''),
+    Column('acronym', 'U', ''),
+    Column('current_price', 'f8', 0.0),
+    Column('market_cap', 'i8'),
+    Column('total_shares', 'i8'),
+    Column('investors', 'i8'),
+)
+
+STOCK_HISTORY_COLUMNS = (
+    Column('stock_id', 'i8'),
+    Column('timestamp', 'i8', timestamp=True),
+    Column('price', 'f8', 0.0),
+    Column('change', 'f8', 0.0),
+)
+
+
+def _require_numpy():
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("NumPy is required for columnar exports. Install it with 'pip install numpy'.") from None
+        np = numpy
+
+
+def _require_pandas():
+    global pd
+    if pd is None:
+        try:
+            import pandas
+        except ImportError:
+            raise ImportError("pandas is required for DataFrame adapters. Install it with 'pip install pandas'.") from None
+        pd = pandas
+
+
+def records(raw: Any) -> List[Dict[str, Any]]:
+    """Return the records of a list-shaped selection, whether the API keyed them by ID or not."""
+    if not raw:
+        return []
+    if isinstance(raw, dict):
+        return list(raw.values())
+    return list(raw)
+
+
+def keyed_records(raw: Any) -> Tuple[List[str], List[Dict[str, Any]]]:
+    """Split a selection keyed by record ID (events, messages, log) into its IDs and records."""
+    if not raw:
+        return [], []
+    if isinstance(raw, dict):
+        return list(raw.keys()), list(raw.values())
+    return list(range(len(raw))), list(raw)
+
+
+def stock_history_records(stocks: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Flatten the `history` lists of a `torn/stocks` response into records tagged with `stock_id`."""
+    flattened = []
+    for stock_id, stock in (stocks or {}).items():
+        stock_id = stock.get('stock_id') or int(stock_id)
+        for point in stock.get('history') or ():
+            flattened.append({'stock_id': stock_id, **point})
+    return flattened
+
+
+def as_columns(rows: Sequence[Dict[str, Any]], columns: Iterable[Column]) -> Dict[str, Any]:
+    """Build one typed NumPy array per column straight from raw response records.
+
+    No per-record model objects are created; each column is filled in a single pass.
+    Empty strings in numeric and boolean columns are replaced by the column default.
+
+    Args:
+        rows (Sequence[dict]): The raw records, e.g. ``columns.records(response['attacks'])``.
+        columns (Iterable[Column]): The column specification.
+
+    Returns:
+        dict: A mapping of column name to ``numpy.ndarray``.
+    """
+    _require_numpy()
+    count = len(rows)
+    result = {}
+    for column in columns:
+        key, default = column.key, column.default
+        values = (row.get(key) for row in rows)
+        values = (default if value is None else value for value in values)
+        if column.dtype == 'U':
+            result[column.name] = np.array(list(values), dtype=str) if count else np.empty(0, dtype='U1')
+        elif column.dtype == 'O':
+            array = np.empty(count, dtype=object)
+            array[:] = list(values)
+            result[column.name] = array
+        else:
+            values = (default if value == '' else value for value in values)
+            result[column.name] = np.fromiter(values, dtype=column.dtype, count=count)
+    return result
+
+
+def to_numpy(rows: Sequence[Dict[str, Any]], columns: Iterable[Column]):
+    """Build a NumPy structured array (one field per column) from raw response records.
+
+    Args:
+        rows (Sequence[dict]): The raw records.
+        columns (Iterable[Column]): The column specification.
+
+    Returns:
+        numpy.ndarray: A structured array with one element per record.
+    """
+    arrays = as_columns(rows, columns)
+    dtype: List[Tuple[str, Any]] = [(name, array.dtype) for name, array in arrays.items()]
+    result = np.empty(len(rows), dtype=dtype)
+    for name, array in arrays.items():
+        result[name] = array
+    return result
+
+
+def to_dataframe(rows: Sequence[Dict[str, Any]], columns: Iterable[Column], index: Sequence[Any] = None,
+                 index_name: str = None):
+    """Build a pandas DataFrame column-wise from raw response records.
+
+    Timestamp columns become UTC datetimes and categorical columns (faction names, results,
+    log categories...) are dictionary-encoded, so large frames stay small and fast to group.
+
+    Args:
+        rows (Sequence[dict]): The raw records.
+        columns (Iterable[Column]): The column specification.
+        index (Sequence, optional): Record IDs to use as the frame index (e.g. event UUIDs).
+        index_name (str, optional): The name of the index.
+
+    Returns:
+        pandas.DataFrame: One row per record.
+    """
+    _require_pandas()
+    data = {}
+    for column in columns:
+        if column.dtype in ('U', 'O'):
+            # Strings stay Python objects; a fixed-width NumPy copy would only be thrown away.
+            values = [column.default if value is None else value for value in (row.get(column.key) for row in rows)]
+            data[column.name] = pd.Categorical(values) if column.categorical else values
+            continue
+        array = as_columns(rows, (column,))[column.name]
+        data[column.name] = pd.to_datetime(array, unit='s', utc=True) if column.timestamp else array
+    frame = pd.DataFrame(data, index=pd.Index(index, name=index_name) if index is not None else None)
+    return frame
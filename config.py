@@ -0,0 +1,120 @@
+# config.py
+
+import os
+from threading import Lock
+from typing import Any, Dict, Optional, Union
+from env_loader import load_environment_variables
+
+
+class Config:
+    """
+    Process-wide settings: the debug level, the API keys for each access level and the
+    response logging policy.
+
+    Args:
+        debug_level (str): The logging level name, e.g. 'WARNING' or 'DEBUG'.
+        api_keys (dict): API keys by access level ('full', 'limited', 'min', 'public').
+        response_log (str): The response logging policy, see `response_log.ResponseLogPolicy.parse`.
+            Defaults to 'full'.
+    """
+    __slots__ = ('debug_level', 'api_keys', 'response_log')
+
+    def __init__(self, debug_level: str = 'WARNING', api_keys: Optional[Dict[str, Optional[str]]] = None,
+                 response_log: str = 'full'):
+        self.debug_level = (debug_level or 'WARNING').upper()
+        self.api_keys = dict(api_keys or {})
+        self.response_log = response_log or 'full'
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Config':
+        """
+        Build a configuration from a dictionary, without reading any file.
+
+        Args:
+            data (dict): Either the `load_environment_variables()` shape ('DEBUG_LEVEL', 'API_KEYS',
+                optionally 'RESPONSE_LOG') or the attribute names ('debug_level', 'api_keys', 'response_log').
+
+        Returns:
+            Config: The configuration.
+        """
+        debug_level = data.get('DEBUG_LEVEL', data.get('debug_level', 'WARNING'))
+        api_keys = data.get('API_KEYS', data.get('api_keys'))
+        response_log = data.get('RESPONSE_LOG', data.get('response_log', 'full'))
+        return cls(debug_level, api_keys, response_log)
+
+    @classmethod
+    def from_env(cls, env_file: str = '.env') -> 'Config':
+        """
+        Build a configuration from a .env file and the process environment.
+
+        Args:
+            env_file (str): The path to the .env file. Defaults to '.env'.
+
+        Returns:
+            Config: The configuration.
+
+        Raises:
+            ValueError: If the environment variables could not be loaded.
+        """
+        env = load_environment_variables(env_file)
+        if env is None:
+            raise ValueError("Failed to load environment variables.")
+        env.setdefault('RESPONSE_LOG', os.getenv('RESPONSE_LOG', 'full'))
+        return cls.from_dict(env)
+
+    def api_key(self, access_level: str) -> Optional[str]:
+        """Return the API key for an access level, or None if it is not configured."""
+        return self.api_keys.get(access_level)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the configuration in the `load_environment_variables()` shape."""
+        return {'DEBUG_LEVEL': self.debug_level, 'API_KEYS': dict(self.api_keys), 'RESPONSE_LOG': self.response_log}
+
+    def __repr__(self):
+        # Never include the keys themselves.
+        configured = sorted(level for level, key in self.api_keys.items() if key)
+        return f"Config(debug_level={self.debug_level!r}, api_keys={configured})"
+
+
+_config: Optional[Config] = None
+_lock = Lock()
+
+
+def get_config(env_file: str = '.env') -> Config:
+    """
+    Return the process configuration, loading it from `env_file` on the first call only.
+
+    Later calls return the same object without touching disk. Use `set_config` to provide
+    the configuration directly (e.g. in worker processes or tests).
+
+    Args:
+        env_file (str): The .env file read on the first call. Defaults to '.env'.
+
+    Returns:
+        Config: The shared configuration.
+    """
+    global _config
+    if _config is None:
+        with _lock:
+            if _config is None:
+                _config = Config.from_env(env_file)
+    return _config
+
+
+def set_config(config: Union[Config, Dict[str, Any], None]) -> Optional[Config]:
+    """
+    Replace the process configuration.
+
+    Args:
+        config (Config, dict or None): The new configuration. A dict is passed to
+            `Config.from_dict`; None clears it so the next `get_config` reloads from disk.
+
+    Returns:
+        Config: The configuration now in use, or None if it was cleared.
+    """
+    global _config
+    if isinstance(config, dict):
+        config = Config.from_dict(config)
+    with _lock:
+        _config = config
+    return _config
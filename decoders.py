@@ -0,0 +1,81 @@
+# decoders.py
+
+import importlib
+import json
+from typing import Any, Callable, Optional, Union
+
+# Backends in order of preference when none is requested.
+BACKENDS = ('orjson', 'msgspec', 'json')
+
+
+class Decoder:
+    """
+    A JSON decoding backend for API response bodies.
+
+    `loads` takes the raw body as bytes, so backends that parse bytes directly (orjson,
+    msgspec) never build an intermediate text string.
+
+    Args:
+        name (str): The backend name, e.g. 'orjson'.
+        loads (callable): Decodes bytes (or str) into Python objects.
+        error (type): The exception `loads` raises for invalid JSON. Defaults to ValueError.
+    """
+    __slots__ = ('name', 'loads', 'error')
+
+    def __init__(self, name: str, loads: Callable[[Union[bytes, str]], Any], error: type = ValueError):
+        self.name = name
+        self.loads = loads
+        self.error = error
+
+    def __repr__(self):
+        return f"Decoder(name={self.name!r})"
+
+
+def _load_backend(name: str) -> Decoder:
+    if name == 'orjson':
+        return Decoder('orjson', importlib.import_module('orjson').loads)
+    if name == 'msgspec':
+        msgspec = importlib.import_module('msgspec')
+        return Decoder('msgspec', importlib.import_module('msgspec.json').decode, msgspec.DecodeError)
+    if name == 'json':
+        return Decoder('json', json.loads)
+    raise ValueError(f"Unknown JSON decoder '{name}'. Expected one of: {', '.join(BACKENDS)}.")
+
+
+def available_decoders():
+    """Return the names of the installed backends, in order of preference."""
+    names = []
+    for name in BACKENDS:
+        try:
+            _load_backend(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def get_decoder(name: Optional[Union[str, Decoder]] = None) -> Decoder:
+    """
+    Return a JSON decoder.
+
+    Args:
+        name (str or Decoder, optional): 'orjson', 'msgspec' or 'json'. Defaults to the
+            fastest installed backend (falling back to the standard library).
+
+    Returns:
+        Decoder: The decoder.
+
+    Raises:
+        ValueError: If the name is unknown.
+        ImportError: If the requested backend is not installed.
+    """
+    if isinstance(name, Decoder):
+        return name
+    if name:
+        return _load_backend(name)
+    for backend in BACKENDS:
+        try:
+            return _load_backend(backend)
+        except ImportError:
+            continue
+    return _load_backend('json')
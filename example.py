@@ -2,14 +2,12 @@ from tornApi import TornAPI
 from sections import Sections
 from typing import Dict, Any, Optional
 from tornApi import TornAPI
-from env_loader import load_environment_variables
+from config import get_config
 from logger import setup_logger, close_logger
 
-env = load_environment_variables()
-if env is None:
-    raise ValueError("Failed to load environment variables.")
-logger, file_handler = setup_logger('Example', env['DEBUG_LEVEL'])
-logger.info("env loaded : %s", env)
+config = get_config()
+logger, file_handler = setup_logger('Example', config.debug_level)
+logger.info("config loaded : %s", config)
 api = TornAPI(access_level='full')
 sections = Sections(api)
 user = sections.user('')
@@ -1,55 +1,222 @@
+import atexit
+import copy
 import logging
+import logging.handlers
 import os
+import queue
+import threading
 
-def setup_logger(name='my_logger', level=logging.CRITICAL):
+# Defaults for setup_logger(queued=None); changed with set_queued_logging().
+_queue_options = {'enabled': False, 'max_size': 10000, 'drop': 'newest'}
+
+# Loggers set up by setup_logger, by name: the logger, its handler and how many callers hold it.
+_registry = {}
+_registry_lock = threading.RLock()
+_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_console = None
+
+class _Listener(logging.handlers.QueueListener):
+    def enqueue_sentinel(self):
+        # Wait for room so stopping a listener with a full queue still flushes it.
+        self.queue.put(self._sentinel)
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Hands records to a background thread that formats and writes them.
+
+    The logging thread only puts a copy of the record on a bounded queue and never
+    waits: when the queue is full, a record is dropped according to the drop policy
+    and counted in `dropped`. Message formatting happens on the listener thread, so
+    log arguments are formatted after the call returns; pass values that are not
+    changed afterwards (as the API's response logging does).
+
+    Args:
+        handlers (list): The handlers that write the records (file, console...).
+        max_size (int): The maximum number of queued records. Default is 10000.
+        drop (str): 'newest' discards the incoming record, 'oldest' discards the
+            longest-queued one. Default is 'newest'.
+    """
+
+    def __init__(self, handlers, max_size=10000, drop='newest'):
+        if drop not in ('newest', 'oldest'):
+            raise ValueError("drop must be 'newest' or 'oldest'")
+        super().__init__(queue.Queue(max_size))
+        self.handlers = list(handlers)
+        self.drop = drop
+        self.dropped = 0
+        self.listener = _Listener(self.queue, *self.handlers, respect_handler_level=True)
+        self.listener.start()
+        self._running = True
+        atexit.register(self.close)
+
+    def prepare(self, record):
+        # The base class formats the message here, on the logging thread. Queue a shallow
+        # copy instead, so other handlers of the record are unaffected, and leave the
+        # formatting to the listener's handlers.
+        return copy.copy(record)
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+        if self.drop == 'oldest':
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                pass
+        self.dropped += 1
+
+    def close(self):
+        """Flushes queued records, stops the listener and closes the handlers."""
+        if self._running:
+            self._running = False
+            self.listener.stop()
+            for handler in self.handlers:
+                if handler is not _console:  # The console handler is shared with other loggers
+                    handler.close()
+            atexit.unregister(self.close)
+        super().close()
+
+def set_queued_logging(enabled=True, max_size=10000, drop='newest'):
+    """Makes setup_logger use a background queue by default.
+
+    Only affects loggers set up afterwards, so call it before creating the API or
+    using any section.
+
+    Args:
+        enabled (bool): Whether new loggers should be queued. Default is True.
+        max_size (int): The maximum number of queued records per logger. Default is 10000.
+        drop (str): The policy for a full queue, 'newest' or 'oldest'. Default is 'newest'.
+    """
+    _queue_options.update(enabled=enabled, max_size=max_size, drop=drop)
+
+def _console_handler():
+    """Returns the process-wide console handler shared by every logger."""
+    global _console
+    if _console is None:
+        _console = logging.StreamHandler()
+        _console.setLevel(logging.WARNING)
+        _console.setFormatter(_formatter)
+    return _console
+
+def setup_logger(name='my_logger', level=logging.CRITICAL, queued=None):
     """Sets up a logger with a specified name and level.
 
+    Calling it again for the same name does not add handlers: the existing handler is
+    returned and only the level is updated, so modules sharing a logger (e.g. all the
+    section modules use 'Sections') write each record once. Every logger writes to its
+    own logs/<name>.log and to one console handler shared by all loggers. Each call
+    should be paired with a close_logger call; the handlers are closed by the last one.
+
     Args:
         name (str): The name of the logger. Default is 'my_logger'.
         level (int): The logging level. Default is logging.DEBUG.
+        queued (bool): Write records on a background thread through a DroppingQueueHandler.
+            Default is None, which uses the set_queued_logging() setting (off unless enabled).
+            Ignored if the logger is already set up.
 
     Returns:
-        tuple: A tuple containing the logger and its file handler.
+        tuple: A tuple containing the logger and its file handler. When queued, the
+        DroppingQueueHandler is returned instead; close_logger stops it the same way.
     """
-    # Create a directory for log files if it doesn't exist
-    log_directory = 'logs'
-    os.makedirs(log_directory, exist_ok=True)
+    with _registry_lock:
+        entry = _registry.get(name)
+        if entry is not None:
+            entry['logger'].setLevel(level)
+            entry['file_handler'].setLevel(level)
+            entry['refs'] += 1
+            return entry['logger'], entry['handler']
 
-    # Define the log file path based on the logger name
-    log_file = os.path.join(log_directory, f'{name}.log')
+        # Create a directory for log files if it doesn't exist
+        log_directory = 'logs'
+        os.makedirs(log_directory, exist_ok=True)
 
-    # Create a logger object with the specified name
-    logger = logging.getLogger(name)
-    logger.setLevel(level)
+        # Define the log file path based on the logger name
+        log_file = os.path.join(log_directory, f'{name}.log')
 
-    # Create a file handler that logs debug and higher level messages to the specified log file
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setLevel(level)
+        # Create a logger object with the specified name
+        logger = logging.getLogger(name)
+        logger.setLevel(level)
+        # The logger has its own file and console sinks; propagating to the root logger
+        # (which logging.basicConfig, or env_loader's logging calls, give a handler) would print records twice
+        logger.propagate = False
 
-    # Create a console handler that logs warning and higher level messages to the console
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.WARNING)
+        # Create a file handler that logs debug and higher level messages to the specified log file
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setLevel(level)
+        file_handler.setFormatter(_formatter)
 
-    # Create a formatter to specify the output format of log messages
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    file_handler.setFormatter(formatter)  # Set the formatter for the file handler
-    console_handler.setFormatter(formatter)  # Set the formatter for the console handler
+        # The console handler (warning and higher) is shared by all loggers
+        console_handler = _console_handler()
 
-    # Add the file and console handlers to the logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+        if queued is None:
+            queued = _queue_options['enabled']
+        if queued:
+            # Both sinks are written by the listener thread; the logger only sees the queue
+            handler = DroppingQueueHandler([file_handler, console_handler],
+                                           _queue_options['max_size'], _queue_options['drop'])
+            logger.addHandler(handler)
+        else:
+            # Add the file and console handlers to the logger
+            handler = file_handler
+            logger.addHandler(file_handler)
+            logger.addHandler(console_handler)
 
-    return logger, file_handler  # Return the logger and file handler for future use
+        _registry[name] = {'logger': logger, 'handler': handler, 'file_handler': file_handler, 'refs': 1}
+        return logger, handler  # Return the logger and file handler for future use
 
 def close_logger(logger, file_handler):
     """Closes the logger's handlers.
 
+    For a logger set up more than once, only the last call closes the handlers.
+
     Args:
         logger (logging.Logger): The logger to close.
         file_handler (logging.FileHandler): The file handler associated with the logger.
     """
+    with _registry_lock:
+        entry = _registry.get(logger.name)
+        if entry is not None and entry['handler'] is file_handler:
+            entry['refs'] -= 1
+            if entry['refs'] > 0:
+                return
+            del _registry[logger.name]
+            logger.removeHandler(_console_handler())
+
     # Remove the file handler from the logger
     logger.removeHandler(file_handler)
     
     # Close the file handler to release any resources
     file_handler.close()
+
+def get_record_logger(name='Sections'):
+    """Returns the child logger used for per-record debug messages.
+
+    Section data classes log every parsed record (e.g. "Processed Attack: ...") through
+    this logger instead of the section logger, so it can be silenced independently.
+    It has no handlers of its own and propagates to the parent logger `name`.
+
+    Args:
+        name (str): The name of the parent logger. Default is 'Sections'.
+
+    Returns:
+        logging.Logger: The logger named '<name>.records'.
+    """
+    return logging.getLogger(f'{name}.records')
+
+def set_record_logging(enabled, name='Sections'):
+    """Turns per-record debug logging on or off.
+
+    When disabled, per-record log calls return before any level check or message
+    formatting, regardless of the parent logger's level.
+
+    Args:
+        enabled (bool): Whether per-record messages should be logged.
+        name (str): The name of the parent logger. Default is 'Sections'.
+    """
+    get_record_logger(name).disabled = not enabled
@@ -0,0 +1,297 @@
+# market_watcher.py
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import cycle
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from config import get_config
+from logger import setup_logger, close_logger
+from order_book import price_levels
+
+MARKETS = ('bazaar', 'itemmarket')
+
+# Kinds of MarketChange
+NEW_LOWEST = 'new_lowest'          # The lowest price dropped (or listings appeared in an empty market)
+LOWEST_GONE = 'lowest_gone'        # Everything at the lowest price sold out or was withdrawn
+NEW_LISTING = 'new_listing'        # Listings appeared at a price that had none
+LISTING_GONE = 'listing_gone'      # Every listing at a price sold out or was withdrawn
+QUANTITY_CHANGED = 'quantity_changed'  # The quantity listed at a price went up or down
+
+
+class MarketChange:
+    """
+    A change between two polls of one market of an item.
+
+    Args:
+        item_id (int): The item.
+        market (str): 'bazaar' or 'itemmarket'.
+        kind (str): One of NEW_LOWEST, LOWEST_GONE, NEW_LISTING, LISTING_GONE, QUANTITY_CHANGED.
+        cost (int): The price the change is at (for LOWEST_GONE, the old lowest price).
+        quantity (int): The quantity now listed at `cost`.
+        previous_quantity (int): The quantity listed at `cost` on the previous poll.
+        lowest (int, optional): The lowest price after the change, or None if nothing is listed.
+        timestamp (float): When the poll that found the change completed.
+    """
+    __slots__ = ('item_id', 'market', 'kind', 'cost', 'quantity', 'previous_quantity', 'lowest', 'timestamp')
+
+    def __init__(self, item_id: int, market: str, kind: str, cost: int, quantity: int = 0,
+                 previous_quantity: int = 0, lowest: Optional[int] = None, timestamp: float = 0.0):
+        self.item_id = item_id
+        self.market = market
+        self.kind = kind
+        self.cost = cost
+        self.quantity = quantity
+        self.previous_quantity = previous_quantity
+        self.lowest = lowest
+        self.timestamp = timestamp
+
+    def __eq__(self, other):
+        if not isinstance(other, MarketChange):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__ if name != 'timestamp')
+
+    def __repr__(self):
+        return (f"MarketChange(item_id={self.item_id}, market={self.market!r}, kind={self.kind!r}, cost={self.cost}, "
+                f"quantity={self.quantity}, previous_quantity={self.previous_quantity}, lowest={self.lowest})")
+
+
+def diff_levels(item_id: int, market: str, old: Dict[int, int], new: Dict[int, int],
+                timestamp: float = 0.0) -> List[MarketChange]:
+    """
+    Return the changes between two sets of price levels of one market, lowest price first.
+
+    A new lowest price is reported as NEW_LOWEST (not also NEW_LISTING), and an emptied lowest
+    price as LOWEST_GONE (not also LISTING_GONE).
+    """
+    old_lowest = min(old) if old else None
+    new_lowest = min(new) if new else None
+    changes = []
+    for cost in sorted(old.keys() | new.keys()):
+        before, after = old.get(cost, 0), new.get(cost, 0)
+        if before == after:
+            continue
+        if not before:
+            kind = NEW_LOWEST if cost == new_lowest and (old_lowest is None or cost < old_lowest) else NEW_LISTING
+        elif not after:
+            kind = LOWEST_GONE if cost == old_lowest else LISTING_GONE
+        else:
+            kind = QUANTITY_CHANGED
+        changes.append(MarketChange(item_id, market, kind, cost, after, before, new_lowest, timestamp))
+    return changes
+
+
+class MarketWatcher:
+    """
+    Polls the bazaar and item market listings of many items and reports what changed.
+
+    Polls are spread evenly across each minute, one item at a time in turn, at
+    `requests_per_minute` per API instance. With several API instances (one per key), the
+    polls are shared between them and the budget adds up. Requests bypass the response
+    cache, and each poll fetches both markets in one request.
+
+    The first poll of an item records its listings without reporting changes. After that,
+    every change is passed to each callback and put on the queue, if one is given.
+
+    An item is never polled again by the background thread while a poll of it is in flight.
+    Each poll is numbered per item, and a result is dropped if a later poll of the item has
+    already been applied or the item was unwatched in the meantime, so listings never go
+    back to an older snapshot.
+
+    Args:
+        apis (TornAPI or list): The API instance(s) to poll with.
+        item_ids (iterable): The items to watch.
+        requests_per_minute (int): The polling budget of each API instance. Defaults to 60,
+            leaving room under the client rate limit for other requests.
+        callbacks (list, optional): Called with each MarketChange, on a polling thread.
+        queue (queue.Queue, optional): Receives each MarketChange.
+        max_workers (int, optional): Polls in flight at once. Defaults to 4 per API instance.
+        config (Config, optional): The configuration for the logger. Defaults to the process-wide one.
+    """
+
+    def __init__(self, apis, item_ids: Iterable[int] = (), requests_per_minute: int = 60,
+                 callbacks: Optional[List[Callable[[MarketChange], None]]] = None, queue=None,
+                 max_workers: Optional[int] = None, config=None):
+        self.apis = list(apis) if isinstance(apis, Sequence) else [apis]
+        if not self.apis:
+            raise ValueError("At least one API instance is required.")
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive.")
+        self.requests_per_minute = requests_per_minute
+        self.callbacks = list(callbacks or [])
+        self.snapshot_callbacks = []
+        self.queue = queue
+        self.max_workers = max_workers or 4 * len(self.apis)
+        self.polls = 0
+        self.errors = 0
+
+        self._items = list(dict.fromkeys(item_ids))
+        self._levels: Dict[Tuple[int, str], Dict[int, int]] = {}
+        self._in_flight = set()
+        self._issued: Dict[int, int] = {}   # The number of the last poll started, per item
+        self._applied: Dict[int, int] = {}  # The number of the poll the listings are from, per item
+        self._lock = Lock()
+        self._stop = Event()
+        self._thread = None
+        self._next_item = 0
+        self._api_cycle = cycle(self.apis)
+
+        config = config if config is not None else get_config()
+        self.logger, self.file_handler = setup_logger('MarketWatcher', config.debug_level)
+
+    @property
+    def interval(self) -> float:
+        """Seconds between two polls."""
+        return 60.0 / (self.requests_per_minute * len(self.apis))
+
+    @property
+    def cycle_time(self) -> float:
+        """Seconds between two polls of the same item."""
+        return self.interval * max(len(self._items), 1)
+
+    def watch(self, item_id: int):
+        """Start watching an item."""
+        with self._lock:
+            if item_id not in self._items:
+                self._items.append(item_id)
+
+    def unwatch(self, item_id: int):
+        """Stop watching an item and forget its listings."""
+        with self._lock:
+            if item_id in self._items:
+                self._items.remove(item_id)
+            # Results of polls started before now are dropped
+            self._applied[item_id] = self._issued.get(item_id, 0)
+            for market in MARKETS:
+                self._levels.pop((item_id, market), None)
+
+    def subscribe(self, callback: Callable[[MarketChange], None]):
+        """Call `callback` with every change from now on."""
+        self.callbacks.append(callback)
+
+    def subscribe_snapshots(self, callback: Callable[[int, Dict[str, Any]], None]):
+        """Call `callback(item_id, data)` with the full response of every successful poll, including the first."""
+        self.snapshot_callbacks.append(callback)
+
+    def lowest(self, item_id: int, market: str = 'itemmarket') -> Optional[int]:
+        """Return the lowest price seen on the last poll of an item, or None."""
+        levels = self._levels.get((item_id, market))
+        return min(levels) if levels else None
+
+    def poll(self, item_id: int, api=None) -> List[MarketChange]:
+        """
+        Poll one item now and report its changes.
+
+        Returns:
+            list: The changes since the previous poll of the item (none on the first poll, on
+                failure, or if the result is older than the listings already recorded).
+        """
+        with self._lock:
+            if api is None:
+                api = next(self._api_cycle)
+            sequence = self._issued[item_id] = self._issued.get(item_id, 0) + 1
+        result = api.request('market', item_id, ','.join(MARKETS), use_cache=False)
+        with self._lock:
+            self.polls += 1
+            self.errors += not result.ok
+        if not result.ok:
+            self.logger.warning("Market poll failed for Item ID: %s: %s", item_id, result.error)
+            return []
+
+        now = time.time()
+        changes = []
+        with self._lock:
+            if sequence <= self._applied.get(item_id, 0):
+                self.logger.debug("Dropped an out-of-date market poll for Item ID: %s", item_id)
+                return []
+            self._applied[item_id] = sequence
+            for market in MARKETS:
+                new = price_levels((result.data or {}).get(market))
+                old = self._levels.get((item_id, market))
+                self._levels[(item_id, market)] = new
+                if old is not None:
+                    changes.extend(diff_levels(item_id, market, old, new, now))
+        for callback in self.snapshot_callbacks:
+            try:
+                callback(item_id, result.data or {})
+            except Exception as e:
+                self.logger.error(f"Market watcher snapshot callback failed for Item ID: {item_id}: {e}")
+        for change in changes:
+            self._deliver(change)
+        return changes
+
+    def _deliver(self, change: MarketChange):
+        if self.queue is not None:
+            self.queue.put(change)
+        for callback in self.callbacks:
+            try:
+                callback(change)
+            except Exception as e:
+                self.logger.error(f"Market watcher callback failed for {change}: {e}")
+
+    def _next(self) -> Optional[Tuple[int, Any]]:
+        with self._lock:
+            # Skip items whose previous poll has not finished yet
+            for _ in range(len(self._items)):
+                self._next_item %= len(self._items)
+                item_id = self._items[self._next_item]
+                self._next_item += 1
+                if item_id not in self._in_flight:
+                    self._in_flight.add(item_id)
+                    return item_id, next(self._api_cycle)
+            return None
+
+    def _run(self):
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='market-poll') as executor:
+            next_poll = time.monotonic()
+            while not self._stop.is_set():
+                job = self._next()
+                if job is not None:
+                    executor.submit(self._poll_safely, *job)
+                # Schedule from the previous slot, not from now, so polls stay evenly spaced
+                next_poll = max(next_poll + self.interval, time.monotonic() - self.interval)
+                self._stop.wait(max(next_poll - time.monotonic(), 0))
+
+    def _poll_safely(self, item_id: int, api):
+        try:
+            self.poll(item_id, api)
+        except Exception as e:
+            with self._lock:
+                self.errors += 1
+            self.logger.error(f"Market poll raised for Item ID: {item_id}: {e}")
+        finally:
+            with self._lock:
+                self._in_flight.discard(item_id)
+
+    def start(self):
+        """Start polling on a background thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = Thread(target=self._run, name='market-watcher', daemon=True)
+        self._thread.start()
+        self.logger.info("Market watcher started for %s items, polling every %.2f s", len(self._items), self.interval)
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stop polling and wait for polls in flight to finish."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def close(self):
+        """Stop polling and close the logger."""
+        self.stop()
+        close_logger(self.logger, self.file_handler)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __repr__(self):
+        return (f"MarketWatcher(items={len(self._items)}, keys={len(self.apis)}, "
+                f"requests_per_minute={self.requests_per_minute})")
@@ -0,0 +1,171 @@
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+Converter = Union[Callable[[Any], Any], str, None]
+FieldSpec = Tuple[str, Any, Converter]
+
+# Defaults that can be written into generated code as literals.
+_LITERAL_TYPES = (int, float, str, bool, type(None))
+
+
+class Field:
+    """Declares one attribute of a schema-driven data model.
+
+    Args:
+        name (str): The attribute name on the model.
+        default (Any): The value used when the key is missing. Empty dicts and lists are
+            created fresh for every record.
+        convert (callable or str, optional): Applied to the raw value. A string names a
+            nested class on the model (e.g. 'Status'), called as ``self.Status(value)``.
+        key (str, optional): The response key, when it differs from `name`.
+    """
+    __slots__ = ('name', 'default', 'convert', 'key')
+
+    def __init__(self, name: str, default: Any = 0, convert: Converter = None, key: Optional[str] = None):
+        self.name = name
+        self.default = default
+        self.convert = convert
+        self.key = name if key is None else key
+
+    def __repr__(self):
+        return f"Field(name={self.name!r}, default={self.default!r}, convert={self.convert!r}, key={self.key!r})"
+
+
+class Schema:
+    """The declarative field list of a section data model.
+
+    A schema generates the model's ``__slots__`` and a straight-line ``__init__`` with the
+    field keys and defaults compiled in as constants, instead of a hand-written constructor
+    per selection::
+
+        class Attack:
+            _schema = Schema(
+                Field('code', ''),
+                Field('stealthed', 0, bool),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('Attack', record_logger)
+    """
+
+    def __init__(self, *fields: Field):
+        self.fields = tuple(fields)
+        self.slots = tuple(field.name for field in self.fields)
+
+    def __repr__(self):
+        return f"Schema(fields={self.slots})"
+
+    def lazy_fields(self) -> Dict[str, FieldSpec]:
+        """Return the field table used by LazyModel subclasses."""
+        return {field.name: (field.key, field.default, field.convert) for field in self.fields}
+
+    def constructor(self, name: str, log=None, arg: str = 'data') -> Callable:
+        """Generate the ``__init__`` for a model using this schema.
+
+        Args:
+            name (str): The model name, used in the per-record debug message.
+            log (logging.Logger, optional): The logger for the "Processed <name>" message.
+            arg (str): The name of the constructor's data argument.
+
+        Returns:
+            function: An ``__init__(self, <arg>)`` assigning every field in declaration order.
+        """
+        namespace = {}
+        lines = [f"def __init__(self, {arg}):"]
+        for index, field in enumerate(self.fields):
+            if field.default == {} and isinstance(field.default, dict):
+                default = '{}'
+            elif field.default == [] and isinstance(field.default, list):
+                default = '[]'
+            elif type(field.default) in _LITERAL_TYPES:
+                default = repr(field.default)
+            else:
+                default = f"_default{index}"
+                namespace[default] = field.default
+            value = f"{arg}.get({field.key!r}, {default})"
+            if isinstance(field.convert, str):
+                value = f"self.{field.convert}({value})"
+            elif field.convert is not None:
+                namespace[f"_convert{index}"] = field.convert
+                value = f"_convert{index}({value})"
+            lines.append(f"    self.{field.name} = {value}")
+        if log is not None:
+            namespace['_log'] = log.debug
+            lines.append(f"    _log({f'Processed {name}: %s'!r}, self)")
+        if len(lines) == 1:
+            lines.append("    pass")
+
+        exec('\n'.join(lines), namespace)
+        init = namespace['__init__']
+        init.__qualname__ = f"{name}.__init__"
+        return init
+
+
+class LazyModel:
+    """Base class for data models that decode each field from the raw response on first access.
+
+    Construction only keeps a reference to the response dict, so it costs the same no matter
+    how many fields the selection has. Subclasses declare ``_fields``, a mapping of attribute
+    name to ``(key, default, convert)``; the decoded value is cached on the instance, so each
+    field is converted at most once.
+    """
+    __slots__ = ('_data', '__dict__')
+    _fields: Dict[str, FieldSpec] = {}
+
+    def __init__(self, data: Dict[str, Any]):
+        self._data = data
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called when the attribute is not cached yet (or does not exist at all).
+        try:
+            key, default, convert = self._fields[name]
+        except KeyError:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'") from None
+        value = self._data.get(key, default)
+        if isinstance(convert, str):
+            value = getattr(self, convert)(value)
+        elif convert is not None:
+            value = convert(value)
+        self.__dict__[name] = value
+        return value
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self._fields))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Decode every field and return them as a plain dictionary."""
+        return {name: getattr(self, name) for name in self._fields}
+
+
+class Selection:
+    """Declares a section attribute whose selection object is built on first access.
+
+    The selection class is looked up on the section by name and called with the named
+    section attributes. The result is stored on the instance, so later accesses are plain
+    attribute lookups and each selection is built at most once::
+
+        class User:
+            ammo = Selection('Ammo', 'api', 'user_id')
+            lookup = Selection('Lookup', 'api')
+
+    Args:
+        class_name (str): The nested selection class, e.g. 'Ammo'.
+        *args (str): Section attributes passed to the selection constructor, in order.
+    """
+
+    def __init__(self, class_name: str, *args: str):
+        self.class_name = class_name
+        self.args = args
+        self.name = None
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        selection = getattr(owner or type(instance), self.class_name)
+        value = selection(*(getattr(instance, arg) for arg in self.args))
+        instance.__dict__[self.name] = value
+        return value
+
+    def __repr__(self):
+        return f"Selection(class_name={self.class_name!r}, args={self.args!r})"
@@ -0,0 +1,185 @@
+# order_book.py
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+def _listing(listing: Any) -> Tuple[Any, Any]:
+    # Raw listing dicts and MarketItem/BazaarItem objects both have cost and quantity.
+    if isinstance(listing, dict):
+        return listing.get('cost'), listing.get('quantity')
+    return getattr(listing, 'cost', None), getattr(listing, 'quantity', None)
+
+
+def price_levels(listings: Optional[Iterable[Any]]) -> Dict[int, int]:
+    """Return the total quantity listed at each price."""
+    levels = {}
+    for listing in listings or ():
+        cost, quantity = _listing(listing)
+        if cost is not None:
+            levels[cost] = levels.get(cost, 0) + (quantity or 0)
+    return levels
+
+
+class OrderBook:
+    """
+    The sell listings of one market as sorted price levels, for fast buy-side queries.
+
+    Listings at the same price are merged into one level. Cumulative quantity and cost
+    arrays are kept alongside the sorted prices, so the cost of buying N units, its VWAP
+    and the depth at a price are binary searches instead of a sort and scan per query.
+
+    The book can be updated in place from each new snapshot (`update`) or level by level
+    (`set_level`); the cumulative arrays are only recomputed from the cheapest changed
+    level, and only when next queried.
+
+    Args:
+        listings (iterable, optional): Raw listing dicts ({'cost', 'quantity'}) or
+            MarketItem/BazaarItem objects.
+    """
+    __slots__ = ('prices', 'quantities', '_cum_quantity', '_cum_cost', '_dirty_from')
+
+    def __init__(self, listings: Optional[Iterable[Any]] = None):
+        levels = price_levels(listings)
+        self.prices: List[int] = sorted(level for level, quantity in levels.items() if quantity > 0)
+        self.quantities: List[int] = [levels[price] for price in self.prices]
+        self._cum_quantity: List[int] = []
+        self._cum_cost: List[int] = []
+        self._dirty_from = 0
+
+    @classmethod
+    def from_response(cls, data: Dict[str, Any], markets: Iterable[str] = ('bazaar', 'itemmarket')) -> 'OrderBook':
+        """Build one book from the listings of one or more markets of a `market` response."""
+        return cls(listing for market in markets for listing in (data or {}).get(market) or ())
+
+    def set_level(self, price: int, quantity: int):
+        """Set the quantity listed at a price; a quantity of 0 removes the level."""
+        index = bisect_left(self.prices, price)
+        exists = index < len(self.prices) and self.prices[index] == price
+        if quantity > 0:
+            if exists:
+                if self.quantities[index] == quantity:
+                    return
+                self.quantities[index] = quantity
+            else:
+                self.prices.insert(index, price)
+                self.quantities.insert(index, quantity)
+        elif exists:
+            del self.prices[index]
+            del self.quantities[index]
+        else:
+            return
+        self._dirty_from = min(self._dirty_from, index)
+
+    def update(self, listings: Optional[Iterable[Any]]) -> int:
+        """
+        Replace the book with a new snapshot, changing only the levels that differ.
+
+        Returns:
+            int: The number of price levels that changed.
+        """
+        new = price_levels(listings)
+        old = dict(zip(self.prices, self.quantities))
+        changed = 0
+        for price in old.keys() | new.keys():
+            quantity = new.get(price, 0)
+            if old.get(price, 0) != quantity:
+                self.set_level(price, quantity)
+                changed += 1
+        return changed
+
+    def _refresh(self):
+        start = self._dirty_from
+        if start >= len(self.prices) and len(self._cum_quantity) == len(self.prices):
+            return
+        quantity = self._cum_quantity[start - 1] if start else 0
+        cost = self._cum_cost[start - 1] if start else 0
+        del self._cum_quantity[start:]
+        del self._cum_cost[start:]
+        for price, level_quantity in zip(self.prices[start:], self.quantities[start:]):
+            quantity += level_quantity
+            cost += price * level_quantity
+            self._cum_quantity.append(quantity)
+            self._cum_cost.append(cost)
+        self._dirty_from = len(self.prices)
+
+    @property
+    def best(self) -> Optional[int]:
+        """The lowest price, or None if nothing is listed."""
+        return self.prices[0] if self.prices else None
+
+    @property
+    def total_quantity(self) -> int:
+        """The number of units listed."""
+        self._refresh()
+        return self._cum_quantity[-1] if self._cum_quantity else 0
+
+    def cheapest(self, k: int) -> List[Tuple[int, int]]:
+        """Return the `k` cheapest price levels as (price, quantity)."""
+        return list(zip(self.prices[:k], self.quantities[:k]))
+
+    def depth_at(self, price: int) -> int:
+        """Return the number of units listed at or below `price`."""
+        self._refresh()
+        index = bisect_right(self.prices, price)
+        return self._cum_quantity[index - 1] if index else 0
+
+    def cost_at(self, price: int) -> int:
+        """Return the cost of buying every unit listed at or below `price`."""
+        self._refresh()
+        index = bisect_right(self.prices, price)
+        return self._cum_cost[index - 1] if index else 0
+
+    def fill_cost(self, units: int) -> Optional[int]:
+        """
+        Return the cost of buying `units` units from the cheapest listings up.
+
+        Returns:
+            int: The total cost, or None if fewer units are listed.
+        """
+        if units <= 0:
+            return 0
+        self._refresh()
+        if not self._cum_quantity or units > self._cum_quantity[-1]:
+            return None
+        index = bisect_left(self._cum_quantity, units)
+        bought = self._cum_quantity[index - 1] if index else 0
+        spent = self._cum_cost[index - 1] if index else 0
+        return spent + (units - bought) * self.prices[index]
+
+    def vwap(self, units: int) -> Optional[float]:
+        """Return the average price paid per unit when buying `units` units, or None if fewer are listed."""
+        cost = self.fill_cost(units)
+        if cost is None or units <= 0:
+            return None
+        return cost / units
+
+    def fill_price(self, units: int) -> Optional[int]:
+        """Return the highest price paid when buying `units` units, or None if fewer are listed."""
+        if units <= 0:
+            return None
+        self._refresh()
+        if not self._cum_quantity or units > self._cum_quantity[-1]:
+            return None
+        return self.prices[bisect_left(self._cum_quantity, units)]
+
+    def units_for(self, budget: int) -> int:
+        """Return the most units that can be bought with `budget`, cheapest first."""
+        if budget <= 0:
+            return 0
+        self._refresh()
+        index = bisect_right(self._cum_cost, budget)
+        bought = self._cum_quantity[index - 1] if index else 0
+        spent = self._cum_cost[index - 1] if index else 0
+        if index < len(self.prices):
+            bought += (budget - spent) // self.prices[index]
+        return bought
+
+    def __len__(self):
+        return len(self.prices)
+
+    def __bool__(self):
+        return bool(self.prices)
+
+    def __repr__(self):
+        return f"OrderBook(levels={len(self.prices)}, best={self.best}, units={self.total_quantity})"
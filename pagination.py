@@ -0,0 +1,221 @@
+# pagination.py
+
+import json
+import os
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+Page = Iterable[Tuple[Any, Dict[str, Any]]]
+
+
+class PaginationError(Exception):
+    """
+    Raised when a page request fails part way through a paginated walk.
+
+    Args:
+        message (str): The error message.
+        result (RequestResult, optional): The failed request, for error codes and retry decisions.
+    """
+
+    def __init__(self, message: str, result=None):
+        super().__init__(message)
+        self.result = result
+
+
+def fetch_page(api, section: str, id, selections: str, key: str, parameters: Dict[str, Any]) -> Page:
+    """
+    Request one page and return the (id, record) entries under `key`.
+
+    Records in a list (rather than keyed by ID) are returned with their own 'id' field as the
+    key, or None if they have none; a list index is not an identity, since it changes from
+    page to page.
+
+    Raises:
+        PaginationError: If the request fails.
+    """
+    result = api.request(section, id, selections, parameters)
+    if not result.ok:
+        raise PaginationError(f"Failed to fetch {section}/{selections} page {parameters}: {result.error}", result)
+    records = (result.data or {}).get(key) or {}
+    if isinstance(records, dict):
+        return list(records.items())
+    return [(record.get('id') if isinstance(record, dict) else None, record) for record in records]
+
+
+def paginate(fetch: Callable[[int, int], Page], from_ts: int, to_ts: Optional[int], page_size: int,
+             timestamp: Callable[[Dict[str, Any]], int], record_id: Callable[[Any, Dict[str, Any]], Any],
+             state: Optional[Dict[str, Any]] = None, on_page: Optional[Callable[[Dict[str, Any]], None]] = None
+             ) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+    """
+    Walk a from/to window backwards, one page at a time, and yield each record once.
+
+    The Torn API returns the newest `limit` records of a window. After each page, the upper
+    bound moves down to the oldest timestamp seen, so consecutive pages overlap by one second;
+    records from that second are de-duplicated by ID. Only those boundary IDs are kept, so
+    memory stays flat however long the history is. The walk ends when a page is not full.
+
+    Args:
+        fetch (callable): ``fetch(from_ts, to_ts)`` returning one page of (key, record) entries.
+        from_ts (int): The oldest timestamp to include.
+        to_ts (int, optional): The newest timestamp to include. Defaults to now.
+        page_size (int): The number of records in a full page (the `limit` sent to the API).
+        timestamp (callable): Returns a record's timestamp.
+        record_id (callable): ``record_id(key, record)`` returning the ID used for de-duplication.
+        state (dict, optional): The walk position ({'to': int, 'seen': list, 'done': bool}) to
+            resume from, e.g. from a saved cursor. Updated in place after every page; a finished
+            walk is marked done and yields nothing if resumed.
+        on_page (callable, optional): Called with `state` after each page has been yielded.
+
+    Yields:
+        tuple: (key, record), page by page from the newest page to the oldest.
+    """
+    if state is None:
+        state = {}
+    if state.get('done'):
+        return
+    upper = state.get('to') or to_ts or int(time.time())
+    seen = set(state.get('seen') or ())
+
+    while upper >= from_ts:
+        page = fetch(from_ts, upper)
+        oldest = None
+        boundary = set()
+        new = 0
+        for key, record in page:
+            ts = timestamp(record)
+            if oldest is None or ts < oldest:
+                oldest, boundary = ts, set()
+            ident = record_id(key, record)
+            if ts == oldest:
+                boundary.add(ident)
+            if ident in seen:
+                continue
+            new += 1
+            yield key, record
+
+        if oldest is None or len(page) < page_size:
+            state.update(to=None, seen=[], done=True)
+            break
+        if new == 0:
+            # A full page of records from one second, all seen already: step past that second.
+            oldest -= 1
+            boundary = set()
+        if oldest == upper:
+            seen |= boundary
+        else:
+            seen = boundary
+        upper = oldest
+        state.update(to=upper, seen=sorted(seen, key=str), done=False)
+        if on_page is not None:
+            on_page(state)
+    else:
+        state.update(to=None, seen=[], done=True)
+
+    if on_page is not None:
+        on_page(state)
+
+
+def save_json(path: str, data: Any):
+    """
+    Write `data` as JSON, atomically replacing `path`.
+
+    The data is written to a temporary file, synced to disk and renamed over `path`, so a
+    crash leaves either the old or the new file, never a partial one.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w') as file:
+        json.dump(data, file)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
+
+
+def load_json(path: str) -> Optional[Dict[str, Any]]:
+    """Return the JSON object saved at `path`, or None if it is missing or unreadable."""
+    try:
+        with open(path) as file:
+            data = json.load(file)
+    except (FileNotFoundError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+class Cursor:
+    """
+    The position of a paginated walk, saved to a JSON file so an interrupted walk can resume.
+
+    The file records the window being walked and the `paginate` state. It is replaced
+    atomically after every page, so a crash leaves either the previous or the new position,
+    never a partial file. At most one page is fetched again after a crash.
+
+    Args:
+        path (str): The cursor file. It is created on the first save.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self, from_ts: int, to_ts: Optional[int] = None) -> Tuple[int, Dict[str, Any]]:
+        """
+        Return the window end and the state to resume a walk of [from_ts, to_ts] from.
+
+        An open-ended window (`to_ts` None) is pinned to the end saved with the cursor, or to
+        now for a new walk, so a resumed walk covers the same records. A cursor saved for a
+        different window is ignored and the walk starts over.
+
+        Returns:
+            tuple: (to_ts, state)
+        """
+        saved = self._read()
+        if saved and saved.get('from') == from_ts and to_ts in (None, saved.get('to')):
+            return saved['to'], dict(saved.get('state') or {})
+        return to_ts or int(time.time()), {}
+
+    def save(self, from_ts: int, to_ts: int, state: Dict[str, Any]):
+        """Atomically write the position of the walk of [from_ts, to_ts]."""
+        save_json(self.path, {'from': from_ts, 'to': to_ts, 'state': state})
+
+    def clear(self):
+        """Delete the cursor file, so the next walk starts over."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def _read(self) -> Optional[Dict[str, Any]]:
+        # An unreadable cursor only costs a restart, not the walk.
+        return load_json(self.path)
+
+    def __repr__(self):
+        return f"Cursor(path={self.path!r})"
+
+
+def paginate_with_cursor(fetch: Callable[[int, int], Page], from_ts: int, to_ts: Optional[int], page_size: int,
+                         timestamp: Callable[[Dict[str, Any]], int], record_id: Callable[[Any, Dict[str, Any]], Any],
+                         cursor: Union[Cursor, str, None] = None, on_page: Optional[Callable[[], None]] = None
+                         ) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+    """
+    `paginate`, resuming from and saving to a cursor after each page.
+
+    The cursor is saved once all records of a page have been consumed, so a record is only
+    skipped on resume if the caller finished with it. Without a cursor this is `paginate`.
+
+    Args:
+        cursor (Cursor or str, optional): The cursor, or the path of its file.
+        on_page (callable, optional): Called with no arguments after each page, before the
+            cursor is saved, e.g. to flush a sink the records were written to.
+    """
+    if isinstance(cursor, str):
+        cursor = Cursor(cursor)
+    state = {}
+    if cursor is not None:
+        to_ts, state = cursor.load(from_ts, to_ts)
+
+    def page_done(state):
+        if on_page is not None:
+            on_page()
+        if cursor is not None:
+            cursor.save(from_ts, to_ts, state)
+
+    yield from paginate(fetch, from_ts, to_ts, page_size, timestamp, record_id, state, page_done)
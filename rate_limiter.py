@@ -1,23 +1,22 @@
 import time
-from env_loader import load_environment_variables
+from config import get_config
 from logger import setup_logger
 # TODO: Implement wait time if limit is exceeded or fix the rate limiter
 class RateLimiter:
-    def __init__(self, limit=100, timeframe=60):
+    def __init__(self, limit=100, timeframe=60, config=None):
         """
         Initializes the rate limiter.
         
         :param limit: Maximum number of requests allowed in the specified timeframe.
         :param timeframe: Timeframe in seconds for the limit.
+        :param config: The Config to use. Defaults to the process-wide configuration.
         """
         self.limit = limit  # Maximum requests allowed
         self.timeframe = timeframe  # Timeframe in seconds
         self.requests = []  # List to track timestamps of requests
-        env = load_environment_variables()
-        if env is None:
-            raise ValueError("Failed to load environment variables.")
+        config = config if config is not None else get_config()
 
-        self.logger, self.file_handler = setup_logger('RateLimiter', env['DEBUG_LEVEL'])
+        self.logger, self.file_handler = setup_logger('RateLimiter', config.debug_level)
 
     def _clean_up(self):
         """Remove timestamps older than the timeframe."""
@@ -0,0 +1,141 @@
+# response_log.py
+
+import itertools
+import logging
+from typing import Dict, Optional, Tuple, Union
+
+MODES = ('off', 'full', 'truncate', 'sample')
+
+
+class ResponseLogPolicy:
+    """
+    Decides how much of each API response `TornAPI.make_request` logs at INFO.
+
+    A mode is one of:
+        'off'         - do not log response bodies
+        'full'        - log the whole decoded response (the default)
+        'truncate:N'  - log the first N bytes of the raw body, without formatting the response
+        'sample:N'    - log the whole response for 1 request in N
+
+    A default mode applies to every request and can be overridden per section or per
+    section/selection, e.g. ``policy.set('truncate:2000', 'torn', 'items')``. Policies can
+    also be parsed from a string (the RESPONSE_LOG setting)::
+
+        full;torn/items=truncate:2000;user/attacksfull=off;user=sample:10
+
+    Args:
+        default (str): The mode used when no override matches. Defaults to 'full'.
+    """
+
+    def __init__(self, default: str = 'full'):
+        self.default = self._parse_mode(default)
+        self.overrides: Dict[Tuple[str, Optional[str]], Tuple[str, int]] = {}
+        self._counters: Dict[Tuple[str, Optional[str]], itertools.count] = {}
+
+    @classmethod
+    def parse(cls, spec: Optional[str]) -> 'ResponseLogPolicy':
+        """
+        Build a policy from a string of ';'-separated entries.
+
+        An entry without '=' sets the default mode; 'section=mode' and
+        'section/selections=mode' set overrides.
+
+        Raises:
+            ValueError: If an entry or mode is invalid.
+        """
+        policy = cls()
+        for entry in (spec or '').split(';'):
+            entry = entry.strip()
+            if not entry:
+                continue
+            if '=' not in entry:
+                policy.default = cls._parse_mode(entry)
+                continue
+            target, mode = (part.strip() for part in entry.split('=', 1))
+            section, _, selections = target.partition('/')
+            policy.set(mode, section, selections or None)
+        return policy
+
+    @staticmethod
+    def _parse_mode(mode: str) -> Tuple[str, int]:
+        name, _, value = mode.strip().lower().partition(':')
+        if name not in MODES:
+            raise ValueError(f"Unknown response log mode '{mode}'. Expected one of: off, full, truncate:N, sample:N.")
+        if name in ('truncate', 'sample'):
+            if not value.isdigit() or int(value) < 1:
+                raise ValueError(f"Response log mode '{mode}' needs a positive integer, e.g. '{name}:1000'.")
+            return name, int(value)
+        return name, 0
+
+    def set(self, mode: str, section: str, selections: Optional[str] = None):
+        """
+        Override the mode for a section, or for one selection string of a section.
+
+        Args:
+            mode (str): The mode, e.g. 'off' or 'truncate:2000'.
+            section (str): The API section, e.g. 'torn'.
+            selections (str, optional): The selections as passed to make_request, e.g. 'items'.
+        """
+        key = (section, self._selections_key(selections))
+        self.overrides[key] = self._parse_mode(mode)
+        self._counters.pop(key, None)
+
+    @staticmethod
+    def _selections_key(selections) -> Optional[str]:
+        if isinstance(selections, (list, tuple)):
+            return ','.join(selections)
+        return selections or None
+
+    def _lookup(self, section: str, selections) -> Tuple[Tuple[str, Optional[str]], Tuple[str, int]]:
+        key = (section, self._selections_key(selections))
+        if key in self.overrides:
+            return key, self.overrides[key]
+        if (section, None) in self.overrides:
+            return (section, None), self.overrides[(section, None)]
+        return (None, None), self.default
+
+    def mode_for(self, section: str, selections=None) -> str:
+        """Return the mode that applies to a request, e.g. 'truncate:2000'."""
+        name, value = self._lookup(section, selections)[1]
+        return f"{name}:{value}" if value else name
+
+    def log(self, logger: logging.Logger, section: str, selections, data, body: Union[bytes, str, None] = None):
+        """
+        Log a response according to the policy.
+
+        Args:
+            logger (logging.Logger): The logger to write to, at INFO.
+            section (str): The API section of the request.
+            selections: The selections of the request.
+            data: The decoded response.
+            body (bytes or str, optional): The raw response body, used by 'truncate'.
+        """
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        key, (mode, value) = self._lookup(section, selections)
+        if mode == 'off':
+            return
+        if mode == 'sample':
+            counter = self._counters.get(key)
+            if counter is None:
+                counter = self._counters.setdefault(key, itertools.count())
+            if next(counter) % value:
+                return
+        if mode == 'truncate':
+            if isinstance(body, (bytes, bytearray)):
+                preview = bytes(body[:value]).decode('utf-8', 'replace')
+                size = len(body)
+            elif isinstance(body, str):
+                preview, size = body[:value], len(body)
+            else:
+                logger.info("Response data: <%s, body not available>", type(data).__name__)
+                return
+            if size > value:
+                logger.info("Response data (first %d of %d bytes): %s", value, size, preview)
+            else:
+                logger.info("Response data: %s", preview)
+            return
+        logger.info("Response data: %s", data)
+
+    def __repr__(self):
+        return f"ResponseLogPolicy(default={self.mode_for(None)!r}, overrides={len(self.overrides)})"
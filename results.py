@@ -0,0 +1,82 @@
+# results.py
+
+import hashlib
+from typing import Any, Optional
+
+# Cache status values of a RequestResult.
+CACHE_HIT = 'hit'
+CACHE_MISS = 'miss'
+CACHE_BYPASS = 'bypass'
+
+# Torn error codes worth retrying later: unknown error, too many requests, IP block,
+# API disabled, temporary error and backend error.
+RETRYABLE_ERROR_CODES = frozenset({0, 5, 8, 9, 15, 17})
+
+
+def key_fingerprint(api_key: Optional[str]) -> Optional[str]:
+    """Return a short, non-reversible identifier for an API key, safe to log."""
+    if not api_key:
+        return None
+    return hashlib.sha256(api_key.encode()).hexdigest()[:8]
+
+
+class RequestResult:
+    """
+    The outcome of one `TornAPI.request` call.
+
+    Args:
+        data (dict, optional): The decoded response, or None if the request failed.
+        error_code (int, optional): The Torn API error code, when the API returned an error.
+        error (str, optional): A description of the failure (API, HTTP, network or JSON error).
+        status_code (int, optional): The HTTP status code, if a response was received.
+        key (str, optional): The fingerprint of the API key used (see `key_fingerprint`).
+        cache (str): 'hit', 'miss' or 'bypass'.
+        latency (float): Seconds spent on the request, including rate limiting and retries.
+        retries (int): How many times the request was retried after a rate limit error.
+    """
+    __slots__ = ('data', 'error_code', 'error', 'status_code', 'key', 'cache', 'latency', 'retries')
+
+    def __init__(self, data: Any = None, error_code: Optional[int] = None, error: Optional[str] = None,
+                 status_code: Optional[int] = None, key: Optional[str] = None, cache: str = CACHE_MISS,
+                 latency: float = 0.0, retries: int = 0):
+        self.data = data
+        self.error_code = error_code
+        self.error = error
+        self.status_code = status_code
+        self.key = key
+        self.cache = cache
+        self.latency = latency
+        self.retries = retries
+
+    @property
+    def ok(self) -> bool:
+        """True if the request succeeded (the data may still be empty)."""
+        return self.error is None and self.error_code is None
+
+    @property
+    def empty(self) -> bool:
+        """True if the request succeeded but returned no data."""
+        return self.ok and not self.data
+
+    @property
+    def throttled(self) -> bool:
+        """True if the request failed because of rate limiting (Torn code 5 or HTTP 429)."""
+        return self.error_code == 5 or self.status_code == 429
+
+    @property
+    def retryable(self) -> bool:
+        """True if the failure is transient and the request may succeed if retried later."""
+        if self.ok:
+            return False
+        if self.error_code is not None:
+            return self.error_code in RETRYABLE_ERROR_CODES
+        # Network errors and 5xx/429 responses are transient; other HTTP errors and bad JSON are not
+        return self.status_code is None or self.status_code == 429 or self.status_code >= 500
+
+    def __bool__(self):
+        return self.ok
+
+    def __repr__(self):
+        status = 'ok' if self.ok else f"error_code={self.error_code}, error={self.error!r}"
+        return (f"RequestResult({status}, cache={self.cache!r}, latency={self.latency:.3f}, "
+                f"retries={self.retries}, key={self.key!r})")
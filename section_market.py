@@ -1,12 +1,14 @@
 from typing import Dict, Any, Optional
 from tornApi import TornAPI
-from env_loader import load_environment_variables
-from logger import setup_logger, close_logger
+from config import get_config
+from logger import setup_logger, close_logger, get_record_logger
+from models import Field, Schema
+import columns
+from order_book import OrderBook
 
-env = load_environment_variables()
-if env is None:
-    raise ValueError("Failed to load environment variables.")
-logger, file_handler = setup_logger('Sections', env['DEBUG_LEVEL'])
+config = get_config()
+logger, file_handler = setup_logger('Sections', config.debug_level)
+record_logger = get_record_logger('Sections')
 
 
 class Market:
@@ -32,7 +34,7 @@ class Market:
 
         def fetch_data(self):
             """Fetch bazaar data for the specified item."""
-            logger.debug(f"Fetching bazaar data for Item ID: {self.item_id}")
+            logger.debug("Fetching bazaar data for Item ID: %s", self.item_id)
             try:
                 response = self.api.make_request('market', self.item_id, 'bazaar')
                 if response and 'bazaar' in response:
@@ -46,15 +48,39 @@ class Market:
                 logger.error(f"Error fetching bazaar data for Item ID: {self.item_id}: {e}")
                 return None
 
+        def as_columns(self):
+            """Fetch bazaar listings as typed NumPy column arrays (cost, quantity) without building item objects."""
+            response = self.api.make_request('market', self.item_id, 'bazaar') or {}
+            return columns.as_columns(columns.records(response.get('bazaar')), columns.LISTING_COLUMNS)
+
+        def to_numpy(self):
+            """Fetch bazaar listings as a NumPy structured array (cost, quantity) without building item objects."""
+            response = self.api.make_request('market', self.item_id, 'bazaar') or {}
+            return columns.to_numpy(columns.records(response.get('bazaar')), columns.LISTING_COLUMNS)
+
+        def to_dataframe(self):
+            """Fetch bazaar listings as a pandas DataFrame (cost, quantity) without building item objects."""
+            response = self.api.make_request('market', self.item_id, 'bazaar') or {}
+            return columns.to_dataframe(columns.records(response.get('bazaar')), columns.LISTING_COLUMNS)
+
         class BazaarData:
+            __slots__ = ('bazaar',)
+
             def __init__(self, data: Dict[str, Any]):
                 self.bazaar = [self.BazaarItem(item) for item in data.get('bazaar', [])]
-                logger.debug(f"Processed BazaarData: {self}")
+                record_logger.debug("Processed BazaarData: %s", self)
 
             class BazaarItem:
-                def __init__(self, item: Dict[str, Any]):
-                    self.cost = item.get('cost', 0)
-                    self.quantity = item.get('quantity', 0)
+                _schema = Schema(
+                    Field('cost', 0),
+                    Field('quantity', 0),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('BazaarItem', arg='item')
+
+            def order_book(self):
+                """Return the bazaar listings as an OrderBook."""
+                return OrderBook(self.bazaar)
 
             def __repr__(self):
                 return f"BazaarData(bazaar_items={len(self.bazaar)})"
@@ -71,7 +97,7 @@ class Market:
 
         def fetch_data(self):
             """Fetch item market data for the specified item."""
-            logger.debug(f"Fetching item market data for Item ID: {self.item_id}")
+            logger.debug("Fetching item market data for Item ID: %s", self.item_id)
             try:
                 response = self.api.make_request('market', self.item_id, 'itemmarket')
                 if response and 'itemmarket' in response:
@@ -85,15 +111,39 @@ class Market:
                 logger.error(f"Error fetching item market data for Item ID: {self.item_id}: {e}")
                 return None
 
+        def as_columns(self):
+            """Fetch item market listings as typed NumPy column arrays (cost, quantity) without building item objects."""
+            response = self.api.make_request('market', self.item_id, 'itemmarket') or {}
+            return columns.as_columns(columns.records(response.get('itemmarket')), columns.LISTING_COLUMNS)
+
+        def to_numpy(self):
+            """Fetch item market listings as a NumPy structured array (cost, quantity) without building item objects."""
+            response = self.api.make_request('market', self.item_id, 'itemmarket') or {}
+            return columns.to_numpy(columns.records(response.get('itemmarket')), columns.LISTING_COLUMNS)
+
+        def to_dataframe(self):
+            """Fetch item market listings as a pandas DataFrame (cost, quantity) without building item objects."""
+            response = self.api.make_request('market', self.item_id, 'itemmarket') or {}
+            return columns.to_dataframe(columns.records(response.get('itemmarket')), columns.LISTING_COLUMNS)
+
         class ItemMarketData:
+            __slots__ = ('itemmarket',)
+
             def __init__(self, data: Dict[str, Any]):
                 self.itemmarket = [self.MarketItem(item) for item in data.get('itemmarket', [])]
-                logger.debug(f"Processed ItemMarketData: {self}")
+                record_logger.debug("Processed ItemMarketData: %s", self)
 
             class MarketItem:
-                def __init__(self, item: Dict[str, Any]):
-                    self.cost = item.get('cost', 0)
-                    self.quantity = item.get('quantity', 0)
+                _schema = Schema(
+                    Field('cost', 0),
+                    Field('quantity', 0),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('MarketItem', arg='item')
+
+            def order_book(self):
+                """Return the item market listings as an OrderBook."""
+                return OrderBook(self.itemmarket)
 
             def __repr__(self):
                 return f"ItemMarketData(market_items={len(self.itemmarket)})"
@@ -124,9 +174,11 @@ class Market:
                 return None
 
         class LookupData:
-            def __init__(self, data: Dict[str, Any]):
-                self.selections = data.get('selections', [])
-                logger.debug(f"Processed LookupData: {self}")
+            _schema = Schema(
+                Field('selections', []),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('LookupData', record_logger)
 
             def __repr__(self):
                 return f"LookupData(selections_count={len(self.selections)})"
@@ -157,15 +209,20 @@ class Market:
                 return None
 
         class PointsMarketData:
+            __slots__ = ('points',)
+
             def __init__(self, data: Dict[str, Any]):
                 self.points = {id: self.Point(point_data) for id, point_data in data.items()}
-                logger.debug(f"Processed PointsMarketData: {self}")
+                record_logger.debug("Processed PointsMarketData: %s", self)
 
             class Point:
-                def __init__(self, point: Dict[str, Any]):
-                    self.cost = point.get('cost', 0)
-                    self.quantity = point.get('quantity', 0)
-                    self.total_cost = point.get('total_cost', 0)
+                _schema = Schema(
+                    Field('cost', 0),
+                    Field('quantity', 0),
+                    Field('total_cost', 0),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('Point', arg='point')
 
             def __repr__(self):
                 return f"PointsMarketData(points_items={len(self.points)})"
@@ -214,7 +271,7 @@ class Market:
             else:
                 raise ValueError("Selections must be a comma-separated string, list, or tuple")
 
-            logger.debug(f"Fetching combined market data for Item ID: {self.item_id}, Selections: {selections}")
+            logger.debug("Fetching combined market data for Item ID: %s, Selections: %s", self.item_id, selections)
             try:
                 response = self.api.make_request('market', self.item_id, ','.join(selections))
                 if response:
@@ -229,15 +286,33 @@ class Market:
                 return None
 
         class CombinedMarketData:
+            __slots__ = ('bazaar', 'itemmarket')
+
             def __init__(self, data: Dict[str, Any]):
                 self.bazaar = [self.MarketItem(item) for item in data.get('bazaar', [])]
                 self.itemmarket = [self.MarketItem(item) for item in data.get('itemmarket', [])]
-                logger.debug(f"Processed CombinedMarketData: {self}")
+                record_logger.debug("Processed CombinedMarketData: %s", self)
 
             class MarketItem:
-                def __init__(self, item: Dict[str, Any]):
-                    self.cost = item.get('cost', 0)
-                    self.quantity = item.get('quantity', 0)
+                _schema = Schema(
+                    Field('cost', 0),
+                    Field('quantity', 0),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('MarketItem', arg='item')
+
+            def order_book(self, market: Optional[str] = None):
+                """
+                Return the listings as an OrderBook.
+
+                Parameters:
+                - market (Optional[str]): 'bazaar' or 'itemmarket' for one market. Defaults to both combined.
+                """
+                if market is None:
+                    return OrderBook(self.bazaar + self.itemmarket)
+                if market not in self.__slots__:
+                    raise ValueError(f"Unknown market '{market}'. Expected 'bazaar' or 'itemmarket'.")
+                return OrderBook(getattr(self, market))
 
             def __repr__(self):
                 return f"CombinedMarketData(bazaar_items={len(self.bazaar)}, itemmarket_items={len(self.itemmarket)})"
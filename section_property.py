@@ -1,12 +1,12 @@
 from typing import Dict, Any, Optional
 from tornApi import TornAPI
-from env_loader import load_environment_variables
-from logger import setup_logger, close_logger
+from config import get_config
+from logger import setup_logger, close_logger, get_record_logger
+from models import Field, Schema
 
-env = load_environment_variables()
-if env is None:
-    raise ValueError("Failed to load environment variables.")
-logger, file_handler = setup_logger('Sections', env['DEBUG_LEVEL'])
+config = get_config()
+logger, file_handler = setup_logger('Sections', config.debug_level)
+record_logger = get_record_logger('Sections')
 
 class Property:
     def __init__(self, api: TornAPI, property_id: Optional[int]):
@@ -41,12 +41,12 @@ class Property:
             Returns:
             - PropertyData: An instance of PropertyData containing the fetched data.
             """
-            logger.debug(f"Fetching property data for Property ID: {self.property_id}")
+            logger.debug("Fetching property data for Property ID: %s", self.property_id)
 
             try:
                 # Make API request for the property selection
                 response = self.api.make_request('property', self.property_id)
-                logger.debug(f"API response for property selection: {response}")
+                logger.debug("API response for property selection: %s", response)
 
                 # Check if response contains valid data
                 if not response:
@@ -63,39 +63,28 @@ class Property:
                 return None
 
         class PropertyData:
-            def __init__(self, data: Dict[str, Any]):
-                """
-                Parse and store the property selection data.
-
-                Args:
-                - data: A dictionary containing the fetched property data.
-                """
-                # Parse fields from the response
-                self.happy = data.get('happy', 0)
-                self.owner_id = data.get('owner_id', 0)
-                self.property_type = data.get('property_type', 0)
-                self.rented = self.Rented(data.get('rented', {}))
-                self.staff = data.get('staff', [])
-                self.upgrades = data.get('upgrades', [])
-                self.upkeep = data.get('upkeep', 0)
-                self.users_living = data.get('users_living', 0)
-
-                logger.debug(f"Processed PropertyData: {self}")
+            _schema = Schema(
+                Field('happy', 0),
+                Field('owner_id', 0),
+                Field('property_type', 0),
+                Field('rented', {}, 'Rented'),
+                Field('staff', []),
+                Field('upgrades', []),
+                Field('upkeep', 0),
+                Field('users_living', 0),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('PropertyData', record_logger)
 
             class Rented:
-                def __init__(self, data: Dict[str, Any]):
-                    """
-                    Parse and store the rented object data.
-
-                    Args:
-                    - data: A dictionary containing the rented data.
-                    """
-                    self.cost_per_day = data.get('cost_per_day', 0)
-                    self.days_left = data.get('days_left', 0)
-                    self.total_cost = data.get('total_cost', 0)
-                    self.user_id = data.get('user_id', 0)
-
-                    logger.debug(f"Processed Rented: {self}")
+                _schema = Schema(
+                    Field('cost_per_day', 0),
+                    Field('days_left', 0),
+                    Field('total_cost', 0),
+                    Field('user_id', 0),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('Rented', record_logger)
 
             def __repr__(self):
                 return (f"PropertyData(happy={self.happy}, owner_id={self.owner_id}, "
@@ -131,7 +120,7 @@ class Property:
             try:
                 # Make API request for the property lookup
                 response = self.api.make_request('property', '', 'lookup')
-                logger.debug(f"API response for property lookup: {response}")
+                logger.debug("API response for property lookup: %s", response)
 
                 # Check if response contains valid data
                 if not response or 'selections' not in response:
@@ -148,16 +137,11 @@ class Property:
                 return None
 
         class LookupData:
-            def __init__(self, data: Dict[str, Any]):
-                """
-                Parse and store the lookup data.
-
-                Args:
-                - data: A dictionary containing the fetched lookup data.
-                """
-                self.selections = data.get('selections', [])
-
-                logger.debug(f"Processed LookupData: {self}")
+            _schema = Schema(
+                Field('selections', []),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('LookupData', record_logger)
 
             def __repr__(self):
                 return f"LookupData(selections={self.selections})"
@@ -174,12 +158,12 @@ class Property:
             Returns:
             - int: The current timestamp.
             """
-            logger.debug(f"Fetching current timestamp for Property ID: {self.property_id}")
+            logger.debug("Fetching current timestamp for Property ID: %s", self.property_id)
 
             try:
                 # Make API request for the property timestamp
                 response = self.api.make_request('property', self.property_id, 'timestamp')
-                logger.debug(f"API response for property timestamp: {response}")
+                logger.debug("API response for property timestamp: %s", response)
 
                 # Check if response contains valid data
                 if not response or 'timestamp' not in response:
@@ -196,16 +180,11 @@ class Property:
                 return None # TODO: Check if this is correct
 
         class TimestampData:
-            def __init__(self, data: Dict[str, Any]):
-                """
-                Parse and store the timestamp data.
-
-                Args:
-                - data: A dictionary containing the fetched timestamp data.
-                """ 
-                self.timestamp = data.get('timestamp', 0)
-
-                logger.debug(f"Processed TimestampData: {self}")
+            _schema = Schema(
+                Field('timestamp', 0),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('TimestampData', record_logger)
 
             def __repr__(self):
                 return f"TimestampData(timestamp={self.timestamp})" # TODO: Check if this is correct      
@@ -1,17 +1,50 @@
 from typing import Dict, Any, Optional, List
 from tornApi import TornAPI
-from env_loader import load_environment_variables
-from logger import setup_logger, close_logger
+from config import get_config
+from logger import setup_logger, close_logger, get_record_logger
+from models import Field, LazyModel, Schema, Selection
+import columns
 from enum import Enum
 from datetime import datetime
 
-env = load_environment_variables()
-if env is None:
-    raise ValueError("Failed to load environment variables.")
-logger, file_handler = setup_logger('Sections', env['DEBUG_LEVEL'])
+config = get_config()
+logger, file_handler = setup_logger('Sections', config.debug_level)
+record_logger = get_record_logger('Sections')
 
 class Torn:
-    
+    # Selection objects are created on first attribute access and then cached on the instance.
+    bank = Selection('Bank', 'api')
+    cards = Selection('Cards', 'api')
+    chainreport = Selection('ChainReport', 'api', 'id')
+    cityshops = Selection('CityShops', 'api')
+    companies = Selection('Companies', 'api', 'id')
+    competition = Selection('Competition', 'api')
+    education = Selection('Education', 'api', 'id')
+    factiontree = Selection('FactionTree', 'api')
+    gyms = Selection('Gyms', 'api', 'id')
+    honors = Selection('Honors', 'api', 'id')
+    itemdetails = Selection('ItemDetails', 'api', 'id')
+    items = Selection('Items', 'api', 'id')
+    itemstats = Selection('ItemStats', 'api', 'id')
+    logcategories = Selection('LogCategories', 'api')
+    logtypes = Selection('LogTypes', 'api')
+    lookup = Selection('Lookup', 'api')
+    medals = Selection('Medals', 'api')
+    organisedcrimes = Selection('OrganisedCrimes', 'api', 'id')
+    pawnshop = Selection('Pawnshop', 'api')
+    properties = Selection('Properties', 'api')
+    rackets = Selection('Rackets', 'api')
+    raids = Selection('Raids', 'api')
+    rankedwars = Selection('RankedWars', 'api')
+    rankedwarreport = Selection('RankedWarReport', 'api', 'id')
+    stats = Selection('Stats', 'api')
+    stocks = Selection('Stocks', 'api', 'id')
+    territory = Selection('Territory', 'api')
+    territorynames = Selection('TerritoryNames', 'api')
+    territorywarreport = Selection('TerritoryWarReport', 'api', 'id')
+    territorywars = Selection('TerritoryWars', 'api')
+    timestamp = Selection('Timestamp')
+
     def __init__(self, api: TornAPI, id: Optional[int] = None):
         """
         Initialize the Torn class with the TornAPI.
@@ -21,39 +54,7 @@ class Torn:
         - id: Optional; The default ID to use for API requests.
         """
         self.api = api
-        self.id = id   
-        self.bank = self.Bank(self.api)
-        self.cards = self.Cards(self.api)
-        self.chainreport = self.ChainReport(self.api, self.id)
-        self.cityshops = self.CityShops(self.api)
-        self.companies = self.Companies(self.api, self.id)
-        self.competition = self.Competition(self.api)
-        self.education = self.Education(self.api, self.id)
-        self.factiontree = self.FactionTree(self.api)
-        self.gyms = self.Gyms(self.api, self.id)
-        self.honors = self.Honors(self.api, self.id)
-        self.itemdetails = self.ItemDetails(self.api, self.id)
-        self.items = self.Items(self.api, self.id)
-        self.itemstats = self.ItemStats(self.api, self.id)
-        self.logcategories = self.LogCategories(self.api)
-        self.logtypes = self.LogTypes(self.api)
-        self.lookup = self.Lookup(self.api) 
-        self.medals = self.Medals(self.api)
-        self.organisedcrimes = self.OrganisedCrimes(self.api, self.id)
-        self.pawnshop = self.Pawnshop(self.api)
-        self.properties = self.Properties(self.api)
-        self.rackets = self.Rackets(self.api)
-        self.raids = self.Raids(self.api)
-        self.rankedwars = self.RankedWars(self.api)
-        self.rankedwarreport = self.RankedWarReport(self.api, self.id)
-        self.stats = self.Stats(self.api)
-        self.stocks = self.Stocks(self.api, self.id)
-        self.territory = self.Territory(self.api)
-        self.territorynames = self.TerritoryNames(self.api)
-        self.territorywarreport = self.TerritoryWarReport(self.api, self.id)
-        self.territorywars = self.TerritoryWars(self.api)
-        self.timestamp = self.Timestamp()
-
+        self.id = id
         logger.info("Initialized Torn class")
 
     class Bank:
@@ -73,7 +74,7 @@ class Torn:
 
             try:
                 response = self.api.make_request('torn', '', 'bank')
-                logger.debug(f"API response for bank: {response}")
+                logger.debug("API response for bank: %s", response)
 
                 if not response or 'bank' not in response:
                     logger.warning("Bank data not found in the response")
@@ -88,20 +89,15 @@ class Torn:
                 return None
 
         class BankData:
-            def __init__(self, data: Dict[str, Any]):
-                """
-                Parse and store the bank data.
-
-                Args:
-                - data: A dictionary containing the fetched bank data.
-                """
-                self.one_month = float(data.get('1m', 0))
-                self.one_week = float(data.get('1w', 0))
-                self.two_months = float(data.get('2m', 0))
-                self.two_weeks = float(data.get('2w', 0))
-                self.three_months = float(data.get('3m', 0))
-
-                logger.debug(f"Processed BankData: {self}")
+            _schema = Schema(
+                Field('one_month', 0, float, key='1m'),
+                Field('one_week', 0, float, key='1w'),
+                Field('two_months', 0, float, key='2m'),
+                Field('two_weeks', 0, float, key='2w'),
+                Field('three_months', 0, float, key='3m'),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('BankData', record_logger)
 
             def __repr__(self):
                 return (f"BankData(1m={self.one_month}, 1w={self.one_week}, "
@@ -125,7 +121,7 @@ class Torn:
 
             try:
                 response = self.api.make_request('torn', '', 'cards')
-                logger.debug(f"API response for cards: {response}")
+                logger.debug("API response for cards: %s", response)
 
                 if not response or 'cards' not in response:
                     logger.warning("Cards data not found in the response")
@@ -140,6 +136,8 @@ class Torn:
                 return None
 
         class CardsData:
+            __slots__ = ('cards',)
+
             def __init__(self, data: Dict[str, Any]):
                 """
                 Parse and store the cards data.
@@ -148,7 +146,7 @@ class Torn:
                 - data: A dictionary containing the fetched cards data.
                 """
                 self.cards = {card_id: self.Card(card_data) for card_id, card_data in data.items()}
-                logger.debug(f"Processed CardsData: {len(self.cards)} cards")
+                record_logger.debug("Processed CardsData: %s cards", len(self.cards))
 
             def __repr__(self):
                 return f"CardsData(cards_count={len(self.cards)})"
@@ -157,12 +155,15 @@ class Torn:
                 return self.cards.get(card_id)
 
             class Card:
-                def __init__(self, data: Dict[str, Any]):
-                    self.cost = data.get('cost', 0)
-                    self.description = data.get('description', '')
-                    self.name = data.get('name', '')
-                    self.rarity = data.get('rarity', '')
-                    self.type = data.get('type', '')
+                _schema = Schema(
+                    Field('cost', 0),
+                    Field('description', ''),
+                    Field('name', ''),
+                    Field('rarity', ''),
+                    Field('type', ''),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('Card')
 
                 def __repr__(self):
                     return f"Card(name={self.name}, rarity={self.rarity})"
@@ -185,11 +186,11 @@ class Torn:
             - ChainReportData: An instance of ChainReportData containing the fetched data, or None if no data is available.
             """
             id_to_use = chain_id if chain_id is not None else self.id
-            logger.debug(f"Fetching chain report data for chain ID: {id_to_use}")
+            logger.debug("Fetching chain report data for chain ID: %s", id_to_use)
 
             try:
                 response = self.api.make_request('torn', id_to_use, 'chainreport')
-                logger.debug(f"API response for chain report: {response}")
+                logger.debug("API response for chain report: %s", response)
 
                 if isinstance(response, dict) and 'chainreport' in response:
                     if 'code' in response['chainreport'] and response['chainreport']['code'] == 6:
@@ -208,6 +209,12 @@ class Torn:
                 return None
 
         class ChainReportData:
+            __slots__ = (
+                'assists', 'besthit', 'bonuses', 'chain', 'code', 'draws', 'end', 'error',
+                'escapes', 'faction_id', 'hospitalize', 'leave', 'losses', 'members', 'mug',
+                'overseas', 'respect', 'retaliations', 'start', 'targets', 'warhits',
+            )
+
             def __init__(self, data: Dict[str, Any]):
                 self.assists = data.get('assists', 0)
                 self.besthit = data.get('besthit', 0)
@@ -235,16 +242,21 @@ class Torn:
                 return f"ChainReportData(chain={self.chain}, respect={self.respect}, members_count={len(self.members)})"
 
             class BonusHit:
-                def __init__(self, data: Dict[str, Any]):
-                    self.attacker = data.get('attacker', 0)
-                    self.chain = data.get('chain', 0)
-                    self.defender = data.get('defender', 0)
-                    self.respect = data.get('respect', 0.0)
+                _schema = Schema(
+                    Field('attacker', 0),
+                    Field('chain', 0),
+                    Field('defender', 0),
+                    Field('respect', 0.0),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('BonusHit')
 
                 def __repr__(self):
                     return f"BonusHit(attacker={self.attacker}, defender={self.defender}, respect={self.respect})"
 
             class Members:
+                __slots__ = ('members',)
+
                 def __init__(self, data: Dict[str, Any]):
                     self.members = {int(user_id): self.Member(member_data) for user_id, member_data in data.items()}
 
@@ -258,25 +270,28 @@ class Torn:
                     return f"Members(count={len(self.members)})"
 
                 class Member:
-                    def __init__(self, data: Dict[str, Any]):
-                        self.assist = data.get('assist', 0)
-                        self.attacks = data.get('attacks', 0)
-                        self.avg = data.get('avg', 0.0)
-                        self.best = data.get('best', 0.0)
-                        self.bonus = data.get('bonus', 0)
-                        self.draw = data.get('draw', 0)
-                        self.escape = data.get('escape', 0)
-                        self.faction_id = data.get('factionID', 0)
-                        self.hosp = data.get('hosp', 0)
-                        self.leave = data.get('leave', 0)
-                        self.level = data.get('level', 0)
-                        self.loss = data.get('loss', 0)
-                        self.mug = data.get('mug', 0)
-                        self.overseas = data.get('overseas', 0)
-                        self.respect = data.get('respect', 0.0)
-                        self.retal = data.get('retal', 0)
-                        self.user_id = data.get('userID', 0)
-                        self.war = data.get('war', 0)
+                    _schema = Schema(
+                        Field('assist', 0),
+                        Field('attacks', 0),
+                        Field('avg', 0.0),
+                        Field('best', 0.0),
+                        Field('bonus', 0),
+                        Field('draw', 0),
+                        Field('escape', 0),
+                        Field('faction_id', 0, key='factionID'),
+                        Field('hosp', 0),
+                        Field('leave', 0),
+                        Field('level', 0),
+                        Field('loss', 0),
+                        Field('mug', 0),
+                        Field('overseas', 0),
+                        Field('respect', 0.0),
+                        Field('retal', 0),
+                        Field('user_id', 0, key='userID'),
+                        Field('war', 0),
+                    )
+                    __slots__ = _schema.slots
+                    __init__ = _schema.constructor('Member')
 
                     def __repr__(self):
                         return f"Member(user_id={self.user_id}, respect={self.respect})"
@@ -298,7 +313,7 @@ class Torn:
 
             try:
                 response = self.api.make_request('torn', '', 'cityshops')
-                logger.debug(f"API response for city shops: {response}")
+                logger.debug("API response for city shops: %s", response)
 
                 if not response or 'cityshops' not in response:
                     logger.warning("City shops data not found in the response")
@@ -313,6 +328,8 @@ class Torn:
                 return None
 
         class CityShopsData:
+            __slots__ = ('shops',)
+
             def __init__(self, data: Dict[str, Any]):
                 """
                 Parse and store the city shops data.
@@ -321,7 +338,7 @@ class Torn:
                 - data: A dictionary containing the fetched city shops data.
                 """
                 self.shops = {shop_id: self.Shop(shop_data) for shop_id, shop_data in data.items()}
-                logger.debug(f"Processed CityShopsData: {len(self.shops)} shops")
+                record_logger.debug("Processed CityShopsData: %s shops", len(self.shops))
 
             def __repr__(self):
                 return f"CityShopsData(shops_count={len(self.shops)})"
@@ -330,14 +347,19 @@ class Torn:
                 return self.shops.get(shop_id)
 
             class Shop:
-                def __init__(self, data: Dict[str, Any]):
-                    self.name = data.get('name', '')
-                    self.inventory = self.Inventory(data.get('inventory', {}))
+                _schema = Schema(
+                    Field('name', ''),
+                    Field('inventory', {}, 'Inventory'),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('Shop')
 
                 def __repr__(self):
                     return f"Shop(name={self.name}, inventory_count={len(self.inventory.items)})"
 
                 class Inventory:
+                    __slots__ = ('items',)
+
                     def __init__(self, data: Dict[str, Any]):
                         self.items = {item_id: self.Item(item_data) for item_id, item_data in data.items()}
 
@@ -348,11 +370,14 @@ class Torn:
                         return self.items.get(item_id)
 
                     class Item:
-                        def __init__(self, data: Dict[str, Any]):
-                            self.in_stock = data.get('in_stock', 0)
-                            self.name = data.get('name', '')
-                            self.price = data.get('price', 0)
-                            self.type = data.get('type', '')
+                        _schema = Schema(
+                            Field('in_stock', 0),
+                            Field('name', ''),
+                            Field('price', 0),
+                            Field('type', ''),
+                        )
+                        __slots__ = _schema.slots
+                        __init__ = _schema.constructor('Item')
 
                         def __repr__(self):
                             return f"Item(name={self.name}, in_stock={self.in_stock}, price={self.price})"
@@ -375,11 +400,11 @@ class Torn:
             - CompaniesData: An instance of CompaniesData containing the fetched data.
             """
             id_to_use = company_id if company_id is not None else self.id
-            logger.debug(f"Fetching companies data{'for company ID: ' + str(id_to_use) if id_to_use else ''}")
+            logger.debug("Fetching companies data%s", 'for company ID: ' + str(id_to_use) if id_to_use else '')
 
             try:
                 response = self.api.make_request('torn', id_to_use, 'companies')
-                logger.debug(f"API response for companies: {response}")
+                logger.debug("API response for companies: %s", response)
 
                 if not response or 'companies' not in response:
                     logger.warning("Companies data not found in the response")
@@ -394,6 +419,8 @@ class Torn:
                 return None
 
         class CompaniesData:
+            __slots__ = ('companies', 'id')
+
             def __init__(self, data: Dict[str, Any], id: Optional[int] = None):
                 """
                 Parse and store the companies data.
@@ -404,7 +431,7 @@ class Torn:
                 """
                 self.companies = {company_id: self.Company(company_data) for company_id, company_data in data.items()}
                 self.id = id
-                logger.debug(f"Processed CompaniesData: {len(self.companies)} companies")
+                record_logger.debug("Processed CompaniesData: %s companies", len(self.companies))
 
             def __repr__(self):
                 return f"CompaniesData(companies_count={len(self.companies)})"
@@ -424,18 +451,23 @@ class Torn:
                 return None
 
             class Company:
-                def __init__(self, data: Dict[str, Any]):
-                    self.cost = data.get('cost', 0)
-                    self.default_employees = data.get('default_employees', 0)
-                    self.name = data.get('name', '')
-                    self.positions = self.Positions(data.get('positions', {}))
-                    self.specials = self.Specials(data.get('specials', {}))
-                    self.stock = self.Stocks(data.get('stock', {}))
+                _schema = Schema(
+                    Field('cost', 0),
+                    Field('default_employees', 0),
+                    Field('name', ''),
+                    Field('positions', {}, 'Positions'),
+                    Field('specials', {}, 'Specials'),
+                    Field('stock', {}, 'Stocks'),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('Company')
 
                 def __repr__(self):
                     return f"Company(name={self.name}, positions={len(self.positions.positions)})"
 
                 class Positions:
+                    __slots__ = ('positions',)
+
                     def __init__(self, data: Dict[str, Any]):
                         self.positions = {name: self.Position(position_data) for name, position_data in data.items()}
 
@@ -446,6 +478,19 @@ class Torn:
                         return self.positions.get(name)
 
                     class Position:
+                        _schema = Schema(
+                            Field('description', ''),
+                            Field('end_gain', 0),
+                            Field('end_required', 0),
+                            Field('int_gain', 0),
+                            Field('int_required', 0),
+                            Field('man_gain', 0),
+                            Field('man_required', 0),
+                            Field('special_ability', 'None', 'SpecialAbility'),
+                        )
+                        __slots__ = _schema.slots
+                        __init__ = _schema.constructor('Position')
+
                         class SpecialAbility(Enum):
                             CLEANER = "Cleaner"
                             MANAGER = "Manager"
@@ -454,20 +499,12 @@ class Torn:
                             SECRETARY = "Secretary"
                             TRAINER = "Trainer"
 
-                        def __init__(self, data: Dict[str, Any]):
-                            self.description = data.get('description', '')
-                            self.end_gain = data.get('end_gain', 0)
-                            self.end_required = data.get('end_required', 0)
-                            self.int_gain = data.get('int_gain', 0)
-                            self.int_required = data.get('int_required', 0)
-                            self.man_gain = data.get('man_gain', 0)
-                            self.man_required = data.get('man_required', 0)
-                            self.special_ability = self.SpecialAbility(data.get('special_ability', 'None'))
-
                         def __repr__(self):
                             return f"Position(special_ability={self.special_ability.value})"
 
                 class Specials:
+                    __slots__ = ('specials',)
+
                     def __init__(self, data: Dict[str, Any]):
                         self.specials = {name: self.Special(special_data) for name, special_data in data.items()}
 
@@ -478,15 +515,20 @@ class Torn:
                         return self.specials.get(name)
 
                     class Special:
-                        def __init__(self, data: Dict[str, Any]):
-                            self.cost = data.get('cost', 0)
-                            self.effect = data.get('effect', '')
-                            self.rating_required = data.get('rating_required', 0)
+                        _schema = Schema(
+                            Field('cost', 0),
+                            Field('effect', ''),
+                            Field('rating_required', 0),
+                        )
+                        __slots__ = _schema.slots
+                        __init__ = _schema.constructor('Special')
 
                         def __repr__(self):
                             return f"Special(effect={self.effect})"
 
                 class Stocks:
+                    __slots__ = ('stocks',)
+
                     def __init__(self, data: Dict[str, Any]):
                         self.stocks = {name: self.Stock(stock_data) for name, stock_data in data.items()}
 
@@ -497,8 +539,11 @@ class Torn:
                         return self.stocks.get(name)
 
                     class Stock:
-                        def __init__(self, data: Dict[str, Any]):
-                            self.cost = data.get('cost', 0)
+                        _schema = Schema(
+                            Field('cost', 0),
+                        )
+                        __slots__ = _schema.slots
+                        __init__ = _schema.constructor('Stock')
 
     class Competition:
         #TODO : handle the error when the competition is not found
@@ -518,7 +563,7 @@ class Torn:
 
             try:
                 response = self.api.make_request('torn', '', 'competition')
-                logger.debug(f"API response for competition: {response}")
+                logger.debug("API response for competition: %s", response)
 
                 if not response or 'competition' not in response:
                     logger.warning("Competition data not found in the response")
@@ -533,6 +578,8 @@ class Torn:
                 return None
 
         class CompetitionData:
+            __slots__ = ('leaderboard_mr', 'leaderboard_mrs', 'name', 'teams')
+
             class CompetitionType(Enum):
                 DOG_TAGS = "Dog Tags"
                 EASTER_EGG_HUNT = "Easter Egg Hunt"
@@ -555,15 +602,23 @@ class Torn:
                 return f"CompetitionData(name={self.name.value}, teams_count={len(self.teams)})"
 
             class LeaderboardPosition:
-                def __init__(self, data: Dict[str, Any]):
-                    self.position = data.get('position', 0)
-                    self.score = float(data.get('score', 0))
-                    self.user_id = data.get('user_id', 0)
+                _schema = Schema(
+                    Field('position', 0),
+                    Field('score', 0, float),
+                    Field('user_id', 0),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('LeaderboardPosition')
 
                 def __repr__(self):
                     return f"LeaderboardPosition(position={self.position}, user_id={self.user_id}, score={self.score})"
 
             class EliminationTeam:
+                __slots__ = (
+                    'lives', 'losses', 'name', 'participants', 'position', 'score', 'status',
+                    'team', 'wins',
+                )
+
                 def __init__(self, data: Dict[str, Any]):
                     self.lives = data.get('lives', 0)
                     self.losses = data.get('losses', 0)
@@ -596,11 +651,11 @@ class Torn:
             - EducationsData: An instance of EducationsData containing the fetched data.
             """
             id_to_use = education_id if education_id is not None else self.id
-            logger.debug(f"Fetching education data{'for education ID: ' + str(id_to_use) if id_to_use else ''}")
+            logger.debug("Fetching education data%s", 'for education ID: ' + str(id_to_use) if id_to_use else '')
 
             try:
                 response = self.api.make_request('torn', id_to_use, 'education')
-                logger.debug(f"API response for education: {response}")
+                logger.debug("API response for education: %s", response)
 
                 if not response or 'education' not in response:
                     logger.warning("Education data not found in the response")
@@ -615,6 +670,8 @@ class Torn:
                 return None
 
         class EducationsData:
+            __slots__ = ('educations',)
+
             def __init__(self, data: Dict[str, Any]):
                 self.educations = {edu_id: self.Education(edu_data) for edu_id, edu_data in data.items()}
 
@@ -625,25 +682,31 @@ class Torn:
                 return self.educations.get(edu_id)
 
             class Education:
-                def __init__(self, data: Dict[str, Any]):
-                    self.code = data.get('code', '')
-                    self.description = data.get('description', '')
-                    self.duration = data.get('duration', 0)
-                    self.money_cost = data.get('money_cost', 0)
-                    self.name = data.get('name', '')
-                    self.prerequisites = data.get('prerequisites', [])
-                    self.results = self.Results(data.get('results', {}))
-                    self.tier = data.get('tier', 0)
+                _schema = Schema(
+                    Field('code', ''),
+                    Field('description', ''),
+                    Field('duration', 0),
+                    Field('money_cost', 0),
+                    Field('name', ''),
+                    Field('prerequisites', []),
+                    Field('results', {}, 'Results'),
+                    Field('tier', 0),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('Education')
 
                 def __repr__(self):
                     return f"Education(name={self.name}, tier={self.tier})"
 
                 class Results:
-                    def __init__(self, data: Dict[str, Any]):
-                        self.endurance = data.get('endurance', [])
-                        self.intelligence = data.get('intelligence', [])
-                        self.manual_labor = data.get('manual_labor', [])
-                        self.perk = data.get('perk', [])
+                    _schema = Schema(
+                        Field('endurance', []),
+                        Field('intelligence', []),
+                        Field('manual_labor', []),
+                        Field('perk', []),
+                    )
+                    __slots__ = _schema.slots
+                    __init__ = _schema.constructor('Results')
 
                     def __repr__(self):
                         return f"Results(endurance={len(self.endurance)}, intelligence={len(self.intelligence)}, manual_labor={len(self.manual_labor)}, perk={len(self.perk)})"
@@ -665,7 +728,7 @@ class Torn:
 
             try:
                 response = self.api.make_request('torn', '', 'factiontree')
-                logger.debug(f"API response for faction tree: {response}")
+                logger.debug("API response for faction tree: %s", response)
 
                 if not response or 'factiontree' not in response:
                     logger.warning("Faction tree data not found in the response")
@@ -680,6 +743,8 @@ class Torn:
                 return None
 
         class FactionTreeData:
+            __slots__ = ('branches',)
+
             class Branch(Enum):
                 AGGRESSION = "Aggression"
                 CORE = "Core"
@@ -698,6 +763,8 @@ class Torn:
                 return f"FactionTreeData(branches_count={len(self.branches)})"
 
             class BranchTree:
+                __slots__ = ('levels',)
+
                 def __init__(self, data: Dict[str, Any]):
                     self.levels = {level: self.Level(level_data) for level, level_data in data.items()}
 
@@ -705,6 +772,8 @@ class Torn:
                     return f"BranchTree(levels_count={len(self.levels)})"
 
                 class Level:
+                    __slots__ = ('ability', 'base_cost', 'branch', 'challenge', 'name')
+
                     def __init__(self, data: Dict[str, Any]):
                         self.ability = data.get('ability', '')
                         self.base_cost = data.get('base_cost', 0)
@@ -733,11 +802,11 @@ class Torn:
             - GymsData: An instance of GymsData containing the fetched data.
             """
             id_to_use = gym_id if gym_id is not None else self.id
-            logger.debug(f"Fetching gyms data{'for gym ID: ' + str(id_to_use) if id_to_use else ''}")
+            logger.debug("Fetching gyms data%s", 'for gym ID: ' + str(id_to_use) if id_to_use else '')
 
             try:
                 response = self.api.make_request('torn', id_to_use, 'gyms')
-                logger.debug(f"API response for gyms: {response}")
+                logger.debug("API response for gyms: %s", response)
 
                 if not response or 'gyms' not in response:
                     logger.warning("Gyms data not found in the response")
@@ -752,6 +821,8 @@ class Torn:
                 return None
 
         class GymsData:
+            __slots__ = ('gyms',)
+
             def __init__(self, data: Dict[str, Any]):
                 self.gyms = {gym_id: self.Gym(gym_data) for gym_id, gym_data in data.items()}
 
@@ -762,16 +833,19 @@ class Torn:
                 return self.gyms.get(gym_id)
 
             class Gym:
-                def __init__(self, data: Dict[str, Any]):
-                    self.cost = data.get('cost', 0)
-                    self.defense = data.get('defense', 0)
-                    self.dexterity = data.get('dexterity', 0)
-                    self.energy = data.get('energy', 0)
-                    self.name = data.get('name', '')
-                    self.note = data.get('note', '')
-                    self.speed = data.get('speed', 0)
-                    self.stage = data.get('stage', 0)
-                    self.strength = data.get('strength', 0)
+                _schema = Schema(
+                    Field('cost', 0),
+                    Field('defense', 0),
+                    Field('dexterity', 0),
+                    Field('energy', 0),
+                    Field('name', ''),
+                    Field('note', ''),
+                    Field('speed', 0),
+                    Field('stage', 0),
+                    Field('strength', 0),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('Gym')
 
                 def __repr__(self):
                     return f"Gym(name={self.name}, stage={self.stage})"
@@ -794,11 +868,11 @@ class Torn:
             - HonorsData: An instance of HonorsData containing the fetched data.
             """
             id_to_use = honor_id if honor_id is not None else self.id
-            logger.debug(f"Fetching honors data{' for honor ID: ' + str(id_to_use) if id_to_use else ''}")
+            logger.debug("Fetching honors data%s", ' for honor ID: ' + str(id_to_use) if id_to_use else '')
 
             try:
                 response = self.api.make_request('torn', id_to_use, 'honors')
-                logger.debug(f"API response for honors: {response}")
+                logger.debug("API response for honors: %s", response)
 
                 if not response or 'honors' not in response:
                     logger.warning("Honors data not found in the response")
@@ -813,6 +887,8 @@ class Torn:
                 return None
 
         class HonorsData:
+            __slots__ = ('honors',)
+
             class Rarity(Enum):
                 COMMON = "Common"
                 EXTREMELY_RARE = "Extremely Rare"
@@ -837,6 +913,8 @@ class Torn:
                 return self.honors.get(honor_id)
 
             class Honor:
+                __slots__ = ('circulation', 'description', 'equipped', 'name', 'type', 'rarity')
+
                 def __init__(self, data: Dict[str, Any]):
                     self.circulation = data.get('circulation', 0)
                     self.description = data.get('description', '')
@@ -882,11 +960,11 @@ class Torn:
                 logger.error("No item ID provided for fetching item details")
                 return None
 
-            logger.debug(f"Fetching item details data for item ID: {id_to_use}")
+            logger.debug("Fetching item details data for item ID: %s", id_to_use)
 
             try:
                 response = self.api.make_request('torn', id_to_use, 'itemdetails')
-                logger.debug(f"API response for item details: {response}")
+                logger.debug("API response for item details: %s", response)
 
                 if not response or 'itemdetails' not in response:
                     logger.warning("Item details data not found in the response")
@@ -901,28 +979,33 @@ class Torn:
                 return None
 
         class ItemData:
+            _schema = Schema(
+                Field('accuracy', 0, float),
+                Field('armor', 0, float),
+                Field('bonuses', {}, 'Bonuses'),
+                Field('damage', 0, float),
+                Field('ID', 0),
+                Field('name', ''),
+                Field('quality', 0, float),
+                Field('rarity', 'None', 'Rarity'),
+                Field('type', ''),
+                Field('UID', 0),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('ItemData')
+
             class Rarity(Enum):
                 NONE = "None"
                 ORANGE = "Orange"
                 RED = "Red"
                 YELLOW = "Yellow"
 
-            def __init__(self, data: Dict[str, Any]):
-                self.accuracy = float(data.get('accuracy', 0))
-                self.armor = float(data.get('armor', 0))
-                self.bonuses = self.Bonuses(data.get('bonuses', {}))
-                self.damage = float(data.get('damage', 0))
-                self.ID = data.get('ID', 0)
-                self.name = data.get('name', '')
-                self.quality = float(data.get('quality', 0))
-                self.rarity = self.Rarity(data.get('rarity', 'None'))
-                self.type = data.get('type', '')
-                self.UID = data.get('UID', 0)
-
             def __repr__(self):
                 return f"ItemData(name={self.name}, rarity={self.rarity.value})"
 
             class Bonuses:
+                __slots__ = ('bonuses',)
+
                 def __init__(self, data: Dict[str, Any]):
                     self.bonuses = {bonus_id: self.Bonus(bonus_data) for bonus_id, bonus_data in data.items()}
 
@@ -933,10 +1016,13 @@ class Torn:
                     return self.bonuses.get(bonus_id)
 
                 class Bonus:
-                    def __init__(self, data: Dict[str, Any]):
-                        self.bonus = data.get('bonus', '')
-                        self.description = data.get('description', '')
-                        self.value = data.get('value', 0)
+                    _schema = Schema(
+                        Field('bonus', ''),
+                        Field('description', ''),
+                        Field('value', 0),
+                    )
+                    __slots__ = _schema.slots
+                    __init__ = _schema.constructor('Bonus')
 
                     def __repr__(self):
                         return f"Bonus(bonus={self.bonus}, value={self.value})"
@@ -959,11 +1045,11 @@ class Torn:
             - ItemsData: An instance of ItemsData containing the fetched data.
             """
             id_to_use = item_id if item_id is not None else self.id
-            logger.debug(f"Fetching items data{' for item ID: ' + str(id_to_use) if id_to_use else ''}")
+            logger.debug("Fetching items data%s", ' for item ID: ' + str(id_to_use) if id_to_use else '')
 
             try:
                 response = self.api.make_request('torn', id_to_use, 'items')
-                logger.debug(f"API response for items: {response}")
+                logger.debug("API response for items: %s", response)
 
                 if not response or 'items' not in response:
                     logger.warning("Items data not found in the response")
@@ -977,10 +1063,30 @@ class Torn:
                 logger.error(f"Error fetching items data: {e}")
                 return None
 
+        def stream(self, item_id: Optional[int] = None):
+            """
+            Stream items one at a time, without decoding the whole response first.
+
+            Args:
+            - item_id: Optional; The ID of a specific item. If not provided, uses the default ID.
+
+            Yields:
+            - Tuple[str, Item]: The item ID and its Item instance.
+
+            Raises:
+            - StreamError: If the request fails or the API returns an error.
+            """
+            id_to_use = item_id if item_id is not None else self.id
+            logger.debug("Streaming items data%s", ' for item ID: ' + str(id_to_use) if id_to_use else '')
+            for item_id, item_data in self.api.stream('torn', id_to_use, 'items'):
+                yield item_id, self.ItemsData.Item(item_data)
+
         class ItemsData:
+            __slots__ = ('items',)
+
             def __init__(self, data: Dict[str, Any]):
                 self.items = {item_id: self.Item(item_data) for item_id, item_data in data.items()}
-                logger.debug(f"Processed ItemsData: {len(self.items)} items")
+                record_logger.debug("Processed ItemsData: %s items", len(self.items))
 
             def __repr__(self):
                 return f"ItemsData(items_count={len(self.items)})"
@@ -989,36 +1095,42 @@ class Torn:
                 return self.items.get(item_id)
 
             class Item:
-                def __init__(self, data: Dict[str, Any]):
-                    self.buy_price = data.get('buy_price', 0)
-                    self.circulation = data.get('circulation', 0)
-                    self.coverage = self.Coverage(data.get('coverage', {}))
-                    self.description = data.get('description', '')
-                    self.effect = data.get('effect', '')
-                    self.image = data.get('image', '')
-                    self.market_value = data.get('market_value', 0)
-                    self.name = data.get('name', '')
-                    self.requirement = data.get('requirement', '')
-                    self.sell_price = data.get('sell_price', 0)
-                    self.type = data.get('type', '')
-                    self.weapon_type = data.get('weapon_type', '')
+                _schema = Schema(
+                    Field('buy_price', 0),
+                    Field('circulation', 0),
+                    Field('coverage', {}, 'Coverage'),
+                    Field('description', ''),
+                    Field('effect', ''),
+                    Field('image', ''),
+                    Field('market_value', 0),
+                    Field('name', ''),
+                    Field('requirement', ''),
+                    Field('sell_price', 0),
+                    Field('type', ''),
+                    Field('weapon_type', ''),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('Item')
 
                 def __repr__(self):
                     return f"Item(name={self.name}, type={self.type})"
 
                 class Coverage:
-                    def __init__(self, data: Dict[str, Any]):
-                        self.arm_coverage = data.get('Arm Coverage', 0.0)
-                        self.chest_coverage = data.get('Chest Coverage', 0.0)
-                        self.foot_coverage = data.get('Foot Coverage', 0.0)
-                        self.full_body_coverage = data.get('Full Body Coverage', 0.0)
-                        self.groin_coverage = data.get('Groin Coverage', 0.0)
-                        self.hand_coverage = data.get('Hand Coverage', 0.0)
-                        self.head_coverage = data.get('Head Coverage', 0.0)
-                        self.heart_coverage = data.get('Heart Coverage', 0.0)
-                        self.leg_coverage = data.get('Leg Coverage', 0.0)
-                        self.stomach_coverage = data.get('Stomach Coverage', 0.0)
-                        self.throat_coverage = data.get('Throat Coverage', 0.0)
+                    _schema = Schema(
+                        Field('arm_coverage', 0.0, key='Arm Coverage'),
+                        Field('chest_coverage', 0.0, key='Chest Coverage'),
+                        Field('foot_coverage', 0.0, key='Foot Coverage'),
+                        Field('full_body_coverage', 0.0, key='Full Body Coverage'),
+                        Field('groin_coverage', 0.0, key='Groin Coverage'),
+                        Field('hand_coverage', 0.0, key='Hand Coverage'),
+                        Field('head_coverage', 0.0, key='Head Coverage'),
+                        Field('heart_coverage', 0.0, key='Heart Coverage'),
+                        Field('leg_coverage', 0.0, key='Leg Coverage'),
+                        Field('stomach_coverage', 0.0, key='Stomach Coverage'),
+                        Field('throat_coverage', 0.0, key='Throat Coverage'),
+                    )
+                    __slots__ = _schema.slots
+                    __init__ = _schema.constructor('Coverage')
 
     class ItemStats:
         def __init__(self, api: TornAPI, id: Optional[int] = None):
@@ -1038,7 +1150,7 @@ class Torn:
             - ItemStatsData: An instance of ItemStatsData containing the fetched data.
             """
             id_to_use = item_id if item_id is not None else self.id
-            logger.debug(f"Fetching item stats data for item ID: {id_to_use}")
+            logger.debug("Fetching item stats data for item ID: %s", id_to_use)
 
             if id_to_use is None:
                 logger.error("No item ID provided for fetching item stats")
@@ -1046,7 +1158,7 @@ class Torn:
 
             try:
                 response = self.api.make_request('torn', id_to_use, 'itemstats')
-                logger.debug(f"API response for item stats: {response}")
+                logger.debug("API response for item stats: %s", response)
 
                 if not response or 'itemstats' not in response:
                     logger.warning("Item stats data not found in the response")
@@ -1061,19 +1173,29 @@ class Torn:
                 return None
 
         class ItemStatsData:
-            def __init__(self, data: Dict[str, Any]):
-                self.ID = data.get('ID', 0)
-                self.market_price = data.get('market_price', 0)
-                self.name = data.get('name', '')
-                self.stats = self.Stats(data.get('stats', {}))
-                self.type = data.get('type', '')
-                self.UID = data.get('UID', 0)
+            _schema = Schema(
+                Field('ID', 0),
+                Field('market_price', 0),
+                Field('name', ''),
+                Field('stats', {}, 'Stats'),
+                Field('type', ''),
+                Field('UID', 0),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('ItemStatsData')
 
             def __repr__(self):
                 return f"ItemStatsData(name={self.name}, type={self.type})"
 
             class Stats:
                 
+                __slots__ = (
+                    'critical_hits', 'damage', 'damage_mitigated', 'damage_taken', 'finishing_hits',
+                    'first_faction_owner', 'first_owner', 'highest_damage', 'hits', 'hits_received',
+                    'misses', 'most_damage_mitigated', 'most_damage_taken', 'reloads',
+                    'respect_earned', 'rounds_fired', 'time_created',
+                )
+
                 def __init__(self, data: Dict[str, Any]):
                     self.critical_hits = data.get('critical_hits', 0)
                     self.damage = data.get('damage', 0)
@@ -1114,7 +1236,7 @@ class Torn:
 
             try:
                 response = self.api.make_request('torn', '', 'logcategories')
-                logger.debug(f"API response for log categories: {response}")
+                logger.debug("API response for log categories: %s", response)
 
                 if not response or 'logcategories' not in response:
                     logger.warning("Log categories data not found in the response")
@@ -1129,9 +1251,11 @@ class Torn:
                 return None
 
         class LogCategoriesData:
+            __slots__ = ('categories',)
+
             def __init__(self, data: Dict[str, Any]):
                 self.categories = {category_id: category_name for category_id, category_name in data.items() }
-                logger.debug(f"Processed LogCategoriesData: {len(self.categories)} categories")
+                record_logger.debug("Processed LogCategoriesData: %s categories", len(self.categories))
 
             def __repr__(self):
                 return f"LogCategoriesData(categories_count={len(self.categories)})"
@@ -1156,7 +1280,7 @@ class Torn:
 
             try:
                 response = self.api.make_request('torn', '', 'logtypes')
-                logger.debug(f"API response for log types: {response}")
+                logger.debug("API response for log types: %s", response)
 
                 if not response or 'logtypes' not in response:
                     logger.warning("Log types data not found in the response")
@@ -1171,9 +1295,11 @@ class Torn:
                 return None
 
         class LogTypesData:
+            __slots__ = ('types',)
+
             def __init__(self, data: Dict[str, Any]):
                 self.types = {type_id: type_name for type_id, type_name in data.items()}
-                logger.debug(f"Processed LogTypesData: {len(self.types)} types")
+                record_logger.debug("Processed LogTypesData: %s types", len(self.types))
 
             def __repr__(self):
                 return f"LogTypesData(types_count={len(self.types)})"
@@ -1197,11 +1323,11 @@ class Torn:
             Returns:
             - LookupData: An instance of LookupData containing the fetched data.
             """
-            logger.debug(f"Fetching lookup data for section: {section}")
+            logger.debug("Fetching lookup data for section: %s", section)
 
             try:
                 response = self.api.make_request('torn', '', 'lookup', selections=section)
-                logger.debug(f"API response for lookup: {response}")
+                logger.debug("API response for lookup: %s", response)
 
                 if not response or 'selections' not in response:
                     logger.warning("Lookup data not found in the response")
@@ -1216,9 +1342,11 @@ class Torn:
                 return None
 
         class LookupData:
+            __slots__ = ('selections',)
+
             def __init__(self, data: List[str]):
                 self.selections = data
-                logger.debug(f"Processed LookupData: {len(self.selections)} selections")
+                record_logger.debug("Processed LookupData: %s selections", len(self.selections))
 
             def __repr__(self):
                 return f"LookupData(selections_count={len(self.selections)})"
@@ -1247,11 +1375,11 @@ class Torn:
             - MedalsData: An instance of MedalsData containing the fetched data.
             """
             id_to_use = medal_id if medal_id is not None else self.id
-            logger.debug(f"Fetching medals data{'for medal ID: ' + str(id_to_use) if id_to_use else ''}")
+            logger.debug("Fetching medals data%s", 'for medal ID: ' + str(id_to_use) if id_to_use else '')
 
             try:
                 response = self.api.make_request('torn', id_to_use, 'medals')
-                logger.debug(f"API response for medals: {response}")
+                logger.debug("API response for medals: %s", response)
 
                 if not response or 'medals' not in response:
                     logger.warning("Medals data not found in the response")
@@ -1266,6 +1394,8 @@ class Torn:
                 return None
 
         class MedalsData:
+            __slots__ = ('medals',)
+
             def __init__(self, data: Dict[str, Any]):
                 """
                 Parse and store the medals data.
@@ -1274,7 +1404,7 @@ class Torn:
                 - data: A dictionary containing the fetched medals data.
                 """
                 self.medals = {medal_id: self.Medal(medal_data) for medal_id, medal_data in data.items()}
-                logger.debug(f"Processed MedalsData: {len(self.medals)} medals")
+                record_logger.debug("Processed MedalsData: %s medals", len(self.medals))
 
             def __repr__(self):
                 return f"MedalsData(medals_count={len(self.medals)})"
@@ -1283,6 +1413,8 @@ class Torn:
                 return self.medals.get(medal_id)
 
             class Medal:
+                __slots__ = ('circulation', 'description', 'equipped', 'name', 'type', 'rarity')
+
                 class Rarity(Enum):
                     UNKNOWN = "Unknown Rarity"
                     VERY_COMMON = "Very Common"
@@ -1333,7 +1465,7 @@ class Torn:
 
             try:
                 response = self.api.make_request('torn', self.id, 'organisedcrimes')
-                logger.debug(f"API response for organised crimes: {response}")
+                logger.debug("API response for organised crimes: %s", response)
 
                 if not response or 'organisedcrimes' not in response:
                     logger.warning("Organised crimes data not found in the response")
@@ -1348,6 +1480,8 @@ class Torn:
                 return None
 
         class OrganisedCrimesData:
+            __slots__ = ('crimes',)
+
             def __init__(self, data: Dict[str, Any]):
                 """
                 Parse and store the organised crimes data.
@@ -1356,7 +1490,7 @@ class Torn:
                 - data: A dictionary containing the fetched organised crimes data.
                 """
                 self.crimes = {crime_id: self.OrganisedCrime(crime_data) for crime_id, crime_data in data.items()}
-                logger.debug(f"Processed OrganisedCrimesData: {len(self.crimes)} crimes")
+                record_logger.debug("Processed OrganisedCrimesData: %s crimes", len(self.crimes))
 
             def __repr__(self):
                 return f"OrganisedCrimesData(crimes_count={len(self.crimes)})"
@@ -1365,14 +1499,17 @@ class Torn:
                 return self.crimes.get(crime_id)
 
             class OrganisedCrime:
-                def __init__(self, data: Dict[str, Any]):
-                    self.max_cash = data.get('max_cash', 0)
-                    self.max_respect = data.get('max_respect', 0)
-                    self.members = data.get('members', 0)
-                    self.min_cash = data.get('min_cash', 0)
-                    self.min_respect = data.get('min_respect', 0)
-                    self.name = data.get('name', '')
-                    self.time = data.get('time', 0)
+                _schema = Schema(
+                    Field('max_cash', 0),
+                    Field('max_respect', 0),
+                    Field('members', 0),
+                    Field('min_cash', 0),
+                    Field('min_respect', 0),
+                    Field('name', ''),
+                    Field('time', 0),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('OrganisedCrime')
 
                 def __repr__(self):
                     return f"OrganisedCrime(name={self.name}, members={self.members}, time={self.time})"
@@ -1394,7 +1531,7 @@ class Torn:
 
             try:
                 response = self.api.make_request('torn', '', 'pawnshop')
-                logger.debug(f"API response for pawnshop: {response}")
+                logger.debug("API response for pawnshop: %s", response)
 
                 if not response or 'pawnshop' not in response:
                     logger.warning("Pawnshop data not found in the response")
@@ -1409,6 +1546,8 @@ class Torn:
                 return None
 
         class PawnshopData:
+            __slots__ = ('donatorpack_value', 'points_value')
+
             def __init__(self, data: Dict[str, Any]):
                 """
                 Parse and store the pawnshop data.
@@ -1418,7 +1557,7 @@ class Torn:
                 """
                 self.donatorpack_value = data.get('donatorpack_value', 0)
                 self.points_value = data.get('points_value', 0)
-                logger.debug(f"Processed PawnshopData: donatorpack_value={self.donatorpack_value}, points_value={self.points_value}")
+                record_logger.debug("Processed PawnshopData: donatorpack_value=%s, points_value=%s", self.donatorpack_value, self.points_value)
 
             def __repr__(self):
                 return f"PawnshopData(donatorpack_value={self.donatorpack_value}, points_value={self.points_value})"
@@ -1440,7 +1579,7 @@ class Torn:
 
             try:
                 response = self.api.make_request('torn', '', 'pokertables')
-                logger.debug(f"API response for poker tables: {response}")
+                logger.debug("API response for poker tables: %s", response)
 
                 if not response or 'pokertables' not in response:
                     logger.warning("Poker tables data not found in the response")
@@ -1455,20 +1594,16 @@ class Torn:
                 return None
 
         class PokerTableData:
-            def __init__(self, data: Dict[str, Any]):
-                """
-                Parse and store the poker table data.
-
-                Args:
-                - data: A dictionary containing the fetched poker table data.
-                """
-                self.big_blind = data.get('big_blind', 0)
-                self.current_players = data.get('current_players', 0)
-                self.maximum_players = data.get('maximum_players', 0)
-                self.name = data.get('name', '')
-                self.small_blind = data.get('small_blind', 0)
-                self.speed = data.get('speed', 0)
-                logger.debug(f"Processed PokerTableData: {self}")
+            _schema = Schema(
+                Field('big_blind', 0),
+                Field('current_players', 0),
+                Field('maximum_players', 0),
+                Field('name', ''),
+                Field('small_blind', 0),
+                Field('speed', 0),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('PokerTableData', record_logger)
 
             def __repr__(self):
                 return f"PokerTableData(name='{self.name}', current_players={self.current_players}, maximum_players={self.maximum_players}, small_blind={self.small_blind}, big_blind={self.big_blind}, speed={self.speed})"
@@ -1491,7 +1626,7 @@ class Torn:
 
             try:
                 response = self.api.make_request('torn', self.id, 'properties')
-                logger.debug(f"API response for properties: {response}")
+                logger.debug("API response for properties: %s", response)
 
                 if not response or 'properties' not in response:
                     logger.warning("Properties data not found in the response")
@@ -1506,19 +1641,15 @@ class Torn:
                 return None
 
         class PropertyData:
-            def __init__(self, data: Dict[str, Any]):
-                """
-                Parse and store the property data.
-
-                Args:
-                - data: A dictionary containing the fetched property data.
-                """
-                self.cost = data.get('cost', '')
-                self.happy = data.get('happy', 0)
-                self.name = data.get('name', '')
-                self.staff_available = data.get('staff_available', [])
-                self.upgrades_available = data.get('upgrades_available', [])
-                logger.debug(f"Processed PropertyData: {self}")
+            _schema = Schema(
+                Field('cost', ''),
+                Field('happy', 0),
+                Field('name', ''),
+                Field('staff_available', []),
+                Field('upgrades_available', []),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('PropertyData', record_logger)
 
             def __repr__(self):
                 return f"PropertyData(name='{self.name}', cost='{self.cost}', happy={self.happy}, staff_available={self.staff_available}, upgrades_available={self.upgrades_available})"
@@ -1540,7 +1671,7 @@ class Torn:
 
             try:
                 response = self.api.make_request('torn', '', 'rackets')
-                logger.debug(f"API response for rackets: {response}")
+                logger.debug("API response for rackets: %s", response)
 
                 if not response or 'rackets' not in response:
                     logger.warning("Rackets data not found in the response")
@@ -1555,20 +1686,16 @@ class Torn:
                 return None
 
         class RacketData:
-            def __init__(self, data: Dict[str, Any]):
-                """
-                Parse and store the racket data.
-
-                Args:
-                - data: A dictionary containing the fetched racket data.
-                """
-                self.changed = data.get('changed', 0)
-                self.created = data.get('created', 0)
-                self.faction = data.get('faction', 0)
-                self.level = data.get('level', 0)
-                self.name = data.get('name', '')
-                self.reward = data.get('reward', '')
-                logger.debug(f"Processed RacketData: {self}")
+            _schema = Schema(
+                Field('changed', 0),
+                Field('created', 0),
+                Field('faction', 0),
+                Field('level', 0),
+                Field('name', ''),
+                Field('reward', ''),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('RacketData', record_logger)
 
             def __repr__(self):
                 return f"RacketData(name='{self.name}', faction={self.faction}, level={self.level}, reward='{self.reward}', changed={self.changed}, created={self.created})"
@@ -1591,11 +1718,11 @@ class Torn:
                 logger.error("Raid report ID is required but not provided")
                 return None
 
-            logger.debug(f"Fetching raid report data for ID: {self.id}")
+            logger.debug("Fetching raid report data for ID: %s", self.id)
 
             try:
                 response = self.api.make_request('torn', self.id, 'raidreport')
-                logger.debug(f"API response for raid report: {response}")
+                logger.debug("API response for raid report: %s", response)
 
                 if not response or 'raidreport' not in response:
                     logger.warning("Raid report data not found in the response")
@@ -1610,21 +1737,19 @@ class Torn:
                 return None
 
         class RaidReportData:
-            def __init__(self, data: Dict[str, Any]):
-                """
-                Parse and store the raid report data.
-
-                Args:
-                - data: A dictionary containing the fetched raid report data.
-                """
-                self.factions = self.Factions(data.get('factions', {}))
-                self.war = self.RaidWar(data.get('war', {}))
-                logger.debug(f"Processed RaidReportData: {self}")
+            _schema = Schema(
+                Field('factions', {}, 'Factions'),
+                Field('war', {}, 'RaidWar'),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('RaidReportData', record_logger)
 
             def __repr__(self):
                 return f"RaidReportData(factions={self.factions}, war={self.war})"
 
             class Factions:
+                __slots__ = ('factions',)
+
                 def __init__(self, data: Dict[str, Any]):
                     self.factions = {faction_id: self.Faction(faction_data) for faction_id, faction_data in data.items()}
 
@@ -1632,17 +1757,22 @@ class Torn:
                     return f"Factions({len(self.factions)} factions)"
 
                 class Faction:
-                    def __init__(self, data: Dict[str, Any]):
-                        self.attacks = data.get('attacks', 0)
-                        self.members = self.Members(data.get('members', {}))
-                        self.name = data.get('name', '')
-                        self.score = data.get('score', 0)
-                        self.type = data.get('type', '')
+                    _schema = Schema(
+                        Field('attacks', 0),
+                        Field('members', {}, 'Members'),
+                        Field('name', ''),
+                        Field('score', 0),
+                        Field('type', ''),
+                    )
+                    __slots__ = _schema.slots
+                    __init__ = _schema.constructor('Faction')
 
                     def __repr__(self):
                         return f"Faction(name='{self.name}', attacks={self.attacks}, score={self.score}, type='{self.type}')"
 
                     class Members:
+                        __slots__ = ('members',)
+
                         def __init__(self, data: Dict[str, Any]):
                             self.members = {user_id: self.User(user_data) for user_id, user_data in data.items()}
 
@@ -1650,20 +1780,26 @@ class Torn:
                             return f"Members({len(self.members)} members)"
 
                         class User:
-                            def __init__(self, data: Dict[str, Any]):
-                                self.attacks = data.get('attacks', 0)
-                                self.damage = data.get('damage', 0.0)
-                                self.faction_id = data.get('faction_id', 0)
-                                self.level = data.get('level', 0)
-                                self.name = data.get('name', '')
+                            _schema = Schema(
+                                Field('attacks', 0),
+                                Field('damage', 0.0),
+                                Field('faction_id', 0),
+                                Field('level', 0),
+                                Field('name', ''),
+                            )
+                            __slots__ = _schema.slots
+                            __init__ = _schema.constructor('User')
 
                             def __repr__(self):
                                 return f"User(name='{self.name}', attacks={self.attacks}, damage={self.damage}, level={self.level})"
 
             class RaidWar:
-                def __init__(self, data: Dict[str, Any]):
-                    self.end = data.get('end', 0)
-                    self.start = data.get('start', 0)
+                _schema = Schema(
+                    Field('end', 0),
+                    Field('start', 0),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('RaidWar')
 
                 def __repr__(self):
                     return f"RaidWar(start={self.start}, end={self.end})"
@@ -1685,7 +1821,7 @@ class Torn:
 
             try:
                 response = self.api.make_request('torn', '', 'raids')
-                logger.debug(f"API response for raids: {response}")
+                logger.debug("API response for raids: %s", response)
 
                 if not response or 'raids' not in response:
                     logger.warning("Raids data not found in the response")
@@ -1700,6 +1836,8 @@ class Torn:
                 return None
 
         class RaidsData:
+            __slots__ = ('raids',)
+
             def __init__(self, data: Dict[str, Any]):
                 """
                 Parse and store the raids data.
@@ -1708,7 +1846,7 @@ class Torn:
                 - data: A dictionary containing the fetched raids data.
                 """
                 self.raids = {raid_id: self.Raid(raid_data) for raid_id, raid_data in data.items()}
-                logger.debug(f"Processed RaidsData: {len(self.raids)} raids")
+                record_logger.debug("Processed RaidsData: %s raids", len(self.raids))
 
             def __repr__(self):
                 return f"RaidsData(raids_count={len(self.raids)})"
@@ -1717,12 +1855,15 @@ class Torn:
                 return self.raids.get(raid_id)
 
             class Raid:
-                def __init__(self, data: Dict[str, Any]):
-                    self.assaulting_faction = data.get('assaulting_faction', 0)
-                    self.assaulting_score = data.get('assaulting_score', 0.0)
-                    self.defending_faction = data.get('defending_faction', 0)
-                    self.defending_score = data.get('defending_score', 0.0)
-                    self.started = data.get('started', 0)
+                _schema = Schema(
+                    Field('assaulting_faction', 0),
+                    Field('assaulting_score', 0.0),
+                    Field('defending_faction', 0),
+                    Field('defending_score', 0.0),
+                    Field('started', 0),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('Raid')
 
                 def __repr__(self):
                     return f"Raid(assaulting_faction={self.assaulting_faction}, defending_faction={self.defending_faction}, started={self.started})"
@@ -1745,11 +1886,11 @@ class Torn:
                 logger.error("Ranked war report ID is required but not provided")
                 return None
 
-            logger.debug(f"Fetching ranked war report data for ID: {self.id}")
+            logger.debug("Fetching ranked war report data for ID: %s", self.id)
 
             try:
                 response = self.api.make_request('torn', self.id, 'rankedwarreport')
-                logger.debug(f"API response for ranked war report: {response}")
+                logger.debug("API response for ranked war report: %s", response)
 
                 if not response or 'rankedwarreport' not in response:
                     logger.warning("Ranked war report data not found in the response")
@@ -1763,7 +1904,27 @@ class Torn:
                 logger.error(f"Error fetching ranked war report data: {e}")
                 return None
 
+        def stream(self):
+            """
+            Stream the factions of the Ranked War Report one at a time, without decoding the whole response first.
+
+            Yields:
+            - Tuple[str, Faction]: The faction ID and its Faction instance (with its members).
+
+            Raises:
+            - StreamError: If the request fails or the API returns an error.
+            """
+            if self.id is None:
+                logger.error("Ranked war report ID is required but not provided")
+                return
+
+            logger.debug("Streaming ranked war report factions for ID: %s", self.id)
+            for faction_id, faction_data in self.api.stream('torn', self.id, 'rankedwarreport', 'rankedwarreport.factions'):
+                yield faction_id, self.RankedWarReportData.Faction(faction_data)
+
         class RankedWarReportData:
+            __slots__ = ('factions', 'war')
+
             def __init__(self, data: Dict[str, Any]):
                 """
                 Parse and store the ranked war report data.
@@ -1773,12 +1934,14 @@ class Torn:
                 """
                 self.factions = {faction_id: self.Faction(faction_data) for faction_id, faction_data in data.get('factions', {}).items()}
                 self.war = self.War(data.get('war', {}))
-                logger.debug(f"Processed RankedWarReportData: {self}")
+                record_logger.debug("Processed RankedWarReportData: %s", self)
 
             def __repr__(self):
                 return f"RankedWarReportData(factions={self.factions}, war={self.war})"
 
             class Faction:
+                __slots__ = ('attacks', 'members', 'name', 'rank_after', 'rank_before', 'rewards', 'score')
+
                 def __init__(self, data: Dict[str, Any]):
                     self.attacks = data.get('attacks', 0)
                     self.members = {user_id: self.User(user_data) for user_id, user_data in data.get('members', {}).items()}
@@ -1787,49 +1950,57 @@ class Torn:
                     self.rank_before = data.get('rank_before', '')
                     self.rewards = self.Rewards(data.get('rewards', {}))
                     self.score = data.get('score', 0)
-                    logger.debug(f"Processed Faction: {self}")
+                    record_logger.debug("Processed Faction: %s", self)
 
                 def __repr__(self):
                     return f"Faction(name='{self.name}', score={self.score})"
 
                 class User:
-                    def __init__(self, data: Dict[str, Any]):
-                        self.attacks = data.get('attacks', 0)
-                        self.faction_id = data.get('faction_id', 0)
-                        self.level = data.get('level', 0)
-                        self.name = data.get('name', '')
-                        self.score = data.get('score', 0.0)
-                        logger.debug(f"Processed User: {self}")
+                    _schema = Schema(
+                        Field('attacks', 0),
+                        Field('faction_id', 0),
+                        Field('level', 0),
+                        Field('name', ''),
+                        Field('score', 0.0),
+                    )
+                    __slots__ = _schema.slots
+                    __init__ = _schema.constructor('User', record_logger)
 
                     def __repr__(self):
                         return f"User(name='{self.name}', score={self.score})"
 
                 class Rewards:
+                    __slots__ = ('items', 'points', 'respect')
+
                     def __init__(self, data: Dict[str, Any]):
                         self.items = {item_id: self.Item(item_data) for item_id, item_data in data.get('items', {}).items()}
                         self.points = data.get('points', 0)
                         self.respect = data.get('respect', 0)
-                        logger.debug(f"Processed Rewards: {self}")
+                        record_logger.debug("Processed Rewards: %s", self)
 
                     def __repr__(self):
                         return f"Rewards(points={self.points}, respect={self.respect})"
 
                     class Item:
-                        def __init__(self, data: Dict[str, Any]):
-                            self.name = data.get('name', '')
-                            self.quantity = data.get('quantity', 0)
-                            logger.debug(f"Processed Item: {self}")
+                        _schema = Schema(
+                            Field('name', ''),
+                            Field('quantity', 0),
+                        )
+                        __slots__ = _schema.slots
+                        __init__ = _schema.constructor('Item', record_logger)
 
                         def __repr__(self):
                             return f"Item(name='{self.name}', quantity={self.quantity})"
 
             class War:
-                def __init__(self, data: Dict[str, Any]):
-                    self.end = data.get('end', 0)
-                    self.forfeit = data.get('forfeit', 0)
-                    self.start = data.get('start', 0)
-                    self.winner = data.get('winner', 0)
-                    logger.debug(f"Processed War: {self}")
+                _schema = Schema(
+                    Field('end', 0),
+                    Field('forfeit', 0),
+                    Field('start', 0),
+                    Field('winner', 0),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('War', record_logger)
 
                 def __repr__(self):
                     return f"War(start={self.start}, end={self.end}, winner={self.winner})"
@@ -1851,7 +2022,7 @@ class Torn:
 
             try:
                 response = self.api.make_request('torn', '', 'rankedwars')
-                logger.debug(f"API response for ranked wars: {response}")
+                logger.debug("API response for ranked wars: %s", response)
 
                 if not response or 'rankedwars' not in response:
                     logger.warning("Ranked wars data not found in the response")
@@ -1866,31 +2037,37 @@ class Torn:
                 return None
 
         class RankedWar:
+            __slots__ = ('factions', 'war')
+
             def __init__(self, data: Dict[str, Any]):
                 self.factions = {faction_id: self.Faction(faction_data) for faction_id, faction_data in data.get('factions', {}).items()}
                 self.war = self.War(data.get('war', {}))
-                logger.debug(f"Processed RankedWar: {self}")
+                record_logger.debug("Processed RankedWar: %s", self)
 
             def __repr__(self):
                 return f"RankedWar(factions={list(self.factions.keys())}, war={self.war})"
 
             class Faction:
-                def __init__(self, data: Dict[str, Any]):
-                    self.chain = data.get('chain', 0)
-                    self.name = data.get('name', '')
-                    self.score = data.get('score', 0)
-                    logger.debug(f"Processed Faction: {self}")
+                _schema = Schema(
+                    Field('chain', 0),
+                    Field('name', ''),
+                    Field('score', 0),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('Faction', record_logger)
 
                 def __repr__(self):
                     return f"Faction(name='{self.name}', score={self.score}, chain={self.chain})"
 
             class War:
-                def __init__(self, data: Dict[str, Any]):
-                    self.end = data.get('end', 0)
-                    self.start = data.get('start', 0)
-                    self.target = data.get('target', 0)
-                    self.winner = data.get('winner', 0)
-                    logger.debug(f"Processed War: {self}")
+                _schema = Schema(
+                    Field('end', 0),
+                    Field('start', 0),
+                    Field('target', 0),
+                    Field('winner', 0),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('War', record_logger)
 
                 def __repr__(self):
                     return f"War(start={self.start}, end={self.end}, target={self.target}, winner={self.winner})"
@@ -1912,7 +2089,7 @@ class Torn:
 
             try:
                 response = self.api.make_request('torn', '', 'rockpaperscissors')
-                logger.debug(f"API response for rock paper scissors: {response}")
+                logger.debug("API response for rock paper scissors: %s", response)
 
                 if not response or 'rockpaperscissors' not in response:
                     logger.warning("Rock paper scissors data not found in the response")
@@ -1927,16 +2104,12 @@ class Torn:
                 return None
 
         class RockPaperScissorsData:
-            def __init__(self, data: Dict[str, Any]):
-                """
-                Parse and store the rock paper scissors data.
-
-                Args:
-                - data: A dictionary containing the fetched rock paper scissors data.
-                """
-                self.count = data.get('count', 0)
-                self.type = data.get('type', '')
-                logger.debug(f"Processed RockPaperScissorsData: {self}")
+            _schema = Schema(
+                Field('count', 0),
+                Field('type', ''),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('RockPaperScissorsData', record_logger)
 
             def __repr__(self):
                 return f"RockPaperScissorsData(count={self.count}, type='{self.type}')"
@@ -1958,7 +2131,7 @@ class Torn:
 
             try:
                 response = self.api.make_request('torn', '', 'searchforcash')
-                logger.debug(f"API response for search for cash: {response}")
+                logger.debug("API response for search for cash: %s", response)
 
                 if not response or 'searchforcash' not in response:
                     logger.warning("Search for cash data not found in the response")
@@ -1973,16 +2146,12 @@ class Torn:
                 return None
 
         class SearchForCashSubcrimeData:
-            def __init__(self, data: Dict[str, Any]):
-                """
-                Parse and store the search for cash subcrime data.
-
-                Args:
-                - data: A dictionary containing the fetched search for cash subcrime data.
-                """
-                self.percentage = data.get('percentage', 0.0)
-                self.title = data.get('title', '')
-                logger.debug(f"Processed SearchForCashSubcrimeData: {self}")
+            _schema = Schema(
+                Field('percentage', 0.0),
+                Field('title', ''),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('SearchForCashSubcrimeData', record_logger)
 
             def __repr__(self):
                 return f"SearchForCashSubcrimeData(percentage={self.percentage}, title='{self.title}')"
@@ -1993,12 +2162,13 @@ class Torn:
             self.data = None
             logger.info("Initialized Stats for Torn section")
 
-        def fetch_data(self, timestamp: Optional[int] = None):
+        def fetch_data(self, timestamp: Optional[int] = None, lazy: bool = False):
             """
             Fetch data for the Stats using TornAPI.
 
             Args:
             - timestamp: Optional; Specify which date (in epoch seconds) to get the stats from.
+            - lazy: Optional; Return a LazyStatsData that decodes each stat on first access.
 
             Returns:
             - StatsData: An instance of StatsData containing the fetched data.
@@ -2010,14 +2180,15 @@ class Torn:
                 params['timestamp'] = timestamp
 
             try:
-                response = self.api.make_request('torn', '', 'stats', params=params)
-                logger.debug(f"API response for stats: {response}")
+                response = self.api.make_request('torn', '', 'stats', params)
+                logger.debug("API response for stats: %s", response)
 
                 if not response or 'stats' not in response:
                     logger.warning("Stats data not found in the response")
                     return None
 
-                self.data = self.StatsData(response['stats'])
+                model = self.LazyStatsData if lazy else self.StatsData
+                self.data = model(response['stats'])
                 logger.info("Fetched stats data successfully")
                 return self.data
 
@@ -2026,127 +2197,132 @@ class Torn:
                 return None
 
         class StatsData:
-            def __init__(self, data: Dict[str, Any]):
-                """
-                Parse and store the stats data.
+            _schema = Schema(
+                Field('communication_articlereads', 0),
+                Field('communication_articles', 0),
+                Field('communication_articleviews', 0),
+                Field('communication_chats', 0),
+                Field('communication_events', 0),
+                Field('communication_forumposts', 0),
+                Field('communication_messages', 0),
+                Field('communication_totalevents', 0),
+                Field('communication_totalmessages', 0),
+                Field('crimes', 0),
+                Field('crimes_today', 0),
+                Field('events', 0),
+                Field('forums_dislikes', 0),
+                Field('forums_likes', 0),
+                Field('forums_posts', 0),
+                Field('forums_threads', 0),
+                Field('gym_trains', 0),
+                Field('items', 0),
+                Field('jailed', 0),
+                Field('job_army', 0),
+                Field('job_casino', 0),
+                Field('job_company', 0),
+                Field('job_education', 0),
+                Field('job_grocer', 0),
+                Field('job_law', 0),
+                Field('job_medical', 0),
+                Field('job_none', 0),
+                Field('money_citybank', 0),
+                Field('money_onhand', 0),
+                Field('points_averagecost', 0),
+                Field('points_bought', 0),
+                Field('points_market', 0),
+                Field('points_total', 0),
+                Field('timestamp', 0),
+                Field('total_attacks_criticalhits', 0),
+                Field('total_attacks_hits', 0),
+                Field('total_attacks_lost', 0),
+                Field('total_attacks_misses', 0),
+                Field('total_attacks_moneymugged', 0),
+                Field('total_attacks_respectgained', 0),
+                Field('total_attacks_roundsfired', 0),
+                Field('total_attacks_runaway', 0),
+                Field('total_attacks_stalemated', 0),
+                Field('total_attacks_stealthed', 0),
+                Field('total_attacks_won', 0),
+                Field('total_bounty_placed', 0),
+                Field('total_bounty_rewards', 0),
+                Field('total_classifiedads_placed', 0),
+                Field('total_company_trains', 0),
+                Field('total_drugs_cannabis', 0),
+                Field('total_drugs_ecstacy', 0),
+                Field('total_drugs_ketamine', 0),
+                Field('total_drugs_lsd', 0),
+                Field('total_drugs_opium', 0),
+                Field('total_drugs_overdosed', 0),
+                Field('total_drugs_pcp', 0),
+                Field('total_drugs_shrooms', 0),
+                Field('total_drugs_speed', 0),
+                Field('total_drugs_used', 0),
+                Field('total_drugs_vicodin', 0),
+                Field('total_drugs_xanax', 0),
+                Field('total_hospital_medicalitemsused', 0),
+                Field('total_hospital_revived', 0),
+                Field('total_hospital_trips', 0),
+                Field('total_items_auctionswon', 0),
+                Field('total_items_bazaarbought', 0),
+                Field('total_items_bazaarincome', 0),
+                Field('total_items_cityfinds', 0),
+                Field('total_items_dumped', 0),
+                Field('total_items_dumpfinds', 0),
+                Field('total_items_marketbought', 0),
+                Field('total_items_sent', 0),
+                Field('total_jail_bailcosts', 0),
+                Field('total_jail_bailed', 0),
+                Field('total_jail_busted', 0),
+                Field('total_jail_busts', 0),
+                Field('total_jail_jailed', 0),
+                Field('total_mails_sent', 0),
+                Field('total_mails_sent_company', 0),
+                Field('total_mails_sent_faction', 0),
+                Field('total_mails_sent_friends', 0),
+                Field('total_mails_sent_spouse', 0),
+                Field('total_merits_bought', 0),
+                Field('total_points_boughttotal', 0),
+                Field('total_refills_bought', 0),
+                Field('total_statenhancers_used', 0),
+                Field('total_trades', 0),
+                Field('total_travel_all', 0),
+                Field('total_travel_argentina', 0),
+                Field('total_travel_canada', 0),
+                Field('total_travel_caymanislands', 0),
+                Field('total_travel_china', 0),
+                Field('total_travel_dubai', 0),
+                Field('total_travel_hawaii', 0),
+                Field('total_travel_japan', 0),
+                Field('total_travel_mexico', 0),
+                Field('total_travel_southafrica', 0),
+                Field('total_travel_switzerland', 0),
+                Field('total_travel_unitedkingdom', 0),
+                Field('total_users_logins', 0),
+                Field('total_users_playtime', 0),
+                Field('users_daily', 0),
+                Field('users_enby', 0),
+                Field('users_female', 0),
+                Field('users_male', 0),
+                Field('users_marriedcouples', 0),
+                Field('users_total', 0),
+                Field('wars_raid', 0),
+                Field('wars_ranked', 0),
+                Field('wars_territory', 0),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('StatsData', record_logger)
 
-                Args:
-                - data: A dictionary containing the fetched stats data.
-                """
-                self.communication_articlereads = data.get('communication_articlereads', 0)
-                self.communication_articles = data.get('communication_articles', 0)
-                self.communication_articleviews = data.get('communication_articleviews', 0)
-                self.communication_chats = data.get('communication_chats', 0)
-                self.communication_events = data.get('communication_events', 0)
-                self.communication_forumposts = data.get('communication_forumposts', 0)
-                self.communication_messages = data.get('communication_messages', 0)
-                self.communication_totalevents = data.get('communication_totalevents', 0)
-                self.communication_totalmessages = data.get('communication_totalmessages', 0)
-                self.crimes = data.get('crimes', 0)
-                self.crimes_today = data.get('crimes_today', 0)
-                self.events = data.get('events', 0)
-                self.forums_dislikes = data.get('forums_dislikes', 0)
-                self.forums_likes = data.get('forums_likes', 0)
-                self.forums_posts = data.get('forums_posts', 0)
-                self.forums_threads = data.get('forums_threads', 0)
-                self.gym_trains = data.get('gym_trains', 0)
-                self.items = data.get('items', 0)
-                self.jailed = data.get('jailed', 0)
-                self.job_army = data.get('job_army', 0)
-                self.job_casino = data.get('job_casino', 0)
-                self.job_company = data.get('job_company', 0)
-                self.job_education = data.get('job_education', 0)
-                self.job_grocer = data.get('job_grocer', 0)
-                self.job_law = data.get('job_law', 0)
-                self.job_medical = data.get('job_medical', 0)
-                self.job_none = data.get('job_none', 0)
-                self.money_citybank = data.get('money_citybank', 0)
-                self.money_onhand = data.get('money_onhand', 0)
-                self.points_averagecost = data.get('points_averagecost', 0)
-                self.points_bought = data.get('points_bought', 0)
-                self.points_market = data.get('points_market', 0)
-                self.points_total = data.get('points_total', 0)
-                self.timestamp = data.get('timestamp', 0)
-                self.total_attacks_criticalhits = data.get('total_attacks_criticalhits', 0)
-                self.total_attacks_hits = data.get('total_attacks_hits', 0)
-                self.total_attacks_lost = data.get('total_attacks_lost', 0)
-                self.total_attacks_misses = data.get('total_attacks_misses', 0)
-                self.total_attacks_moneymugged = data.get('total_attacks_moneymugged', 0)
-                self.total_attacks_respectgained = data.get('total_attacks_respectgained', 0)
-                self.total_attacks_roundsfired = data.get('total_attacks_roundsfired', 0)
-                self.total_attacks_runaway = data.get('total_attacks_runaway', 0)
-                self.total_attacks_stalemated = data.get('total_attacks_stalemated', 0)
-                self.total_attacks_stealthed = data.get('total_attacks_stealthed', 0)
-                self.total_attacks_won = data.get('total_attacks_won', 0)
-                self.total_bounty_placed = data.get('total_bounty_placed', 0)
-                self.total_bounty_rewards = data.get('total_bounty_rewards', 0)
-                self.total_classifiedads_placed = data.get('total_classifiedads_placed', 0)
-                self.total_company_trains = data.get('total_company_trains', 0)
-                self.total_drugs_cannabis = data.get('total_drugs_cannabis', 0)
-                self.total_drugs_ecstacy = data.get('total_drugs_ecstacy', 0)
-                self.total_drugs_ketamine = data.get('total_drugs_ketamine', 0)
-                self.total_drugs_lsd = data.get('total_drugs_lsd', 0)
-                self.total_drugs_opium = data.get('total_drugs_opium', 0)
-                self.total_drugs_overdosed = data.get('total_drugs_overdosed', 0)
-                self.total_drugs_pcp = data.get('total_drugs_pcp', 0)
-                self.total_drugs_shrooms = data.get('total_drugs_shrooms', 0)
-                self.total_drugs_speed = data.get('total_drugs_speed', 0)
-                self.total_drugs_used = data.get('total_drugs_used', 0)
-                self.total_drugs_vicodin = data.get('total_drugs_vicodin', 0)
-                self.total_drugs_xanax = data.get('total_drugs_xanax', 0)
-                self.total_hospital_medicalitemsused = data.get('total_hospital_medicalitemsused', 0)
-                self.total_hospital_revived = data.get('total_hospital_revived', 0)
-                self.total_hospital_trips = data.get('total_hospital_trips', 0)
-                self.total_items_auctionswon = data.get('total_items_auctionswon', 0)
-                self.total_items_bazaarbought = data.get('total_items_bazaarbought', 0)
-                self.total_items_bazaarincome = data.get('total_items_bazaarincome', 0)
-                self.total_items_cityfinds = data.get('total_items_cityfinds', 0)
-                self.total_items_dumped = data.get('total_items_dumped', 0)
-                self.total_items_dumpfinds = data.get('total_items_dumpfinds', 0)
-                self.total_items_marketbought = data.get('total_items_marketbought', 0)
-                self.total_items_sent = data.get('total_items_sent', 0)
-                self.total_jail_bailcosts = data.get('total_jail_bailcosts', 0)
-                self.total_jail_bailed = data.get('total_jail_bailed', 0)
-                self.total_jail_busted = data.get('total_jail_busted', 0)
-                self.total_jail_busts = data.get('total_jail_busts', 0)
-                self.total_jail_jailed = data.get('total_jail_jailed', 0)
-                self.total_mails_sent = data.get('total_mails_sent', 0)
-                self.total_mails_sent_company = data.get('total_mails_sent_company', 0)
-                self.total_mails_sent_faction = data.get('total_mails_sent_faction', 0)
-                self.total_mails_sent_friends = data.get('total_mails_sent_friends', 0)
-                self.total_mails_sent_spouse = data.get('total_mails_sent_spouse', 0)
-                self.total_merits_bought = data.get('total_merits_bought', 0)
-                self.total_points_boughttotal = data.get('total_points_boughttotal', 0)
-                self.total_refills_bought = data.get('total_refills_bought', 0)
-                self.total_statenhancers_used = data.get('total_statenhancers_used', 0)
-                self.total_trades = data.get('total_trades', 0)
-                self.total_travel_all = data.get('total_travel_all', 0)
-                self.total_travel_argentina = data.get('total_travel_argentina', 0)
-                self.total_travel_canada = data.get('total_travel_canada', 0)
-                self.total_travel_caymanislands = data.get('total_travel_caymanislands', 0)
-                self.total_travel_china = data.get('total_travel_china', 0)
-                self.total_travel_dubai = data.get('total_travel_dubai', 0)
-                self.total_travel_hawaii = data.get('total_travel_hawaii', 0)
-                self.total_travel_japan = data.get('total_travel_japan', 0)
-                self.total_travel_mexico = data.get('total_travel_mexico', 0)
-                self.total_travel_southafrica = data.get('total_travel_southafrica', 0)
-                self.total_travel_switzerland = data.get('total_travel_switzerland', 0)
-                self.total_travel_unitedkingdom = data.get('total_travel_unitedkingdom', 0)
-                self.total_users_logins = data.get('total_users_logins', 0)
-                self.total_users_playtime = data.get('total_users_playtime', 0)
-                self.users_daily = data.get('users_daily', 0)
-                self.users_enby = data.get('users_enby', 0)
-                self.users_female = data.get('users_female', 0)
-                self.users_male = data.get('users_male', 0)
-                self.users_marriedcouples = data.get('users_marriedcouples', 0)
-                self.users_total = data.get('users_total', 0)
-                self.wars_raid = data.get('wars_raid', 0)
-                self.wars_ranked = data.get('wars_ranked', 0)
-                self.wars_territory = data.get('wars_territory', 0)
-                logger.debug(f"Processed StatsData: {self}")
+            def __repr__(self):
+                return f"StatsData(users_total={self.users_total})"
 
+        class LazyStatsData(LazyModel):
+            """
+            Lazy variant of StatsData. Keeps the raw response and decodes each stat on first access.
+            """
             def __repr__(self):
-                return f"StatsData(timestamp={self.timestamp}, users_total={self.users_total})"
+                return f"LazyStatsData(users_total={self.users_total})"
+
+        LazyStatsData._fields = StatsData._schema.lazy_fields()
     
     class Stocks:
         def __init__(self, api: TornAPI, id: Optional[int] = None):
@@ -2166,7 +2342,7 @@ class Torn:
 
             try:
                 response = self.api.make_request('torn', self.id, 'stocks')
-                logger.debug(f"API response for stocks: {response}")
+                logger.debug("API response for stocks: %s", response)
 
                 if not response or 'stocks' not in response:
                     logger.warning("Stocks data not found in the response")
@@ -2180,7 +2356,49 @@ class Torn:
                 logger.error(f"Error fetching stocks data: {e}")
                 return None
 
+        def as_columns(self):
+            """
+            Fetch the price history of every stock as typed NumPy column arrays.
+
+            Returns:
+            - dict: Arrays for stock_id, timestamp, price and change, one element per history point.
+            """
+            response = self.api.make_request('torn', self.id, 'stocks') or {}
+            return columns.as_columns(columns.stock_history_records(response.get('stocks')), columns.STOCK_HISTORY_COLUMNS)
+
+        def to_numpy(self):
+            """
+            Fetch the price history of every stock as a NumPy structured array.
+
+            Returns:
+            - numpy.ndarray: One element per history point with stock_id, timestamp, price and change fields.
+            """
+            response = self.api.make_request('torn', self.id, 'stocks') or {}
+            return columns.to_numpy(columns.stock_history_records(response.get('stocks')), columns.STOCK_HISTORY_COLUMNS)
+
+        def to_dataframe(self, history: bool = True):
+            """
+            Fetch stocks as a pandas DataFrame, built column-wise without creating Stock objects.
+
+            Parameters:
+            - history (bool): One row per price history point when True, otherwise one row per stock.
+
+            Returns:
+            - pandas.DataFrame: The stock history (stock_id, timestamp, price, change) or the current stock table.
+            """
+            response = self.api.make_request('torn', self.id, 'stocks') or {}
+            if history:
+                return columns.to_dataframe(columns.stock_history_records(response.get('stocks')), columns.STOCK_HISTORY_COLUMNS)
+            ids, rows = columns.keyed_records(response.get('stocks'))
+            return columns.to_dataframe(rows, columns.STOCK_COLUMNS, index=ids, index_name='stock_id')
+
         class Stock:
+            __slots__ = (
+                'acronym', 'all_time', 'benefit', 'current_price', 'history', 'investors',
+                'last_day', 'last_hour', 'last_month', 'last_week', 'last_year', 'market_cap',
+                'name', 'stock_id', 'total_shares',
+            )
+
             def __init__(self, data: Dict[str, Any]):
                 """
                 Parse and store the stock data.
@@ -2203,41 +2421,47 @@ class Torn:
                 self.name = data.get('name', '')
                 self.stock_id = data.get('stock_id', 0)
                 self.total_shares = data.get('total_shares', 0)
-                logger.debug(f"Processed Stock: {self}")
+                record_logger.debug("Processed Stock: %s", self)
 
             def __repr__(self):
                 return f"Stock(name='{self.name}', acronym='{self.acronym}', current_price={self.current_price})"
 
             class Benefit:
-                def __init__(self, data: Dict[str, Any]):
-                    self.description = data.get('description', '')
-                    self.frequency = data.get('frequency', 0)
-                    self.requirement = data.get('requirement', 0)
-                    self.type = data.get('type', '')
-                    logger.debug(f"Processed Benefit: {self}")
+                _schema = Schema(
+                    Field('description', ''),
+                    Field('frequency', 0),
+                    Field('requirement', 0),
+                    Field('type', ''),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('Benefit', record_logger)
 
                 def __repr__(self):
                     return f"Benefit(type='{self.type}', description='{self.description}')"
 
             class History:
-                def __init__(self, data: Dict[str, Any]):
-                    self.change = data.get('change', 0.0)
-                    self.price = data.get('price', 0.0)
-                    self.timestamp = data.get('timestamp', 0)
-                    logger.debug(f"Processed History: {self}")
+                _schema = Schema(
+                    Field('change', 0.0),
+                    Field('price', 0.0),
+                    Field('timestamp', 0),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('History', record_logger)
 
                 def __repr__(self):
                     return f"History(price={self.price}, change={self.change}, timestamp={self.timestamp})"
 
             class Price:
-                def __init__(self, data: Dict[str, Any]):
-                    self.change = data.get('change', 0.0)
-                    self.change_percentage = data.get('change_percentage', 0.0)
-                    self.end = data.get('end', 0.0)
-                    self.high = data.get('high', 0.0)
-                    self.low = data.get('low', 0.0)
-                    self.start = data.get('start', 0.0)
-                    logger.debug(f"Processed Price: {self}")
+                _schema = Schema(
+                    Field('change', 0.0),
+                    Field('change_percentage', 0.0),
+                    Field('end', 0.0),
+                    Field('high', 0.0),
+                    Field('low', 0.0),
+                    Field('start', 0.0),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('Price', record_logger)
 
                 def __repr__(self):
                     return f"Price(start={self.start}, end={self.end}, high={self.high}, low={self.low}, change={self.change}, change_percentage={self.change_percentage})"
@@ -2267,7 +2491,7 @@ class Torn:
             try:
                 territory_ids = ','.join(territory_names)
                 response = self.api.make_request('torn', territory_ids, 'territory')
-                logger.debug(f"API response for territory: {response}")
+                logger.debug("API response for territory: %s", response)
 
                 if not response or 'territory' not in response:
                     logger.warning("Territory data not found in the response")
@@ -2282,27 +2506,31 @@ class Torn:
                 return None
 
         class Racket:
-            def __init__(self, data: Dict[str, Any]):
-                self.changed = data.get('changed', 0)
-                self.created = data.get('created', 0)
-                self.level = data.get('level', 0)
-                self.name = data.get('name', '')
-                self.reward = data.get('reward', '')
-                logger.debug(f"Processed Racket: {self}")
+            _schema = Schema(
+                Field('changed', 0),
+                Field('created', 0),
+                Field('level', 0),
+                Field('name', ''),
+                Field('reward', ''),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('Racket', record_logger)
 
             def __repr__(self):
                 return f"Racket(name='{self.name}', level={self.level}, reward='{self.reward}')"
 
         class TerritoryWar:
-            def __init__(self, data: Dict[str, Any]):
-                self.assaulting_faction = data.get('assaulting_faction', 0)
-                self.defending_faction = data.get('defending_faction', 0)
-                self.ends = data.get('ends', 0)
-                self.required_score = data.get('required_score', 0)
-                self.score = data.get('score', 0)
-                self.started = data.get('started', 0)
-                self.territory_war_id = data.get('territory_war_id', 0)
-                logger.debug(f"Processed TerritoryWar: {self}")
+            _schema = Schema(
+                Field('assaulting_faction', 0),
+                Field('defending_faction', 0),
+                Field('ends', 0),
+                Field('required_score', 0),
+                Field('score', 0),
+                Field('started', 0),
+                Field('territory_war_id', 0),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('TerritoryWar', record_logger)
 
             def __repr__(self):
                 return f"TerritoryWar(assaulting_faction={self.assaulting_faction}, defending_faction={self.defending_faction}, ends={self.ends}, required_score={self.required_score}, score={self.score}, started={self.started}, territory_war_id={self.territory_war_id})"
@@ -2324,7 +2552,7 @@ class Torn:
 
             try:
                 response = self.api.make_request('torn', '', 'territorynames')
-                logger.debug(f"API response for territory names: {response}")
+                logger.debug("API response for territory names: %s", response)
 
                 if not response or 'territoryNames' not in response:
                     logger.warning("Territory names data not found in the response")
@@ -2359,11 +2587,11 @@ class Torn:
                 logger.error("Territory war report ID is required but not provided")
                 return None
 
-            logger.debug(f"Fetching territory war report data for ID: {self.id}")
+            logger.debug("Fetching territory war report data for ID: %s", self.id)
 
             try:
                 response = self.api.make_request('torn', self.id, 'territorywarreport')
-                logger.debug(f"API response for territory war report: {response}")
+                logger.debug("API response for territory war report: %s", response)
 
                 if not response or 'territorywarreport' not in response:
                     logger.warning("Territory war report data not found in the response")
@@ -2378,6 +2606,8 @@ class Torn:
                 return None
 
         class TerritoryWarReportData:
+            __slots__ = ('factions', 'territory', 'war')
+
             def __init__(self, data: Dict[str, Any]):
                 """
                 Parse and store the territory war report data.
@@ -2388,12 +2618,14 @@ class Torn:
                 self.factions = {faction_id: self.Faction(faction_data) for faction_id, faction_data in data.get('factions', {}).items()}
                 self.territory = self.Territory(data.get('territory', {}))
                 self.war = self.War(data.get('war', {}))
-                logger.debug(f"Processed TerritoryWarReportData: {self}")
+                record_logger.debug("Processed TerritoryWarReportData: %s", self)
 
             def __repr__(self):
                 return f"TerritoryWarReportData(factions={self.factions}, territory={self.territory}, war={self.war})"
 
             class Faction:
+                __slots__ = ('clears', 'joins', 'members', 'name', 'score', 'type')
+
                 def __init__(self, data: Dict[str, Any]):
                     self.clears = data.get('clears', 0)
                     self.joins = data.get('joins', 0)
@@ -2401,39 +2633,45 @@ class Torn:
                     self.name = data.get('name', '')
                     self.score = data.get('score', 0)
                     self.type = data.get('type', '')
-                    logger.debug(f"Processed Faction: {self}")
+                    record_logger.debug("Processed Faction: %s", self)
 
                 def __repr__(self):
                     return f"Faction(name='{self.name}', score={self.score}, type='{self.type}')"
 
                 class User:
-                    def __init__(self, data: Dict[str, Any]):
-                        self.clears = data.get('clears', 0.0)
-                        self.faction_id = data.get('faction_id', 0)
-                        self.joins = data.get('joins', 0.0)
-                        self.level = data.get('level', 0)
-                        self.name = data.get('name', '')
-                        self.points = data.get('points', 0)
-                        logger.debug(f"Processed User: {self}")
+                    _schema = Schema(
+                        Field('clears', 0.0),
+                        Field('faction_id', 0),
+                        Field('joins', 0.0),
+                        Field('level', 0),
+                        Field('name', ''),
+                        Field('points', 0),
+                    )
+                    __slots__ = _schema.slots
+                    __init__ = _schema.constructor('User', record_logger)
 
                     def __repr__(self):
                         return f"User(name='{self.name}', points={self.points})"
 
             class Territory:
-                def __init__(self, data: Dict[str, Any]):
-                    self.name = data.get('name', '')
-                    logger.debug(f"Processed Territory: {self}")
+                _schema = Schema(
+                    Field('name', ''),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('Territory', record_logger)
 
                 def __repr__(self):
                     return f"Territory(name='{self.name}')"
 
             class War:
-                def __init__(self, data: Dict[str, Any]):
-                    self.end = data.get('end', 0)
-                    self.result = data.get('result', '')
-                    self.start = data.get('start', 0)
-                    self.winner = data.get('winner', 0)
-                    logger.debug(f"Processed War: {self}")
+                _schema = Schema(
+                    Field('end', 0),
+                    Field('result', ''),
+                    Field('start', 0),
+                    Field('winner', 0),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('War', record_logger)
 
                 def __repr__(self):
                     return f"War(start={self.start}, end={self.end}, result='{self.result}', winner={self.winner})"
@@ -2446,7 +2684,7 @@ class Torn:
                         self.score = data.get('score', 0)
                         self.started = data.get('started', 0)
                         self.territory_war_id = data.get('territory_war_id', 0)
-                        logger.debug(f"Processed TerritoryWar: {self}")
+                        record_logger.debug("Processed TerritoryWar: %s", self)
 
                     def __repr__(self):
                         return (f"TerritoryWar(assaulting_faction={self.assaulting_faction}, "
@@ -2471,7 +2709,7 @@ class Torn:
 
             try:
                 response = self.api.make_request('torn', '', 'territorywars')
-                logger.debug(f"API response for territory wars: {response}")
+                logger.debug("API response for territory wars: %s", response)
 
                 if not response or 'territorywars' not in response:
                     logger.warning("Territory wars data not found in the response")
@@ -2486,15 +2724,17 @@ class Torn:
                 return None
 
         class TerritoryWar:
-            def __init__(self, data: Dict[str, Any]):
-                self.assaulting_faction = data.get('assaulting_faction', 0)
-                self.defending_faction = data.get('defending_faction', 0)
-                self.ends = data.get('ends', 0)
-                self.required_score = data.get('required_score', 0)
-                self.score = data.get('score', 0)
-                self.started = data.get('started', 0)
-                self.territory_war_id = data.get('territory_war_id', 0)
-                logger.debug(f"Processed TerritoryWar: {self}")
+            _schema = Schema(
+                Field('assaulting_faction', 0),
+                Field('defending_faction', 0),
+                Field('ends', 0),
+                Field('required_score', 0),
+                Field('score', 0),
+                Field('started', 0),
+                Field('territory_war_id', 0),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('TerritoryWar', record_logger)
 
             def __repr__(self):
                 return (f"TerritoryWar(assaulting_faction={self.assaulting_faction}, "
@@ -2515,7 +2755,7 @@ class Torn:
             - int: The current epoch timestamp in seconds.
             """
             self.timestamp = int(datetime.now().timestamp())
-            logger.debug(f"Updated Timestamp to current value: {self.timestamp}")
+            logger.debug("Updated Timestamp to current value: %s", self.timestamp)
             return self.timestamp
 
         def __repr__(self):
@@ -1,68 +1,112 @@
 from typing import Dict, Any, Optional
 from tornApi import TornAPI
-from env_loader import load_environment_variables
-from logger import setup_logger, close_logger
+from config import get_config
+from logger import setup_logger, close_logger, get_record_logger
+from models import Field, LazyModel, Schema, Selection
+import columns
+from pagination import fetch_page, paginate, paginate_with_cursor
+from sinks import write_records
+from sync import SELECTIONS
 
-env = load_environment_variables()
-if env is None:
-    raise ValueError("Failed to load environment variables.")
-logger, file_handler = setup_logger('Sections', env['DEBUG_LEVEL'])
+config = get_config()
+logger, file_handler = setup_logger('Sections', config.debug_level)
+record_logger = get_record_logger('Sections')
+
+
+def _attack_started(attack: Dict[str, Any]) -> int:
+    # Pages are walked by start time: it is never later than the end time, so no attack is skipped.
+    return attack.get('timestamp_started') or 0
+
+
+def _attack_code(attack_id: str, attack: Dict[str, Any]) -> str:
+    return attack.get('code') or attack_id
 
-class User:
-    def __init__(self, api: TornAPI, user_id: Optional[int] = None):
-        self.api = api
-        self.user_id = user_id
-        self.ammo = self.Ammo(self.api, self.user_id)
-        self.basic = self.Basic(self.api, self.user_id)
-        self.attacks = self.Attacks(self.api, self.user_id)
-        self.attacks_full = self.AttacksFull(self.api, self.user_id)
-        self.bars = self.Bars(self.api, self.user_id)
-        self.battle_stats = self.BattleStats(self.api, self.user_id)
-        self.bazaar = self.Bazaar(self.api, self.user_id)
-        self.cooldowns = self.Cooldowns(self.api, self.user_id)
-        self.crimes = self.Crimes(self.api, self.user_id)
-        self.criminal_record = self.CriminalRecord(self.api, self.user_id)
-        self.discord = self.Discord(self.api, self.user_id)
-        self.display_items = self.DisplayItems(self.api, self.user_id)
-        self.education = self.Education(self.api, self.user_id)
-        self.equipment = self.Equipment(self.api, self.user_id)
-        self.events = self.Events(self.api, self.user_id)
-        self.gym = self.Gym(self.api, self.user_id)
-        self.hof = self.HallOfFame(self.api, self.user_id)
-        self.honors = self.Honors(self.api, self.user_id)
-        self.icons = self.Icons(self.api, self.user_id)
-        self.jobpoints = self.JobPoints(self.api, self.user_id)
-        self.log = self.Log(self.api, self.user_id)
-        self.lookup = self.Lookup(self.api)
-        self.medals = self.Medals(self.api, self.user_id)
-        self.merits = self.Merits(self.api, self.user_id)
-        self.messages = self.Messages(self.api, self.user_id)
-        self.missions = self.Missions(self.api, self.user_id)
-        self.money = self.Money(self.api, self.user_id)
-        self.networth = self.Networth(self.api, self.user_id)
-        self.newevents = self.NewEvents(self.api, self.user_id)
-        self.newmessages = self.NewMessages(self.api, self.user_id)
-        self.notifications = self.Notifications(self.api, self.user_id)
-        self.perks = self.Perks(self.api, self.user_id)
-        self.personalstats = self.PersonalStats(self.api, self.user_id)
-        self.profile = self.Profile(self.api, self.user_id)
-        self.properties = self.Properties(self.api, self.user_id)
-        self.public_status = self.PublicStatus(self.api, self.user_id)
-        self.refills = self.Refills(self.api, self.user_id)
-        self.reports = self.Reports(self.api, self.user_id)
-        self.revives = self.Revives(self.api, self.user_id)
-        self.revives_full = self.RevivesFull(self.api, self.user_id)
-        self.skills = self.Skills(self.api, self.user_id)
-        self.stocks = self.Stocks(self.api, self.user_id)
-        self.timestamp = self.Timestamp(self.api, self.user_id)
-        self.travel = self.Travel(self.api, self.user_id)
-        self.weapon_exp = self.WeaponExp(self.api, self.user_id)
-        self.work_stats = self.WorkStats(self.api, self.user_id)
 
+def _event_timestamp(event: Dict[str, Any]) -> int:
+    # Also used for log entries, messages and revives, which have the same 'timestamp' field.
+    return event.get('timestamp') or 0
 
 
+def _event_uuid(event_uuid: str, event: Dict[str, Any]) -> str:
+    # Events, log entries and messages are keyed by their ID in the response.
+    return event_uuid
 
 
+def _revive_id(key: Any, revive: Dict[str, Any]) -> str:
+    # Revives keyed by ID use it; revives listed without one use their timestamp, reviver and target.
+    return SELECTIONS['revives'].record_id(key, revive)
+
+
+def _window_parameters(from_timestamp: Optional[int], to_timestamp: Optional[int], limit: Optional[int]) -> Dict[str, Any]:
+    # The from/to/limit query parameters of the time-windowed selections. 0 is a valid bound.
+    parameters = {}
+    if from_timestamp is not None:
+        parameters['from'] = from_timestamp
+    if to_timestamp is not None:
+        parameters['to'] = to_timestamp
+    if limit is not None:
+        parameters['limit'] = limit
+    return parameters
+
+
+def _join_ids(ids) -> str:
+    # The API takes filters such as 'log' and 'cat' as comma-separated IDs.
+    if isinstance(ids, (str, int)):
+        return str(ids)
+    return ','.join(str(id) for id in ids)
+
+class User:
+    # Selection objects are created on first attribute access and then cached on the instance.
+    ammo = Selection('Ammo', 'api', 'user_id')
+    basic = Selection('Basic', 'api', 'user_id')
+    attacks = Selection('Attacks', 'api', 'user_id')
+    attacks_full = Selection('AttacksFull', 'api', 'user_id')
+    bars = Selection('Bars', 'api', 'user_id')
+    battle_stats = Selection('BattleStats', 'api', 'user_id')
+    bazaar = Selection('Bazaar', 'api', 'user_id')
+    cooldowns = Selection('Cooldowns', 'api', 'user_id')
+    crimes = Selection('Crimes', 'api', 'user_id')
+    criminal_record = Selection('CriminalRecord', 'api', 'user_id')
+    discord = Selection('Discord', 'api', 'user_id')
+    display_items = Selection('DisplayItems', 'api', 'user_id')
+    education = Selection('Education', 'api', 'user_id')
+    equipment = Selection('Equipment', 'api', 'user_id')
+    events = Selection('Events', 'api', 'user_id')
+    gym = Selection('Gym', 'api', 'user_id')
+    hof = Selection('HallOfFame', 'api', 'user_id')
+    honors = Selection('Honors', 'api', 'user_id')
+    icons = Selection('Icons', 'api', 'user_id')
+    jobpoints = Selection('JobPoints', 'api', 'user_id')
+    log = Selection('Log', 'api', 'user_id')
+    lookup = Selection('Lookup', 'api')
+    medals = Selection('Medals', 'api', 'user_id')
+    merits = Selection('Merits', 'api', 'user_id')
+    messages = Selection('Messages', 'api', 'user_id')
+    missions = Selection('Missions', 'api', 'user_id')
+    money = Selection('Money', 'api', 'user_id')
+    networth = Selection('Networth', 'api', 'user_id')
+    newevents = Selection('NewEvents', 'api', 'user_id')
+    newmessages = Selection('NewMessages', 'api', 'user_id')
+    notifications = Selection('Notifications', 'api', 'user_id')
+    perks = Selection('Perks', 'api', 'user_id')
+    personalstats = Selection('PersonalStats', 'api', 'user_id')
+    profile = Selection('Profile', 'api', 'user_id')
+    properties = Selection('Properties', 'api', 'user_id')
+    public_status = Selection('PublicStatus', 'api', 'user_id')
+    refills = Selection('Refills', 'api', 'user_id')
+    reports = Selection('Reports', 'api', 'user_id')
+    revives = Selection('Revives', 'api', 'user_id')
+    revives_full = Selection('RevivesFull', 'api', 'user_id')
+    skills = Selection('Skills', 'api', 'user_id')
+    stocks = Selection('Stocks', 'api', 'user_id')
+    timestamp = Selection('Timestamp', 'api', 'user_id')
+    travel = Selection('Travel', 'api', 'user_id')
+    weapon_exp = Selection('WeaponExp', 'api', 'user_id')
+    work_stats = Selection('WorkStats', 'api', 'user_id')
+
+    def __init__(self, api: TornAPI, user_id: Optional[int] = None):
+        self.api = api
+        self.user_id = user_id
         logger.info(f"Initialized User with ID: {self.user_id}")
 
 
@@ -75,7 +119,7 @@ class User:
 
         def fetch_data(self):
             """Fetch ammo data from the API."""
-            logger.debug(f"Fetching ammo data for User ID: {self.user_id}")
+            logger.debug("Fetching ammo data for User ID: %s", self.user_id)
             response = self.api.make_request('user', self.user_id, 'ammo')
             if response and 'ammo' in response:
                 logger.info(f"Ammo data fetched for User ID: {self.user_id}")
@@ -85,14 +129,16 @@ class User:
 
         class AmmoItem:
             """Class representing an individual ammo item."""
-            def __init__(self, data: Dict[str, Any]):
-                self.ammo_id = data.get('ammoID', 0)
-                self.equipped = bool(data.get('equipped', 0))
-                self.quantity = data.get('quantity', 0)
-                self.size = data.get('size', '')
-                self.type = data.get('type', '')
-                self.type_id = data.get('typeID', 0)
-                logger.debug(f"Processed AmmoItem: {self}")
+            _schema = Schema(
+                Field('ammo_id', 0, key='ammoID'),
+                Field('equipped', 0, bool),
+                Field('quantity', 0),
+                Field('size', ''),
+                Field('type', ''),
+                Field('type_id', 0, key='typeID'),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('AmmoItem', record_logger)
 
             def __repr__(self):
                 return (
@@ -112,7 +158,7 @@ class User:
 
         def fetch_data(self):
             """Fetch basic user information from the API."""
-            logger.debug(f"Fetching basic information for User ID: {self.user_id}")
+            logger.debug("Fetching basic information for User ID: %s", self.user_id)
             response = self.api.make_request('user', self.user_id, 'basic')
             if response:
                 logger.info(f"Basic information fetched for User ID: {self.user_id}")
@@ -122,23 +168,27 @@ class User:
 
         class BasicInfo:
             """Class representing basic user information."""
-            def __init__(self, data: Dict[str, Any]):
-                self.gender = data.get('gender', '')
-                self.level = data.get('level', 0)
-                self.name = data.get('name', '')
-                self.player_id = data.get('player_id', 0)
-                self.status = self.Status(data.get('status', {}))
-                logger.debug(f"Processed BasicInfo: {self}")
+            _schema = Schema(
+                Field('gender', ''),
+                Field('level', 0),
+                Field('name', ''),
+                Field('player_id', 0),
+                Field('status', {}, 'Status'),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('BasicInfo', record_logger)
 
             class Status:
                 """Class representing the user's status."""
-                def __init__(self, status_data: Dict[str, Any]):
-                    self.color = status_data.get('color', '')
-                    self.description = status_data.get('description', '')
-                    self.details = status_data.get('details', '')
-                    self.state = status_data.get('state', '')
-                    self.until = status_data.get('until', 0)
-                    logger.debug(f"Processed Status: {self}")
+                _schema = Schema(
+                    Field('color', ''),
+                    Field('description', ''),
+                    Field('details', ''),
+                    Field('state', ''),
+                    Field('until', 0),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('Status', record_logger, arg='status_data')
 
                 def __repr__(self):
                     return (
@@ -153,6 +203,8 @@ class User:
                 )
 
     class Attacks:
+        PAGE_SIZE = 100  # The most attacks the API returns per request
+
         def __init__(self, api: TornAPI, user_id: Optional[int]):
             self.api = api
             self.user_id = user_id
@@ -161,17 +213,9 @@ class User:
 
         def fetch_data(self, from_timestamp: Optional[int] = None, to_timestamp: Optional[int] = None, limit: Optional[int] = None):
             """Fetches the last 100 attacks with optional filtering."""
-            logger.debug(f"Fetching attacks for User ID: {self.user_id} with filters from: {from_timestamp}, to: {to_timestamp}, limit: {limit}")
-
-            parameters = {}
-            if from_timestamp:
-                parameters['from'] = from_timestamp
-            if to_timestamp:
-                parameters['to'] = to_timestamp
-            if limit:
-                parameters['limit'] = limit
+            logger.debug("Fetching attacks for User ID: %s with filters from: %s, to: %s, limit: %s", self.user_id, from_timestamp, to_timestamp, limit)
 
-            response = self.api.make_request('user', self.user_id, 'attacks', parameters)
+            response = self._request(from_timestamp, to_timestamp, limit)
 
             if response and 'attacks' in response:
                 logger.info(f"Attacks data fetched for User ID: {self.user_id}")
@@ -181,30 +225,89 @@ class User:
                 logger.warning(f"No attacks data found for User ID: {self.user_id}")
                 return []
 
+        def as_columns(self, from_timestamp: Optional[int] = None, to_timestamp: Optional[int] = None, limit: Optional[int] = None):
+            """Fetches attacks as typed NumPy column arrays, without building Attack objects."""
+            response = self._request(from_timestamp, to_timestamp, limit) or {}
+            return columns.as_columns(columns.records(response.get('attacks')), columns.ATTACK_COLUMNS)
+
+        def to_numpy(self, from_timestamp: Optional[int] = None, to_timestamp: Optional[int] = None, limit: Optional[int] = None):
+            """Fetches attacks as a NumPy structured array, without building Attack objects."""
+            response = self._request(from_timestamp, to_timestamp, limit) or {}
+            return columns.to_numpy(columns.records(response.get('attacks')), columns.ATTACK_COLUMNS)
+
+        def to_dataframe(self, from_timestamp: Optional[int] = None, to_timestamp: Optional[int] = None, limit: Optional[int] = None):
+            """Fetches attacks as a pandas DataFrame indexed by attack ID, built column-wise from the raw response."""
+            response = self._request(from_timestamp, to_timestamp, limit) or {}
+            ids, rows = columns.keyed_records(response.get('attacks'))
+            return columns.to_dataframe(rows, columns.ATTACK_COLUMNS, index=ids, index_name='attack_id')
+
+        def stream(self, from_timestamp: Optional[int] = None, to_timestamp: Optional[int] = None, limit: Optional[int] = None):
+            """
+            Streams attacks one Attack at a time, without decoding the whole response first.
+
+            Yields:
+            - Attack: Each attack, in response order.
+
+            Raises:
+            - StreamError: If the request fails or the API returns an error.
+            """
+            logger.debug("Streaming attacks for User ID: %s with filters from: %s, to: %s, limit: %s", self.user_id, from_timestamp, to_timestamp, limit)
+            parameters = _window_parameters(from_timestamp, to_timestamp, limit)
+            for _, item in self.api.stream('user', self.user_id, 'attacks', 'attacks', parameters):
+                yield self.Attack(item)
+
+        def iter_attacks(self, from_ts: int, to_ts: Optional[int] = None):
+            """
+            Iterates over every attack between two timestamps, fetching pages of 100 as needed.
+
+            Pages are requested lazily through the rate limiter, moving `to` backwards after each
+            one; attacks repeated at page boundaries are skipped by attack code.
+
+            Parameters:
+            - from_ts (int): The oldest timestamp to include.
+            - to_ts (Optional[int]): The newest timestamp to include. Defaults to now.
+
+            Yields:
+            - Attack: Each attack once, newest pages first.
+
+            Raises:
+            - PaginationError: If a page request fails.
+            """
+            logger.debug("Iterating attacks for User ID: %s from: %s, to: %s", self.user_id, from_ts, to_ts)
+            fetch = lambda lower, upper: fetch_page(self.api, 'user', self.user_id, 'attacks', 'attacks',
+                                                    _window_parameters(lower, upper, self.PAGE_SIZE))
+            for _, item in paginate(fetch, from_ts, to_ts, self.PAGE_SIZE, _attack_started, _attack_code):
+                yield self.Attack(item)
+
+        def _request(self, from_timestamp: Optional[int], to_timestamp: Optional[int], limit: Optional[int]):
+            return self.api.make_request('user', self.user_id, 'attacks', _window_parameters(from_timestamp, to_timestamp, limit))
+
         class Attack:
             """Class representing an individual attack."""
-            def __init__(self, data: Dict[str, Any]):
-                self.attacker_faction = data.get('attacker_faction', 0)
-                self.attacker_factionname = data.get('attacker_factionname', '')
-                self.attacker_id = data.get('attacker_id', 0)
-                self.attacker_name = data.get('attacker_name', '')
-                self.chain = data.get('chain', 0)
-                self.code = data.get('code', '')
-                self.defender_faction = data.get('defender_faction', 0)
-                self.defender_factionname = data.get('defender_factionname', '')
-                self.defender_id = data.get('defender_id', 0)
-                self.defender_name = data.get('defender_name', '')
-                self.modifiers = data.get('modifiers', {})
-                self.raid = bool(data.get('raid', 0))
-                self.ranked_war = bool(data.get('ranked_war', 0))
-                self.respect = data.get('respect', 0.0)
-                self.respect_gain = data.get('respect_gain', 0.0)
-                self.respect_loss = data.get('respect_loss', 0.0)
-                self.result = data.get('result', '')
-                self.stealthed = bool(data.get('stealthed', 0))
-                self.timestamp_ended = data.get('timestamp_ended', 0)
-                self.timestamp_started = data.get('timestamp_started', 0)
-                logger.debug(f"Processed Attack: {self}")
+            _schema = Schema(
+                Field('attacker_faction', 0),
+                Field('attacker_factionname', ''),
+                Field('attacker_id', 0),
+                Field('attacker_name', ''),
+                Field('chain', 0),
+                Field('code', ''),
+                Field('defender_faction', 0),
+                Field('defender_factionname', ''),
+                Field('defender_id', 0),
+                Field('defender_name', ''),
+                Field('modifiers', {}),
+                Field('raid', 0, bool),
+                Field('ranked_war', 0, bool),
+                Field('respect', 0.0),
+                Field('respect_gain', 0.0),
+                Field('respect_loss', 0.0),
+                Field('result', ''),
+                Field('stealthed', 0, bool),
+                Field('timestamp_ended', 0),
+                Field('timestamp_started', 0),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('Attack', record_logger)
 
             def __repr__(self):
                 return (
@@ -213,6 +316,8 @@ class User:
                 )
 
     class AttacksFull:
+        PAGE_SIZE = 1000  # The most attacksfull the API returns per request
+
         def __init__(self, api: TornAPI, user_id: Optional[int]):
             self.api = api
             self.user_id = user_id
@@ -221,17 +326,9 @@ class User:
 
         def fetch_data(self, from_timestamp: Optional[int] = None, to_timestamp: Optional[int] = None, limit: Optional[int] = None):
             """Fetches the last 1000 attacks with less details and optional filtering."""
-            logger.debug(f"Fetching attacksfull for User ID: {self.user_id} with filters from: {from_timestamp}, to: {to_timestamp}, limit: {limit}")
-
-            parameters = {}
-            if from_timestamp:
-                parameters['from'] = from_timestamp
-            if to_timestamp:
-                parameters['to'] = to_timestamp
-            if limit:
-                parameters['limit'] = limit
+            logger.debug("Fetching attacksfull for User ID: %s with filters from: %s, to: %s, limit: %s", self.user_id, from_timestamp, to_timestamp, limit)
 
-            response = self.api.make_request('user', self.user_id, 'attacksfull', parameters)
+            response = self._request(from_timestamp, to_timestamp, limit)
 
             if response and 'attacks' in response:
                 logger.info(f"AttacksFull data fetched for User ID: {self.user_id}")
@@ -241,20 +338,79 @@ class User:
                 logger.warning(f"No attacksfull data found for User ID: {self.user_id}")
                 return []
 
+        def as_columns(self, from_timestamp: Optional[int] = None, to_timestamp: Optional[int] = None, limit: Optional[int] = None):
+            """Fetches attacksfull as typed NumPy column arrays, without building AttackFull objects."""
+            response = self._request(from_timestamp, to_timestamp, limit) or {}
+            return columns.as_columns(columns.records(response.get('attacks')), columns.ATTACK_FULL_COLUMNS)
+
+        def to_numpy(self, from_timestamp: Optional[int] = None, to_timestamp: Optional[int] = None, limit: Optional[int] = None):
+            """Fetches attacksfull as a NumPy structured array, without building AttackFull objects."""
+            response = self._request(from_timestamp, to_timestamp, limit) or {}
+            return columns.to_numpy(columns.records(response.get('attacks')), columns.ATTACK_FULL_COLUMNS)
+
+        def to_dataframe(self, from_timestamp: Optional[int] = None, to_timestamp: Optional[int] = None, limit: Optional[int] = None):
+            """Fetches attacks as a pandas DataFrame indexed by attack ID, built column-wise from the raw response."""
+            response = self._request(from_timestamp, to_timestamp, limit) or {}
+            ids, rows = columns.keyed_records(response.get('attacks'))
+            return columns.to_dataframe(rows, columns.ATTACK_FULL_COLUMNS, index=ids, index_name='attack_id')
+
+        def stream(self, from_timestamp: Optional[int] = None, to_timestamp: Optional[int] = None, limit: Optional[int] = None):
+            """
+            Streams attacksfull one AttackFull at a time, without decoding the whole response first.
+
+            Yields:
+            - AttackFull: Each attack, in response order.
+
+            Raises:
+            - StreamError: If the request fails or the API returns an error.
+            """
+            logger.debug("Streaming attacksfull for User ID: %s with filters from: %s, to: %s, limit: %s", self.user_id, from_timestamp, to_timestamp, limit)
+            parameters = _window_parameters(from_timestamp, to_timestamp, limit)
+            for _, item in self.api.stream('user', self.user_id, 'attacksfull', 'attacks', parameters):
+                yield self.AttackFull(item)
+
+        def iter_attacks(self, from_ts: int, to_ts: Optional[int] = None):
+            """
+            Iterates over every attack between two timestamps, fetching pages of 1000 as needed.
+
+            Pages are requested lazily through the rate limiter, moving `to` backwards after each
+            one; attacks repeated at page boundaries are skipped by attack code.
+
+            Parameters:
+            - from_ts (int): The oldest timestamp to include.
+            - to_ts (Optional[int]): The newest timestamp to include. Defaults to now.
+
+            Yields:
+            - AttackFull: Each attack once, newest pages first.
+
+            Raises:
+            - PaginationError: If a page request fails.
+            """
+            logger.debug("Iterating attacksfull for User ID: %s from: %s, to: %s", self.user_id, from_ts, to_ts)
+            fetch = lambda lower, upper: fetch_page(self.api, 'user', self.user_id, 'attacksfull', 'attacks',
+                                                    _window_parameters(lower, upper, self.PAGE_SIZE))
+            for _, item in paginate(fetch, from_ts, to_ts, self.PAGE_SIZE, _attack_started, _attack_code):
+                yield self.AttackFull(item)
+
+        def _request(self, from_timestamp: Optional[int], to_timestamp: Optional[int], limit: Optional[int]):
+            return self.api.make_request('user', self.user_id, 'attacksfull', _window_parameters(from_timestamp, to_timestamp, limit))
+
         class AttackFull:
             """Class representing an individual attack with less details."""
-            def __init__(self, data: Dict[str, Any]):
-                self.attacker_faction = data.get('attacker_faction', 0)
-                self.attacker_id = data.get('attacker_id', 0)
-                self.code = data.get('code', '')
-                self.defender_faction = data.get('defender_faction', 0)
-                self.defender_id = data.get('defender_id', 0)
-                self.respect = data.get('respect', 0.0)
-                self.result = data.get('result', '')
-                self.stealthed = bool(data.get('stealthed', 0))
-                self.timestamp_ended = data.get('timestamp_ended', 0)
-                self.timestamp_started = data.get('timestamp_started', 0)
-                logger.debug(f"Processed AttackFull: {self}")
+            _schema = Schema(
+                Field('attacker_faction', 0),
+                Field('attacker_id', 0),
+                Field('code', ''),
+                Field('defender_faction', 0),
+                Field('defender_id', 0),
+                Field('respect', 0.0),
+                Field('result', ''),
+                Field('stealthed', 0, bool),
+                Field('timestamp_ended', 0),
+                Field('timestamp_started', 0),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('AttackFull', record_logger)
 
             def __repr__(self):
                 return (
@@ -271,7 +427,7 @@ class User:
 
         def fetch_data(self):
             """Fetches the current bars (energy, happy, life, nerve, chain) from the API."""
-            logger.debug(f"Fetching bars for User ID: {self.user_id}")
+            logger.debug("Fetching bars for User ID: %s", self.user_id)
 
             response = self.api.make_request('user', self.user_id, 'bars')
 
@@ -285,25 +441,29 @@ class User:
 
         class BarsData:
             """Class representing the user's bars data."""
-            def __init__(self, data: Dict[str, Any]):
-                self.chain = self.ChainBar(data.get('chain', {}))
-                self.energy = self.Bar(data.get('energy', {}))
-                self.happy = self.Bar(data.get('happy', {}))
-                self.life = self.Bar(data.get('life', {}))
-                self.nerve = self.Bar(data.get('nerve', {}))
-                self.server_time = data.get('server_time', 0)
-                logger.debug(f"Processed BarsData: {self}")
+            _schema = Schema(
+                Field('chain', {}, 'ChainBar'),
+                Field('energy', {}, 'Bar'),
+                Field('happy', {}, 'Bar'),
+                Field('life', {}, 'Bar'),
+                Field('nerve', {}, 'Bar'),
+                Field('server_time', 0),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('BarsData', record_logger)
 
             class Bar:
                 """Class representing a generic bar (energy, happy, life, nerve)."""
-                def __init__(self, bar_data: Dict[str, Any]):
-                    self.current = bar_data.get('current', 0)
-                    self.fulltime = bar_data.get('fulltime', 0)
-                    self.increment = bar_data.get('increment', 0)
-                    self.interval = bar_data.get('interval', 0)
-                    self.maximum = bar_data.get('maximum', 0)
-                    self.ticktime = bar_data.get('ticktime', 0)
-                    logger.debug(f"Processed Bar: {self}")
+                _schema = Schema(
+                    Field('current', 0),
+                    Field('fulltime', 0),
+                    Field('increment', 0),
+                    Field('interval', 0),
+                    Field('maximum', 0),
+                    Field('ticktime', 0),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('Bar', record_logger, arg='bar_data')
 
                 def __repr__(self):
                     return (
@@ -314,13 +474,15 @@ class User:
 
             class ChainBar:
                 """Class representing the chain bar."""
-                def __init__(self, chain_data: Dict[str, Any]):
-                    self.cooldown = chain_data.get('cooldown', 0)
-                    self.current = chain_data.get('current', 0)
-                    self.maximum = chain_data.get('maximum', 0)
-                    self.modifier = chain_data.get('modifier', 0.0)
-                    self.timeout = chain_data.get('timeout', 0)
-                    logger.debug(f"Processed ChainBar: {self}")
+                _schema = Schema(
+                    Field('cooldown', 0),
+                    Field('current', 0),
+                    Field('maximum', 0),
+                    Field('modifier', 0.0),
+                    Field('timeout', 0),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('ChainBar', record_logger, arg='chain_data')
 
                 def __repr__(self):
                     return (
@@ -343,7 +505,7 @@ class User:
 
         def fetch_data(self):
             """Fetches the battle stats and their modifiers from the API."""
-            logger.debug(f"Fetching battle stats for User ID: {self.user_id}")
+            logger.debug("Fetching battle stats for User ID: %s", self.user_id)
 
             response = self.api.make_request('user', self.user_id, 'battlestats')
 
@@ -357,26 +519,23 @@ class User:
 
         class BattleStatsData:
             """Class representing the user's battle stats and their modifiers."""
-            def __init__(self, data: Dict[str, Any]):
-                self.defense = data.get('defense', 0)
-                self.defense_info = data.get('defense_info', [])
-                self.defense_modifier = data.get('defense_modifier', 0)
-
-                self.dexterity = data.get('dexterity', 0)
-                self.dexterity_info = data.get('dexterity_info', [])
-                self.dexterity_modifier = data.get('dexterity_modifier', 0)
-
-                self.speed = data.get('speed', 0)
-                self.speed_info = data.get('speed_info', [])
-                self.speed_modifier = data.get('speed_modifier', 0)
-
-                self.strength = data.get('strength', 0)
-                self.strength_info = data.get('strength_info', [])
-                self.strength_modifier = data.get('strength_modifier', 0)
-
-                self.total = data.get('total', 0)
-
-                logger.debug(f"Processed BattleStatsData: {self}")
+            _schema = Schema(
+                Field('defense', 0),
+                Field('defense_info', []),
+                Field('defense_modifier', 0),
+                Field('dexterity', 0),
+                Field('dexterity_info', []),
+                Field('dexterity_modifier', 0),
+                Field('speed', 0),
+                Field('speed_info', []),
+                Field('speed_modifier', 0),
+                Field('strength', 0),
+                Field('strength_info', []),
+                Field('strength_modifier', 0),
+                Field('total', 0),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('BattleStatsData', record_logger)
 
             def __repr__(self):
                 return (
@@ -398,7 +557,7 @@ class User:
 
         def fetch_data(self):
             """Fetches the bazaar items from the API."""
-            logger.debug(f"Fetching bazaar items for User ID: {self.user_id}")
+            logger.debug("Fetching bazaar items for User ID: %s", self.user_id)
             response = self.api.make_request('user', self.user_id, 'bazaar')
 
             if response and 'bazaar' in response:
@@ -411,15 +570,17 @@ class User:
 
         class BazaarItem:
             """Class representing an individual bazaar item."""
-            def __init__(self, data: Dict[str, Any]):
-                self.id = data.get('ID', 0)
-                self.market_price = data.get('market_price', 0)
-                self.name = data.get('name', '')
-                self.price = data.get('price', 0)
-                self.quantity = data.get('quantity', 0)
-                self.type = data.get('type', '')
-                self.uid = data.get('UID', 0)
-                logger.debug(f"Processed BazaarItem: {self}")
+            _schema = Schema(
+                Field('id', 0, key='ID'),
+                Field('market_price', 0),
+                Field('name', ''),
+                Field('price', 0),
+                Field('quantity', 0),
+                Field('type', ''),
+                Field('uid', 0, key='UID'),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('BazaarItem', record_logger)
 
             def __repr__(self):
                 return (
@@ -437,7 +598,7 @@ class User:
 
         def fetch_data(self):
             """Fetches the cooldown data from the API."""
-            logger.debug(f"Fetching cooldowns for User ID: {self.user_id}")
+            logger.debug("Fetching cooldowns for User ID: %s", self.user_id)
             response = self.api.make_request('user', self.user_id, 'cooldowns')
 
             if response and 'cooldowns' in response:
@@ -449,11 +610,13 @@ class User:
 
         class CooldownInfo:
             """Class representing cooldown information."""
-            def __init__(self, data: Dict[str, Any]):
-                self.booster = data.get('booster', 0)
-                self.drug = data.get('drug', 0)
-                self.medical = data.get('medical', 0)
-                logger.debug(f"Processed CooldownInfo: {self}")
+            _schema = Schema(
+                Field('booster', 0),
+                Field('drug', 0),
+                Field('medical', 0),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('CooldownInfo', record_logger)
 
             def __repr__(self):
                 return (
@@ -470,7 +633,7 @@ class User:
 
         def fetch_data(self):
             """Fetches the criminal record from the API."""
-            logger.debug(f"Fetching crimes for User ID: {self.user_id}")
+            logger.debug("Fetching crimes for User ID: %s", self.user_id)
             response = self.api.make_request('user', self.user_id, 'crimes')
 
             if response and 'criminalrecord' in response:
@@ -482,24 +645,26 @@ class User:
 
         class CriminalRecord:
             """Class representing a user's criminal record."""
-            def __init__(self, data: Dict[str, Any]):
-                self.auto_theft = data.get('auto_theft', 0)
-                self.computer_crimes = data.get('computer_crimes', 0)
-                self.counterfeiting = data.get('counterfeiting', 0)
-                self.cybercrime = data.get('cybercrime', 0)
-                self.drug_deals = data.get('drug_deals', 0)
-                self.extortion = data.get('extortion', 0)
-                self.fraud = data.get('fraud', 0)
-                self.fraud_crimes = data.get('fraud_crimes', 0)
-                self.illegalproduction = data.get('illegalproduction', 0)
-                self.illicitservices = data.get('illicitservices', 0)
-                self.murder = data.get('murder', 0)
-                self.other = data.get('other', 0)
-                self.selling_illegal_products = data.get('selling_illegal_products', 0)
-                self.theft = data.get('theft', 0)
-                self.total = data.get('total', 0)
-                self.vandalism = data.get('vandalism', 0)
-                logger.debug(f"Processed CriminalRecord: {self}")
+            _schema = Schema(
+                Field('auto_theft', 0),
+                Field('computer_crimes', 0),
+                Field('counterfeiting', 0),
+                Field('cybercrime', 0),
+                Field('drug_deals', 0),
+                Field('extortion', 0),
+                Field('fraud', 0),
+                Field('fraud_crimes', 0),
+                Field('illegalproduction', 0),
+                Field('illicitservices', 0),
+                Field('murder', 0),
+                Field('other', 0),
+                Field('selling_illegal_products', 0),
+                Field('theft', 0),
+                Field('total', 0),
+                Field('vandalism', 0),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('CriminalRecord', record_logger)
 
             def __repr__(self):
                 return (
@@ -521,7 +686,7 @@ class User:
 
         def fetch_data(self):
             """Fetches the current criminal record from the API."""
-            logger.debug(f"Fetching criminal record for User ID: {self.user_id}")
+            logger.debug("Fetching criminal record for User ID: %s", self.user_id)
 
             response = self.api.make_request('user', self.user_id, 'criminalrecord')
 
@@ -535,24 +700,26 @@ class User:
 
         class RecordData:
             """Class representing the user's criminal record data."""
-            def __init__(self, data: Dict[str, Any]):
-                self.auto_theft = data.get('auto_theft', 0)
-                self.computer_crimes = data.get('computer_crimes', 0)
-                self.counterfeiting = data.get('counterfeiting', 0)
-                self.cybercrime = data.get('cybercrime', 0)
-                self.drug_deals = data.get('drug_deals', 0)
-                self.extortion = data.get('extortion', 0)
-                self.fraud = data.get('fraud', 0)
-                self.fraud_crimes = data.get('fraud_crimes', 0)
-                self.illegal_production = data.get('illegalproduction', 0)
-                self.illicit_services = data.get('illicitservices', 0)
-                self.murder = data.get('murder', 0)
-                self.other = data.get('other', 0)
-                self.selling_illegal_products = data.get('selling_illegal_products', 0)
-                self.theft = data.get('theft', 0)
-                self.total = data.get('total', 0)
-                self.vandalism = data.get('vandalism', 0)
-                logger.debug(f"Processed RecordData: {self}")
+            _schema = Schema(
+                Field('auto_theft', 0),
+                Field('computer_crimes', 0),
+                Field('counterfeiting', 0),
+                Field('cybercrime', 0),
+                Field('drug_deals', 0),
+                Field('extortion', 0),
+                Field('fraud', 0),
+                Field('fraud_crimes', 0),
+                Field('illegal_production', 0, key='illegalproduction'),
+                Field('illicit_services', 0, key='illicitservices'),
+                Field('murder', 0),
+                Field('other', 0),
+                Field('selling_illegal_products', 0),
+                Field('theft', 0),
+                Field('total', 0),
+                Field('vandalism', 0),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('RecordData', record_logger)
 
             def __repr__(self):
                 return (
@@ -583,7 +750,7 @@ class User:
 
         def fetch_data(self):
             """Fetches the current Discord verification information from the API."""
-            logger.debug(f"Fetching Discord info for User ID: {self.user_id}")
+            logger.debug("Fetching Discord info for User ID: %s", self.user_id)
 
             response = self.api.make_request('user', self.user_id, 'discord')
 
@@ -597,10 +764,12 @@ class User:
 
         class DiscordData:
             """Class representing the user's Discord verification data."""
-            def __init__(self, data: Dict[str, Any]):
-                self.discord_id = data.get('discordID', '')
-                self.user_id = data.get('userID', 0)
-                logger.debug(f"Processed DiscordData: {self}")
+            _schema = Schema(
+                Field('discord_id', '', key='discordID'),
+                Field('user_id', 0, key='userID'),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('DiscordData', record_logger)
 
             def __repr__(self):
                 return f"DiscordData(discord_id='{self.discord_id}', user_id={self.user_id})"
@@ -614,7 +783,7 @@ class User:
 
             def fetch_data(self):
                 """Fetches the list of display items from the API."""
-                logger.debug(f"Fetching display items for User ID: {self.user_id}")
+                logger.debug("Fetching display items for User ID: %s", self.user_id)
 
                 response = self.api.make_request('display', self.user_id)
 
@@ -628,15 +797,17 @@ class User:
 
             class DisplayItem:
                 """Class representing an item in the display case."""
-                def __init__(self, data: Dict[str, Any]):
-                    self.circulation = data.get('circulation', 0)
-                    self.id = data.get('ID', 0)
-                    self.market_price = data.get('market_price', 0)
-                    self.name = data.get('name', '')
-                    self.quantity = data.get('quantity', 0)
-                    self.type = data.get('type', '')
-                    self.uid = data.get('UID', 0)
-                    logger.debug(f"Processed DisplayItem: {self}")
+                _schema = Schema(
+                    Field('circulation', 0),
+                    Field('id', 0, key='ID'),
+                    Field('market_price', 0),
+                    Field('name', ''),
+                    Field('quantity', 0),
+                    Field('type', ''),
+                    Field('uid', 0, key='UID'),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('DisplayItem', record_logger)
 
                 def __repr__(self):
                     return (f"DisplayItem(id={self.id}, name='{self.name}', "
@@ -654,7 +825,7 @@ class User:
 
         def fetch_data(self):
             """Fetches the user's education information from the API."""
-            logger.debug(f"Fetching education info for User ID: {self.user_id}")
+            logger.debug("Fetching education info for User ID: %s", self.user_id)
 
             response = self.api.make_request('user', self.user_id, 'education')
 
@@ -678,7 +849,7 @@ class User:
 
         def fetch_data(self):
             """Fetches the list of equipped items from the API."""
-            logger.debug(f"Fetching equipped items for User ID: {self.user_id}")
+            logger.debug("Fetching equipped items for User ID: %s", self.user_id)
 
             response = self.api.make_request('user', self.user_id, 'equipment')
 
@@ -692,15 +863,17 @@ class User:
 
         class EquippedItem:
             """Class representing an item equipped by the user."""
-            def __init__(self, data: Dict[str, Any]):
-                self.equipped = data.get('equipped', 0)
-                self.id = data.get('ID', 0)
-                self.market_price = data.get('market_price', 0)
-                self.name = data.get('name', '')
-                self.quantity = data.get('quantity', 1)  # Will always be 1
-                self.type = data.get('type', '')
-                self.uid = data.get('UID', 0)
-                logger.debug(f"Processed EquippedItem: {self}")
+            _schema = Schema(
+                Field('equipped', 0),
+                Field('id', 0, key='ID'),
+                Field('market_price', 0),
+                Field('name', ''),
+                Field('quantity', 1),
+                Field('type', ''),
+                Field('uid', 0, key='UID'),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('EquippedItem', record_logger)
 
             def __repr__(self):
                 return (f"EquippedItem(id={self.id}, name='{self.name}', "
@@ -708,6 +881,8 @@ class User:
                         f"quantity={self.quantity}, type='{self.type}', uid={self.uid})")
 
     class Events:
+        PAGE_SIZE = 100  # The most events the API returns per request
+
         def __init__(self, api: TornAPI, user_id: Optional[int]):
             self.api = api
             self.user_id = user_id
@@ -716,18 +891,9 @@ class User:
 
         def fetch_data(self, limit: int = 25, from_timestamp: Optional[int] = None, to_timestamp: Optional[int] = None):
             """Fetches the last events for the user."""
-            logger.debug(f"Fetching events for User ID: {self.user_id}, Limit: {limit}, From: {from_timestamp}, To: {to_timestamp}")
-
-            parameters = {}
-            if from_timestamp is not None:
-                parameters['from'] = from_timestamp
-            if to_timestamp is not None:
-                parameters['to'] = to_timestamp
-            if limit > 100:
-                limit = 100  # Ensure limit does not exceed the maximum allowed
-            parameters['limit'] = limit
+            logger.debug("Fetching events for User ID: %s, Limit: %s, From: %s, To: %s", self.user_id, limit, from_timestamp, to_timestamp)
 
-            response = self.api.make_request('user', self.user_id, 'events', parameters)
+            response = self._request(limit, from_timestamp, to_timestamp)
 
             if response and 'events' in response:
                 logger.info(f"Events fetched for User ID: {self.user_id}")
@@ -737,13 +903,51 @@ class User:
                 logger.warning(f"No events found for User ID: {self.user_id}")
                 return []
 
+        def to_dataframe(self, limit: int = 25, from_timestamp: Optional[int] = None, to_timestamp: Optional[int] = None):
+            """Fetches events as a pandas DataFrame indexed by event UUID, without building Event objects."""
+            response = self._request(limit, from_timestamp, to_timestamp) or {}
+            ids, rows = columns.keyed_records(response.get('events'))
+            return columns.to_dataframe(rows, columns.EVENT_COLUMNS, index=ids, index_name='uuid')
+
+        def iter_events(self, from_ts: int, to_ts: Optional[int] = None, cursor=None):
+            """
+            Iterates over every event between two timestamps, fetching pages of 100 as needed.
+
+            With a cursor, the position is saved after each page, so an interrupted walk resumes
+            where it stopped instead of fetching every page again. Events repeated at page
+            boundaries are skipped by UUID.
+
+            Parameters:
+            - from_ts (int): The oldest timestamp to include.
+            - to_ts (Optional[int]): The newest timestamp to include. Defaults to now.
+            - cursor (Optional[Cursor or str]): The cursor, or the path of its JSON file.
+
+            Yields:
+            - Event: Each event once, newest pages first.
+
+            Raises:
+            - PaginationError: If a page request fails.
+            """
+            logger.debug("Iterating events for User ID: %s from: %s, to: %s, cursor: %s", self.user_id, from_ts, to_ts, cursor)
+            fetch = lambda lower, upper: fetch_page(self.api, 'user', self.user_id, 'events', 'events',
+                                                    _window_parameters(lower, upper, self.PAGE_SIZE))
+            for event_uuid, event in paginate_with_cursor(fetch, from_ts, to_ts, self.PAGE_SIZE,
+                                                          _event_timestamp, _event_uuid, cursor):
+                yield self.Event(event_uuid, event)
+
+        def _request(self, limit: int, from_timestamp: Optional[int], to_timestamp: Optional[int]):
+            return self.api.make_request('user', self.user_id, 'events',
+                                         _window_parameters(from_timestamp, to_timestamp, min(limit, 100)))  # 100 at most
+
         class Event:
             """Class representing a user event."""
+            __slots__ = ('event', 'timestamp', 'uuid')
+
             def __init__(self, event_uuid: str, data: Dict[str, Any]):
                 self.event = data.get('event', '')
                 self.timestamp = data.get('timestamp', 0)
                 self.uuid = event_uuid  # Unique identifier for the event
-                logger.debug(f"Processed Event: {self}")
+                record_logger.debug("Processed Event: %s", self)
 
             def __repr__(self):
                 return f"Event(uuid='{self.uuid}', event='{self.event}', timestamp={self.timestamp})"
@@ -757,7 +961,7 @@ class User:
         
         def fetch_data(self):
             """Fetches the currently active gym for the user."""
-            logger.debug(f"Fetching active gym for User ID: {self.user_id}")
+            logger.debug("Fetching active gym for User ID: %s", self.user_id)
 
             response = self.api.make_request('user', self.user_id, 'gym')
 
@@ -778,7 +982,7 @@ class User:
 
         def fetch_data(self):
             """Fetches the Hall of Fame rankings for the user."""
-            logger.debug(f"Fetching Hall of Fame rankings for User ID: {self.user_id}")
+            logger.debug("Fetching Hall of Fame rankings for User ID: %s", self.user_id)
 
             response = self.api.make_request('user', self.user_id, 'hof')
 
@@ -792,10 +996,12 @@ class User:
 
         class Ranking:
             """Class representing a ranking object."""
-            def __init__(self, data: Dict[str, Any]):
-                self.rank = data.get('rank', 0)
-                self.value = data.get('value', 0)
-                logger.debug(f"Processed Ranking: {self}")
+            _schema = Schema(
+                Field('rank', 0),
+                Field('value', 0),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('Ranking', record_logger)
 
             def __repr__(self):
                 return f"Ranking(rank={self.rank}, value={self.value})"
@@ -810,7 +1016,7 @@ class User:
 
         def fetch_data(self):
             """Fetches the awarded honors for the user."""
-            logger.debug(f"Fetching honors for User ID: {self.user_id}")
+            logger.debug("Fetching honors for User ID: %s", self.user_id)
 
             response = self.api.make_request('user', self.user_id, 'honors')
 
@@ -835,7 +1041,7 @@ class User:
 
         def fetch_data(self):
             """Fetches the currently shown icons for the user."""
-            logger.debug(f"Fetching icons for User ID: {self.user_id}")
+            logger.debug("Fetching icons for User ID: %s", self.user_id)
 
             response = self.api.make_request('user', self.user_id, 'icons')
 
@@ -856,7 +1062,7 @@ class User:
 
         def fetch_data(self):
             """Fetches the currently owned job points for the user."""
-            logger.debug(f"Fetching job points for User ID: {self.user_id}")
+            logger.debug("Fetching job points for User ID: %s", self.user_id)
 
             response = self.api.make_request('user', self.user_id, 'jobpoints')
 
@@ -870,6 +1076,8 @@ class User:
 
     class Log:
         #TODO: Probably needs to be fully fleshed out to easily be able to access logs , basic implementation works 
+        PAGE_SIZE = 100  # The most log entries the API returns per request
+
         def __init__(self, api: TornAPI, user_id: Optional[int]):
             self.api = api
             self.user_id = user_id
@@ -890,7 +1098,7 @@ class User:
             Returns:
             - dict: A dictionary containing the user's activity logs, or an empty dictionary if no logs are found.
             """
-            logger.debug(f"Fetching logs for User ID: {self.user_id} with parameters: {parameters}")
+            logger.debug("Fetching logs for User ID: %s with parameters: %s", self.user_id, parameters)
 
             response = self.api.make_request('user', self.user_id, 'log', parameters)
 
@@ -902,6 +1110,63 @@ class User:
                 logger.warning(f"No logs found for User ID: {self.user_id}")
                 return {}
 
+        def to_dataframe(self, parameters: Optional[dict] = None):
+            """Fetches activity logs as a pandas DataFrame indexed by log entry ID. Takes the same parameters as fetch_data."""
+            response = self.api.make_request('user', self.user_id, 'log', parameters) or {}
+            ids, rows = columns.keyed_records(response.get('log'))
+            return columns.to_dataframe(rows, columns.LOG_COLUMNS, index=ids, index_name='id')
+
+        def iter_logs(self, from_ts: int, to_ts: Optional[int] = None, log=None, cat=None, cursor=None, on_page=None):
+            """
+            Iterates over every activity log entry between two timestamps, fetching pages of 100 as needed.
+
+            The `log` and `cat` filters are sent to the API, so only matching entries are downloaded.
+            Entries repeated at page boundaries are skipped by log entry ID.
+
+            Parameters:
+            - from_ts (int): The oldest timestamp to include.
+            - to_ts (Optional[int]): The newest timestamp to include. Defaults to now.
+            - log (Optional[int, str or list]): Log type ID(s) to include.
+            - cat (Optional[int, str or list]): Log category ID(s) to include.
+            - cursor (Optional[Cursor or str]): The cursor, or the path of its JSON file, to resume from and save to.
+            - on_page (Optional[callable]): Called after each page, before the cursor is saved.
+
+            Yields:
+            - tuple: (log entry ID, entry dict), newest pages first.
+
+            Raises:
+            - PaginationError: If a page request fails.
+            """
+            logger.debug("Iterating logs for User ID: %s from: %s, to: %s, log: %s, cat: %s", self.user_id, from_ts, to_ts, log, cat)
+            filters = {}
+            if log is not None:
+                filters['log'] = _join_ids(log)
+            if cat is not None:
+                filters['cat'] = _join_ids(cat)
+
+            def fetch(lower, upper):
+                parameters = {'from': lower, 'to': upper, 'limit': self.PAGE_SIZE, **filters}
+                return fetch_page(self.api, 'user', self.user_id, 'log', 'log', parameters)
+
+            yield from paginate_with_cursor(fetch, from_ts, to_ts, self.PAGE_SIZE, _event_timestamp, _event_uuid,
+                                            cursor, on_page)
+
+        def export(self, sink, from_ts: int, to_ts: Optional[int] = None, log=None, cat=None, cursor=None) -> int:
+            """
+            Streams activity log entries straight into a sink without holding them in memory.
+
+            The sink is flushed after each page, before the cursor (if any) is saved, so a resumed
+            export never skips an entry that was not written.
+
+            Parameters:
+            - sink: A `sinks.NDJSONSink`, `sinks.SQLiteSink` or any object with write(key, record) and flush().
+            - from_ts, to_ts, log, cat, cursor: As for iter_logs.
+
+            Returns:
+            - int: The number of entries written.
+            """
+            return write_records(self.iter_logs(from_ts, to_ts, log, cat, cursor, on_page=sink.flush), sink)
+
     class Lookup:
         #TODO Probably needs to return an object but returns a list for right now
         def __init__(self, api: TornAPI):
@@ -943,7 +1208,7 @@ class User:
             Returns:
             - dict: A dictionary with 'medals_awarded' (list of integers) and 'medals_time' (list of timestamps).
             """
-            logger.debug(f"Fetching medals for User ID: {self.user_id}")
+            logger.debug("Fetching medals for User ID: %s", self.user_id)
 
             response = self.api.make_request('user', self.user_id, 'medals')
 
@@ -973,7 +1238,7 @@ class User:
             Returns:
             - MeritsData: An instance of the MeritsData class containing the player's merits.
             """
-            logger.debug(f"Fetching merits for User ID: {self.user_id}")
+            logger.debug("Fetching merits for User ID: %s", self.user_id)
 
             response = self.api.make_request('user', self.user_id, 'merits')
 
@@ -989,36 +1254,37 @@ class User:
             """
             A class representing the player's assigned merits, where each merit is an attribute.
             """
-            def __init__(self, merits: Dict[str, int]):
-                # Assign each merit type as an attribute
-                self.addiction_mitigation = merits.get('Addiction Mitigation', 0)
-                self.awareness = merits.get('Awareness', 0)
-                self.bank_interest = merits.get('Bank Interest', 0)
-                self.brawn = merits.get('Brawn', 0)
-                self.club_mastery = merits.get('Club Mastery', 0)
-                self.crime_xp = merits.get('Crime XP', 0)
-                self.critical_hit_rate = merits.get('Critical Hit Rate', 0)
-                self.education_length = merits.get('Education Length', 0)
-                self.employee_effectiveness = merits.get('Employee Effectiveness', 0)
-                self.evasion = merits.get('Evasion', 0)
-                self.heavy_artillery_mastery = merits.get('Heavy Artillery Mastery', 0)
-                self.hospitalizing = merits.get('Hospitalizing', 0)
-                self.life_points = merits.get('Life Points', 0)
-                self.machine_gun_mastery = merits.get('Machine Gun Mastery', 0)
-                self.masterful_looting = merits.get('Masterful Looting', 0)
-                self.mechanical_mastery = merits.get('Mechanical Mastery', 0)
-                self.nerve_bar = merits.get('Nerve Bar', 0)
-                self.piercing_mastery = merits.get('Piercing Mastery', 0)
-                self.pistol_mastery = merits.get('Pistol Mastery', 0)
-                self.protection = merits.get('Protection', 0)
-                self.rifle_mastery = merits.get('Rifle Mastery', 0)
-                self.sharpness = merits.get('Sharpness', 0)
-                self.shotgun_mastery = merits.get('Shotgun Mastery', 0)
-                self.slashing_mastery = merits.get('Slashing Mastery', 0)
-                self.smg_mastery = merits.get('SMG Mastery', 0)
-                self.stealth = merits.get('Stealth', 0)
-                self.temporary_mastery = merits.get('Temporary Mastery', 0)
-                logger.debug(f"Processed MeritsData: {self}")
+            _schema = Schema(
+                Field('addiction_mitigation', 0, key='Addiction Mitigation'),
+                Field('awareness', 0, key='Awareness'),
+                Field('bank_interest', 0, key='Bank Interest'),
+                Field('brawn', 0, key='Brawn'),
+                Field('club_mastery', 0, key='Club Mastery'),
+                Field('crime_xp', 0, key='Crime XP'),
+                Field('critical_hit_rate', 0, key='Critical Hit Rate'),
+                Field('education_length', 0, key='Education Length'),
+                Field('employee_effectiveness', 0, key='Employee Effectiveness'),
+                Field('evasion', 0, key='Evasion'),
+                Field('heavy_artillery_mastery', 0, key='Heavy Artillery Mastery'),
+                Field('hospitalizing', 0, key='Hospitalizing'),
+                Field('life_points', 0, key='Life Points'),
+                Field('machine_gun_mastery', 0, key='Machine Gun Mastery'),
+                Field('masterful_looting', 0, key='Masterful Looting'),
+                Field('mechanical_mastery', 0, key='Mechanical Mastery'),
+                Field('nerve_bar', 0, key='Nerve Bar'),
+                Field('piercing_mastery', 0, key='Piercing Mastery'),
+                Field('pistol_mastery', 0, key='Pistol Mastery'),
+                Field('protection', 0, key='Protection'),
+                Field('rifle_mastery', 0, key='Rifle Mastery'),
+                Field('sharpness', 0, key='Sharpness'),
+                Field('shotgun_mastery', 0, key='Shotgun Mastery'),
+                Field('slashing_mastery', 0, key='Slashing Mastery'),
+                Field('smg_mastery', 0, key='SMG Mastery'),
+                Field('stealth', 0, key='Stealth'),
+                Field('temporary_mastery', 0, key='Temporary Mastery'),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('MeritsData', record_logger, arg='merits')
 
             def __repr__(self):
                 return (f"MeritsData(Addiction Mitigation={self.addiction_mitigation}, Awareness={self.awareness}, "
@@ -1036,6 +1302,8 @@ class User:
                         f"Stealth={self.stealth}, Temporary Mastery={self.temporary_mastery})")
 
     class Messages:
+        PAGE_SIZE = 100  # The most messages the API returns per request
+
         def __init__(self, api: TornAPI, user_id: Optional[int]):
             self.api = api
             self.user_id = user_id
@@ -1054,19 +1322,9 @@ class User:
             Returns:
             - List[Message]: A list of message objects.
             """
-            logger.debug(f"Fetching messages for User ID: {self.user_id}")
+            logger.debug("Fetching messages for User ID: %s", self.user_id)
 
-            # Construct query parameters
-            parameters = {}
-            if from_timestamp:
-                parameters['from'] = from_timestamp
-            if to_timestamp:
-                parameters['to'] = to_timestamp
-            if limit:
-                parameters['limit'] = limit
-
-            # Make API request
-            response = self.api.make_request('user', self.user_id, 'messages', parameters)
+            response = self._request(from_timestamp, to_timestamp, limit)
 
             if response and 'messages' in response:
                 self.messages_data = {msg_id: self.Message(msg_id, msg_data) for msg_id, msg_data in response['messages'].items()}
@@ -1076,10 +1334,46 @@ class User:
                 logger.warning(f"No messages data found for User ID: {self.user_id}")
                 return None
 
+        def to_dataframe(self, from_timestamp: Optional[int] = None, to_timestamp: Optional[int] = None, limit: Optional[int] = None):
+            """Fetches messages as a pandas DataFrame indexed by message ID, without building Message objects."""
+            response = self._request(from_timestamp, to_timestamp, limit) or {}
+            ids, rows = columns.keyed_records(response.get('messages'))
+            return columns.to_dataframe(rows, columns.MESSAGE_COLUMNS, index=ids, index_name='id')
+
+        def iter_messages(self, from_ts: int, to_ts: Optional[int] = None, cursor=None):
+            """
+            Iterates over every message between two timestamps, fetching pages of 100 as needed.
+
+            Messages repeated at page boundaries are skipped by message ID. With a cursor, the
+            position is saved after each page so an interrupted scan resumes where it stopped.
+
+            Parameters:
+            - from_ts (int): The oldest timestamp to include.
+            - to_ts (Optional[int]): The newest timestamp to include. Defaults to now.
+            - cursor (Optional[Cursor or str]): The cursor, or the path of its JSON file.
+
+            Yields:
+            - Message: Each message once, newest pages first.
+
+            Raises:
+            - PaginationError: If a page request fails.
+            """
+            logger.debug("Iterating messages for User ID: %s from: %s, to: %s, cursor: %s", self.user_id, from_ts, to_ts, cursor)
+            fetch = lambda lower, upper: fetch_page(self.api, 'user', self.user_id, 'messages', 'messages',
+                                                    _window_parameters(lower, upper, self.PAGE_SIZE))
+            for message_id, message in paginate_with_cursor(fetch, from_ts, to_ts, self.PAGE_SIZE,
+                                                            _event_timestamp, _event_uuid, cursor):
+                yield self.Message(message_id, message)
+
+        def _request(self, from_timestamp: Optional[int], to_timestamp: Optional[int], limit: Optional[int]):
+            return self.api.make_request('user', self.user_id, 'messages', _window_parameters(from_timestamp, to_timestamp, limit))
+
         class Message:
             """
             A class representing an individual message.
             """
+            __slots__ = ('id', 'name', 'read', 'seen', 'timestamp', 'title', 'type')
+
             def __init__(self, msg_id: int, data: Dict[str, Any]):
                 self.id = msg_id
                 self.name = data.get('name', '')
@@ -1108,7 +1402,7 @@ class User:
             - Dict[str, List[Mission]]: A dictionary where each key is a mission giver (e.g., 'Duke'),
               and the value is a list of Mission objects.
             """
-            logger.debug(f"Fetching missions for User ID: {self.user_id}")
+            logger.debug("Fetching missions for User ID: %s", self.user_id)
             
             # Make API request
             response = self.api.make_request('user', self.user_id, 'missions')
@@ -1126,9 +1420,12 @@ class User:
             """
             A class representing an individual mission.
             """
-            def __init__(self, data: Dict[str, Any]):
-                self.status = data.get('status', 'notAccepted')
-                self.title = data.get('title', '')
+            _schema = Schema(
+                Field('status', 'notAccepted'),
+                Field('title', ''),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('Mission')
 
             def __repr__(self):
                 return f"Mission(status='{self.status}', title='{self.title}')"
@@ -1147,7 +1444,7 @@ class User:
             Returns:
             - MoneyData: An instance of MoneyData containing various financial details of the user.
             """
-            logger.debug(f"Fetching money information for User ID: {self.user_id}")
+            logger.debug("Fetching money information for User ID: %s", self.user_id)
             
             # Make API request
             response = self.api.make_request('user', self.user_id, 'money')
@@ -1164,15 +1461,17 @@ class User:
             """
             A class representing the user's financial information.
             """
-            def __init__(self, data: Dict[str, Any]):
-                self.cayman_bank = data.get('cayman_bank', 0)
-                self.city_bank = self.CityBank(data.get('city_bank', {}))
-                self.company_funds = data.get('company_funds', 0)
-                self.daily_networth = data.get('daily_networth', 0)
-                self.money_onhand = data.get('money_onhand', 0)
-                self.points = data.get('points', 0)
-                self.vault_amount = data.get('vault_amount', 0)
-                logger.debug(f"Processed MoneyData: {self}")
+            _schema = Schema(
+                Field('cayman_bank', 0),
+                Field('city_bank', {}, 'CityBank'),
+                Field('company_funds', 0),
+                Field('daily_networth', 0),
+                Field('money_onhand', 0),
+                Field('points', 0),
+                Field('vault_amount', 0),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('MoneyData', record_logger)
 
             def __repr__(self):
                 return (f"MoneyData(cayman_bank={self.cayman_bank}, city_bank={self.city_bank}, "
@@ -1183,9 +1482,12 @@ class User:
                 """
                 A class representing the user's City Bank information.
                 """
-                def __init__(self, data: Dict[str, Any]):
-                    self.amount = data.get('amount', 0)
-                    self.time_left = data.get('time_left', 0)
+                _schema = Schema(
+                    Field('amount', 0),
+                    Field('time_left', 0),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('CityBank')
 
                 def __repr__(self):
                     return f"CityBank(amount={self.amount}, time_left={self.time_left})"
@@ -1204,7 +1506,7 @@ class User:
             Returns:
             - NetworthData: An instance of NetworthData containing the user's financial assets and their corresponding values.
             """
-            logger.debug(f"Fetching networth information for User ID: {self.user_id}")
+            logger.debug("Fetching networth information for User ID: %s", self.user_id)
 
             # Make API request
             response = self.api.make_request('user', self.user_id, 'networth')
@@ -1221,30 +1523,32 @@ class User:
             """
             A class representing the user's networth values.
             """
-            def __init__(self, data: Dict[str, Any]):
-                self.auctionhouse = data.get('auctionhouse', 0)
-                self.bank = data.get('bank', 0)
-                self.bazaar = data.get('bazaar', 0)
-                self.bookie = data.get('bookie', 0)
-                self.cayman = data.get('cayman', 0)
-                self.company = data.get('company', 0)
-                self.displaycase = data.get('displaycase', 0)
-                self.enlistedcars = data.get('enlistedcars', 0)
-                self.itemmarket = data.get('itemmarket', 0)
-                self.items = data.get('items', 0)
-                self.loan = data.get('loan', 0)
-                self.parsetime = data.get('parsetime', 0.0)
-                self.pending = data.get('pending', 0)
-                self.piggybank = data.get('piggybank', 0)
-                self.points = data.get('points', 0)
-                self.properties = data.get('properties', 0)
-                self.stockmarket = data.get('stockmarket', 0)
-                self.total = data.get('total', 0)
-                self.trade = data.get('trade', 0)
-                self.unpaidfees = data.get('unpaidfees', 0)
-                self.vault = data.get('vault', 0)
-                self.wallet = data.get('wallet', 0)
-                logger.debug(f"Processed NetworthData: {self}")
+            _schema = Schema(
+                Field('auctionhouse', 0),
+                Field('bank', 0),
+                Field('bazaar', 0),
+                Field('bookie', 0),
+                Field('cayman', 0),
+                Field('company', 0),
+                Field('displaycase', 0),
+                Field('enlistedcars', 0),
+                Field('itemmarket', 0),
+                Field('items', 0),
+                Field('loan', 0),
+                Field('parsetime', 0.0),
+                Field('pending', 0),
+                Field('piggybank', 0),
+                Field('points', 0),
+                Field('properties', 0),
+                Field('stockmarket', 0),
+                Field('total', 0),
+                Field('trade', 0),
+                Field('unpaidfees', 0),
+                Field('vault', 0),
+                Field('wallet', 0),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('NetworthData', record_logger)
 
             def __repr__(self):
                 return (
@@ -1272,7 +1576,7 @@ class User:
             Returns:
             - NewEventsData: An instance of NewEventsData containing the user's unread events.
             """
-            logger.debug(f"Fetching new events for User ID: {self.user_id}")
+            logger.debug("Fetching new events for User ID: %s", self.user_id)
 
             # Make API request
             response = self.api.make_request('user', self.user_id, 'newevents')
@@ -1289,20 +1593,24 @@ class User:
             """
             A class representing the user's unread events.
             """
+            __slots__ = ('events', 'player_id')
+
             def __init__(self, data: Dict[str, Any]):
                 self.events = {event_id: self.Event(event_data) for event_id, event_data in data.get('events', {}).items()}
                 self.player_id = data.get('player_id', 0)
-                logger.debug(f"Processed NewEventsData: {self}")
+                record_logger.debug("Processed NewEventsData: %s", self)
 
             class Event:
                 """
                 A class representing an individual event.
                 """
-                def __init__(self, data: Dict[str, Any]):
-                    self.event = data.get('event', '')
-                    self.seen = data.get('seen', 0)  # Will always be 0 for unread events
-                    self.timestamp = data.get('timestamp', 0)
-                    logger.debug(f"Processed Event: {self}")
+                _schema = Schema(
+                    Field('event', ''),
+                    Field('seen', 0),
+                    Field('timestamp', 0),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('Event', record_logger)
 
                 def __repr__(self):
                     return f"Event(event='{self.event}', seen={self.seen}, timestamp={self.timestamp})"
@@ -1324,7 +1632,7 @@ class User:
             Returns:
             - NewMessagesData: An instance of NewMessagesData containing the user's unread messages.
             """
-            logger.debug(f"Fetching new messages for User ID: {self.user_id}")
+            logger.debug("Fetching new messages for User ID: %s", self.user_id)
 
             # Make API request
             response = self.api.make_request('user', self.user_id, 'newmessages')
@@ -1341,24 +1649,28 @@ class User:
             """
             A class representing the user's unread messages.
             """
+            __slots__ = ('messages', 'player_id')
+
             def __init__(self, data: Dict[str, Any]):
                 self.messages = {message_id: self.Message(message_data) for message_id, message_data in data.get('messages', {}).items()}
                 self.player_id = data.get('player_id', 0)
-                logger.debug(f"Processed NewMessagesData: {self}")
+                record_logger.debug("Processed NewMessagesData: %s", self)
 
             class Message:
                 """
                 A class representing an individual message.
                 """
-                def __init__(self, data: Dict[str, Any]):
-                    self.ID = data.get('ID', 0)
-                    self.name = data.get('name', '')
-                    self.read = data.get('read', 0)  # Will always be 0 for unread messages
-                    self.seen = data.get('seen', 0)
-                    self.timestamp = data.get('timestamp', 0)
-                    self.title = data.get('title', '')
-                    self.type = data.get('type', '')
-                    logger.debug(f"Processed Message: {self}")
+                _schema = Schema(
+                    Field('ID', 0),
+                    Field('name', ''),
+                    Field('read', 0),
+                    Field('seen', 0),
+                    Field('timestamp', 0),
+                    Field('title', ''),
+                    Field('type', ''),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('Message', record_logger)
 
                 def __repr__(self):
                     return (f"Message(ID={self.ID}, name='{self.name}', read={self.read}, "
@@ -1382,7 +1694,7 @@ class User:
             Returns:
             - NotificationsData: An instance of NotificationsData containing the counts of various notifications.
             """
-            logger.debug(f"Fetching notifications for User ID: {self.user_id}")
+            logger.debug("Fetching notifications for User ID: %s", self.user_id)
 
             # Make API request
             response = self.api.make_request('user', self.user_id, 'notifications')
@@ -1399,12 +1711,14 @@ class User:
             """
             A class representing the counts of various notifications for the user.
             """
-            def __init__(self, data: Dict[str, Any]):
-                self.awards = data.get('awards', 0)
-                self.competition = data.get('competition', 0)
-                self.events = data.get('events', 0)
-                self.messages = data.get('messages', 0)
-                logger.debug(f"Processed NotificationsData: {self}")
+            _schema = Schema(
+                Field('awards', 0),
+                Field('competition', 0),
+                Field('events', 0),
+                Field('messages', 0),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('NotificationsData', record_logger)
 
             def __repr__(self):
                 return (f"NotificationsData(awards={self.awards}, "
@@ -1425,7 +1739,7 @@ class User:
             Returns:
             - PerksData: An instance of PerksData containing the user's active perks.
             """
-            logger.debug(f"Fetching perks for User ID: {self.user_id}")
+            logger.debug("Fetching perks for User ID: %s", self.user_id)
 
             # Make API request
             response = self.api.make_request('user', self.user_id, 'perks')
@@ -1442,16 +1756,18 @@ class User:
             """
             A class representing the user's active perks.
             """
-            def __init__(self, data: Dict[str, Any]):
-                self.book_perks = data.get('book_perks', [])
-                self.education_perks = data.get('education_perks', [])
-                self.enhancer_perks = data.get('enhancer_perks', [])
-                self.faction_perks = data.get('faction_perks', [])
-                self.job_perks = data.get('job_perks', [])
-                self.merit_perks = data.get('merit_perks', [])
-                self.property_perks = data.get('property_perks', [])
-                self.stock_perks = data.get('stock_perks', [])
-                logger.debug(f"Processed PerksData: {self}")
+            _schema = Schema(
+                Field('book_perks', []),
+                Field('education_perks', []),
+                Field('enhancer_perks', []),
+                Field('faction_perks', []),
+                Field('job_perks', []),
+                Field('merit_perks', []),
+                Field('property_perks', []),
+                Field('stock_perks', []),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('PerksData', record_logger)
 
             def __repr__(self):
                 return (f"PerksData(book_perks={self.book_perks}, education_perks={self.education_perks}, "
@@ -1467,18 +1783,19 @@ class User:
             self.stats_data = None
             logger.info(f"Initialized PersonalStats for User ID: {self.user_id}")
 
-        def fetch_data(self, timestamp: Optional[int] = None, stat: Optional[str] = None):
+        def fetch_data(self, timestamp: Optional[int] = None, stat: Optional[str] = None, lazy: bool = False):
             """
             Fetch the user's personal stats.
             
             Args:
             - timestamp (int, optional): The epoch timestamp to get the stats from. Older dates might return combined data.
             - stat (str, optional): The specific stat key to retrieve data for.
+            - lazy (bool, optional): Return a LazyPersonalStatsData that decodes each stat on first access.
             
             Returns:
             - PersonalStatsData: An instance of PersonalStatsData containing the user's personal stats.
             """
-            logger.debug(f"Fetching personal stats for User ID: {self.user_id}, Timestamp: {timestamp}, Stat: {stat}")
+            logger.debug("Fetching personal stats for User ID: %s, Timestamp: %s, Stat: %s", self.user_id, timestamp, stat)
             
             # Prepare parameters for query
             parameters = {}
@@ -1492,7 +1809,8 @@ class User:
             # print(f"response {response}")
             if response and isinstance(response, dict) and 'personalstats' in response:
                 # Create a new PersonalStatsData instance with the response data
-                self.stats_data = self.PersonalStatsData(response['personalstats'])
+                model = self.LazyPersonalStatsData if lazy else self.PersonalStatsData
+                self.stats_data = model(response['personalstats'])
                 logger.info(f"Fetched personal stats for User ID: {self.user_id}")
                 return self.stats_data
             else:
@@ -1503,204 +1821,205 @@ class User:
             """
             A class representing the user's personal stats.
             """
-            def __init__(self, data: Dict[str, Any]):
-                # Personal stats fields initialization
-                self.activestreak = data.get('activestreak', 0)
-                self.alcoholused = data.get('alcoholused', 0)
-                self.argtravel = data.get('argtravel', 0)
-                self.arrestsmade = data.get('arrestsmade', 0)
-                self.attackcriticalhits = data.get('attackcriticalhits', 0)
-                self.attackdamage = data.get('attackdamage', 0)
-                self.attackhits = data.get('attackhits', 0)
-                self.attackmisses = data.get('attackmisses', 0)
-                self.attacksassisted = data.get('attacksassisted', 0)
-                self.attacksdraw = data.get('attacksdraw', 0)
-                self.attackslost = data.get('attackslost', 0)
-                self.attacksstealthed = data.get('attacksstealthed', 0)
-                self.attackswon = data.get('attackswon', 0)
-                self.attackswonabroad = data.get('attackswonabroad', 0)
-                self.auctionsells = data.get('auctionsells', 0)
-                self.auctionswon = data.get('auctionswon', 0)
-                self.awards = data.get('awards', 0)
-                self.axehits = data.get('axehits', 0)
-                self.bazaarcustomers = data.get('bazaarcustomers', 0)
-                self.bazaarprofit = data.get('bazaarprofit', 0)
-                self.bazaarsales = data.get('bazaarsales', 0)
-                self.bestactivestreak = data.get('bestactivestreak', 0)
-                self.bestdamage = data.get('bestdamage', 0)
-                self.bestkillstreak = data.get('bestkillstreak', 0)
-                self.bloodwithdrawn = data.get('bloodwithdrawn', 0)
-                self.booksread = data.get('booksread', 0)
-                self.boostersused = data.get('boostersused', 0)
-                self.bountiescollected = data.get('bountiescollected', 0)
-                self.bountiesplaced = data.get('bountiesplaced', 0)
-                self.bountiesreceived = data.get('bountiesreceived', 0)
-                self.candyused = data.get('candyused', 0)
-                self.cantaken = data.get('cantaken', 0)
-                self.cantravel = data.get('cantravel', 0)
-                self.caytravel = data.get('caytravel', 0)
-                self.chahits = data.get('chahits', 0)
-                self.chitravel = data.get('chitravel', 0)
-                self.cityfinds = data.get('cityfinds', 0)
-                self.cityitemsbought = data.get('cityitemsbought', 0)
-                self.classifiedadsplaced = data.get('classifiedadsplaced', 0)
-                self.companymailssent = data.get('companymailssent', 0)
-                self.consumablesused = data.get('consumablesused', 0)
-                self.contractscompleted = data.get('contractscompleted', 0)
-                self.counterfeiting = data.get('counterfeiting', 0)
-                self.criminaloffenses = data.get('criminaloffenses', 0)
-                self.cybercrime = data.get('cybercrime', 0)
-                self.daysbeendonator = data.get('daysbeendonator', 0)
-                self.defendslost = data.get('defendslost', 0)
-                self.defendslostabroad = data.get('defendslostabroad', 0)
-                self.defendsstalemated = data.get('defendsstalemated', 0)
-                self.defendswon = data.get('defendswon', 0)
-                self.defense = data.get('defense', 0)
-                self.dexterity = data.get('dexterity', 0)
-                self.drugsused = data.get('drugsused', 0)
-                self.dubtravel = data.get('dubtravel', 0)
-                self.dukecontractscompleted = data.get('dukecontractscompleted', 0)
-                self.dumpfinds = data.get('dumpfinds', 0)
-                self.dumpsearches = data.get('dumpsearches', 0)
-                self.eastereggs = data.get('eastereggs', 0)
-                self.eastereggsused = data.get('eastereggsused', 0)
-                self.elo = data.get('elo', 0)
-                self.endurance = data.get('endurance', 0)
-                self.energydrinkused = data.get('energydrinkused', 0)
-                self.extortion = data.get('extortion', 0)
-                self.exttaken = data.get('exttaken', 0)
-                self.factionmailssent = data.get('factionmailssent', 0)
-                self.failedbusts = data.get('failedbusts', 0)
-                self.fraud = data.get('fraud', 0)
-                self.friendmailssent = data.get('friendmailssent', 0)
-                self.grehits = data.get('grehits', 0)
-                self.h2hhits = data.get('h2hhits', 0)
-                self.hawtravel = data.get('hawtravel', 0)
-                self.heahits = data.get('heahits', 0)
-                self.highestbeaten = data.get('highestbeaten', 0)
-                self.hollowammoused = data.get('hollowammoused', 0)
-                self.hospital = data.get('hospital', 0)
-                self.illegalproduction = data.get('illegalproduction', 0)
-                self.illicitservices = data.get('illicitservices', 0)
-                self.incendiaryammoused = data.get('incendiaryammoused', 0)
-                self.intelligence = data.get('intelligence', 0)
-                self.investedprofit = data.get('investedprofit', 0)
-                self.itemsbought = data.get('itemsbought', 0)
-                self.itemsboughtabroad = data.get('itemsboughtabroad', 0)
-                self.itemsdumped = data.get('itemsdumped', 0)
-                self.itemslooted = data.get('itemslooted', 0)
-                self.itemssent = data.get('itemssent', 0)
-                self.jailed = data.get('jailed', 0)
-                self.japtravel = data.get('japtravel', 0)
-                self.jobpointsused = data.get('jobpointsused', 0)
-                self.kettaken = data.get('kettaken', 0)
-                self.killstreak = data.get('killstreak', 0)
-                self.largestmug = data.get('largestmug', 0)
-                self.lontravel = data.get('lontravel', 0)
-                self.lsdtaken = data.get('lsdtaken', 0)
-                self.machits = data.get('machits', 0)
-                self.mailssent = data.get('mailssent', 0)
-                self.manuallabor = data.get('manuallabor', 0)
-                self.medicalitemsused = data.get('medicalitemsused', 0)
-                self.meritsbought = data.get('meritsbought', 0)
-                self.mextravel = data.get('mextravel', 0)
-                self.missioncreditsearned = data.get('missioncreditsearned', 0)
-                self.missionscompleted = data.get('missionscompleted', 0)
-                self.moneyinvested = data.get('moneyinvested', 0)
-                self.moneymugged = data.get('moneymugged', 0)
-                self.nerverefills = data.get('nerverefills', 0)
-                self.networth = data.get('networth', 0)
-                self.networthauctionhouse = data.get('networthauctionhouse', 0)
-                self.networthbank = data.get('networthbank', 0)
-                self.networthbazaar = data.get('networthbazaar', 0)
-                self.networthbookie = data.get('networthbookie', 0)
-                self.networthcayman = data.get('networthcayman', 0)
-                self.networthcompany = data.get('networthcompany', 0)
-                self.networthdisplaycase = data.get('networthdisplaycase', 0)
-                self.networthenlistedcars = data.get('networthenlistedcars', 0)
-                self.networthitemmarket = data.get('networthitemmarket', 0)
-                self.networthitems = data.get('networthitems', 0)
-                self.networthloan = data.get('networthloan', 0)
-                self.networthpending = data.get('networthpending', 0)
-                self.networthpiggybank = data.get('networthpiggybank', 0)
-                self.networthpoints = data.get('networthpoints', 0)
-                self.networthproperties = data.get('networthproperties', 0)
-                self.networthstockmarket = data.get('networthstockmarket', 0)
-                self.networthunpaidfees = data.get('networthunpaidfees', 0)
-                self.networthvault = data.get('networthvault', 0)
-                self.networthwallet = data.get('networthwallet', 0)
-                self.onehitkills = data.get('onehitkills', 0)
-                self.opitaken = data.get('opitaken', 0)
-                self.organisedcrimes = data.get('organisedcrimes', 0)
-                self.overdosed = data.get('overdosed', 0)
-                self.pcptaken = data.get('pcptaken', 0)
-                self.peoplebought = data.get('peoplebought', 0)
-                self.peopleboughtspent = data.get('peopleboughtspent', 0)
-                self.peoplebusted = data.get('peoplebusted', 0)
-                self.personalsplaced = data.get('personalsplaced', 0)
-                self.piehits = data.get('piehits', 0)
-                self.piercingammoused = data.get('piercingammoused', 0)
-                self.pishits = data.get('pishits', 0)
-                self.pointsbought = data.get('pointsbought', 0)
-                self.pointssold = data.get('pointssold', 0)
-                self.racesentered = data.get('racesentered', 0)
-                self.raceswon = data.get('raceswon', 0)
-                self.racingpointsearned = data.get('racingpointsearned', 0)
-                self.racingskill = data.get('racingskill', 0)
-                self.raidhits = data.get('raidhits', 0)
-                self.rankedwarhits = data.get('rankedwarhits', 0)
-                self.rankedwarringwins = data.get('rankedwarringwins', 0)
-                self.receivedbountyvalue = data.get('receivedbountyvalue', 0)
-                self.refills = data.get('refills', 0)
-                self.rehabcost = data.get('rehabcost', 0)
-                self.rehabs = data.get('rehabs', 0)
-                self.respectforfaction = data.get('respectforfaction', 0)
-                self.retals = data.get('retals', 0)
-                self.revives = data.get('revives', 0)
-                self.reviveskill = data.get('reviveskill', 0)
-                self.revivesreceived = data.get('revivesreceived', 0)
-                self.rifhits = data.get('rifhits', 0)
-                self.roundsfired = data.get('roundsfired', 0)
-                self.shohits = data.get('shohits', 0)
-                self.shrtaken = data.get('shrtaken', 0)
-                self.slahits = data.get('slahits', 0)
-                self.smghits = data.get('smghits', 0)
-                self.soutravel = data.get('soutravel', 0)
-                self.specialammoused = data.get('specialammoused', 0)
-                self.speed = data.get('speed', 0)
-                self.spetaken = data.get('spetaken', 0)
-                self.spousemailssent = data.get('spousemailssent', 0)
-                self.statenhancersused = data.get('statenhancersused', 0)
-                self.stockfees = data.get('stockfees', 0)
-                self.stocklosses = data.get('stocklosses', 0)
-                self.stocknetprofits = data.get('stocknetprofits', 0)
-                self.stockpayouts = data.get('stockpayouts', 0)
-                self.stockprofits = data.get('stockprofits', 0)
-                self.strength = data.get('strength', 0)
-                self.switravel = data.get('switravel', 0)
-                self.territoryclears = data.get('territoryclears', 0)
-                self.territoryjoins = data.get('territoryjoins', 0)
-                self.territorytime = data.get('territorytime', 0)
-                self.theft = data.get('theft', 0)
-                self.theyrunaway = data.get('theyrunaway', 0)
-                self.tokenrefills = data.get('tokenrefills', 0)
-                self.totalbountyreward = data.get('totalbountyreward', 0)
-                self.totalbountyspent = data.get('totalbountyspent', 0)
-                self.totalstats = data.get('totalstats', 0)
-                self.totalworkingstats = data.get('totalworkingstats', 0)
-                self.tracerammoused = data.get('tracerammoused', 0)
-                self.trades = data.get('trades', 0)
-                self.trainsreceived = data.get('trainsreceived', 0)
-                self.traveltime = data.get('traveltime', 0)
-                self.traveltimes = data.get('traveltimes', 0)
-                self.unarmoredwon = data.get('unarmoredwon',0)
-                self.useractivity = data.get('useractivity', 0)	
-                self.victaken = data.get('victaken', 0)
-                self.virusescoded = data.get('virusescoded', 0)
-                self.weaponsbought = data.get('weaponsbought', 0)
-                self.xantaken = data.get('xantaken', 0)
-                self.yourunaway = data.get('yourunaway', 0)
-                logger.debug(f"Processed PersonalStatsData: {self}")
+            _schema = Schema(
+                Field('activestreak', 0),
+                Field('alcoholused', 0),
+                Field('argtravel', 0),
+                Field('arrestsmade', 0),
+                Field('attackcriticalhits', 0),
+                Field('attackdamage', 0),
+                Field('attackhits', 0),
+                Field('attackmisses', 0),
+                Field('attacksassisted', 0),
+                Field('attacksdraw', 0),
+                Field('attackslost', 0),
+                Field('attacksstealthed', 0),
+                Field('attackswon', 0),
+                Field('attackswonabroad', 0),
+                Field('auctionsells', 0),
+                Field('auctionswon', 0),
+                Field('awards', 0),
+                Field('axehits', 0),
+                Field('bazaarcustomers', 0),
+                Field('bazaarprofit', 0),
+                Field('bazaarsales', 0),
+                Field('bestactivestreak', 0),
+                Field('bestdamage', 0),
+                Field('bestkillstreak', 0),
+                Field('bloodwithdrawn', 0),
+                Field('booksread', 0),
+                Field('boostersused', 0),
+                Field('bountiescollected', 0),
+                Field('bountiesplaced', 0),
+                Field('bountiesreceived', 0),
+                Field('candyused', 0),
+                Field('cantaken', 0),
+                Field('cantravel', 0),
+                Field('caytravel', 0),
+                Field('chahits', 0),
+                Field('chitravel', 0),
+                Field('cityfinds', 0),
+                Field('cityitemsbought', 0),
+                Field('classifiedadsplaced', 0),
+                Field('companymailssent', 0),
+                Field('consumablesused', 0),
+                Field('contractscompleted', 0),
+                Field('counterfeiting', 0),
+                Field('criminaloffenses', 0),
+                Field('cybercrime', 0),
+                Field('daysbeendonator', 0),
+                Field('defendslost', 0),
+                Field('defendslostabroad', 0),
+                Field('defendsstalemated', 0),
+                Field('defendswon', 0),
+                Field('defense', 0),
+                Field('dexterity', 0),
+                Field('drugsused', 0),
+                Field('dubtravel', 0),
+                Field('dukecontractscompleted', 0),
+                Field('dumpfinds', 0),
+                Field('dumpsearches', 0),
+                Field('eastereggs', 0),
+                Field('eastereggsused', 0),
+                Field('elo', 0),
+                Field('endurance', 0),
+                Field('energydrinkused', 0),
+                Field('extortion', 0),
+                Field('exttaken', 0),
+                Field('factionmailssent', 0),
+                Field('failedbusts', 0),
+                Field('fraud', 0),
+                Field('friendmailssent', 0),
+                Field('grehits', 0),
+                Field('h2hhits', 0),
+                Field('hawtravel', 0),
+                Field('heahits', 0),
+                Field('highestbeaten', 0),
+                Field('hollowammoused', 0),
+                Field('hospital', 0),
+                Field('illegalproduction', 0),
+                Field('illicitservices', 0),
+                Field('incendiaryammoused', 0),
+                Field('intelligence', 0),
+                Field('investedprofit', 0),
+                Field('itemsbought', 0),
+                Field('itemsboughtabroad', 0),
+                Field('itemsdumped', 0),
+                Field('itemslooted', 0),
+                Field('itemssent', 0),
+                Field('jailed', 0),
+                Field('japtravel', 0),
+                Field('jobpointsused', 0),
+                Field('kettaken', 0),
+                Field('killstreak', 0),
+                Field('largestmug', 0),
+                Field('lontravel', 0),
+                Field('lsdtaken', 0),
+                Field('machits', 0),
+                Field('mailssent', 0),
+                Field('manuallabor', 0),
+                Field('medicalitemsused', 0),
+                Field('meritsbought', 0),
+                Field('mextravel', 0),
+                Field('missioncreditsearned', 0),
+                Field('missionscompleted', 0),
+                Field('moneyinvested', 0),
+                Field('moneymugged', 0),
+                Field('nerverefills', 0),
+                Field('networth', 0),
+                Field('networthauctionhouse', 0),
+                Field('networthbank', 0),
+                Field('networthbazaar', 0),
+                Field('networthbookie', 0),
+                Field('networthcayman', 0),
+                Field('networthcompany', 0),
+                Field('networthdisplaycase', 0),
+                Field('networthenlistedcars', 0),
+                Field('networthitemmarket', 0),
+                Field('networthitems', 0),
+                Field('networthloan', 0),
+                Field('networthpending', 0),
+                Field('networthpiggybank', 0),
+                Field('networthpoints', 0),
+                Field('networthproperties', 0),
+                Field('networthstockmarket', 0),
+                Field('networthunpaidfees', 0),
+                Field('networthvault', 0),
+                Field('networthwallet', 0),
+                Field('onehitkills', 0),
+                Field('opitaken', 0),
+                Field('organisedcrimes', 0),
+                Field('overdosed', 0),
+                Field('pcptaken', 0),
+                Field('peoplebought', 0),
+                Field('peopleboughtspent', 0),
+                Field('peoplebusted', 0),
+                Field('personalsplaced', 0),
+                Field('piehits', 0),
+                Field('piercingammoused', 0),
+                Field('pishits', 0),
+                Field('pointsbought', 0),
+                Field('pointssold', 0),
+                Field('racesentered', 0),
+                Field('raceswon', 0),
+                Field('racingpointsearned', 0),
+                Field('racingskill', 0),
+                Field('raidhits', 0),
+                Field('rankedwarhits', 0),
+                Field('rankedwarringwins', 0),
+                Field('receivedbountyvalue', 0),
+                Field('refills', 0),
+                Field('rehabcost', 0),
+                Field('rehabs', 0),
+                Field('respectforfaction', 0),
+                Field('retals', 0),
+                Field('revives', 0),
+                Field('reviveskill', 0),
+                Field('revivesreceived', 0),
+                Field('rifhits', 0),
+                Field('roundsfired', 0),
+                Field('shohits', 0),
+                Field('shrtaken', 0),
+                Field('slahits', 0),
+                Field('smghits', 0),
+                Field('soutravel', 0),
+                Field('specialammoused', 0),
+                Field('speed', 0),
+                Field('spetaken', 0),
+                Field('spousemailssent', 0),
+                Field('statenhancersused', 0),
+                Field('stockfees', 0),
+                Field('stocklosses', 0),
+                Field('stocknetprofits', 0),
+                Field('stockpayouts', 0),
+                Field('stockprofits', 0),
+                Field('strength', 0),
+                Field('switravel', 0),
+                Field('territoryclears', 0),
+                Field('territoryjoins', 0),
+                Field('territorytime', 0),
+                Field('theft', 0),
+                Field('theyrunaway', 0),
+                Field('tokenrefills', 0),
+                Field('totalbountyreward', 0),
+                Field('totalbountyspent', 0),
+                Field('totalstats', 0),
+                Field('totalworkingstats', 0),
+                Field('tracerammoused', 0),
+                Field('trades', 0),
+                Field('trainsreceived', 0),
+                Field('traveltime', 0),
+                Field('traveltimes', 0),
+                Field('unarmoredwon', 0),
+                Field('useractivity', 0),
+                Field('victaken', 0),
+                Field('virusescoded', 0),
+                Field('weaponsbought', 0),
+                Field('xantaken', 0),
+                Field('yourunaway', 0),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('PersonalStatsData', record_logger)
 
             def __repr__(self):
                 # Summary of some key stats for concise logging or printing
@@ -1708,6 +2027,16 @@ class User:
                         f""
                         f"xantaken={self.xantaken}, yourunaway={self.yourunaway})")
 
+        class LazyPersonalStatsData(LazyModel):
+            """
+            Lazy variant of PersonalStatsData. Keeps the raw response and decodes each stat on first access.
+            """
+            def __repr__(self):
+                return (f"LazyPersonalStatsData(activestreak={self.activestreak}, alcoholused={self.alcoholused}, "
+                        f"xantaken={self.xantaken}, yourunaway={self.yourunaway})")
+
+        LazyPersonalStatsData._fields = PersonalStatsData._schema.lazy_fields()
+
     class Profile:
 #TODO: needs to have a test for profile data  User.Profile:
         def __init__(self, api: TornAPI, user_id: Optional[int]):
@@ -1723,7 +2052,7 @@ class User:
             Returns:
             - ProfileData: An instance of ProfileData containing the user's profile.
             """
-            logger.debug(f"Fetching profile for User ID: {self.user_id}")
+            logger.debug("Fetching profile for User ID: %s", self.user_id)
             
             # Make API request
             response = self.api.make_request('user', self.user_id, 'profile')
@@ -1739,37 +2068,38 @@ class User:
             """
             A class representing the user's profile data.
             """
-            def __init__(self, data: Dict[str, Any]):
-                # Basic fields
-                self.age = data.get('age', 0)
-                self.awards = data.get('awards', 0)
-                self.basicicons = self.Icons(data.get('basicicons', {}))
-                self.competition = self.Competition(data.get('competition', {}))
-                self.donator = data.get('donator', 0)
-                self.enemies = data.get('enemies', 0)
-                self.faction = self.Faction(data.get('faction', {}))
-                self.forum_posts = data.get('forum_posts', 0)
-                self.friends = data.get('friends', 0)
-                self.gender = data.get('gender', 'Unknown')
-                self.honor = data.get('honor', 0)
-                self.job = self.Job(data.get('job', {}))
-                self.karma = data.get('karma', 0)
-                self.last_action = self.LastAction(data.get('last_action', {}))
-                self.level = data.get('level', 0)
-                self.life = self.Bar(data.get('life', {}))
-                self.married = self.Married(data.get('married', {}))
-                self.name = data.get('name', 'Unknown')
-                self.player_id = data.get('player_id', None)
-                self.profile_image = data.get('profile_image', '')
-                self.property = data.get('property', '')
-                self.property_id = data.get('property_id', 0)
-                self.rank = data.get('rank', 'Unknown')
-                self.revivable = data.get('revivable', 0)
-                self.role = data.get('role', 'Unknown')
-                self.signup = data.get('signup', 'Unknown')
-                self.states = self.States(data.get('states', {}))
-                self.status = self.Status(data.get('status', {}))
-                logger.debug(f"Processed ProfileData: {self}")
+            _schema = Schema(
+                Field('age', 0),
+                Field('awards', 0),
+                Field('basicicons', {}, 'Icons'),
+                Field('competition', {}, 'Competition'),
+                Field('donator', 0),
+                Field('enemies', 0),
+                Field('faction', {}, 'Faction'),
+                Field('forum_posts', 0),
+                Field('friends', 0),
+                Field('gender', 'Unknown'),
+                Field('honor', 0),
+                Field('job', {}, 'Job'),
+                Field('karma', 0),
+                Field('last_action', {}, 'LastAction'),
+                Field('level', 0),
+                Field('life', {}, 'Bar'),
+                Field('married', {}, 'Married'),
+                Field('name', 'Unknown'),
+                Field('player_id', None),
+                Field('profile_image', ''),
+                Field('property', ''),
+                Field('property_id', 0),
+                Field('rank', 'Unknown'),
+                Field('revivable', 0),
+                Field('role', 'Unknown'),
+                Field('signup', 'Unknown'),
+                Field('states', {}, 'States'),
+                Field('status', {}, 'Status'),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('ProfileData', record_logger)
 
             def __repr__(self):
                 # Summary of some key profile fields for concise logging or printing
@@ -1778,73 +2108,99 @@ class User:
                         f"rank={self.rank}, status={self.status.state})")
 
             class Bar:
-                def __init__(self, data: Dict[str, Any]):
-                    self.current = data.get('current', 0)
-                    self.fulltime = data.get('fulltime', 0)
-                    self.increment = data.get('increment', 0)
-                    self.interval = data.get('interval', 0)
-                    self.maximum = data.get('maximum', 0)
-                    self.ticktime = data.get('ticktime', 0)
+                _schema = Schema(
+                    Field('current', 0),
+                    Field('fulltime', 0),
+                    Field('increment', 0),
+                    Field('interval', 0),
+                    Field('maximum', 0),
+                    Field('ticktime', 0),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('Bar')
 
             class Competition:
-                def __init__(self, data: Dict[str, Any]):
-                    self.attacks = data.get('attacks', 0)
-                    self.image = data.get('image', '')
-                    self.name = data.get('name', 'Unknown')
-                    self.position = data.get('position', 'Unknown')
-                    self.score = data.get('score', 0)
-                    self.status = data.get('status', 'Unknown')
-                    self.team = data.get('team', 'Unknown')
-                    self.text = data.get('text', '')
-                    self.total = data.get('total', 0)
-                    self.treats_collected_total = data.get('treats_collected_total', 0)
-                    self.votes = data.get('votes', 0)
+                _schema = Schema(
+                    Field('attacks', 0),
+                    Field('image', ''),
+                    Field('name', 'Unknown'),
+                    Field('position', 'Unknown'),
+                    Field('score', 0),
+                    Field('status', 'Unknown'),
+                    Field('team', 'Unknown'),
+                    Field('text', ''),
+                    Field('total', 0),
+                    Field('treats_collected_total', 0),
+                    Field('votes', 0),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('Competition')
 
             class Faction:
-                def __init__(self, data: Dict[str, Any]):
-                    self.days_in_faction = data.get('days_in_faction', 0)
-                    self.faction_id = data.get('faction_id', 0)
-                    self.faction_name = data.get('faction_name', '')
-                    self.faction_tag = data.get('faction_tag', '')
-                    self.position = data.get('position', '')
+                _schema = Schema(
+                    Field('days_in_faction', 0),
+                    Field('faction_id', 0),
+                    Field('faction_name', ''),
+                    Field('faction_tag', ''),
+                    Field('position', ''),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('Faction')
 
             class Icons:
+                __slots__ = ('icons',)
+
                 def __init__(self, data: Dict[str, Any]):
                     # Assuming the structure is a dictionary of icon IDs and their associated values
                     self.icons = data
 
             class Job:
-                def __init__(self, data: Dict[str, Any]):
-                    self.company_id = data.get('company_id', 0)
-                    self.company_name = data.get('company_name', '')
-                    self.company_type = data.get('company_type', 0)
-                    self.job = data.get('job', '')
-                    self.position = data.get('position', '')
+                _schema = Schema(
+                    Field('company_id', 0),
+                    Field('company_name', ''),
+                    Field('company_type', 0),
+                    Field('job', ''),
+                    Field('position', ''),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('Job')
 
             class LastAction:
-                def __init__(self, data: Dict[str, Any]):
-                    self.relative = data.get('relative', 'Unknown')
-                    self.status = data.get('status', 'Offline')
-                    self.timestamp = data.get('timestamp', 0)
+                _schema = Schema(
+                    Field('relative', 'Unknown'),
+                    Field('status', 'Offline'),
+                    Field('timestamp', 0),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('LastAction')
 
             class Married:
-                def __init__(self, data: Dict[str, Any]):
-                    self.duration = data.get('duration', 0)
-                    self.spouse_id = data.get('spouse_id', 0)
-                    self.spouse_name = data.get('spouse_name', '')
+                _schema = Schema(
+                    Field('duration', 0),
+                    Field('spouse_id', 0),
+                    Field('spouse_name', ''),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('Married')
 
             class States:
-                def __init__(self, data: Dict[str, Any]):
-                    self.hospital_timestamp = data.get('hospital_timestamp', 0)
-                    self.jail_timestamp = data.get('jail_timestamp', 0)
+                _schema = Schema(
+                    Field('hospital_timestamp', 0),
+                    Field('jail_timestamp', 0),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('States')
 
             class Status:
-                def __init__(self, data: Dict[str, Any]):
-                    self.color = data.get('color', 'Unknown')
-                    self.description = data.get('description', '')
-                    self.details = data.get('details', '')
-                    self.state = data.get('state', 'Okay')
-                    self.until = data.get('until', 0)
+                _schema = Schema(
+                    Field('color', 'Unknown'),
+                    Field('description', ''),
+                    Field('details', ''),
+                    Field('state', 'Okay'),
+                    Field('until', 0),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('Status')
 
 
 #TODO: Needs to bee looked over and tested. modifications 
@@ -1863,12 +2219,12 @@ class User:
             Returns:
             - PropertiesData: An instance of PropertiesData containing the user's properties.
             """
-            logger.debug(f"Fetching properties for User ID: {self.user_id}")
+            logger.debug("Fetching properties for User ID: %s", self.user_id)
             
             try:
                 # Make API request
                 response = self.api.make_request('user', self.user_id, 'properties')
-                logger.debug(f"API response for properties: {response}")
+                logger.debug("API response for properties: %s", response)
                 
                 # Check if the response contains the 'properties' field
                 if not response or 'properties' not in response:
@@ -1889,11 +2245,13 @@ class User:
             Represents a collection of properties owned by the user.
             Each property has its own PropertyData object with further details.
             """
+            __slots__ = ('properties',)
+
             def __init__(self, data: Dict[str, Any]):
                 try:
                     # Parse properties into a list of Property instances
                     self.properties = [self.Property(prop_id, prop_data) for prop_id, prop_data in data.get('properties', {}).items()]
-                    logger.debug(f"Processed PropertiesData with {len(self.properties)} properties.")
+                    record_logger.debug("Processed PropertiesData with %s properties.", len(self.properties))
                 except Exception as e:
                     logger.error(f"Error processing PropertiesData: {e}")
 
@@ -1906,6 +2264,8 @@ class User:
                 Represents a single property and its associated data.
                 Each property holds a PropertyData instance that contains its specific details.
                 """
+                __slots__ = ('id', 'property_data')
+
                 def __init__(self, prop_id: str, data: Dict[str, Any]):
                     self.id = prop_id  # Store the property ID
                     self.property_data = self.PropertyData(
@@ -1922,7 +2282,7 @@ class User:
                         staff=self.Staff(data.get('staff', {})),
                         rented=self.Rented(data.get('rented', None)) if data.get('rented') else None
                     )
-                    logger.debug(f"Processed Property ID: {self.id} ({self.property_data.property_name})")
+                    record_logger.debug("Processed Property ID: %s (%s)", self.id, self.property_data.property_name)
 
                 def __repr__(self):
                     return f"Property(ID: {self.id}, Name: {self.property_data.property_name})"
@@ -1931,6 +2291,11 @@ class User:
                     """
                     Contains detailed information about a specific property.
                     """
+                    __slots__ = (
+                        'owner_id', 'property_type', 'property_name', 'status', 'happy', 'upkeep',
+                        'staff_cost', 'cost', 'marketprice', 'modifications', 'staff', 'rented',
+                    )
+
                     #TODO: Modifications, Staff, Rented arent being found correctly , i think it should be a modifications class and Staff class and rented class that gets passed in
                     def __init__(self, owner_id: int, property_type: str, property_name: str, status: str, 
                                 happy: int, upkeep: int, staff_cost: int, cost: int, marketprice: int,
@@ -1955,38 +2320,47 @@ class User:
                     """
                     Represents modifications available in the property.
                     """
-                    def __init__(self, data: Dict[str, Any]):
-                        self.interior = data.get('interior', 0)
-                        self.hot_tub = data.get('hot_tub', 0)
-                        self.sauna = data.get('sauna', 0)
-                        self.pool = data.get('pool', 0)
-                        self.open_bar = data.get('open_bar', 0)
-                        self.shooting_range = data.get('shooting_range', 0)
-                        self.vault = data.get('vault', 0)
-                        self.medical_facility = data.get('medical_facility', 0)
-                        self.airstrip = data.get('airstrip', 0)
-                        self.yacht = data.get('yacht', 0)
+                    _schema = Schema(
+                        Field('interior', 0),
+                        Field('hot_tub', 0),
+                        Field('sauna', 0),
+                        Field('pool', 0),
+                        Field('open_bar', 0),
+                        Field('shooting_range', 0),
+                        Field('vault', 0),
+                        Field('medical_facility', 0),
+                        Field('airstrip', 0),
+                        Field('yacht', 0),
+                    )
+                    __slots__ = _schema.slots
+                    __init__ = _schema.constructor('Modifications')
 
                 class Rented:
                     """
                     Represents details about the property's rental status.
                     """
-                    def __init__(self, data: Optional[Dict[str, Any]]):
-                        self.cost_per_day = data.get('cost_per_day', 0)
-                        self.days_left = data.get('days_left', 0)
-                        self.total_cost = data.get('total_cost', 0)
-                        self.user_id = data.get('user_id', 0)
+                    _schema = Schema(
+                        Field('cost_per_day', 0),
+                        Field('days_left', 0),
+                        Field('total_cost', 0),
+                        Field('user_id', 0),
+                    )
+                    __slots__ = _schema.slots
+                    __init__ = _schema.constructor('Rented')
 
                 class Staff:
                     """
                     Represents the staff employed at the property.
                     """
-                    def __init__(self, data: Dict[str, Any]):
-                        self.maid = data.get('maid', 0)
-                        self.guard = data.get('guard', 0)
-                        self.pilot = data.get('pilot', 0)
-                        self.butler = data.get('butler', 0)
-                        self.doctor = data.get('doctor', 0)
+                    _schema = Schema(
+                        Field('maid', 0),
+                        Field('guard', 0),
+                        Field('pilot', 0),
+                        Field('butler', 0),
+                        Field('doctor', 0),
+                    )
+                    __slots__ = _schema.slots
+                    __init__ = _schema.constructor('Staff')
 
     class PublicStatus:
         def __init__(self, api: TornAPI, user_id: Optional[int]):
@@ -2002,12 +2376,12 @@ class User:
             Returns:
             - PublicStatusData: An instance of PublicStatusData containing the user's public status.
             """
-            logger.debug(f"Fetching public status for User ID: {self.user_id}")
+            logger.debug("Fetching public status for User ID: %s", self.user_id)
             
             try:
                 # Make API request
                 response = self.api.make_request('user', self.user_id, 'publicstatus')
-                logger.debug(f"API response for public status: {response}")
+                logger.debug("API response for public status: %s", response)
                 
                 # Check if the response contains the necessary fields
                 if not response or 'playername' not in response or 'status' not in response:
@@ -2027,13 +2401,15 @@ class User:
             """
             A class representing the public status information of a user.
             """
+            __slots__ = ('baned', 'playername', 'status', 'user_id')
+
             def __init__(self, data: Dict[str, Any]):
                 try:
                     self.baned = data.get('baned', False)  # Note the intentional spelling from the API
                     self.playername = data.get('playername', 'Unknown')
                     self.status = data.get('status', 'Unknown')
                     self.user_id = data.get('userID', 0)
-                    logger.debug(f"Processed PublicStatusData: {self}")
+                    record_logger.debug("Processed PublicStatusData: %s", self)
                 except Exception as e:
                     logger.error(f"Error processing PublicStatusData: {e}")
 
@@ -2054,12 +2430,12 @@ class User:
             Returns:
             - RefillsData: An instance of RefillsData containing the user's refill status.
             """
-            logger.debug(f"Fetching refill status for User ID: {self.user_id}")
+            logger.debug("Fetching refill status for User ID: %s", self.user_id)
             
             try:
                 # Make API request
                 response = self.api.make_request('user', self.user_id, 'refills')
-                logger.debug(f"API response for refill status: {response}")
+                logger.debug("API response for refill status: %s", response)
 
                 # Check if the response contains the necessary fields
                 if not response or 'refills' not in response:
@@ -2079,13 +2455,18 @@ class User:
             """
             A class representing the refill status of a user.
             """
+            __slots__ = (
+                'energy_refill_used', 'nerve_refill_used', 'special_refills_available',
+                'token_refill_used',
+            )
+
             def __init__(self, data: Dict[str, Any]):
                 try:
                     self.energy_refill_used = data.get('energy_refill_used', False)
                     self.nerve_refill_used = data.get('nerve_refill_used', False)
                     self.special_refills_available = data.get('special_refills_available', 0)
                     self.token_refill_used = data.get('token_refill_used', False)
-                    logger.debug(f"Processed RefillsData: {self}")
+                    record_logger.debug("Processed RefillsData: %s", self)
                 except Exception as e:
                     logger.error(f"Error processing RefillsData: {e}")
 
@@ -2110,12 +2491,12 @@ class User:
             Returns:
             - List[ReportData]: A list of ReportData instances containing report details.
             """
-            logger.debug(f"Fetching last 100 reports for User ID: {self.user_id}")
+            logger.debug("Fetching last 100 reports for User ID: %s", self.user_id)
 
             try:
                 # Make API request
                 response = self.api.make_request('user', self.user_id, 'reports')
-                logger.debug(f"API response for reports: {response}")
+                logger.debug("API response for reports: %s", response)
 
                 # Check if the response contains the necessary fields
                 if not response or 'reports' not in response:
@@ -2124,7 +2505,7 @@ class User:
 
                 # Parse and return reports data
                 self.reports_data = [self.ReportData(report) for report in response['reports']]
-                logger.debug(f"reports data: {self.reports_data}")
+                logger.debug("reports data: %s", self.reports_data)
                 logger.info(f"Fetched {len(self.reports_data)} reports for User ID: {self.user_id}")
                 return self.reports_data
 
@@ -2136,19 +2517,28 @@ class User:
             """
             A class representing the details of a report.
             """
-            def __init__(self, data: Dict[str, Any]):
-                self.id = data.get('id', '')
-                self.target = data.get('target', 0)
-                self.timestamp = data.get('timestamp', 0)
-                self.type = data.get('type', '')
-                self.user_id = data.get('user_id', 0)
-                self.report = self.ReportDetails(data.get('report', {}))
-                logger.debug(f"Processed ReportData: {self}")
+            _schema = Schema(
+                Field('id', ''),
+                Field('target', 0),
+                Field('timestamp', 0),
+                Field('type', ''),
+                Field('user_id', 0),
+                Field('report', {}, 'ReportDetails'),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('ReportData', record_logger)
 
             class ReportDetails:
                 """
                 A class representing the detailed information within a report.
                 """
+                __slots__ = (
+                    'bounties', 'company_history', 'defense', 'dexterity', 'enemylist',
+                    'faction_history', 'friendlist', 'invested_amount', 'invested_completion',
+                    'money', 'otherlist', 'speed', 'strength', 'toplist', 'total_battlestats',
+                    'truelevel',
+                )
+
                 def __init__(self, data: Dict[str, Any]):
                     self.bounties = data.get('bounties', [])
                     self.company_history = data.get('company_history', [])
@@ -2176,15 +2566,19 @@ class User:
             """
             A class representing a friend or foe user in the report.
             """
-            def __init__(self, data: Dict[str, Any]):
-                self.name = data.get('name', '')
-                self.user_id = data.get('user_id', 0)
-                logger.debug(f"Processed UserData: {self}")
+            _schema = Schema(
+                Field('name', ''),
+                Field('user_id', 0),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('UserData', record_logger)
 
             def __repr__(self):
                 return f"UserData(name={self.name}, user_id={self.user_id})"
 
     class Revives:
+        PAGE_SIZE = 100  # The most revives the API returns per request
+
         def __init__(self, api: TornAPI, user_id: Optional[int]):
             self.api = api
             self.user_id = user_id
@@ -2205,21 +2599,12 @@ class User:
             Returns:
             - List[ReviveData]: A list of ReviveData instances containing revive details.
             """
-            logger.debug(f"Fetching latest revives with params - from: {from_timestamp}, to: {to_timestamp}, limit: {limit}")
+            logger.debug("Fetching latest revives with params - from: %s, to: %s, limit: %s", from_timestamp, to_timestamp, limit)
 
             try:
-                # Prepare query parameters
-                params = {}
-                if from_timestamp:
-                    params['from'] = from_timestamp
-                if to_timestamp:
-                    params['to'] = to_timestamp
-                if limit:
-                    params['limit'] = limit
-
                 # Make API request with user_id specified
-                response = self.api.make_request('user', self.user_id,'revives', params)
-                logger.debug(f"API response for revives: {response}")
+                response = self._request(from_timestamp, to_timestamp, limit)
+                logger.debug("API response for revives: %s", response)
 
                 # Check if the response contains the necessary fields
                 if not response or 'revives' not in response:
@@ -2235,34 +2620,83 @@ class User:
                 logger.error(f"Error fetching revives: {e}")
                 return []
 
+        def as_columns(self, from_timestamp: Optional[int] = None, to_timestamp: Optional[int] = None, limit: Optional[int] = None):
+            """Fetches revives as typed NumPy column arrays, without building ReviveData objects."""
+            response = self._request(from_timestamp, to_timestamp, limit) or {}
+            return columns.as_columns(columns.records(response.get('revives')), columns.REVIVE_COLUMNS)
+
+        def to_numpy(self, from_timestamp: Optional[int] = None, to_timestamp: Optional[int] = None, limit: Optional[int] = None):
+            """Fetches revives as a NumPy structured array, without building ReviveData objects."""
+            response = self._request(from_timestamp, to_timestamp, limit) or {}
+            return columns.to_numpy(columns.records(response.get('revives')), columns.REVIVE_COLUMNS)
+
+        def to_dataframe(self, from_timestamp: Optional[int] = None, to_timestamp: Optional[int] = None, limit: Optional[int] = None):
+            """Fetches revives as a pandas DataFrame indexed by revive ID, built column-wise from the raw response."""
+            response = self._request(from_timestamp, to_timestamp, limit) or {}
+            ids, rows = columns.keyed_records(response.get('revives'))
+            return columns.to_dataframe(rows, columns.REVIVE_COLUMNS, index=ids, index_name='revive_id')
+
+        def iter_revives(self, from_ts: int, to_ts: Optional[int] = None, cursor=None):
+            """
+            Iterates over every revive between two timestamps, fetching pages of 100 as needed.
+
+            Revives repeated at page boundaries are skipped by revive ID, or by timestamp, reviver
+            and target for revives listed without IDs. With a cursor, the position is saved after
+            each page so an interrupted scan resumes where it stopped.
+
+            Parameters:
+            - from_ts (int): The oldest timestamp to include.
+            - to_ts (Optional[int]): The newest timestamp to include. Defaults to now.
+            - cursor (Optional[Cursor or str]): The cursor, or the path of its JSON file.
+
+            Yields:
+            - ReviveData: Each revive once, newest pages first.
+
+            Raises:
+            - PaginationError: If a page request fails.
+            """
+            logger.debug("Iterating revives for User ID: %s from: %s, to: %s, cursor: %s", self.user_id, from_ts, to_ts, cursor)
+            fetch = lambda lower, upper: fetch_page(self.api, 'user', self.user_id, 'revives', 'revives',
+                                                    _window_parameters(lower, upper, self.PAGE_SIZE))
+            for _, revive in paginate_with_cursor(fetch, from_ts, to_ts, self.PAGE_SIZE,
+                                                  _event_timestamp, _revive_id, cursor):
+                yield self.ReviveData(revive)
+
+        def _request(self, from_timestamp: Optional[int], to_timestamp: Optional[int], limit: Optional[int]):
+            return self.api.make_request('user', self.user_id, 'revives', _window_parameters(from_timestamp, to_timestamp, limit))
+
         class ReviveData:
             """
             A class representing the details of a revive.
             """
-            def __init__(self, data: Dict[str, Any]):
-                self.timestamp = data.get('timestamp', 0)
-                self.reviver_id = data.get('reviver_id', 0)
-                self.reviver_name = data.get('reviver_name', '')
-                self.reviver_faction = data.get('reviver_faction', 0)
-                self.reviver_factionname = data.get('reviver_factionname', '')
-                self.target_id = data.get('target_id', 0)
-                self.target_name = data.get('target_name', '')
-                self.target_faction = data.get('target_faction', 0)
-                self.target_factionname = data.get('target_factionname', '')
-                self.target_hospital_reason = data.get('target_hospital_reason', '')
-                self.target_last_action = self.LastAction(data.get('target_last_action', {}))
-                self.chance = data.get('chance', 0.0)
-                self.result = data.get('result', '')
-                logger.debug(f"Processed ReviveData: {self}")
+            _schema = Schema(
+                Field('timestamp', 0),
+                Field('reviver_id', 0),
+                Field('reviver_name', ''),
+                Field('reviver_faction', 0),
+                Field('reviver_factionname', ''),
+                Field('target_id', 0),
+                Field('target_name', ''),
+                Field('target_faction', 0),
+                Field('target_factionname', ''),
+                Field('target_hospital_reason', ''),
+                Field('target_last_action', {}, 'LastAction'),
+                Field('chance', 0.0),
+                Field('result', ''),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('ReviveData', record_logger)
 
             class LastAction:
                 """
                 A class representing the last action status of the revived target.
                 """
-                def __init__(self, data: Dict[str, Any]):
-                    self.status = data.get('status', '')
-                    self.timestamp = data.get('timestamp', 0)
-                    logger.debug(f"Processed LastAction: {self}")
+                _schema = Schema(
+                    Field('status', ''),
+                    Field('timestamp', 0),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('LastAction', record_logger)
 
             def __repr__(self):
                 return (f"ReviveData(timestamp={self.timestamp}, reviver_id={self.reviver_id}, "
@@ -2270,6 +2704,8 @@ class User:
                         f"target_name={self.target_name}, result={self.result})")
 
     class RevivesFull:
+        PAGE_SIZE = 1000  # The most revivesfull the API returns per request
+
         def __init__(self, api: TornAPI, user_id: Optional[int]):
             self.api = api
             self.user_id = user_id
@@ -2290,21 +2726,12 @@ class User:
             Returns:
             - List[ReviveFullData]: A list of ReviveFullData instances containing revive details.
             """
-            logger.debug(f"Fetching latest revives full with params - from: {from_timestamp}, to: {to_timestamp}, limit: {limit}")
+            logger.debug("Fetching latest revives full with params - from: %s, to: %s, limit: %s", from_timestamp, to_timestamp, limit)
 
             try:
-                # Prepare query parameters
-                params = {}
-                if from_timestamp:
-                    params['from'] = from_timestamp
-                if to_timestamp:
-                    params['to'] = to_timestamp
-                if limit:
-                    params['limit'] = limit
-
                 # Make API request with user_id specified
-                response = self.api.make_request('user', self.user_id, 'revivesfull', params)
-                logger.debug(f"API response for revives full: {response}")
+                response = self._request(from_timestamp, to_timestamp, limit)
+                logger.debug("API response for revives full: %s", response)
 
                 # Check if the response contains the necessary fields
                 if not response or 'revives' not in response:
@@ -2320,30 +2747,79 @@ class User:
                 logger.error(f"Error fetching revives full: {e}")
                 return []
 
+        def as_columns(self, from_timestamp: Optional[int] = None, to_timestamp: Optional[int] = None, limit: Optional[int] = None):
+            """Fetches revives as typed NumPy column arrays, without building ReviveFullData objects."""
+            response = self._request(from_timestamp, to_timestamp, limit) or {}
+            return columns.as_columns(columns.records(response.get('revives')), columns.REVIVE_FULL_COLUMNS)
+
+        def to_numpy(self, from_timestamp: Optional[int] = None, to_timestamp: Optional[int] = None, limit: Optional[int] = None):
+            """Fetches revives as a NumPy structured array, without building ReviveFullData objects."""
+            response = self._request(from_timestamp, to_timestamp, limit) or {}
+            return columns.to_numpy(columns.records(response.get('revives')), columns.REVIVE_FULL_COLUMNS)
+
+        def to_dataframe(self, from_timestamp: Optional[int] = None, to_timestamp: Optional[int] = None, limit: Optional[int] = None):
+            """Fetches revives as a pandas DataFrame indexed by revive ID, built column-wise from the raw response."""
+            response = self._request(from_timestamp, to_timestamp, limit) or {}
+            ids, rows = columns.keyed_records(response.get('revives'))
+            return columns.to_dataframe(rows, columns.REVIVE_FULL_COLUMNS, index=ids, index_name='revive_id')
+
+        def iter_revives(self, from_ts: int, to_ts: Optional[int] = None, cursor=None):
+            """
+            Iterates over every revive between two timestamps, fetching pages of 1000 as needed.
+
+            Revives repeated at page boundaries are skipped by revive ID, or by timestamp, reviver
+            and target for revives listed without IDs. With a cursor, the position is saved after
+            each page so an interrupted scan resumes where it stopped.
+
+            Parameters:
+            - from_ts (int): The oldest timestamp to include.
+            - to_ts (Optional[int]): The newest timestamp to include. Defaults to now.
+            - cursor (Optional[Cursor or str]): The cursor, or the path of its JSON file.
+
+            Yields:
+            - ReviveFullData: Each revive once, newest pages first.
+
+            Raises:
+            - PaginationError: If a page request fails.
+            """
+            logger.debug("Iterating revivesfull for User ID: %s from: %s, to: %s, cursor: %s", self.user_id, from_ts, to_ts, cursor)
+            fetch = lambda lower, upper: fetch_page(self.api, 'user', self.user_id, 'revivesfull', 'revives',
+                                                    _window_parameters(lower, upper, self.PAGE_SIZE))
+            for _, revive in paginate_with_cursor(fetch, from_ts, to_ts, self.PAGE_SIZE,
+                                                  _event_timestamp, _revive_id, cursor):
+                yield self.ReviveFullData(revive)
+
+        def _request(self, from_timestamp: Optional[int], to_timestamp: Optional[int], limit: Optional[int]):
+            return self.api.make_request('user', self.user_id, 'revivesfull', _window_parameters(from_timestamp, to_timestamp, limit))
+
         class ReviveFullData:
             """
             A class representing the details of a revive without player names.
             """
-            def __init__(self, data: Dict[str, Any]):
-                self.timestamp = data.get('timestamp', 0)
-                self.reviver_id = data.get('reviver_id', 0)
-                self.reviver_faction = data.get('reviver_faction', 0)
-                self.target_id = data.get('target_id', 0)
-                self.target_faction = data.get('target_faction', 0)
-                self.target_hospital_reason = data.get('target_hospital_reason', '')
-                self.target_last_action = self.LastAction(data.get('target_last_action', {}))
-                self.chance = data.get('chance', 0.0)
-                self.result = data.get('result', '')
-                logger.debug(f"Processed ReviveFullData: {self}")
+            _schema = Schema(
+                Field('timestamp', 0),
+                Field('reviver_id', 0),
+                Field('reviver_faction', 0),
+                Field('target_id', 0),
+                Field('target_faction', 0),
+                Field('target_hospital_reason', ''),
+                Field('target_last_action', {}, 'LastAction'),
+                Field('chance', 0.0),
+                Field('result', ''),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('ReviveFullData', record_logger)
 
             class LastAction:
                 """
                 A class representing the last action status of the revived target.
                 """
-                def __init__(self, data: Dict[str, Any]):
-                    self.status = data.get('status', '')
-                    self.timestamp = data.get('timestamp', 0)
-                    logger.debug(f"Processed LastAction: {self}")
+                _schema = Schema(
+                    Field('status', ''),
+                    Field('timestamp', 0),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('LastAction', record_logger)
 
             def __repr__(self):
                 return (f"ReviveFullData(timestamp={self.timestamp}, reviver_id={self.reviver_id}, "
@@ -2363,12 +2839,12 @@ class User:
             Returns:
             - SkillsData: An instance of SkillsData containing the user's skills.
             """
-            logger.debug(f"Fetching skills for User ID: {self.user_id}")
+            logger.debug("Fetching skills for User ID: %s", self.user_id)
             
             try:
                 # Make API request
                 response = self.api.make_request('user', self.user_id, 'skills')
-                logger.debug(f"API response for skills: {response}")
+                logger.debug("API response for skills: %s", response)
 
                 # Check if the response contains the necessary fields
                 if not response or 'player_id' not in response:
@@ -2388,6 +2864,12 @@ class User:
             """
             A class representing the skill levels of a user.
             """
+            __slots__ = (
+                'player_id', 'bootlegging', 'burglary', 'card_skimming', 'cracking', 'disposal',
+                'forgery', 'graffiti', 'hunting', 'hustling', 'pickpocketing', 'racing', 'reviving',
+                'search_for_cash', 'shoplifting',
+            )
+
             def __init__(self, data: Dict[str, Any]):
                 try:
                     self.player_id = data.get('player_id')
@@ -2405,7 +2887,7 @@ class User:
                     self.reviving = data.get('reviving', '0')
                     self.search_for_cash = data.get('search_for_cash', '0')
                     self.shoplifting = data.get('shoplifting', '0')
-                    logger.debug(f"Processed SkillsData: {self}")
+                    record_logger.debug("Processed SkillsData: %s", self)
                 except Exception as e:
                     logger.error(f"Error processing SkillsData: {e}")
 
@@ -2441,12 +2923,12 @@ class User:
             Returns:
             - StocksData: An instance of StocksData containing the user's stock information.
             """
-            logger.debug(f"Fetching stock information for User ID: {self.user_id}")
+            logger.debug("Fetching stock information for User ID: %s", self.user_id)
 
             try:
                 # Make API request
                 response = self.api.make_request('user', self.user_id, 'stocks')
-                logger.debug(f"API response for stocks: {response}")
+                logger.debug("API response for stocks: %s", response)
 
                 # Check if the response contains the 'stocks' key
                 if not response or 'stocks' not in response:
@@ -2472,6 +2954,8 @@ class User:
             """
             A class representing the stocks information of a user.
             """
+            __slots__ = ('stocks',)
+
             def __init__(self, data: Dict[str, Any]):
                 self.stocks = []
 
@@ -2480,12 +2964,14 @@ class User:
                         stock = self.Stock(stock_id, stock_info)
                         self.stocks.append(stock)
 
-                logger.debug(f"Processed StocksData: {self}")
+                record_logger.debug("Processed StocksData: %s", self)
 
             class Stock:
                 """
                 A class representing an individual stock.
                 """
+                __slots__ = ('stock_id', 'benefit', 'dividend', 'total_shares', 'transactions')
+
                 def __init__(self, stock_id: int, stock_info: Dict[str, Any]):
                     self.stock_id = stock_id
                     self.benefit = stock_info.get('benefit', {})
@@ -2493,7 +2979,7 @@ class User:
                     self.total_shares = stock_info.get('total_shares', 0)
                     self.transactions = stock_info.get('transactions', {})
 
-                    logger.debug(f"Processed Stock: {self}")
+                    record_logger.debug("Processed Stock: %s", self)
 
                 def __repr__(self):
                     return (f"Stock(stock_id={self.stock_id}, total_shares={self.total_shares}, "
@@ -2521,7 +3007,7 @@ class User:
             try:
                 # Make API request
                 response = self.api.make_request('user',self.user_id,'timestamp')
-                logger.debug(f"API response for timestamp: {response}")
+                logger.debug("API response for timestamp: %s", response)
 
                 # Check if the response contains the necessary fields
                 if not response or 'timestamp' not in response:
@@ -2551,12 +3037,12 @@ class User:
             Returns:
             - TravelData: An instance of TravelData containing the user's travel information.
             """
-            logger.debug(f"Fetching travel information for User ID: {self.user_id}")
+            logger.debug("Fetching travel information for User ID: %s", self.user_id)
 
             try:
                 # Make API request
                 response = self.api.make_request('user', self.user_id, 'travel')
-                logger.debug(f"API response for travel information: {response}")
+                logger.debug("API response for travel information: %s", response)
 
                 # Check if the response contains the necessary fields
                 if not response or 'travel' not in response:
@@ -2576,6 +3062,8 @@ class User:
             """
             A class representing the travel information of a user.
             """
+            __slots__ = ('departed', 'destination', 'method', 'time_left', 'timestamp')
+
             def __init__(self, data: Dict[str, Any]):
                 try:
                     self.departed = data.get('departed', None)
@@ -2583,7 +3071,7 @@ class User:
                     self.method = data.get('method', None)
                     self.time_left = data.get('time_left', None)
                     self.timestamp = data.get('timestamp', None)
-                    logger.debug(f"Processed TravelData: {self}")
+                    record_logger.debug("Processed TravelData: %s", self)
                 except Exception as e:
                     logger.error(f"Error processing TravelData: {e}")
 
@@ -2609,12 +3097,12 @@ class User:
             Returns:
             - WeaponExpData: An instance of WeaponExpData containing the user's weapon experience.
             """
-            logger.debug(f"Fetching weapon experience for User ID: {self.user_id}")
+            logger.debug("Fetching weapon experience for User ID: %s", self.user_id)
 
             try:
                 # Make API request
                 response = self.api.make_request('user', self.user_id, 'weaponexp')
-                logger.debug(f"API response for weapon experience: {response}")
+                logger.debug("API response for weapon experience: %s", response)
 
                 # Check if the response contains the 'weaponexp' key
                 if not response or 'weaponexp' not in response:
@@ -2634,6 +3122,8 @@ class User:
             """
             A class representing the weapon experience of a user.
             """
+            __slots__ = ('weapon_experiences',)
+
             def __init__(self, data: Dict[str, Any]):
                 self.weapon_experiences = []
 
@@ -2642,18 +3132,19 @@ class User:
                         weapon_exp = self.WeaponExperience(item)
                         self.weapon_experiences.append(weapon_exp)
 
-                logger.debug(f"Processed WeaponExpData: {self}")
+                record_logger.debug("Processed WeaponExpData: %s", self)
 
             class WeaponExperience:
                 """
                 A class representing individual weapon experience.
                 """
-                def __init__(self, data: Dict[str, Any]):
-                    self.exp = data.get('exp', 0)
-                    self.itemID = data.get('itemID', 0)
-                    self.name = data.get('name', '')
-
-                    logger.debug(f"Processed WeaponExperience: {self}")
+                _schema = Schema(
+                    Field('exp', 0),
+                    Field('itemID', 0),
+                    Field('name', ''),
+                )
+                __slots__ = _schema.slots
+                __init__ = _schema.constructor('WeaponExperience', record_logger)
 
                 def __repr__(self):
                     return (f"WeaponExperience(itemID={self.itemID}, exp={self.exp}, "
@@ -2676,7 +3167,7 @@ class User:
             Returns:
             - WorkStatsData: An instance of WorkStatsData containing the user's work stats.
             """
-            logger.debug(f"Fetching work stats for User ID: {self.user_id}")
+            logger.debug("Fetching work stats for User ID: %s", self.user_id)
 
             # Check if user_id is valid
             if self.user_id is None:
@@ -2686,7 +3177,7 @@ class User:
             try:
                 # Make API request
                 response = self.api.make_request('user', self.user_id, 'workstats')
-                logger.debug(f"API response for work stats: {response}")
+                logger.debug("API response for work stats: %s", response)
 
                 # Check if the response contains the necessary fields
                 if not response or 'endurance' not in response:
@@ -2703,11 +3194,13 @@ class User:
                 return None
 
         class WorkStatsData:
-            def __init__(self, data: Dict[str, Any]):
-                self.endurance = data.get('endurance', 0)
-                self.intelligence = data.get('intelligence', 0)
-                self.manual_labor = data.get('manual_labor', 0)
-                logger.debug(f"Processed WorkStatsData: {self}")
+            _schema = Schema(
+                Field('endurance', 0),
+                Field('intelligence', 0),
+                Field('manual_labor', 0),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('WorkStatsData', record_logger)
 
             def __repr__(self):
                 return (f"WorkStatsData(endurance={self.endurance}, "
@@ -1,44 +1,70 @@
 # sections.py
 # TODO: Format each selection to use a fecth class and a sub class of attributes
-from typing import Dict, Any, Optional
+import importlib
+from typing import TYPE_CHECKING, Dict, Any, Optional
 from tornApi import TornAPI
-from env_loader import load_environment_variables
+from config import get_config
 from logger import setup_logger, close_logger
 
-env = load_environment_variables()
-if env is None:
-    raise ValueError("Failed to load environment variables.")
-logger, file_handler = setup_logger('Sections', env['DEBUG_LEVEL'])
+if TYPE_CHECKING:
+    from section_user import User
+    from section_property import Property
+    from section_market import Market
+    from section_torn import Torn
+
+config = get_config()
+logger, file_handler = setup_logger('Sections', config.debug_level)
+
+# Section classes and the modules that define them. The modules are large and set up their
+# own logging when imported, so each one is only imported the first time it is used.
+_SECTION_MODULES = {
+    'User': 'section_user',
+    'Property': 'section_property',
+    'Market': 'section_market',
+    'Torn': 'section_torn',
+}
+
+
+def _load_section(name: str):
+    """Import the module defining the section class `name` (once) and return the class."""
+    section = globals().get(name)
+    if section is None:
+        logger.debug("Loading section module %s", _SECTION_MODULES[name])
+        section = getattr(importlib.import_module(_SECTION_MODULES[name]), name)
+        globals()[name] = section
+    return section
+
+
+def __getattr__(name: str):
+    # Keeps `from sections import User` working without importing every section up front.
+    if name in _SECTION_MODULES:
+        return _load_section(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-from section_user import User
-from section_property import Property
-from section_market import Market
-from section_torn import Torn
 
 class Sections:
     def __init__(self, api: TornAPI):
         self.api = api
         logger.info("Initialized Sections")
 
-    def user(self, user_id: Optional[int] = None) -> User:
+    def user(self, user_id: Optional[int] = None) -> 'User':
         """Return a User object initialized with the provided user_id."""
         logger.info(f"Creating User object for User ID: {user_id}")
-        return User(self.api, user_id)
+        return _load_section('User')(self.api, user_id)
 
-    def property(self, property_id: Optional[int] = None) -> Property:
+    def property(self, property_id: Optional[int] = None) -> 'Property':
         """Return a Property object initialized with the provided property_id."""
         logger.info(f"Creating Property object for Property ID: {property_id}")
-        return Property(self.api, property_id)
+        return _load_section('Property')(self.api, property_id)
 
-    def market(self, item_id: Optional[int] = None) -> Market:
+    def market(self, item_id: Optional[int] = None) -> 'Market':
         """Return a Market object initialized with the provided item_id."""
         logger.info(f"Creating Market object for Item ID: {item_id}")
-        return Market(self.api, item_id)
-    
-    
-    def torn(self, id: Optional[int] = None) -> Torn:
+        return _load_section('Market')(self.api, item_id)
+
+
+    def torn(self, id: Optional[int] = None) -> 'Torn':
         """Return a Torn object initialized with the provided selection and id."""
         logger.info(f"Creating Torn object for ID: {id}")
-        return Torn(self.api,id)
-    
-    
\ No newline at end of file
+        return _load_section('Torn')(self.api, id)
+
@@ -0,0 +1,135 @@
+# sinks.py
+
+import json
+import sqlite3
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+class NDJSONSink:
+    """
+    Writes records to a newline-delimited JSON file, one object per line.
+
+    Each line holds the record with its key added under `key_field`, so nothing is
+    kept in memory and the file can be appended to across runs.
+
+    Args:
+        path (str): The output file. It is appended to if it exists.
+        key_field (str): The field the record key is written to. Defaults to 'id'.
+    """
+
+    def __init__(self, path: str, key_field: str = 'id'):
+        self.path = path
+        self.key_field = key_field
+        self.count = 0
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def write(self, key: Any, record: Dict[str, Any]):
+        """Write one record."""
+        line = dict(record)
+        line[self.key_field] = key
+        self._file.write(json.dumps(line, separators=(',', ':')))
+        self._file.write('\n')
+        self.count += 1
+
+    def flush(self):
+        """Flush written records to disk."""
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __repr__(self):
+        return f"NDJSONSink(path={self.path!r}, count={self.count})"
+
+
+class SQLiteSink:
+    """
+    Writes records to an SQLite table, keyed by record ID.
+
+    Each row holds the record key, its timestamp and the whole record as JSON text, so any
+    selection can be stored without losing fields; individual fields can be queried with
+    SQLite's JSON functions, e.g. `json_extract(record, '$.category')`. Records are inserted
+    in batches, and a record written again replaces the stored one, so re-running an
+    interrupted export does not create duplicates.
+
+    Args:
+        path (str): The database file, or ':memory:'.
+        table (str): The table name. Defaults to 'records'.
+        timestamp_field (str): The record field stored in the indexed `timestamp` column.
+            Defaults to 'timestamp' (e.g. 'timestamp_started' for attacks).
+        batch_size (int): Records buffered before each insert. Defaults to 500.
+    """
+    COLUMNS = ('id', 'timestamp', 'record')
+
+    def __init__(self, path: str, table: str = 'records', timestamp_field: str = 'timestamp', batch_size: int = 500):
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name '{table}'.")
+        self.path = path
+        self.table = table
+        self.timestamp_field = timestamp_field
+        self.batch_size = batch_size
+        self.count = 0
+        self._rows = []
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(f"CREATE TABLE IF NOT EXISTS {table} (id TEXT PRIMARY KEY, timestamp INTEGER, record TEXT)")
+        self.connection.execute(f"CREATE INDEX IF NOT EXISTS {table}_timestamp ON {table} (timestamp)")
+        self.connection.commit()
+        self._insert = f"INSERT OR REPLACE INTO {table} ({', '.join(self.COLUMNS)}) VALUES ({', '.join('?' * len(self.COLUMNS))})"
+
+    def write(self, key: Any, record: Dict[str, Any]):
+        """Buffer one record, inserting the batch once it is full."""
+        self._rows.append((str(key), record.get(self.timestamp_field), json.dumps(record, separators=(',', ':'))))
+        self.count += 1
+        if len(self._rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Insert and commit the buffered records."""
+        if self._rows:
+            with self.connection:
+                self.connection.executemany(self._insert, self._rows)
+            self._rows = []
+
+    def close(self):
+        if self.connection is not None:
+            self.flush()
+            self.connection.close()
+            self.connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __repr__(self):
+        return f"SQLiteSink(path={self.path!r}, table={self.table!r}, count={self.count})"
+
+
+def write_records(records: Iterable[Tuple[Any, Dict[str, Any]]], sink, flush_every: Optional[int] = None) -> int:
+    """
+    Write (key, record) pairs to a sink as they are produced.
+
+    Args:
+        records (iterable): The (key, record) pairs, e.g. a streaming iterator.
+        sink: An `NDJSONSink`, `SQLiteSink` or any object with `write(key, record)` and `flush()`.
+        flush_every (int, optional): Flush after this many records. The sink is always flushed at the end.
+
+    Returns:
+        int: The number of records written.
+    """
+    written = 0
+    for key, record in records:
+        sink.write(key, record)
+        written += 1
+        if flush_every and written % flush_every == 0:
+            sink.flush()
+    sink.flush()
+    return written
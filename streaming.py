@@ -0,0 +1,103 @@
+# streaming.py
+
+import warnings
+from typing import Any, Iterable, Iterator, Optional, Tuple
+
+try:
+    import ijson
+except ImportError:  # ijson is listed in requirements.txt; without it streams fall back to a full decode.
+    ijson = None
+
+# Bytes read before deciding whether a body is a Torn error ({"error": {...}}), which is always small.
+SNIFF_SIZE = 256
+CHUNK_SIZE = 64 * 1024
+
+
+class StreamError(Exception):
+    """
+    Raised when a streamed request fails.
+
+    Args:
+        message (str): The error message.
+        error_code (int, optional): The Torn API error code, when the API returned one.
+    """
+
+    def __init__(self, message: str, error_code: Optional[int] = None):
+        super().__init__(message)
+        self.error_code = error_code
+
+
+class ChunkReader:
+    """
+    A minimal binary file object over an iterable of byte chunks (e.g. `response.iter_content()`).
+
+    Only the chunks needed for each `read` are pulled, so the body is never held in memory
+    as a whole unless it is read to the end in one call.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], head: bytes = b''):
+        self._chunks = iter(chunks)
+        self._buffer = bytearray(head)
+
+    def peek(self, size: int) -> bytes:
+        """Return up to `size` bytes from the start of the unread data without consuming them."""
+        while len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        return bytes(self._buffer[:size])
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            data = bytes(self._buffer) + b''.join(self._chunks)
+            self._buffer.clear()
+            return data
+        while not self._buffer:
+            # Skip empty chunks (e.g. keep-alives); only an exhausted iterator is the end of the body
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return b''
+            if 0 < len(chunk) <= size:
+                return chunk
+            self._buffer += chunk
+        self.peek(size)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+
+def is_error_body(head: bytes) -> bool:
+    """Return True if a body starting with `head` is a Torn API error response (its first key is "error")."""
+    head = head.lstrip()
+    return head[:1] == b'{' and head[1:].lstrip().startswith(b'"error"')
+
+
+def iter_mapping(stream, path: str, decoder) -> Iterator[Tuple[str, Any]]:
+    """
+    Yield the (key, value) pairs of the JSON object at `path` in a response body.
+
+    With ijson installed, the body is parsed incrementally and only one value is decoded at
+    a time. Without it, the whole body is decoded with `decoder` first and a RuntimeWarning
+    is issued, since the response is then held in memory in full.
+
+    Args:
+        stream: A binary file object with the response body.
+        path (str): The dotted path of the object, e.g. 'items' or 'rankedwarreport.factions'.
+        decoder (decoders.Decoder): The decoder used when ijson is not installed.
+
+    Yields:
+        tuple: (key, value) for each entry of the object.
+    """
+    if ijson is not None:
+        yield from ijson.kvitems(stream, path, use_float=True)
+        return
+    warnings.warn("ijson is not installed, so the response body is decoded in full instead of streamed. "
+                  "Install it with 'pip install ijson'.", RuntimeWarning, stacklevel=2)
+    data = decoder.loads(stream.read())
+    for part in path.split('.'):
+        data = data.get(part) if isinstance(data, dict) else None
+    if isinstance(data, dict):
+        yield from data.items()
+    elif isinstance(data, list):
+        yield from enumerate(data)
@@ -0,0 +1,175 @@
+# sync.py
+
+import time
+from threading import Lock
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from pagination import fetch_page, load_json, paginate, save_json
+from sinks import write_records
+
+
+class SyncSelection:
+    """
+    How an append-only user selection is synced.
+
+    Args:
+        key (str): The response key holding the records, e.g. 'attacks'.
+        timestamp (str): The record field the API's from/to filters apply to.
+        page_size (int): The most records the API returns per request.
+        id_field (str, optional): The record field identifying it. Defaults to the record's key.
+        identity (tuple, optional): The fields that together identify a record without a key
+            (one listed without an ID), e.g. ('timestamp', 'reviver_id', 'target_id').
+    """
+    __slots__ = ('key', 'timestamp', 'page_size', 'id_field', 'identity')
+
+    def __init__(self, key: str, timestamp: str, page_size: int, id_field: Optional[str] = None,
+                 identity: Tuple[str, ...] = ()):
+        self.key = key
+        self.timestamp = timestamp
+        self.page_size = page_size
+        self.id_field = id_field
+        self.identity = identity
+
+    def record_id(self, key: Any, record: Dict[str, Any]) -> str:
+        if self.id_field and record.get(self.id_field):
+            return str(record[self.id_field])
+        if key is None and self.identity:
+            return ':'.join(str(record.get(name)) for name in self.identity)
+        return str(key)
+
+    def record_key(self, key: Any, record: Dict[str, Any]) -> Any:
+        """Return the key to write a record under: its response key, or its identity if it has none."""
+        return key if key is not None else self.record_id(key, record)
+
+    def record_timestamp(self, record: Dict[str, Any]) -> int:
+        return record.get(self.timestamp) or 0
+
+
+# Revives may be listed without IDs; one reviver cannot revive the same target twice in a second.
+_REVIVE_IDENTITY = ('timestamp', 'reviver_id', 'target_id')
+
+SELECTIONS = {
+    'attacks': SyncSelection('attacks', 'timestamp_started', 100, 'code'),
+    'attacksfull': SyncSelection('attacks', 'timestamp_started', 1000, 'code'),
+    'revives': SyncSelection('revives', 'timestamp', 100, identity=_REVIVE_IDENTITY),
+    'revivesfull': SyncSelection('revives', 'timestamp', 1000, identity=_REVIVE_IDENTITY),
+    'events': SyncSelection('events', 'timestamp', 100),
+    'log': SyncSelection('log', 'timestamp', 100),
+    'messages': SyncSelection('messages', 'timestamp', 100),
+}
+
+
+class SyncManager:
+    """
+    Incremental polling of append-only user selections.
+
+    A high-water mark (the newest record timestamp) is kept per API key, user and selection.
+    Each `pull` asks the API only for records from that mark on, and records already returned
+    by an earlier pull are skipped by ID. The marks are saved to a JSON file, if one is given,
+    once a pull has been fully consumed; an interrupted pull is repeated in full next time, so
+    consumers should merge by ID (as `sinks.SQLiteSink` and `attack_store.AttackStore` do).
+
+    Args:
+        api (TornAPI): The API instance used for requests.
+        path (str, optional): The JSON file the marks are kept in. Defaults to memory only.
+        lookback (int): Seconds before the mark to request again, for records the API may list
+            late (e.g. attacks, which are listed by start time once they end). Defaults to 0.
+    """
+
+    def __init__(self, api, path: Optional[str] = None, lookback: int = 0):
+        self.api = api
+        self.path = path
+        self.lookback = lookback
+        self._lock = Lock()
+        self._marks = (load_json(path) if path else None) or {}
+
+    def _mark_key(self, user_id, selection: str) -> str:
+        return f"{self.api.key_fingerprint or 'nokey'}/{user_id or 'self'}/{selection}"
+
+    def mark(self, user_id, selection: str) -> Optional[int]:
+        """Return the high-water mark of a user's selection, or None if it was never synced."""
+        entry = self._marks.get(self._mark_key(user_id, selection))
+        return entry['mark'] if entry else None
+
+    def pull(self, user_id, selection: str, since: int = 0,
+             on_complete: Optional[Callable[[], None]] = None) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+        """
+        Yield the records added to a user's selection since the last pull.
+
+        Args:
+            user_id: The user ID, or None for the key owner.
+            selection (str): One of `SELECTIONS`, e.g. 'events'.
+            since (int): The oldest timestamp fetched on the first pull. Defaults to 0 (everything).
+            on_complete (callable, optional): Called once every record has been consumed, before
+                the mark is saved, e.g. to flush a sink.
+
+        Yields:
+            tuple: (key, record) for each new record, newest first. Records listed without a key
+                are keyed by their identity (see `SyncSelection`).
+
+        Raises:
+            ValueError: If the selection is not an append-only selection.
+            PaginationError: If a page request fails. The mark is not advanced.
+        """
+        spec = SELECTIONS.get(selection)
+        if spec is None:
+            raise ValueError(f"Cannot sync '{selection}'. Expected one of: {', '.join(SELECTIONS)}.")
+        mark_key = self._mark_key(user_id, selection)
+        entry = self._marks.get(mark_key)
+        if entry:
+            from_ts, seen = entry['mark'] - self.lookback, set(entry['seen'])
+        else:
+            from_ts, seen = since, set()
+
+        def fetch(lower, upper):
+            parameters = {'from': lower, 'to': upper, 'limit': spec.page_size}
+            return fetch_page(self.api, 'user', user_id, selection, spec.key, parameters)
+
+        newest = None
+        recent = []  # (id, timestamp) of records that may be listed again by the next pull
+        for key, record in paginate(fetch, from_ts, int(time.time()), spec.page_size,
+                                    spec.record_timestamp, spec.record_id):
+            ident, ts = spec.record_id(key, record), spec.record_timestamp(record)
+            if newest is None or ts > newest:
+                newest = ts
+            if ts >= newest - self.lookback:
+                recent.append((ident, ts))
+            if ident in seen:
+                continue
+            yield spec.record_key(key, record), record
+
+        if on_complete is not None:
+            on_complete()
+        if newest is None or (entry and newest < entry['mark']):
+            return
+        cutoff = newest - self.lookback
+        with self._lock:
+            self._marks[mark_key] = {'mark': newest, 'seen': sorted({ident for ident, ts in recent if ts >= cutoff})}
+            self._save()
+
+    def sync(self, user_id, selection: str, sink, since: int = 0) -> int:
+        """
+        Write the records added since the last pull to a sink, then advance the mark.
+
+        Args:
+            sink: A `sinks.NDJSONSink`, `sinks.SQLiteSink` or any object with write(key, record) and flush().
+                For attacks, an `attack_store.AttackStore` keeps them queryable by attacker, defender
+                and faction.
+
+        Returns:
+            int: The number of new records written.
+        """
+        return write_records(self.pull(user_id, selection, since, on_complete=sink.flush), sink, flush_every=1000)
+
+    def reset(self, user_id=None, selection: Optional[str] = None):
+        """Forget the mark of a user's selection, or every mark if no selection is given."""
+        with self._lock:
+            if selection is None:
+                self._marks.clear()
+            else:
+                self._marks.pop(self._mark_key(user_id, selection), None)
+            self._save()
+
+    def _save(self):
+        if self.path:
+            save_json(self.path, self._marks)
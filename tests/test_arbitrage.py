@@ -0,0 +1,103 @@
+import sys
+import os
+import math
+import time
+import unittest
+from unittest.mock import MagicMock
+# Add the parent directory to sys.path to allow importing arbitrage
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arbitrage import ArbitrageScanner
+from config import Config
+from market_watcher import MarketWatcher
+from order_book import OrderBook
+from results import RequestResult
+
+CATALOGUE = {
+    '1': {'name': 'Hammer', 'buy_price': 75, 'sell_price': 50, 'market_value': 100},
+    '2': {'name': 'Xanax', 'buy_price': 0, 'sell_price': 0, 'market_value': 800000},
+    '3': {'name': 'Plushie', 'buy_price': 500, 'sell_price': 250, 'market_value': 0},
+}
+
+
+class TestArbitrageScanner(unittest.TestCase):
+
+    def setUp(self):
+        """Create a scanner over a small catalogue with some market prices."""
+        self.scanner = ArbitrageScanner(CATALOGUE)
+        self.scanner.update_market(1, bazaar=[{'cost': 40, 'quantity': 1}], itemmarket=[{'cost': 45, 'quantity': 3}])
+        self.scanner.update_market('2', itemmarket=[{'cost': 760000, 'quantity': 2}, {'cost': 700000, 'quantity': 0}])
+        self.scanner.update_market(3, itemmarket=[{'cost': 900, 'quantity': 1}])
+
+    def test_arrays_are_aligned_by_item_id(self):
+        """Test that catalogue and market arrays share one item order, with 0 prices missing."""
+        self.assertEqual(self.scanner.item_ids.tolist(), [1, 2, 3])
+        self.assertEqual(self.scanner.bazaar_min[0], 40)
+        self.assertTrue(math.isnan(self.scanner.buy_price[1]))
+        self.assertFalse(self.scanner.update_market(99, bazaar=[]))
+
+    def test_scan(self):
+        """Test the spreads and margins computed for every item."""
+        result = self.scanner.scan()
+
+        self.assertEqual(result['market_min'].tolist(), [40, 760000, 900])
+        self.assertEqual(result['market_source'].tolist(), ['bazaar', 'itemmarket', 'itemmarket'])
+        self.assertEqual(result['shop_sell_profit'][0], 10)
+        self.assertEqual(result['market_value_margin'][1], 0.05)
+        self.assertEqual(result['shop_buy_profit'][2], 400)
+        self.assertEqual(result['cross_market_profit'][0], 5)
+        self.assertTrue(math.isnan(result['cross_market_profit'][1]))
+
+    def test_opportunities_ranked(self):
+        """Test ranking, thresholds and unknown kinds."""
+        ranked = self.scanner.opportunities('market_value')
+        self.assertEqual([(o['item_id'], o['profit']) for o in ranked], [(2, 40000.0), (1, 60.0)])
+        self.assertEqual([o['name'] for o in self.scanner.opportunities('market_value', min_margin=0.5)], ['Hammer'])
+        self.assertEqual(len(self.scanner.opportunities('market_value', top=1)), 1)
+        self.assertEqual(self.scanner.opportunities('shop_buy')[0]['item_id'], 3)
+        with self.assertRaises(ValueError):
+            self.scanner.opportunities('points')
+
+    def test_incremental_updates_and_age(self):
+        """Test that market updates change one item, empty markets clear it, and stale prices are ignored."""
+        self.scanner.update_market(1, bazaar=[], itemmarket=OrderBook([{'cost': 60, 'quantity': 1}]))
+        self.assertEqual(self.scanner.scan()['market_min'][0], 60)
+
+        self.scanner.update_market(3, itemmarket=[{'cost': 800, 'quantity': 1}], timestamp=time.time() - 600)
+        self.assertTrue(math.isnan(self.scanner.scan(max_age=60)['market_min'][2]))
+
+    def test_age_is_per_market(self):
+        """Test that updating one market does not make the other market's old price look fresh."""
+        self.scanner.update_market(1, bazaar=[{'cost': 10, 'quantity': 1}], timestamp=time.time() - 3600)
+        self.scanner.update_market(1, itemmarket=[{'cost': 45, 'quantity': 1}])
+
+        result = self.scanner.scan(max_age=60)
+
+        self.assertEqual(result['market_min'][0], 45)
+        self.assertEqual(result['market_source'][0], 'itemmarket')
+        self.assertEqual(self.scanner.scan()['market_min'][0], 10)
+
+    def test_reload_catalogue_keeps_prices(self):
+        """Test that reloading the catalogue keeps market prices of items still listed."""
+        self.scanner.load_catalogue({'1': CATALOGUE['1'], '4': {'name': 'Bat', 'market_value': 10}})
+
+        self.assertEqual(self.scanner.item_ids.tolist(), [1, 4])
+        self.assertEqual(self.scanner.bazaar_min[0], 40)
+        self.assertTrue(math.isnan(self.scanner.itemmarket_min[1]))
+
+    def test_attach_to_watcher(self):
+        """Test that an attached scanner is updated from every watcher poll, including the first."""
+        api = MagicMock()
+        api.request.return_value = RequestResult({'bazaar': [{'cost': 30, 'quantity': 1}], 'itemmarket': []})
+        watcher = MarketWatcher(api, [1], config=Config('WARNING', {'full': 'key'}))
+        self.scanner.attach(watcher)
+
+        watcher.poll(1)
+        watcher.close()
+
+        self.assertEqual(self.scanner.bazaar_min[0], 30)
+        self.assertTrue(math.isnan(self.scanner.itemmarket_min[0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import sys
+import os
+import tempfile
+import unittest
+# Add the parent directory to sys.path to allow importing attack_store
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from attack_store import AttackStore
+
+
+def make_attack(code, started, attacker=1, attacker_faction=10, defender=2, defender_faction=20, **fields):
+    return {'code': code, 'timestamp_started': started, 'timestamp_ended': started + 30,
+            'attacker_id': attacker, 'attacker_faction': attacker_faction,
+            'defender_id': defender, 'defender_faction': defender_faction,
+            'result': 'Hospitalized', 'stealthed': 0, 'respect': 1.5, **fields}
+
+
+class TestAttackStore(unittest.TestCase):
+
+    def setUp(self):
+        """Create an in-memory store with a few attacks."""
+        self.store = AttackStore()
+        self.store.add([
+            make_attack('a1', 100),
+            make_attack('a2', 200, defender_faction=30),
+            make_attack('a3', 300, attacker=5, attacker_faction=20, defender=1, defender_faction=10),
+            make_attack('a4', 400, modifiers={'chain': 1.1}, stealthed=1),
+        ])
+
+    def tearDown(self):
+        """Close the store."""
+        self.store.close()
+
+    def test_add_is_keyed_by_code(self):
+        """Test that adding an attack again does not create a duplicate."""
+        self.assertEqual(self.store.add([make_attack('a1', 100), make_attack('a5', 500)]), 1)
+        self.assertEqual(len(self.store), 5)
+
+    def test_add_fills_missing_fields(self):
+        """Test that a richer record for a stored attack fills in its missing fields only."""
+        self.store.add([make_attack('a1', 100, attacker_name='Alice', respect=9.0)])
+
+        attack = self.store.get('a1')
+        self.assertEqual(attack['attacker_name'], 'Alice')
+        self.assertEqual(attack['respect'], 1.5)
+
+    def test_get_decodes_fields(self):
+        """Test that booleans and modifiers are returned as Python values."""
+        attack = self.store.get('a4')
+        self.assertIs(attack['stealthed'], True)
+        self.assertEqual(attack['modifiers'], {'chain': 1.1})
+        self.assertIsNone(self.store.get('missing'))
+
+    def test_hits_on_faction_in_range(self):
+        """Test querying the attacks on a faction within a time range."""
+        hits = self.store.hits_on_faction(20, start=150, end=450)
+        self.assertEqual([attack['code'] for attack in hits], ['a4'])
+        self.assertNotIn('modifiers', hits[0])
+        self.assertEqual(self.store.hits_on_faction(20, start=150, end=450, modifiers=True)[0]['modifiers'], {'chain': 1.1})
+        self.assertEqual([attack['code'] for attack in self.store.hits_by_faction(20)], ['a3'])
+
+    def test_find_and_count(self):
+        """Test combined filters, ordering and limits."""
+        found = self.store.find(attacker_id=1, newest_first=False, limit=2)
+        self.assertEqual([attack['code'] for attack in found], ['a1', 'a2'])
+        self.assertEqual(self.store.count(attacker_faction=10, start=200), 2)
+        self.assertEqual(self.store.latest_timestamp(), 400)
+        with self.assertRaises(ValueError):
+            self.store.find(respect=1.5)
+
+    def test_write_and_reopen(self):
+        """Test the sink interface and that a file store keeps its attacks."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'attacks.db')
+            with AttackStore(path, batch_size=2) as store:
+                for n in range(3):
+                    store.write(f"k{n}", make_attack(f"c{n}", n))
+            with AttackStore(path) as store:
+                self.assertEqual(len(store), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+import sys
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+# Add the parent directory to sys.path to allow importing backfill
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backfill import Backfill, plan_shards
+from pagination import PaginationError
+from results import RequestResult
+
+
+class FakeRevivesAPI:
+    """Serves revives from an in-memory history, filtered like the Torn API."""
+
+    def __init__(self, history, fail=None, listed=False):
+        self.history = history
+        self.fail = fail or {}
+        self.listed = listed  # Serve the revives as a list without IDs
+        self.request = MagicMock(side_effect=self._request)
+
+    def _request(self, section, id, selections, parameters):
+        error = self.fail.pop(parameters['to'], None)
+        if error is not None:
+            return error
+        window = [(k, r) for k, r in self.history.items() if parameters['from'] <= r['timestamp'] <= parameters['to']]
+        window.sort(key=lambda entry: entry[1]['timestamp'], reverse=True)
+        page = window[:parameters['limit']]
+        return RequestResult({'revives': [r for _, r in page] if self.listed else dict(page)})
+
+
+HISTORY = {f"r{n}": {'timestamp': 1000 + n * 7, 'result': 'success'} for n in range(400)}
+
+
+class TestPlanShards(unittest.TestCase):
+
+    def test_shards_cover_range_without_overlap(self):
+        """Test that shards are consecutive, inclusive and end at to_ts."""
+        self.assertEqual(plan_shards(0, 24, 10), [(0, 9), (10, 19), (20, 24)])
+        self.assertEqual(plan_shards(5, 5, 10), [(5, 5)])
+        with self.assertRaises(ValueError):
+            plan_shards(0, 10, 0)
+
+
+class TestBackfill(unittest.TestCase):
+
+    def setUp(self):
+        """Create a temporary checkpoint directory."""
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Remove the checkpoint directory."""
+        self.directory.cleanup()
+
+    def test_records_merged_in_order(self):
+        """Test that shards fetched in parallel across keys are merged oldest first."""
+        apis = [FakeRevivesAPI(HISTORY), FakeRevivesAPI(HISTORY)]
+        backfill = Backfill(apis, 'faction', 5, 'revives', 1000, 3799, shard_seconds=500, workers_per_key=2)
+
+        keys = [key for key, _ in backfill.iter_records()]
+
+        self.assertEqual(keys, [f"r{n}" for n in range(400)])
+        self.assertTrue(all(api.request.called for api in apis))
+
+    def test_list_shaped_revives(self):
+        """Test that revives listed without IDs are neither repeated nor lost at page boundaries."""
+        backfill = Backfill(FakeRevivesAPI(HISTORY, listed=True), 'user', None, 'revives', 1000, 3799,
+                            shard_seconds=1000)
+
+        records = list(backfill.iter_records())
+
+        self.assertEqual(len(records), 400)
+        self.assertEqual(len({key for key, _ in records}), 400)
+        self.assertEqual(records[0][0], '1000:None:None')
+
+    def test_checkpointed_shards_are_not_fetched_again(self):
+        """Test that a rerun only fetches shards that did not finish."""
+        failing = FakeRevivesAPI(HISTORY, fail={2999: RequestResult(error_code=2, error='Incorrect Key')})
+        backfill = Backfill(failing, 'user', None, 'revives', 1000, 3799, shard_seconds=1000,
+                            checkpoint=self.directory.name)
+        with self.assertRaises(PaginationError):
+            list(backfill.iter_records())
+        self.assertEqual(backfill.pending(), [(2000, 2999)])
+
+        api = FakeRevivesAPI(HISTORY)
+        sink = MagicMock()
+        count = Backfill(api, 'user', None, 'revives', 1000, 3799, shard_seconds=1000,
+                         checkpoint=self.directory.name).run(sink)
+
+        self.assertEqual(count, 400)
+        self.assertEqual({call[0][3]['from'] for call in api.request.call_args_list}, {2000})
+
+    def test_open_ended_run_resumes_pinned_end(self):
+        """Test that a resumed open-ended backfill keeps the end of the interrupted run."""
+        failing = FakeRevivesAPI(HISTORY, fail={2999: RequestResult(error_code=2, error='Incorrect Key')})
+        with patch('time.time', return_value=3799.0):
+            backfill = Backfill(failing, 'user', None, 'revives', 1000, shard_seconds=1000,
+                                checkpoint=self.directory.name)
+            with self.assertRaises(PaginationError):
+                list(backfill.iter_records())
+
+        with patch('time.time', return_value=5000.0):
+            resumed = Backfill(FakeRevivesAPI(HISTORY), 'user', None, 'revives', 1000, shard_seconds=1000,
+                               checkpoint=self.directory.name)
+            self.assertEqual(resumed.to_ts, 3799)
+            self.assertEqual(resumed.pending(), [(2000, 2999)])
+            self.assertEqual(len(list(resumed.iter_records())), 400)
+
+            # The finished run unpins the end and drops its partial final shard
+            self.assertEqual(sorted(os.listdir(self.directory.name)),
+                             ['user-self-revives-1000-1999.ndjson', 'user-self-revives-2000-2999.ndjson'])
+            self.assertEqual(Backfill(FakeRevivesAPI(HISTORY), 'user', None, 'revives', 1000, shard_seconds=1000,
+                                      checkpoint=self.directory.name).to_ts, 5000)
+
+    def test_transient_errors_are_retried(self):
+        """Test that a shard failing with a retryable error is fetched again."""
+        api = FakeRevivesAPI(HISTORY, fail={1999: RequestResult(error_code=5, error='Too many requests')})
+        backfill = Backfill(api, 'user', None, 'revives', 1000, 3799, shard_seconds=1000, retry_wait=0)
+
+        self.assertEqual(len(list(backfill.iter_records())), 400)
+
+    def test_unknown_selection(self):
+        """Test that selections without timestamps are rejected."""
+        with self.assertRaises(ValueError):
+            Backfill(FakeRevivesAPI({}), 'user', None, 'profile', 0, 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
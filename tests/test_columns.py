@@ -0,0 +1,142 @@
+import sys
+import os
+import unittest
+from unittest.mock import MagicMock
+# Add the parent directory to sys.path to allow importing columns and sections
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+import columns
+from tornApi import TornAPI
+from sections import Sections
+
+
+ATTACKS_RESPONSE = {
+    'attacks': {
+        '101': {'code': 'a1', 'timestamp_started': 1700000000, 'timestamp_ended': 1700000060,
+                'attacker_id': 1, 'attacker_faction': 10, 'attacker_factionname': 'Alpha',
+                'defender_id': 2, 'defender_faction': None, 'result': 'Mugged',
+                'stealthed': 1, 'respect': 2.5},
+        '102': {'code': 'a2', 'timestamp_started': 1700000100, 'timestamp_ended': 1700000160,
+                'attacker_id': 1, 'attacker_faction': 10, 'defender_id': 3, 'defender_faction': 20,
+                'result': 'Lost', 'stealthed': 0, 'respect': 0},
+    }
+}
+
+
+class TestColumns(unittest.TestCase):
+
+    def test_as_columns_types_and_defaults(self):
+        """Test that columns are typed arrays and null or missing values use defaults."""
+        result = columns.as_columns(columns.records(ATTACKS_RESPONSE['attacks']), columns.ATTACK_FULL_COLUMNS)
+
+        self.assertEqual(result['timestamp_started'].dtype, np.int64)
+        self.assertEqual(result['respect'].dtype, np.float64)
+        self.assertEqual(result['stealthed'].dtype, np.bool_)
+        self.assertEqual(result['defender_faction'].tolist(), [0, 20])
+        self.assertEqual(result['result'].tolist(), ['Mugged', 'Lost'])
+        self.assertAlmostEqual(result['respect'].sum(), 2.5)
+
+    def test_empty_string_ids_use_defaults(self):
+        """Test that empty-string IDs (e.g. stealthed attackers) become the column default instead of failing."""
+        rows = [{'code': 'a3', 'attacker_id': '', 'attacker_faction': '', 'stealthed': '', 'defender_id': 7}]
+
+        result = columns.as_columns(rows, columns.ATTACK_FULL_COLUMNS)
+
+        self.assertEqual(result['attacker_id'].tolist(), [0])
+        self.assertEqual(result['attacker_faction'].tolist(), [0])
+        self.assertEqual(result['stealthed'].tolist(), [False])
+        self.assertEqual(result['defender_id'].tolist(), [7])
+        self.assertEqual(columns.to_dataframe(rows, columns.ATTACK_FULL_COLUMNS)['attacker_id'].tolist(), [0])
+
+    def test_to_numpy_structured_array(self):
+        """Test building a structured array with one field per column."""
+        result = columns.to_numpy(columns.records(ATTACKS_RESPONSE['attacks']), columns.ATTACK_FULL_COLUMNS)
+
+        self.assertEqual(result.shape, (2,))
+        self.assertEqual(result.dtype.names, tuple(column.name for column in columns.ATTACK_FULL_COLUMNS))
+        self.assertEqual(result[1]['code'], 'a2')
+
+    def test_empty_records(self):
+        """Test that empty responses give empty arrays."""
+        result = columns.as_columns(columns.records(None), columns.LISTING_COLUMNS)
+
+        self.assertEqual(len(result['cost']), 0)
+        self.assertEqual(len(columns.to_numpy([], columns.ATTACK_COLUMNS)), 0)
+
+    def test_stock_history_records(self):
+        """Test flattening stock history into records tagged with the stock ID."""
+        stocks = {'1': {'stock_id': 1, 'history': [{'timestamp': 1, 'price': 10.0, 'change': 0.5}]},
+                  '2': {'history': [{'timestamp': 2, 'price': 20.0, 'change': -1.0}]}}
+
+        result = columns.as_columns(columns.stock_history_records(stocks), columns.STOCK_HISTORY_COLUMNS)
+
+        self.assertEqual(result['stock_id'].tolist(), [1, 2])
+        self.assertEqual(result['price'].tolist(), [10.0, 20.0])
+
+    def test_to_dataframe_dtypes(self):
+        """Test that DataFrames get datetime, categorical and numeric dtypes and the record index."""
+        ids, rows = columns.keyed_records(ATTACKS_RESPONSE['attacks'])
+
+        frame = columns.to_dataframe(rows, columns.ATTACK_FULL_COLUMNS, index=ids, index_name='attack_id')
+
+        self.assertEqual(frame.index.tolist(), ['101', '102'])
+        self.assertEqual(frame.index.name, 'attack_id')
+        self.assertIsInstance(frame['result'].dtype, pd.CategoricalDtype)
+        self.assertEqual(frame['timestamp_started'].iloc[0], pd.Timestamp(1700000000, unit='s', tz='UTC'))
+        self.assertEqual(frame['defender_faction'].dtype, np.int64)
+        self.assertEqual(frame['stealthed'].tolist(), [True, False])
+
+
+class TestSelectionColumns(unittest.TestCase):
+
+    def setUp(self):
+        self.api = MagicMock(spec=TornAPI)
+        self.sections = Sections(self.api)
+
+    def test_user_attacks_as_columns(self):
+        """Test that User.Attacks.as_columns requests attacks and returns columns."""
+        self.api.make_request.return_value = ATTACKS_RESPONSE
+        user = self.sections.user(1)
+
+        result = user.attacks.as_columns(from_timestamp=1700000000)
+
+        self.api.make_request.assert_called_once_with('user', 1, 'attacks', {'from': 1700000000})
+        self.assertEqual(result['attacker_factionname'].tolist(), ['Alpha', ''])
+
+    def test_market_bazaar_to_numpy(self):
+        """Test that Market.Bazaar.to_numpy returns cost and quantity fields."""
+        self.api.make_request.return_value = {'bazaar': [{'cost': 500, 'quantity': 10}, {'cost': 750, 'quantity': 5}]}
+        market = self.sections.market(206)
+
+        result = market.bazaar.to_numpy()
+
+        self.assertEqual(int((result['cost'] * result['quantity']).sum()), 8750)
+
+    def test_user_events_to_dataframe(self):
+        """Test that User.Events.to_dataframe indexes events by UUID."""
+        self.api.make_request.return_value = {'events': {'abc': {'timestamp': 1700000000, 'event': 'You were attacked'}}}
+        user = self.sections.user(1)
+
+        frame = user.events.to_dataframe(limit=10)
+
+        self.api.make_request.assert_called_once_with('user', 1, 'events', {'limit': 10})
+        self.assertEqual(frame.index.name, 'uuid')
+        self.assertEqual(frame.loc['abc', 'event'], 'You were attacked')
+
+    def test_user_log_to_dataframe(self):
+        """Test that User.Log.to_dataframe keeps nested log data as objects."""
+        self.api.make_request.return_value = {'log': {'x1': {'log': 4810, 'title': 'Gym train', 'timestamp': 1,
+                                                             'category': 'Gym', 'data': {'energy_used': 10}}}}
+        user = self.sections.user(1)
+
+        frame = user.log.to_dataframe({'cat': 25})
+
+        self.assertEqual(frame.loc['x1', 'data'], {'energy_used': 10})
+        self.assertIsInstance(frame['category'].dtype, pd.CategoricalDtype)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import sys
+import os
+import unittest
+from unittest.mock import patch
+# Add the parent directory to sys.path to allow importing config
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from config import Config, get_config, set_config
+
+
+class TestConfig(unittest.TestCase):
+
+    def setUp(self):
+        self.previous = config._config
+
+    def tearDown(self):
+        set_config(self.previous)
+
+    def test_from_dict_accepts_env_shape(self):
+        """Test building a Config from the load_environment_variables() dictionary."""
+        cfg = Config.from_dict({'DEBUG_LEVEL': 'debug', 'API_KEYS': {'full': 'abc', 'public': None}})
+
+        self.assertEqual(cfg.debug_level, 'DEBUG')
+        self.assertEqual(cfg.api_key('full'), 'abc')
+        self.assertIsNone(cfg.api_key('limited'))
+        self.assertEqual(cfg.as_dict(), {'DEBUG_LEVEL': 'DEBUG', 'API_KEYS': {'full': 'abc', 'public': None},
+                                         'RESPONSE_LOG': 'full'})
+        self.assertNotIn('abc', repr(cfg))
+
+    @patch('config.load_environment_variables')
+    def test_get_config_loads_once(self, mock_load_env):
+        """Test that the .env file is only read by the first get_config() call."""
+        mock_load_env.return_value = {'DEBUG_LEVEL': 'INFO', 'API_KEYS': {'full': 'abc'}}
+        set_config(None)
+
+        first = get_config()
+        second = get_config()
+
+        self.assertIs(first, second)
+        mock_load_env.assert_called_once_with('.env')
+
+    @patch('config.load_environment_variables')
+    def test_set_config_skips_disk(self, mock_load_env):
+        """Test that an injected configuration is used without loading the environment."""
+        cfg = set_config({'debug_level': 'ERROR', 'api_keys': {'min': 'xyz'}})
+
+        self.assertIs(get_config(), cfg)
+        self.assertEqual(get_config().api_key('min'), 'xyz')
+        mock_load_env.assert_not_called()
+
+    @patch('config.load_environment_variables', return_value=None)
+    def test_from_env_failure(self, mock_load_env):
+        """Test that a failed environment load raises ValueError."""
+        with self.assertRaises(ValueError):
+            Config.from_env()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,8 @@
 import unittest
 import logging
 import os
-from logger import setup_logger, close_logger
+import threading
+from logger import setup_logger, close_logger, get_record_logger, set_record_logging, DroppingQueueHandler
 
 class TestLogger(unittest.TestCase):
 
@@ -53,5 +54,121 @@ class TestLogger(unittest.TestCase):
             logs = f.read()
         self.assertIn("This is a critical message.", logs)
 
+    def test_record_logging_toggle(self):
+        """Test that per-record messages propagate to the parent and can be turned off."""
+        records = get_record_logger('test_logger')
+        records.debug("Processed record: %s", "enabled")
+        set_record_logging(False, 'test_logger')
+        try:
+            records.debug("Processed record: %s", "disabled")
+        finally:
+            set_record_logging(True, 'test_logger')
+        with open(self.log_file_path, 'r') as f:
+            logs = f.read()
+        self.assertIn("Processed record: enabled", logs)
+        self.assertNotIn("Processed record: disabled", logs)
+
+class TestSharedLogger(unittest.TestCase):
+
+    def test_setup_is_idempotent(self):
+        """Test that setting up a logger twice shares handlers and writes each record once."""
+        first, handler = setup_logger('test_shared_logger', level=logging.DEBUG)
+        second, same_handler = setup_logger('test_shared_logger', level=logging.DEBUG)
+        log_file_path = os.path.join('logs', 'test_shared_logger.log')
+        try:
+            self.assertIs(first, second)
+            self.assertIs(handler, same_handler)
+            self.assertEqual(len(first.handlers), 2)
+            first.info("Shared message.")
+            close_logger(second, same_handler)
+            self.assertIn(handler, first.handlers)  # Still held by the first caller
+        finally:
+            close_logger(first, handler)
+        self.assertEqual(first.handlers, [])
+        with open(log_file_path, 'r') as f:
+            logs = f.read()
+        os.remove(log_file_path)
+        self.assertEqual(logs.count("Shared message."), 1)
+
+    def test_console_handler_is_shared(self):
+        """Test that different loggers share one console handler."""
+        one, one_handler = setup_logger('test_shared_one', level=logging.DEBUG)
+        two, two_handler = setup_logger('test_shared_two', level=logging.DEBUG)
+        try:
+            consoles = [h for log in (one, two) for h in log.handlers if type(h) is logging.StreamHandler]
+            self.assertEqual(len(consoles), 2)
+            self.assertIs(consoles[0], consoles[1])
+        finally:
+            close_logger(one, one_handler)
+            close_logger(two, two_handler)
+            os.remove(os.path.join('logs', 'test_shared_one.log'))
+            os.remove(os.path.join('logs', 'test_shared_two.log'))
+
+class TestQueuedLogger(unittest.TestCase):
+
+    def test_queued_logger_writes_file_on_close(self):
+        """Test that queued records are written by the listener and flushed by close_logger."""
+        log, handler = setup_logger('test_queued_logger', level=logging.DEBUG, queued=True)
+        log_file_path = os.path.join('logs', 'test_queued_logger.log')
+        try:
+            self.assertIsInstance(handler, DroppingQueueHandler)
+            log.info("Queued message: %s", {'payload': 1})
+        finally:
+            close_logger(log, handler)
+        with open(log_file_path, 'r') as f:
+            logs = f.read()
+        os.remove(log_file_path)
+        self.assertIn("Queued message: {'payload': 1}", logs)
+
+    def test_formatting_is_deferred_to_listener(self):
+        """Test that queued records are formatted on the listener thread, not the calling thread."""
+        formatted_on = []
+        written = []
+
+        class Payload:
+            def __str__(self):
+                formatted_on.append(threading.current_thread())
+                return 'payload'
+
+        class ListHandler(logging.Handler):
+            def emit(self, record):
+                written.append(self.format(record))
+
+        handler = DroppingQueueHandler([ListHandler()])
+        record = logging.LogRecord('q', logging.INFO, __file__, 0, "Response data: %s", (Payload(),), None)
+        handler.handle(record)
+        handler.close()
+        handler.close()  # Closing twice is harmless
+
+        self.assertEqual(written, ['Response data: payload'])
+        self.assertNotIn(threading.current_thread(), formatted_on)
+        self.assertEqual(record.msg, "Response data: %s")
+
+    def test_full_queue_drops_records(self):
+        """Test that a full queue drops records instead of blocking the caller."""
+        release = threading.Event()
+        written = []
+
+        class SlowHandler(logging.Handler):
+            def emit(self, record):
+                release.wait(5)
+                written.append(record.getMessage())
+
+        for drop, expected in (('newest', ['0', '1', '2']), ('oldest', ['0', '3', '4'])):
+            with self.subTest(drop=drop):
+                release.clear()
+                written.clear()
+                handler = DroppingQueueHandler([SlowHandler()], max_size=2, drop=drop)
+                record = lambda n: logging.LogRecord('q', logging.INFO, __file__, 0, str(n), None, None)
+                handler.handle(record(0))
+                while handler.queue.qsize():  # Wait for the listener to pick up the first record
+                    pass
+                for n in range(1, 5):
+                    handler.handle(record(n))
+                self.assertEqual(handler.dropped, 2)
+                release.set()
+                handler.close()
+                self.assertEqual(written, expected)
+
 if __name__ == "__main__":
     unittest.main()
@@ -8,18 +8,19 @@ import requests
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from tornApi import TornAPI
+from config import Config
+from decoders import available_decoders, get_decoder
+from streaming import StreamError
 
 class TestTornAPI(unittest.TestCase):
-    @patch('tornApi.load_environment_variables')
     @patch('tornApi.setup_logger')
-    def setUp(self, mock_setup_logger, mock_load_env):
+    def setUp(self, mock_setup_logger):
         self.mock_env = {
             'API_KEYS': {'full': 'test_api_key'},
             'DEBUG_LEVEL': 'INFO'
         }
-        mock_load_env.return_value = self.mock_env
         mock_setup_logger.return_value = (MagicMock(), MagicMock())
-        self.api = TornAPI(access_level='full')
+        self.api = TornAPI(access_level='full', config=Config.from_dict(self.mock_env))
 
     def tearDown(self):
         self.api.close()
@@ -28,14 +29,12 @@ class TestTornAPI(unittest.TestCase):
         self.assertEqual(self.api.api_key, 'test_api_key')
         self.assertIsNotNone(self.api.logger)
 
-    @patch('tornApi.load_environment_variables')
     @patch('tornApi.setup_logger')
-    def test_torn_api_initialization_invalid_access_level(self, mock_setup_logger, mock_load_env):
+    def test_torn_api_initialization_invalid_access_level(self, mock_setup_logger):
         mock_env = {'API_KEYS': {}, 'DEBUG_LEVEL': 'INFO'}
-        mock_load_env.return_value = mock_env
         mock_setup_logger.return_value = (MagicMock(), MagicMock())
         with self.assertRaises(ValueError) as context:
-            TornAPI(access_level='invalid')
+            TornAPI(access_level='invalid', config=Config.from_dict(mock_env))
         self.assertIn("API key is required for the specified access level", str(context.exception))
 
     def test_interpret_error(self):
@@ -53,7 +52,7 @@ class TestTornAPI(unittest.TestCase):
     @patch('tornApi.requests.get')
     def test_make_request_success(self, mock_get):
         mock_response = MagicMock()
-        mock_response.json.return_value = {"success": True, "data": "test_data"}
+        mock_response.content = b'{"success": true, "data": "test_data"}'
         mock_response.status_code = 200
         mock_get.return_value = mock_response
 
@@ -73,7 +72,7 @@ class TestTornAPI(unittest.TestCase):
     @patch('tornApi.requests.get')
     def test_make_request_api_error(self, mock_get):
         mock_response = MagicMock()
-        mock_response.json.return_value = {"error": {"code": 2}}
+        mock_response.content = b'{"error": {"code": 2}}'
         mock_response.status_code = 400
         mock_get.return_value = mock_response
 
@@ -89,6 +88,129 @@ class TestTornAPI(unittest.TestCase):
 
         self.assertIsNone(result)
 
+    @patch('tornApi.requests.get')
+    def test_make_request_decoders(self, mock_get):
+        mock_response = MagicMock()
+        mock_response.content = b'{"items": {"1": {"name": "Hammer", "value": 1.5}}}'
+        mock_get.return_value = mock_response
+
+        for name in available_decoders():
+            with self.subTest(decoder=name):
+                self.api.decoder = get_decoder(name)
+                self.api.cache = {}
+
+                result = self.api.make_request('torn', '', 'items')
+
+                self.assertEqual(result, {"items": {"1": {"name": "Hammer", "value": 1.5}}})
+
+    @patch('tornApi.requests.get')
+    def test_make_request_invalid_json(self, mock_get):
+        mock_response = MagicMock()
+        mock_response.content = b'<html>Bad gateway</html>'
+        mock_get.return_value = mock_response
+
+        for name in available_decoders():
+            with self.subTest(decoder=name):
+                self.api.decoder = get_decoder(name)
+
+                self.assertIsNone(self.api.make_request('torn', '', 'items'))
+
+    @patch('tornApi.requests.get')
+    def test_stream(self, mock_get):
+        body = b'{"items": {"1": {"name": "Hammer"}, "2": {"name": "Baseball Bat"}}}'
+        mock_response = MagicMock()
+        mock_response.iter_content.return_value = iter([body[:20], body[20:]])
+        mock_get.return_value = mock_response
+
+        result = list(self.api.stream('torn', '', 'items'))
+
+        self.assertEqual(result, [('1', {'name': 'Hammer'}), ('2', {'name': 'Baseball Bat'})])
+        self.assertTrue(mock_get.call_args[1]['stream'])
+
+    @patch('tornApi.requests.get')
+    def test_stream_api_error(self, mock_get):
+        mock_response = MagicMock()
+        mock_response.iter_content.return_value = iter([b'{"error": {"code": 2, "error": "Incorrect key"}}'])
+        mock_get.return_value = mock_response
+
+        with self.assertRaises(StreamError) as context:
+            list(self.api.stream('torn', '', 'items'))
+        self.assertEqual(context.exception.error_code, 2)
+
+    @patch('tornApi.requests.get')
+    def test_request_result(self, mock_get):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"error": {"code": 2, "error": "Incorrect key"}}'
+        mock_get.return_value = mock_response
+
+        result = self.api.request('user', '123', 'basic')
+
+        self.assertFalse(result.ok)
+        self.assertEqual(result.error_code, 2)
+        self.assertFalse(result.retryable)
+        self.assertEqual(result.key, self.api.key_fingerprint)
+        self.assertNotIn('test_api_key', repr(result))
+        self.assertIs(self.api.last_result, result)
+
+        mock_response.content = b'{"basic": {}}'
+        first = self.api.request('user', '123', 'basic')
+        second = self.api.request('user', '123', 'basic')
+        bypass = self.api.request('user', '123', 'basic', use_cache=False)
+
+        self.assertTrue(first.ok)
+        self.assertEqual((first.cache, second.cache, bypass.cache), ('miss', 'hit', 'bypass'))
+        self.assertEqual(mock_get.call_count, 3)
+
+    @patch('tornApi.requests.get')
+    def test_request_http_error_is_retryable(self, mock_get):
+        mock_response = MagicMock()
+        mock_response.status_code = 503
+        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("503 Server Error")
+        mock_get.return_value = mock_response
+
+        result = self.api.request('user', '123', 'basic')
+
+        self.assertIsNone(result.data)
+        self.assertEqual(result.status_code, 503)
+        self.assertTrue(result.retryable)
+        self.assertIsNone(self.api.make_request('user', '123', 'basic'))
+
+    @patch('tornApi.requests.get')
+    def test_request_throttled_after_max_retries(self, mock_get):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"error": {"code": 5, "error": "Too many requests"}}'
+        mock_get.return_value = mock_response
+        self.api.rate_limiter = MagicMock()
+
+        result = self.api.request('user', '123', 'basic')
+
+        self.assertTrue(result.throttled)
+        self.assertEqual(result.retries, 3)
+        self.assertEqual(mock_get.call_count, 4)
+
+        mock_get.reset_mock()
+        result = self.api.request('user', '123', 'basic', retry_on_limit=False)
+
+        self.assertTrue(result.throttled)
+        self.assertEqual(result.retries, 0)
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch('tornApi.requests.get')
+    def test_request_retries_rate_limit(self, mock_get):
+        throttled, ok = MagicMock(status_code=200), MagicMock(status_code=200)
+        throttled.content = b'{"error": {"code": 5, "error": "Too many requests"}}'
+        ok.content = b'{"basic": {}}'
+        mock_get.side_effect = [throttled, ok]
+        self.api.rate_limiter = MagicMock()
+
+        result = self.api.request('user', '123', 'basic')
+
+        self.assertTrue(result.ok)
+        self.assertEqual(result.retries, 1)
+        self.api.rate_limiter.increase_wait_time.assert_called_once_with()
+
     @patch('tornApi.RateLimiter.request_allowed')
     def test_make_request_rate_limit_exceeded(self, mock_request_allowed):
         mock_request_allowed.return_value = False
@@ -116,6 +116,20 @@ class TestMarket(unittest.TestCase):
         self.assertEqual(bazaar_data.bazaar[0].cost, 500)
         self.assertEqual(bazaar_data.bazaar[0].quantity, 10)
 
+    def test_combined_market_order_book(self):
+        """Test that CombinedMarketData builds order books for one or both markets."""
+        combined = self.market.combined_market.CombinedMarketData({
+            'bazaar': [{'cost': 500, 'quantity': 10}],
+            'itemmarket': [{'cost': 450, 'quantity': 2}, {'cost': 500, 'quantity': 1}],
+        })
+
+        book = combined.order_book()
+        self.assertEqual(book.cheapest(5), [(450, 2), (500, 11)])
+        self.assertEqual(book.fill_cost(3), 1400)
+        self.assertEqual(combined.order_book('bazaar').best, 500)
+        with self.assertRaises(ValueError):
+            combined.order_book('points')
+
     def test_bazaar_data_initialization_with_missing_data(self):
         """Test the initialization of BazaarData class with missing bazaar data."""
         mock_data = {}  # Empty dictionary to simulate missing data
@@ -124,6 +138,15 @@ class TestMarket(unittest.TestCase):
         
         self.assertEqual(len(bazaar_data.bazaar), 0)
 
+    def test_bazaar_item_is_slotted(self):
+        """Test that bazaar listings are compact slotted records without a __dict__."""
+        item = self.market.bazaar.BazaarData.BazaarItem({'cost': 500, 'quantity': 10})
+
+        self.assertFalse(hasattr(item, '__dict__'))
+        self.assertEqual((item.cost, item.quantity), (500, 10))
+        with self.assertRaises(AttributeError):
+            item.unknown_field = 1
+
     # ----- ItemMarket Tests -----
 
     def test_fetch_itemmarket_data(self):
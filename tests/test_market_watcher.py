@@ -0,0 +1,150 @@
+import sys
+import os
+import queue
+import time
+import unittest
+from unittest.mock import MagicMock
+# Add the parent directory to sys.path to allow importing market_watcher
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+from market_watcher import (LISTING_GONE, LOWEST_GONE, NEW_LISTING, NEW_LOWEST, QUANTITY_CHANGED,
+                            MarketChange, MarketWatcher, diff_levels, price_levels)
+from results import RequestResult
+
+CONFIG = Config('WARNING', {'full': 'key'})
+
+
+def market(bazaar=(), itemmarket=()):
+    return RequestResult({'bazaar': [{'cost': c, 'quantity': q} for c, q in bazaar],
+                          'itemmarket': [{'cost': c, 'quantity': q} for c, q in itemmarket]})
+
+
+class TestDiffLevels(unittest.TestCase):
+
+    def test_price_levels_sum_quantities(self):
+        """Test that listings at the same price are added up."""
+        self.assertEqual(price_levels([{'cost': 5, 'quantity': 2}, {'cost': 5, 'quantity': 3}, {'cost': 7}]), {5: 5, 7: 0})
+
+    def test_change_kinds(self):
+        """Test each kind of change between two polls."""
+        old = {100: 2, 120: 5, 150: 1}
+        new = {90: 1, 120: 3, 130: 4}
+
+        changes = diff_levels(1, 'itemmarket', old, new)
+
+        self.assertEqual([(change.kind, change.cost) for change in changes], [
+            (NEW_LOWEST, 90), (LOWEST_GONE, 100), (QUANTITY_CHANGED, 120), (NEW_LISTING, 130), (LISTING_GONE, 150),
+        ])
+        self.assertTrue(all(change.lowest == 90 for change in changes))
+        self.assertEqual((changes[2].quantity, changes[2].previous_quantity), (3, 5))
+
+    def test_market_emptied_and_refilled(self):
+        """Test that an empty market reports no lowest price, and a refilled one a new lowest."""
+        self.assertEqual(diff_levels(1, 'bazaar', {10: 1}, {})[0].lowest, None)
+        self.assertEqual(diff_levels(1, 'bazaar', {}, {10: 1})[0].kind, NEW_LOWEST)
+
+
+class TestMarketWatcher(unittest.TestCase):
+
+    def setUp(self):
+        """Create a watcher over a mocked API."""
+        self.api = MagicMock()
+        self.events = queue.Queue()
+        self.watcher = MarketWatcher(self.api, [1, 2], requests_per_minute=60, queue=self.events, config=CONFIG)
+
+    def tearDown(self):
+        """Stop the watcher."""
+        self.watcher.close()
+
+    def test_first_poll_is_baseline(self):
+        """Test that the first poll only records listings and later polls report changes."""
+        callback = MagicMock()
+        self.watcher.subscribe(callback)
+        self.api.request.side_effect = [market(itemmarket=[(100, 1)]), market(itemmarket=[(95, 2), (100, 1)])]
+
+        self.assertEqual(self.watcher.poll(1), [])
+        changes = self.watcher.poll(1)
+
+        self.assertEqual(changes, [MarketChange(1, 'itemmarket', NEW_LOWEST, 95, 2, 0, 95)])
+        self.assertEqual(self.events.get_nowait(), changes[0])
+        callback.assert_called_once_with(changes[0])
+        self.api.request.assert_called_with('market', 1, 'bazaar,itemmarket', use_cache=False)
+        self.assertEqual(self.watcher.lowest(1), 95)
+
+    def test_failed_poll_keeps_listings(self):
+        """Test that a failed poll reports nothing and does not reset the item."""
+        self.api.request.side_effect = [market(bazaar=[(10, 1)]), RequestResult(error_code=5, error='Too many requests'),
+                                        market(bazaar=[(10, 1)])]
+
+        self.watcher.poll(1)
+        self.assertEqual(self.watcher.poll(1), [])
+        self.assertEqual(self.watcher.poll(1), [])
+        self.assertEqual(self.watcher.errors, 1)
+
+    def test_out_of_order_result_dropped(self):
+        """Test that a poll finishing after a later poll of the same item does not overwrite it."""
+        def request(*args, **kwargs):
+            if self.api.request.call_count == 3:
+                return market(itemmarket=[(90, 1)])
+            self.watcher.poll(1)  # A later poll of the item finishes first
+            return market(itemmarket=[(100, 1)])
+
+        self.api.request.return_value = market(itemmarket=[(100, 1)])
+        self.watcher.poll(1)
+        self.api.request.side_effect = request
+
+        self.assertEqual(self.watcher.poll(1), [])
+        self.assertEqual(self.watcher.lowest(1), 90)
+        self.assertEqual(self.events.qsize(), 2)  # Only the later poll's changes
+
+    def test_unwatch_during_poll(self):
+        """Test that a poll in flight when its item is unwatched does not record its listings."""
+        def request(*args, **kwargs):
+            self.watcher.unwatch(1)
+            return market(itemmarket=[(95, 1)])
+
+        self.api.request.side_effect = [market(itemmarket=[(100, 1)])]
+        self.watcher.poll(1)
+        self.api.request.side_effect = request
+
+        self.assertEqual(self.watcher.poll(1), [])
+        self.assertIsNone(self.watcher.lowest(1))
+        self.assertNotIn((1, 'itemmarket'), self.watcher._levels)
+
+    def test_items_in_flight_skipped(self):
+        """Test that the scheduler does not poll an item again while its poll is in flight."""
+        self.assertEqual(self.watcher._next()[0], 1)
+        self.assertEqual(self.watcher._next()[0], 2)
+        self.assertIsNone(self.watcher._next())
+
+        self.api.request.return_value = market()
+        self.watcher._poll_safely(1, self.api)
+
+        self.assertEqual(self.watcher._next()[0], 1)
+
+    def test_budget_spreads_polls(self):
+        """Test the poll spacing for the budget and number of keys."""
+        self.assertEqual(self.watcher.interval, 1.0)
+        self.assertEqual(self.watcher.cycle_time, 2.0)
+        watcher = MarketWatcher([self.api, MagicMock()], range(300), requests_per_minute=60, config=CONFIG)
+        self.assertEqual(watcher.interval, 0.5)
+        self.assertEqual(watcher.cycle_time, 150.0)
+        watcher.close()
+
+    def test_background_polling(self):
+        """Test that started watchers poll the items in turn until stopped."""
+        self.api.request.return_value = market(itemmarket=[(100, 1)])
+        watcher = MarketWatcher(self.api, [1, 2, 3], requests_per_minute=3000, config=CONFIG)
+
+        watcher.start()
+        time.sleep(0.2)
+        watcher.close()
+
+        polled = [call[0][1] for call in self.api.request.call_args_list]
+        self.assertGreaterEqual(len(polled), 3)
+        self.assertEqual(polled[:3], [1, 2, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+import sys
+import os
+import unittest
+# Add the parent directory to sys.path to allow importing models
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import Field, LazyModel, Schema, Selection
+
+
+class SampleLazy(LazyModel):
+    _fields = {
+        'kills': ('kills', 0, None),
+        'name': ('player_name', '', str.upper),
+    }
+
+
+class TestLazyModel(unittest.TestCase):
+
+    def test_fields_are_decoded_on_first_access(self):
+        """Test that a field is read from the raw data and cached on the instance."""
+        model = SampleLazy({'kills': 12, 'player_name': 'duke'})
+
+        self.assertEqual(model.__dict__, {})
+        self.assertEqual(model.kills, 12)
+        self.assertEqual(model.name, 'DUKE')
+        self.assertEqual(model.__dict__, {'kills': 12, 'name': 'DUKE'})
+
+    def test_missing_key_uses_default(self):
+        """Test that missing response keys fall back to the declared default."""
+        model = SampleLazy({})
+
+        self.assertEqual(model.kills, 0)
+
+    def test_unknown_attribute_raises(self):
+        """Test that attributes outside the field table raise AttributeError."""
+        model = SampleLazy({'kills': 1})
+
+        with self.assertRaises(AttributeError):
+            model.deaths
+        self.assertFalse(hasattr(model, 'deaths'))
+
+    def test_conversion_runs_once(self):
+        """Test that the converter is not called again after the value is cached."""
+        calls = []
+
+        class Counting(LazyModel):
+            _fields = {'value': ('value', 0, lambda v: calls.append(v) or v * 2)}
+
+        model = Counting({'value': 4})
+        self.assertEqual(model.value, 8)
+        self.assertEqual(model.value, 8)
+        self.assertEqual(calls, [4])
+
+    def test_to_dict_and_schema_fields(self):
+        """Test building a lazy field table from a schema and decoding all of it."""
+        class Stats(LazyModel):
+            _fields = Schema(Field('a', 0), Field('b', 0)).lazy_fields()
+
+        self.assertEqual(Stats({'a': 5}).to_dict(), {'a': 5, 'b': 0})
+        self.assertIn('b', dir(Stats({})))
+
+
+class TestSchema(unittest.TestCase):
+
+    def setUp(self):
+        class Record:
+            _schema = Schema(
+                Field('name', ''),
+                Field('stealthed', 0, bool),
+                Field('ammo_id', 0, key='ammoID'),
+                Field('modifiers', {}),
+                Field('status', {}, 'Status'),
+            )
+            __slots__ = _schema.slots
+            __init__ = _schema.constructor('Record')
+
+            class Status:
+                def __init__(self, data):
+                    self.state = data.get('state', '')
+
+        self.Record = Record
+
+    def test_constructor_assigns_declared_fields(self):
+        """Test that the generated constructor applies keys, defaults and converters."""
+        record = self.Record({'name': 'duke', 'stealthed': 1, 'ammoID': 7, 'status': {'state': 'Okay'}})
+
+        self.assertEqual(record.name, 'duke')
+        self.assertIs(record.stealthed, True)
+        self.assertEqual(record.ammo_id, 7)
+        self.assertEqual(record.modifiers, {})
+        self.assertEqual(record.status.state, 'Okay')
+
+    def test_constructor_defaults(self):
+        """Test that missing keys use the declared defaults and mutable defaults are not shared."""
+        first, second = self.Record({}), self.Record({})
+
+        self.assertEqual((first.name, first.stealthed, first.ammo_id), ('', False, 0))
+        self.assertIsNot(first.modifiers, second.modifiers)
+
+    def test_slots_follow_schema(self):
+        """Test that the model is slotted with the schema's field names."""
+        self.assertEqual(self.Record.__slots__, ('name', 'stealthed', 'ammo_id', 'modifiers', 'status'))
+        self.assertFalse(hasattr(self.Record({}), '__dict__'))
+
+
+class SampleSection:
+    created = []
+    profile = Selection('Profile', 'api', 'user_id')
+
+    def __init__(self, api, user_id):
+        self.api = api
+        self.user_id = user_id
+
+    class Profile:
+        def __init__(self, api, user_id):
+            SampleSection.created.append(user_id)
+            self.api = api
+            self.user_id = user_id
+
+
+class TestSelection(unittest.TestCase):
+
+    def setUp(self):
+        SampleSection.created.clear()
+
+    def test_selection_built_on_first_access_and_cached(self):
+        """Test that a selection is only constructed when accessed, then reused."""
+        section = SampleSection('api', 7)
+        self.assertEqual(SampleSection.created, [])
+
+        profile = section.profile
+
+        self.assertIs(section.profile, profile)
+        self.assertEqual((profile.api, profile.user_id), ('api', 7))
+        self.assertEqual(SampleSection.created, [7])
+
+    def test_selection_can_be_replaced(self):
+        """Test that assigning the attribute overrides the lazily built selection."""
+        section = SampleSection('api', 7)
+        section.profile = 'stub'
+
+        self.assertEqual(section.profile, 'stub')
+        self.assertEqual(SampleSection.created, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import sys
+import os
+import random
+import unittest
+# Add the parent directory to sys.path to allow importing order_book
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from order_book import OrderBook, price_levels
+
+LISTINGS = [{'cost': 120, 'quantity': 5}, {'cost': 100, 'quantity': 2}, {'cost': 150, 'quantity': 1},
+            {'cost': 100, 'quantity': 1}, {'cost': 130, 'quantity': 0}]
+
+
+def brute_fill_cost(listings, units):
+    """Sort-and-scan reference implementation."""
+    cost = 0
+    for listing in sorted(listings, key=lambda listing: listing['cost']):
+        take = min(units, listing['quantity'])
+        cost += take * listing['cost']
+        units -= take
+    return cost if units == 0 else None
+
+
+class TestOrderBook(unittest.TestCase):
+
+    def setUp(self):
+        """Build a book from a few listings."""
+        self.book = OrderBook(LISTINGS)
+
+    def test_levels_are_sorted_and_merged(self):
+        """Test that listings are merged per price, sorted, and empty levels dropped."""
+        self.assertEqual(self.book.cheapest(10), [(100, 3), (120, 5), (150, 1)])
+        self.assertEqual(self.book.best, 100)
+        self.assertEqual(self.book.total_quantity, 9)
+        self.assertEqual(price_levels(LISTINGS)[130], 0)
+
+    def test_fill_cost_and_vwap(self):
+        """Test the cost, VWAP and worst price of buying N units."""
+        self.assertEqual(self.book.fill_cost(0), 0)
+        self.assertEqual(self.book.fill_cost(3), 300)
+        self.assertEqual(self.book.fill_cost(4), 420)
+        self.assertEqual(self.book.fill_cost(9), 1050)
+        self.assertIsNone(self.book.fill_cost(10))
+        self.assertEqual(self.book.vwap(4), 105.0)
+        self.assertEqual(self.book.fill_price(4), 120)
+        self.assertIsNone(OrderBook().vwap(1))
+
+    def test_depth_and_budget(self):
+        """Test the depth and cost at a price, and the units a budget buys."""
+        self.assertEqual(self.book.depth_at(99), 0)
+        self.assertEqual(self.book.depth_at(120), 8)
+        self.assertEqual(self.book.cost_at(120), 900)
+        self.assertEqual(self.book.units_for(299), 2)
+        self.assertEqual(self.book.units_for(540), 5)
+        self.assertEqual(self.book.units_for(10 ** 9), 9)
+
+    def test_incremental_update(self):
+        """Test that applying a new snapshot changes only the differing levels."""
+        self.book.fill_cost(1)
+        changed = self.book.update([{'cost': 90, 'quantity': 1}, {'cost': 120, 'quantity': 5}, {'cost': 150, 'quantity': 4}])
+
+        self.assertEqual(changed, 3)
+        self.assertEqual(self.book.cheapest(10), [(90, 1), (120, 5), (150, 4)])
+        self.assertEqual(self.book.fill_cost(7), 90 + 600 + 150)
+
+        self.book.set_level(200, 1)
+        self.book.set_level(90, 0)
+        self.assertEqual(self.book.total_quantity, 10)
+
+    def test_matches_sort_and_scan(self):
+        """Test fill costs against a sort-and-scan reference over random snapshots."""
+        rng = random.Random(3)
+        book = OrderBook()
+        for _ in range(20):
+            listings = [{'cost': rng.randint(1, 50), 'quantity': rng.randint(0, 5)} for _ in range(rng.randint(0, 30))]
+            book.update(listings)
+            for units in range(0, 40, 3):
+                self.assertEqual(book.fill_cost(units), brute_fill_cost(listings, units))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+import sys
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+# Add the parent directory to sys.path to allow importing pagination
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pagination import Cursor, PaginationError, fetch_page, paginate, paginate_with_cursor
+from results import RequestResult
+
+
+def make_history(timestamps):
+    """Records keyed by ID, as the API returns them."""
+    return {f"id{n}": {'code': f"c{n}", 'timestamp_started': ts} for n, ts in enumerate(timestamps)}
+
+
+class FakeWindowAPI:
+    """Returns the newest `limit` records with from <= timestamp <= to, like the Torn API."""
+
+    def __init__(self, history):
+        self.history = history
+        self.calls = []
+
+    def fetch(self, lower, upper, limit):
+        self.calls.append((lower, upper))
+        window = [(k, r) for k, r in self.history.items() if lower <= r['timestamp_started'] <= upper]
+        window.sort(key=lambda entry: entry[1]['timestamp_started'], reverse=True)
+        return window[:limit]
+
+
+def walk(api, from_ts, to_ts, limit, state=None, on_page=None):
+    return list(paginate(lambda lower, upper: api.fetch(lower, upper, limit), from_ts, to_ts, limit,
+                         lambda record: record['timestamp_started'], lambda key, record: record['code'],
+                         state, on_page))
+
+
+class TestPaginate(unittest.TestCase):
+
+    def test_walks_window_and_deduplicates_boundaries(self):
+        """Test that every record is yielded exactly once across overlapping pages."""
+        timestamps = [100, 101, 101, 101, 102, 103, 103, 104, 105, 106, 107, 107]
+        api = FakeWindowAPI(make_history(timestamps))
+
+        result = walk(api, 100, 200, limit=3)
+
+        self.assertEqual(sorted(key for key, _ in result), sorted(api.history))
+        self.assertEqual(len(result), len(timestamps))
+
+    def test_respects_from_timestamp(self):
+        """Test that records older than from_ts are not requested or yielded."""
+        api = FakeWindowAPI(make_history(range(100, 130)))
+
+        result = walk(api, 120, 129, limit=4)
+
+        self.assertEqual(len(result), 10)
+        self.assertTrue(all(lower == 120 for lower, _ in api.calls))
+
+    def test_full_page_in_one_second_moves_on(self):
+        """Test that a page of records sharing one timestamp does not loop forever."""
+        api = FakeWindowAPI(make_history([100, 105, 105, 105, 105]))
+
+        result = walk(api, 0, 200, limit=2)
+
+        self.assertIn('id0', [key for key, _ in result])
+        self.assertLess(len(api.calls), 10)
+
+    def test_resume_from_state(self):
+        """Test that a saved state resumes the walk below the last completed page."""
+        api = FakeWindowAPI(make_history(range(100, 110)))
+        states = []
+
+        walk(api, 100, 109, limit=3, on_page=lambda state: states.append(dict(state)))
+        resumed = walk(FakeWindowAPI(api.history), 100, 109, limit=3, state=dict(states[0]))
+        finished = walk(FakeWindowAPI(api.history), 100, 109, limit=3, state=dict(states[-1]))
+
+        self.assertEqual(len(resumed), 7)
+        self.assertTrue(states[-1]['done'])
+        self.assertEqual(finished, [])
+
+
+class TestCursor(unittest.TestCase):
+
+    def setUp(self):
+        """Create a temporary directory for cursor files."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'events.cursor')
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.directory.cleanup()
+
+    def walk(self, api, limit, stop_after=None):
+        records = []
+        walker = paginate_with_cursor(lambda lower, upper: api.fetch(lower, upper, limit), 100, 129, limit,
+                                      lambda record: record['timestamp_started'], lambda key, record: record['code'],
+                                      self.path)
+        for key, record in walker:
+            records.append(key)
+            if stop_after is not None and len(records) == stop_after:
+                break
+        return records
+
+    def test_interrupted_walk_resumes(self):
+        """Test that a walk interrupted mid-page resumes from the last completed page."""
+        history = make_history(range(100, 130))
+
+        first = self.walk(FakeWindowAPI(history), limit=5, stop_after=12)
+        resumed_api = FakeWindowAPI(history)
+        second = self.walk(resumed_api, limit=5)
+
+        # Two pages (129-125 and 125-121) were completed; the third is fetched again
+        self.assertEqual(len(second), 21)
+        self.assertEqual(set(first) | set(second), set(history))
+        self.assertEqual(resumed_api.calls[0], (100, 121))
+
+    def test_finished_walk_is_not_repeated(self):
+        """Test that a completed walk yields nothing until its cursor is cleared."""
+        history = make_history(range(100, 130))
+        self.walk(FakeWindowAPI(history), limit=5)
+
+        self.assertEqual(self.walk(FakeWindowAPI(history), limit=5), [])
+        Cursor(self.path).clear()
+        self.assertEqual(len(self.walk(FakeWindowAPI(history), limit=5)), 30)
+
+    def test_other_window_or_corrupt_file_starts_over(self):
+        """Test that a cursor for another window, or an unreadable one, is ignored."""
+        cursor = Cursor(self.path)
+        cursor.save(50, 60, {'to': 55, 'seen': [], 'done': False})
+        self.assertEqual(cursor.load(100, 129), (129, {}))
+
+        with open(self.path, 'w') as file:
+            file.write('{"from": 100, "to"')
+        self.assertEqual(cursor.load(100, 129), (129, {}))
+
+    def test_open_window_is_pinned(self):
+        """Test that resuming an open-ended walk keeps the end saved with the cursor."""
+        cursor = Cursor(self.path)
+        cursor.save(100, 500, {'to': 300, 'seen': ['a'], 'done': False})
+
+        self.assertEqual(cursor.load(100), (500, {'to': 300, 'seen': ['a'], 'done': False}))
+        self.assertFalse(os.path.exists(self.path + '.tmp'))
+
+
+class TestFetchPage(unittest.TestCase):
+
+    def test_failed_request_raises(self):
+        """Test that a failed page request raises PaginationError with the result."""
+        api = MagicMock()
+        api.request.return_value = RequestResult(error_code=5, error='Too many requests')
+
+        with self.assertRaises(PaginationError) as context:
+            fetch_page(api, 'user', 1, 'attacks', 'attacks', {'to': 10})
+        self.assertTrue(context.exception.result.throttled)
+
+    def test_list_records_are_keyed_by_their_id(self):
+        """Test that list-shaped selections are keyed by the records' own ID, never by their index."""
+        api = MagicMock()
+        api.request.return_value = RequestResult({'revives': [{'id': 9, 'timestamp': 2}, {'timestamp': 1}]})
+
+        self.assertEqual(fetch_page(api, 'user', 1, 'revives', 'revives', {}),
+                         [(9, {'id': 9, 'timestamp': 2}), (None, {'timestamp': 1})])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import sys
+import os
+import unittest
+# Add the parent directory to sys.path to allow importing response_log
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import logging
+from response_log import ResponseLogPolicy
+
+
+RESPONSE = {'items': {'1': {'name': 'Hammer'}}}
+BODY = b'{"items": {"1": {"name": "Hammer"}}}'
+
+
+class TestResponseLogPolicy(unittest.TestCase):
+
+    def setUp(self):
+        self.logger = logging.getLogger('test_response_log')
+        self.logger.setLevel(logging.INFO)
+
+    def logged(self, policy, section='torn', selections='items', calls=1):
+        with self.assertLogs(self.logger, level='INFO') as log:
+            self.logger.info("marker")
+            for _ in range(calls):
+                policy.log(self.logger, section, selections, RESPONSE, BODY)
+        return [message.split(':', 2)[2] for message in log.output[1:]]
+
+    def test_full_logs_the_response(self):
+        """Test that the default policy logs the whole decoded response."""
+        self.assertEqual(self.logged(ResponseLogPolicy()), [f"Response data: {RESPONSE}"])
+
+    def test_truncate_logs_raw_body_prefix(self):
+        """Test that truncate logs the first N bytes of the raw body."""
+        messages = self.logged(ResponseLogPolicy('truncate:10'))
+
+        self.assertEqual(messages, [f"Response data (first 10 of {len(BODY)} bytes): {BODY[:10].decode()}"])
+
+    def test_sample_logs_one_in_n(self):
+        """Test that sample logs every Nth response."""
+        self.assertEqual(len(self.logged(ResponseLogPolicy('sample:3'), calls=7)), 3)
+
+    def test_overrides_by_section_and_selection(self):
+        """Test that selection overrides beat section overrides, which beat the default."""
+        policy = ResponseLogPolicy.parse("truncate:100; torn=off; torn/items=sample:2; user/attacks,basic=full")
+
+        self.assertEqual(policy.mode_for('torn', 'items'), 'sample:2')
+        self.assertEqual(policy.mode_for('torn', 'stocks'), 'off')
+        self.assertEqual(policy.mode_for('user', ['attacks', 'basic']), 'full')
+        self.assertEqual(policy.mode_for('market', 'bazaar'), 'truncate:100')
+        self.assertEqual(self.logged(policy, 'torn', 'stocks'), [])
+
+    def test_invalid_modes(self):
+        """Test that unknown modes and missing sizes are rejected."""
+        for spec in ('verbose', 'truncate', 'sample:0', 'torn=truncate:x'):
+            with self.subTest(spec=spec):
+                with self.assertRaises(ValueError):
+                    ResponseLogPolicy.parse(spec)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import sys
+import os
+import unittest
+# Add the parent directory to sys.path to allow importing results
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from results import RequestResult, key_fingerprint
+
+
+class TestRequestResult(unittest.TestCase):
+
+    def test_empty_is_not_failed(self):
+        """Test that an empty successful response is distinguishable from a failure."""
+        empty = RequestResult({})
+        failed = RequestResult(error='Request failed: timeout')
+
+        self.assertTrue(empty.ok and empty.empty)
+        self.assertFalse(failed.ok or failed.empty)
+
+    def test_throttled_and_retryable(self):
+        """Test the retry classification of API, HTTP and network failures."""
+        cases = [
+            (RequestResult(error_code=5, error='Too many requests'), True, True),
+            (RequestResult(error_code=2, error='Incorrect key'), False, False),
+            (RequestResult(error_code=17, error='Backend error'), False, True),
+            (RequestResult(error='Request failed', status_code=429), True, True),
+            (RequestResult(error='Request failed', status_code=404), False, False),
+            (RequestResult(error='Request failed: connection reset'), False, True),
+            (RequestResult({'basic': {}}), False, False),
+        ]
+        for result, throttled, retryable in cases:
+            with self.subTest(result=result):
+                self.assertEqual(result.throttled, throttled)
+                self.assertEqual(result.retryable, retryable)
+
+    def test_key_fingerprint(self):
+        """Test that key fingerprints are short, stable and do not contain the key."""
+        fingerprint = key_fingerprint('abcdEFGH12345678')
+
+        self.assertEqual(len(fingerprint), 8)
+        self.assertEqual(fingerprint, key_fingerprint('abcdEFGH12345678'))
+        self.assertNotIn('abcd', fingerprint)
+        self.assertIsNone(key_fingerprint(None))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -20,5 +20,20 @@ if env is None:
     raise ValueError("Failed to load environment variables.")
 logger, file_handler = setup_logger('Test_Sections', env['DEBUG_LEVEL'])
 
+
+class TestLazySections(unittest.TestCase):
+
+    def test_section_class_loaded_on_first_use(self):
+        """Test that Sections resolves section classes lazily and exposes them as module attributes."""
+        import sections
+        from section_market import Market
+
+        market = Sections(MagicMock(spec=TornAPI)).market(206)
+
+        self.assertIsInstance(market, Market)
+        self.assertIs(sections.Market, Market)
+        with self.assertRaises(AttributeError):
+            sections.Faction
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file
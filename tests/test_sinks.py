@@ -0,0 +1,77 @@
+import sys
+import os
+import json
+import tempfile
+import unittest
+# Add the parent directory to sys.path to allow importing sinks
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sinks import NDJSONSink, SQLiteSink, write_records
+
+ENTRIES = [
+    ('a1', {'log': 4100, 'title': 'Item use', 'timestamp': 200, 'category': 'Items', 'data': {'item': 1}, 'params': {}}),
+    ('a2', {'log': 8150, 'title': 'Attack', 'timestamp': 190, 'category': 'Attacking', 'data': {}, 'params': {'color': 'red'}}),
+]
+
+
+class TestSinks(unittest.TestCase):
+
+    def setUp(self):
+        """Create a temporary directory for output files."""
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.directory.cleanup()
+
+    def test_ndjson_sink(self):
+        """Test that NDJSONSink writes one JSON object per line with the key added."""
+        path = os.path.join(self.directory.name, 'log.ndjson')
+        with NDJSONSink(path) as sink:
+            self.assertEqual(write_records(iter(ENTRIES), sink), 2)
+
+        with open(path) as file:
+            lines = [json.loads(line) for line in file]
+        self.assertEqual([line['id'] for line in lines], ['a1', 'a2'])
+        self.assertEqual(lines[0]['data'], {'item': 1})
+
+    def test_sqlite_sink_replaces_duplicates(self):
+        """Test that SQLiteSink stores entries by ID and replaces an entry written twice."""
+        path = os.path.join(self.directory.name, 'log.db')
+        with SQLiteSink(path, batch_size=1) as sink:
+            write_records(iter(ENTRIES + ENTRIES[:1]), sink)
+            rows = sink.connection.execute(
+                "SELECT id, json_extract(record, '$.log'), json_extract(record, '$.category') FROM records ORDER BY timestamp"
+            ).fetchall()
+
+        self.assertEqual(rows, [('a2', 8150, 'Attacking'), ('a1', 4100, 'Items')])
+
+    def test_sqlite_sink_keeps_every_field(self):
+        """Test that records of any selection are stored whole, with the configured timestamp field indexed."""
+        attack = {'code': 'abc', 'timestamp_started': 150, 'attacker': {'id': 1}, 'modifiers': {'chain': 1.1}}
+        with SQLiteSink(':memory:', table='attacks', timestamp_field='timestamp_started') as sink:
+            sink.write('abc', attack)
+            sink.flush()
+            row = sink.connection.execute('SELECT id, timestamp, record FROM attacks').fetchone()
+
+        self.assertEqual(row[:2], ('abc', 150))
+        self.assertEqual(json.loads(row[2]), attack)
+
+    def test_sqlite_sink_flushes_on_close(self):
+        """Test that entries buffered below the batch size are written on close."""
+        path = os.path.join(self.directory.name, 'log.db')
+        sink = SQLiteSink(path, table='audit')
+        sink.write(*ENTRIES[0])
+        sink.close()
+
+        with SQLiteSink(path, table='audit') as reopened:
+            self.assertEqual(reopened.connection.execute('SELECT COUNT(*) FROM audit').fetchone(), (1,))
+
+    def test_invalid_table_name(self):
+        """Test that a table name that is not an identifier is rejected."""
+        with self.assertRaises(ValueError):
+            SQLiteSink(':memory:', table='log; DROP TABLE log')
+
+
+if __name__ == '__main__':
+    unittest.main()
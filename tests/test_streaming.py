@@ -0,0 +1,72 @@
+import sys
+import os
+import io
+import unittest
+from unittest.mock import patch
+# Add the parent directory to sys.path to allow importing streaming
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import streaming
+from decoders import get_decoder
+from streaming import ChunkReader, is_error_body, iter_mapping
+
+
+BODY = b'{"rankedwarreport": {"factions": {"1": {"name": "Alpha"}, "2": {"name": "Beta"}}, "war": {"winner": 1}}}'
+
+
+class TestChunkReader(unittest.TestCase):
+
+    def test_read_across_chunks(self):
+        """Test that reads of any size return the body in order."""
+        reader = ChunkReader([b'abc', b'defg', b'h'])
+
+        self.assertEqual(reader.peek(5), b'abcde')
+        self.assertEqual(reader.read(2), b'ab')
+        self.assertEqual(reader.read(4), b'cdef')
+        self.assertEqual(reader.read(), b'gh')
+        self.assertEqual(reader.read(10), b'')
+
+    def test_empty_chunks_are_not_eof(self):
+        """Test that empty chunks are skipped and only the end of the chunks ends the body."""
+        reader = ChunkReader([b'', b'ab', b'', b'', b'cd'])
+
+        self.assertEqual(reader.read(2), b'ab')
+        self.assertEqual(reader.read(2), b'cd')
+        self.assertEqual(reader.read(2), b'')
+
+    def test_is_error_body(self):
+        """Test that Torn error bodies are recognised from their first bytes."""
+        self.assertTrue(is_error_body(b' {"error": {"code": 2'))
+        self.assertTrue(is_error_body(b'{ "error": {"code": 2'))
+        self.assertTrue(is_error_body(b'{\n  "error" : {"code": 2'))
+        self.assertFalse(is_error_body(b'{"items": {"error": {}}}'))
+        self.assertFalse(is_error_body(b''))
+        self.assertFalse(is_error_body(b'{"items": {"1": {}}}'))
+
+
+class TestIterMapping(unittest.TestCase):
+
+    def test_fallback_without_ijson(self):
+        """Test that entries are yielded from a full decode when ijson is missing."""
+        with patch.object(streaming, 'ijson', None), self.assertWarns(RuntimeWarning):
+            entries = list(iter_mapping(io.BytesIO(BODY), 'rankedwarreport.factions', get_decoder('json')))
+
+        self.assertEqual(entries, [('1', {'name': 'Alpha'}), ('2', {'name': 'Beta'})])
+
+    def test_missing_path_yields_nothing(self):
+        """Test that a path missing from the body yields no entries."""
+        with patch.object(streaming, 'ijson', None), self.assertWarns(RuntimeWarning):
+            self.assertEqual(list(iter_mapping(io.BytesIO(BODY), 'rankedwarreport.members', get_decoder('json'))), [])
+
+    @unittest.skipIf(streaming.ijson is None, "ijson is not installed")
+    def test_incremental_with_ijson(self):
+        """Test that ijson streams the same entries chunk by chunk."""
+        chunks = [BODY[i:i + 7] for i in range(0, len(BODY), 7)]
+
+        entries = list(iter_mapping(ChunkReader(chunks), 'rankedwarreport.factions', get_decoder('json')))
+
+        self.assertEqual(entries, [('1', {'name': 'Alpha'}), ('2', {'name': 'Beta'})])
+
+
+if __name__ == '__main__':
+    unittest.main()
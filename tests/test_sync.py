@@ -0,0 +1,120 @@
+import sys
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+# Add the parent directory to sys.path to allow importing sync
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from results import RequestResult
+from sinks import SQLiteSink
+from sync import SyncManager
+
+
+class FakeEventsAPI:
+    """Serves user events from an in-memory history, filtered like the Torn API."""
+
+    def __init__(self, history):
+        self.history = history
+        self.key_fingerprint = 'abcd1234'
+        self.request = MagicMock(side_effect=self._request)
+
+    def _request(self, section, id, selections, parameters):
+        window = [(k, e) for k, e in self.history.items() if parameters['from'] <= e['timestamp'] <= parameters['to']]
+        window.sort(key=lambda entry: entry[1]['timestamp'], reverse=True)
+        return RequestResult({'events': dict(window[:parameters['limit']])})
+
+
+class FakeRevivesAPI:
+    """Serves user revives as a list without IDs, filtered like the Torn API."""
+
+    def __init__(self, history):
+        self.history = history
+        self.key_fingerprint = 'abcd1234'
+        self.request = MagicMock(side_effect=self._request)
+
+    def _request(self, section, id, selections, parameters):
+        window = [r for r in self.history if parameters['from'] <= r['timestamp'] <= parameters['to']]
+        window.sort(key=lambda revive: revive['timestamp'], reverse=True)
+        return RequestResult({'revives': window[:parameters['limit']]})
+
+
+class TestSyncManager(unittest.TestCase):
+
+    def setUp(self):
+        """Create a temporary directory for the marks file."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'marks.json')
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.directory.cleanup()
+
+    def test_pull_only_fetches_new_records(self):
+        """Test that a second pull starts at the mark and yields only records added since."""
+        api = FakeEventsAPI({f"e{n}": {'timestamp': 1000 + n} for n in range(150)})
+        sync = SyncManager(api, self.path)
+
+        self.assertEqual(len(list(sync.pull(1, 'events'))), 150)
+        self.assertEqual(sync.mark(1, 'events'), 1149)
+
+        api.history.update({'e150': {'timestamp': 1149}, 'e151': {'timestamp': 1200}})
+        api.request.reset_mock()
+        new = [key for key, _ in sync.pull(1, 'events')]
+
+        self.assertEqual(sorted(new), ['e150', 'e151'])
+        self.assertEqual(api.request.call_count, 1)
+        self.assertEqual(api.request.call_args[0][3]['from'], 1149)
+
+    def test_marks_persist_per_key_and_user(self):
+        """Test that marks are saved to disk and kept apart by user and selection."""
+        api = FakeEventsAPI({'e1': {'timestamp': 500}})
+        list(SyncManager(api, self.path).pull(1, 'events'))
+
+        reloaded = SyncManager(api, self.path)
+        self.assertEqual(reloaded.mark(1, 'events'), 500)
+        self.assertIsNone(reloaded.mark(2, 'events'))
+        self.assertEqual(list(reloaded.pull(1, 'events')), [])
+
+        reloaded.reset(1, 'events')
+        self.assertIsNone(SyncManager(api, self.path).mark(1, 'events'))
+
+    def test_interrupted_pull_does_not_advance(self):
+        """Test that the mark only advances once a pull has been fully consumed."""
+        api = FakeEventsAPI({'e1': {'timestamp': 500}, 'e2': {'timestamp': 600}})
+        sync = SyncManager(api)
+
+        next(sync.pull(1, 'events'))
+        self.assertIsNone(sync.mark(1, 'events'))
+
+    def test_list_shaped_revives_keep_their_identity(self):
+        """Test that revives listed without IDs are told apart by content, not by list position."""
+        api = FakeRevivesAPI([{'timestamp': 500, 'reviver_id': 1, 'target_id': 2}])
+        sync = SyncManager(api)
+        self.assertEqual(len(list(sync.pull(1, 'revives'))), 1)
+
+        api.history.append({'timestamp': 600, 'reviver_id': 1, 'target_id': 3})
+        with SQLiteSink(':memory:') as sink:
+            self.assertEqual(sync.sync(1, 'revives', sink, since=0), 1)
+            rows = sink.connection.execute('SELECT id, timestamp FROM records').fetchall()
+
+        self.assertEqual(rows, [('600:1:3', 600)])
+
+    def test_sync_writes_to_sink(self):
+        """Test that sync writes new records and flushes the sink before saving the mark."""
+        api = FakeEventsAPI({'e1': {'timestamp': 500}, 'e2': {'timestamp': 600}})
+        sink = MagicMock()
+        sync = SyncManager(api)
+
+        self.assertEqual(sync.sync(1, 'events', sink), 2)
+        self.assertTrue(sink.flush.called)
+        self.assertEqual(sync.sync(1, 'events', sink), 0)
+
+    def test_unknown_selection(self):
+        """Test that selections that are not append-only are rejected."""
+        with self.assertRaises(ValueError):
+            list(SyncManager(FakeEventsAPI({})).pull(1, 'profile'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import sys
 import os
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 from datetime import datetime
@@ -8,6 +9,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from logger import setup_logger, close_logger
 from tornApi import TornAPI
+from results import RequestResult
+from pagination import PaginationError
 from sections import Sections
 from env_loader import load_environment_variables
 
@@ -1692,6 +1695,113 @@ class TestUser(unittest.TestCase):
                     logger.info(f"API call for section '{test_case['section_name']}' and method '{test_case['method_name']}' was called exactly once.")
                     logger.info(f"Completed test case {index + 1}/{len(test_cases)}: '{test_case['section_name']}'")
 
+    def test_fetch_personalstats_lazy(self):
+        """Test that lazy personal stats expose the same attributes as the eager model."""
+        self.api.make_request.return_value = {'personalstats': {'xantaken': 42, 'useractivity': 3600}}
+
+        result = self.user.personalstats.fetch_data(lazy=True)
+        eager = self.user.personalstats.PersonalStatsData({'xantaken': 42, 'useractivity': 3600})
+
+        self.assertIsInstance(result, self.user.personalstats.LazyPersonalStatsData)
+        for name in eager.__slots__:
+            self.assertEqual(getattr(result, name), getattr(eager, name), name)
+
+    def test_stream_attacks_full(self):
+        """Test that AttacksFull.stream builds AttackFull objects from the streamed entries."""
+        self.api.stream.return_value = iter([('1', {'attacker_id': 1, 'result': 'Mugged', 'stealthed': 1}),
+                                             ('2', {'attacker_id': 2, 'result': 'Lost'})])
+
+        result = list(self.user.attacks_full.stream(from_timestamp=100, limit=2))
+
+        self.api.stream.assert_called_once_with('user', self.user_id, 'attacksfull', 'attacks', {'from': 100, 'limit': 2})
+        self.assertEqual([attack.result for attack in result], ['Mugged', 'Lost'])
+        self.assertIs(result[0].stealthed, True)
+
+    def test_zero_timestamp_bounds_are_sent(self):
+        """Test that a from or to timestamp of 0 is sent to the API rather than dropped."""
+        self.api.make_request.return_value = {}
+
+        self.user.attacks.fetch_data(from_timestamp=0, to_timestamp=500)
+        self.api.make_request.assert_called_with('user', self.user_id, 'attacks', {'from': 0, 'to': 500})
+        self.user.revives_full.fetch_data(from_timestamp=100, to_timestamp=0, limit=10)
+        self.api.make_request.assert_called_with('user', self.user_id, 'revivesfull', {'from': 100, 'to': 0, 'limit': 10})
+        self.user.messages.fetch_data(from_timestamp=0)
+        self.api.make_request.assert_called_with('user', self.user_id, 'messages', {'from': 0})
+        self.user.events.fetch_data(limit=500, from_timestamp=0)
+        self.api.make_request.assert_called_with('user', self.user_id, 'events', {'from': 0, 'limit': 100})
+
+    def test_iter_events_pages_backwards(self):
+        """Test that Events.iter_events walks pages by timestamp and skips boundary repeats."""
+        first = {f"e{n}": {'event': f"Event {n}", 'timestamp': 200 - n // 2} for n in range(100)}
+        second = {'e98': first['e98'], 'e99': first['e99'], 'e100': {'event': 'Event 100', 'timestamp': 140}}
+        self.api.request.side_effect = [RequestResult({'events': first}), RequestResult({'events': second})]
+
+        result = list(self.user.events.iter_events(from_ts=100, to_ts=200))
+
+        self.assertEqual(len(result), 101)
+        self.assertEqual(result[-1].uuid, 'e100')
+        self.api.request.assert_called_with('user', self.user_id, 'events', {'from': 100, 'to': 151, 'limit': 100})
+
+    def test_iter_logs_sends_filters(self):
+        """Test that Log.iter_logs sends log/cat filters and yields raw entries lazily."""
+        self.api.request.return_value = RequestResult({'log': {'x1': {'log': 4100, 'timestamp': 150}}})
+
+        result = list(self.user.log.iter_logs(100, 200, log=[4100, 4101], cat=5))
+
+        self.assertEqual(result, [('x1', {'log': 4100, 'timestamp': 150})])
+        self.api.request.assert_called_once_with('user', self.user_id, 'log',
+                                                 {'from': 100, 'to': 200, 'limit': 100, 'log': '4100,4101', 'cat': '5'})
+
+    def test_export_logs_to_sink(self):
+        """Test that Log.export writes entries to a sink and flushes it after each page."""
+        sink = MagicMock()
+        self.api.request.return_value = RequestResult({'log': {'x1': {'timestamp': 150}, 'x2': {'timestamp': 140}}})
+
+        self.assertEqual(self.user.log.export(sink, 100, 200), 2)
+        sink.write.assert_any_call('x2', {'timestamp': 140})
+        self.assertTrue(sink.flush.called)
+
+    def test_iter_messages(self):
+        """Test that Messages.iter_messages builds Message objects from each page."""
+        self.api.request.return_value = RequestResult({'messages': {'7': {'name': 'Bob', 'timestamp': 150, 'read': 1}}})
+
+        result = list(self.user.messages.iter_messages(100, 200))
+
+        self.assertEqual([(message.id, message.name, message.read) for message in result], [('7', 'Bob', True)])
+        self.api.request.assert_called_once_with('user', self.user_id, 'messages', {'from': 100, 'to': 200, 'limit': 100})
+
+    def test_iter_revives_list_pages(self):
+        """Test that revives listed without IDs are de-duplicated at page boundaries by content, not position."""
+        history = [{'timestamp': 10000 - n // 3, 'reviver_id': n, 'target_id': 1, 'result': 'success'} for n in range(250)]
+
+        def request(section, id, selections, parameters):
+            window = [r for r in history if parameters['from'] <= r['timestamp'] <= parameters['to']]
+            return RequestResult({'revives': window[:parameters['limit']]})
+
+        self.api.request.side_effect = request
+
+        result = list(self.user.revives.iter_revives(0, 10000))
+
+        self.assertEqual(sorted(revive.reviver_id for revive in result), list(range(250)))
+
+    def test_iter_revives_resumes_from_checkpoint(self):
+        """Test that RevivesFull.iter_revives saves a checkpoint and a rerun skips finished pages."""
+        page = {str(n): {'timestamp': 2000 - n, 'result': 'success'} for n in range(1000)}
+        last = {'999': page['999'], '1000': {'timestamp': 10, 'result': 'failure'}}
+        with tempfile.TemporaryDirectory() as directory:
+            cursor = os.path.join(directory, 'revives.cursor')
+            self.api.request.side_effect = [RequestResult({'revives': page}), RequestResult(error_code=5, error='Too many requests')]
+            revives = self.user.revives_full.iter_revives(0, 2400, cursor=cursor)
+            with self.assertRaises(PaginationError):
+                for _ in revives:
+                    pass
+
+            self.api.request.side_effect = [RequestResult({'revives': last})]
+            result = list(self.user.revives_full.iter_revives(0, 2400, cursor=cursor))
+
+        self.assertEqual([revive.result for revive in result], ['failure'])
+        self.api.request.assert_called_with('user', self.user_id, 'revivesfull', {'from': 0, 'to': 1001, 'limit': 1000})
+
     def test_fetch_with_no_data(self):
         """Test fetching when API returns no data for all sections."""
         # Define the sections and their expected behavior when no data is returned
@@ -1,31 +1,48 @@
 import requests
 import time
 from collections import deque
-from threading import Lock
+from threading import Lock, local
 from urllib.parse import urlencode
-from logger import setup_logger
-from env_loader import load_environment_variables
+from logger import setup_logger, close_logger
+from config import get_config
+from response_log import ResponseLogPolicy
+from decoders import get_decoder
+from results import CACHE_HIT, CACHE_MISS, CACHE_BYPASS, RequestResult, key_fingerprint
+from streaming import CHUNK_SIZE, SNIFF_SIZE, ChunkReader, StreamError, is_error_body, iter_mapping
 # from rate_limiter import RateLimiter
 from functools import lru_cache
 
 class TornAPI:
-    def __init__(self, access_level='full'):
-        # Load environment variables
-        env = load_environment_variables()
-        if env is None:
-            raise ValueError("Failed to load environment variables.")
+    def __init__(self, access_level='full', config=None, response_log=None, decoder=None, max_retries=3):
+        # Use the injected configuration, or the process-wide one (loaded from .env once)
+        self.config = config if config is not None else get_config()
+
+        # How much of each response is logged: a ResponseLogPolicy, a policy string, or the configured one
+        if not isinstance(response_log, ResponseLogPolicy):
+            response_log = ResponseLogPolicy.parse(response_log or self.config.response_log)
+        self.response_log = response_log
+
+        # JSON decoder for response bodies: orjson, msgspec or json (the fastest installed by default)
+        self.decoder = get_decoder(decoder)
 
         # Set up logger with the specified debug level
-        self.logger, self.file_handler = setup_logger('TornAPI', env['DEBUG_LEVEL'])
+        self.logger, self.file_handler = setup_logger('TornAPI', self.config.debug_level)
         
         # Initialize the rate limiter
-        self.rate_limiter = RateLimiter(limit=90, timeframe=60, backoff_factor=2)  # Adjusted limit for safety
+        self.rate_limiter = RateLimiter(limit=90, timeframe=60, backoff_factor=2, config=self.config)  # Adjusted limit for safety
+
+        # Retries after a "too many requests" error before it is returned to the caller (None retries forever)
+        self.max_retries = max_retries
 
         # Retrieve the API key based on the specified access level
-        self.api_key = env['API_KEYS'].get(access_level)
+        self.api_key = self.config.api_key(access_level)
         if not self.api_key:
             self.logger.error(f"API key for access level '{access_level}' not found.")
             raise ValueError("API key is required for the specified access level.")
+        self.key_fingerprint = key_fingerprint(self.api_key)
+
+        # Per-thread storage for last_result
+        self._local = local()
 
         self.logger.info("TornAPI initialized with access level: %s", access_level)
 
@@ -38,51 +55,77 @@ class TornAPI:
         return urlencode(sorted(params.items()))
 
     def make_request(self, section, id, selections=None, parameters=None):
+        """Make a request and return the decoded response, or None if it failed (see `request`)."""
+        return self.request(section, id, selections, parameters).data
+
+    @property
+    def last_result(self):
+        """The RequestResult of the last request made by the current thread, or None."""
+        return getattr(self._local, 'last_result', None)
+
+    def request(self, section, id, selections=None, parameters=None, use_cache=True, retry_on_limit=True):
+        """
+        Make a request and describe its outcome.
+
+        Args:
+            section (str): The API section, e.g. 'user'.
+            id: The section ID.
+            selections: The selections, as a comma-separated string, list or tuple.
+            parameters (dict, optional): Additional query parameters.
+            use_cache (bool): Whether a cached response may be returned. Defaults to True.
+            retry_on_limit (bool): Whether to back off and retry (up to `max_retries` times) when
+                the API reports too many requests. If False, or once the retries are used up, the
+                result is returned with `throttled` set. Defaults to True.
+
+        Returns:
+            RequestResult: The data or the error, with the key fingerprint, cache status,
+            latency and retry count. It is also available as `last_result` on this thread.
+        """
+        start = time.perf_counter()
+        result = self._request(section, id, selections, parameters, use_cache, retry_on_limit)
+        result.key = self.key_fingerprint
+        result.latency = time.perf_counter() - start
+        self._local.last_result = result
+        return result
+
+    def _can_retry(self, retries):
+        """Return whether a request may be retried again after a "too many requests" error."""
+        if self.max_retries is not None and retries >= self.max_retries:
+            self.logger.warning(f"Giving up after {retries} retries on the rate limit.")
+            return False
+        return True
+
+    def _request(self, section, id, selections, parameters, use_cache, retry_on_limit=True):
         # Generate cache key
         cache_key = self._get_cache_key(section, id, selections, frozenset(parameters.items()) if parameters else None)
         
         # Check cache
-        cached_response = self._get_from_cache(cache_key)
-        if cached_response:
-            self.logger.info(f"Using cached response for {cache_key}")
-            return cached_response
+        if use_cache:
+            cached_response = self._get_from_cache(cache_key)
+            if cached_response:
+                self.logger.info(f"Using cached response for {cache_key}")
+                return RequestResult(cached_response, cache=CACHE_HIT)
 
+        retries = 0
+        cache = CACHE_MISS if use_cache else CACHE_BYPASS
         while True:
             self.rate_limiter.wait_for_next_request()
             self.rate_limiter.log_request()
-            
-            # Base URL
-            url = f"https://api.torn.com/{section}/{id}"
-
-            # Query parameters dictionary
-            query_params = {'key': self.api_key}
-
-            # Add selections if available
-            if selections:
-                if isinstance(selections, (list, tuple)):
-                    query_params['selections'] = ','.join(selections)
-                elif isinstance(selections, str):
-                    query_params['selections'] = selections
-                else:
-                    self.logger.warning(f"Invalid selections type: {type(selections)}. Expected list, tuple, or string.")
-
-            # Add additional parameters if provided
-            if parameters:
-                query_params.update(parameters)
-
-            # Construct the full URL with encoded query parameters
-            url += f"?{urlencode(query_params)}"
-            
+
+            url = self._build_url(section, id, selections, parameters)
             self.logger.info(f"Making request to {url}")
 
+            status_code = None
             try:
                 # Make the GET request
                 response = requests.get(url)
+                status_code = response.status_code
                 response.raise_for_status()
                 self.logger.info(f"Received response: {response.status_code}")
 
-                json_response = response.json()
-                self.logger.info(f"Response data: {json_response}")  # Log the full response
+                # Decode the raw body directly, without building a text string first
+                json_response = self.decoder.loads(response.content)
+                self.response_log.log(self.logger, section, selections, json_response, response.content)
 
                 # Handle error in the response
                 if 'error' in json_response:
@@ -92,18 +135,105 @@ class TornAPI:
                     
                     if error_code == 5:  # Too many requests (rate limit hit)
                         self.rate_limiter.increase_wait_time()
-                        continue  # Retry the request
+                        if retry_on_limit and self._can_retry(retries):
+                            retries += 1
+                            continue  # Retry the request
                     
-                    return None
+                    return RequestResult(error_code=error_code, error=error_message, status_code=status_code,
+                                         cache=cache, retries=retries)
 
                 # Cache the successful response
                 self._add_to_cache(cache_key, json_response)
 
-                return json_response
+                return RequestResult(json_response, status_code=status_code, cache=cache, retries=retries)
                 
             except requests.exceptions.RequestException as e:
                 self.logger.error(f"Request failed: {e}")
-                return None
+                return RequestResult(error=f"Request failed: {e}", status_code=status_code, cache=cache, retries=retries)
+            except self.decoder.error as e:
+                self.logger.error(f"Invalid JSON in response: {e}")
+                return RequestResult(error=f"Invalid JSON in response: {e}", status_code=status_code,
+                                     cache=cache, retries=retries)
+
+    def stream(self, section, id, selections=None, path=None, parameters=None):
+        """
+        Stream the entries of one object in a response without decoding the whole body.
+
+        The body is downloaded in chunks and parsed incrementally with ijson, so only one
+        entry is decoded at a time. If ijson is not installed, the body is decoded in full
+        first and a RuntimeWarning is issued.
+        Streamed responses bypass the cache.
+
+        Args:
+            section (str): The API section, e.g. 'torn'.
+            id: The section ID.
+            selections: The selections, as for make_request.
+            path (str, optional): The dotted path of the object to stream, e.g.
+                'rankedwarreport.factions'. Defaults to the selections.
+            parameters (dict, optional): Additional query parameters.
+
+        Yields:
+            tuple: (key, value) for each entry of the object.
+
+        Raises:
+            StreamError: If the request fails or the API returns an error, including too many
+                requests once `max_retries` retries are used up.
+        """
+        path = path or (','.join(selections) if isinstance(selections, (list, tuple)) else selections)
+        retries = 0
+        while True:
+            self.rate_limiter.wait_for_next_request()
+            self.rate_limiter.log_request()
+
+            url = self._build_url(section, id, selections, parameters)
+            self.logger.info(f"Streaming request to {url}")
+
+            try:
+                response = requests.get(url, stream=True)
+                response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                self.logger.error(f"Request failed: {e}")
+                raise StreamError(f"Request failed: {e}") from e
+
+            with response:
+                body = ChunkReader(response.iter_content(chunk_size=CHUNK_SIZE))
+                if is_error_body(body.peek(SNIFF_SIZE)):
+                    error_code = self.decoder.loads(body.read())['error']['code']
+                    error_message = self.interpret_error(error_code)
+                    self.logger.error(f"Error occurred: {error_message}")
+                    if error_code == 5:  # Too many requests (rate limit hit)
+                        self.rate_limiter.increase_wait_time()
+                        if self._can_retry(retries):
+                            retries += 1
+                            continue  # Retry the request
+                    raise StreamError(error_message, error_code)
+
+                yield from iter_mapping(body, path, self.decoder)
+                return
+
+    def _build_url(self, section, id, selections=None, parameters=None):
+        """Build the request URL with the API key, selections and query parameters."""
+        # Base URL
+        url = f"https://api.torn.com/{section}/{id}"
+
+        # Query parameters dictionary
+        query_params = {'key': self.api_key}
+
+        # Add selections if available
+        if selections:
+            if isinstance(selections, (list, tuple)):
+                query_params['selections'] = ','.join(selections)
+            elif isinstance(selections, str):
+                query_params['selections'] = selections
+            else:
+                self.logger.warning(f"Invalid selections type: {type(selections)}. Expected list, tuple, or string.")
+
+        # Add additional parameters if provided
+        if parameters:
+            query_params.update(parameters)
+
+        # Construct the full URL with encoded query parameters
+        return url + f"?{urlencode(query_params)}"
 
     def _get_from_cache(self, key):
         """Retrieve a response from the cache if available."""
@@ -126,8 +256,8 @@ class TornAPI:
     def close(self):
         """Close the logger handlers to free resources."""
         if self.file_handler:
-            self.logger.removeHandler(self.file_handler)
-            self.file_handler.close()
+            close_logger(self.logger, self.file_handler)
+            self.file_handler = None
 
     def interpret_error(self, error_code):
         """Interprets the error code from the TornAPI response."""
@@ -156,13 +286,14 @@ class TornAPI:
         return error_messages.get(error_code, "Unknown error code. Please check the API documentation.")
 
 class RateLimiter:
-    def __init__(self, limit=90, timeframe=60, backoff_factor=2):
+    def __init__(self, limit=90, timeframe=60, backoff_factor=2, config=None):
         """
         Initializes the rate limiter.
         
         :param limit: Maximum number of requests allowed in the specified timeframe.
         :param timeframe: Timeframe in seconds for the limit.
         :param backoff_factor: Factor to multiply wait time when rate limited.
+        :param config: The Config to use. Defaults to the process-wide configuration.
         """
         self.limit = limit
         self.timeframe = timeframe
@@ -170,11 +301,9 @@ class RateLimiter:
         self.requests = deque()
         self.current_wait_time = 0
         self.lock = Lock()
-        env = load_environment_variables()
-        if env is None:
-            raise ValueError("Failed to load environment variables.")
+        config = config if config is not None else get_config()
 
-        self.logger, self.file_handler = setup_logger('RateLimiter', env['DEBUG_LEVEL'])
+        self.logger, self.file_handler = setup_logger('RateLimiter', config.debug_level)
 
     def _clean_up(self):
         """Remove requests older than the timeframe."""